@@ -81,6 +81,7 @@ from ansys.aedt.core.internal.aedt_versions import aedt_versions
 from ansys.aedt.core.internal.errors import AEDTRuntimeError
 from ansys.aedt.core.internal.errors import GrpcApiError
 from ansys.aedt.core.internal.load_aedt_file import load_entire_aedt_file
+from ansys.aedt.core.internal.load_aedt_file import refresh_aedt_file
 from ansys.aedt.core.modules.boundary.common import BoundaryObject
 from ansys.aedt.core.modules.boundary.icepak_boundary import NetworkObject
 from ansys.aedt.core.modules.boundary.layout_boundary import BoundaryObject3dLayout
@@ -100,7 +101,7 @@ def load_aedt_thread(project_path) -> None:
     project_path : str
         Path to the AEDT project file.
     """
-    pp = load_entire_aedt_file(project_path)
+    pp = load_entire_aedt_file(project_path, lazy=True)
     inner_project_settings.properties[Path(project_path)] = pp
     inner_project_settings.time_stamp = Path(project_path).stat().st_mtime
 
@@ -178,6 +179,7 @@ class Design(AedtObjects, PyAedtBase):
         self._project_name: str = None
         self._project_path: str = None
         self.__t: threading.Thread = None
+        self._designs_by_name: tuple = (None, {})
         if isinstance(project_name, Path):
             project_name = str(project_name)
         if (
@@ -650,9 +652,16 @@ class Design(AedtObjects, PyAedtBase):
             Path(self.project_file).exists()
             and Path(self.project_file).resolve() not in inner_project_settings.properties
         ):
-            inner_project_settings.properties[Path(self.project_file).resolve()] = load_entire_aedt_file(
-                self.project_file
-            )
+            previous = inner_project_settings.properties.get(Path(self.project_file).resolve())
+            if previous is None:
+                inner_project_settings.properties[Path(self.project_file).resolve()] = load_entire_aedt_file(
+                    self.project_file, lazy=True
+                )
+            else:
+                # only the blocks changed since the previous load are parsed again
+                inner_project_settings.properties[Path(self.project_file).resolve()] = refresh_aedt_file(
+                    previous, self.project_file
+                )
             self._logger.info(f"aedt file load time {time.time() - start}")
         elif (
             Path(self.project_file).resolve() not in inner_project_settings.properties
@@ -683,13 +692,13 @@ class Design(AedtObjects, PyAedtBase):
         try:
             if self._design_type.model_name in self.project_properties["AnsoftProject"]:
                 designs = self.project_properties["AnsoftProject"][self._design_type.model_name]
-                if isinstance(designs, list):
-                    for design in designs:
-                        if design["Name"] == self.design_name:
-                            return design
-                else:
-                    if designs["Name"] == self.design_name:
-                        return designs
+                # the lookup by name is built once for each version of the project properties
+                if self._designs_by_name[0] is not designs:
+                    by_name = {}
+                    for design in designs if isinstance(designs, list) else [designs]:
+                        by_name.setdefault(design["Name"], design)
+                    self._designs_by_name = (designs, by_name)
+                return self._designs_by_name[1].get(self.design_name)
         except Exception:
             return {}
 
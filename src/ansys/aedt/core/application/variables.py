@@ -734,6 +734,54 @@ class VariableManager(PyAedtBase):
         self.__independent_project_variables = {}
         self.__dependent_design_variables = {}
         self.__dependent_project_variables = {}
+        self._version = 0
+        self.__cache = {}
+
+    @pyaedt_function_handler()
+    def refresh(self) -> None:
+        """Discard cached variables so that they are read again from AEDT on next access.
+
+        Variables are cached between calls and the cache is only invalidated by
+        the methods of this class. Call this method after variables are modified
+        outside PyAEDT, for example in the AEDT user interface.
+
+        Examples
+        --------
+        >>> from ansys.aedt.core import Hfss
+        >>> hfss = Hfss()
+        >>> hfss.variable_manager.refresh()
+        >>> hfss.variable_manager.variables
+        """
+        self.__independent_design_variables = {}
+        self.__independent_project_variables = {}
+        self.__dependent_design_variables = {}
+        self.__dependent_project_variables = {}
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Invalidate the variable listings cached for the current version."""
+        self._version += 1
+        self.__cache.clear()
+
+    def _forget(self, name):
+        """Drop a variable from the cache so that it is read again from AEDT."""
+        for dict_var in (
+            self.__independent_design_variables,
+            self.__independent_project_variables,
+            self.__dependent_design_variables,
+            self.__dependent_project_variables,
+        ):
+            dict_var.pop(name, None)
+        self._invalidate()
+
+    def _cached_var_list(self, desktop_object):
+        """Retrieve the variable names of a desktop object, reusing the listing of the current version."""
+        key = ("names", id(desktop_object))
+        cached = self.__cache.get(key)
+        if cached is None or cached[0] is not desktop_object:
+            cached = (desktop_object, self._get_var_list_from_aedt(desktop_object))
+            self.__cache[key] = cached
+        return cached[1]
 
     @property
     def _independent_variables(self):
@@ -774,7 +822,8 @@ class VariableManager(PyAedtBase):
 
     @pyaedt_function_handler()
     def _cleanup_variables(self) -> None:
-        variables = self._get_var_list_from_aedt(self._app.odesign) + self._get_var_list_from_aedt(self._app.oproject)
+        variables = set(self._cached_var_list(self._app.odesign))
+        variables.update(self._cached_var_list(self._app.oproject))
         all_dicts = [
             self.__independent_project_variables,
             self.__independent_design_variables,
@@ -797,8 +846,9 @@ class VariableManager(PyAedtBase):
 
         """
         all_names = {}
+        known_names = self._all_variables
         for obj in object_list:
-            variables = [i for i in self._get_var_list_from_aedt(obj) if i not in list(self._all_variables.keys())]
+            variables = [i for i in self._cached_var_list(obj) if i not in known_names]
             for variable_name in variables:
                 variable_expression = self.get_expression(variable_name)
                 if variable_expression:
@@ -834,6 +884,10 @@ class VariableManager(PyAedtBase):
             Dictionary of the specified variables.
 
         """
+        key = ("dict", tuple(id(obj) for obj in object_list), dependent, independent)
+        cached = self.__cache.get(key)
+        if cached is not None and all(i is j for i, j in zip(cached[0], object_list)):
+            return dict(cached[1])
         self._update_variable_dict(object_list)
         self._cleanup_variables()
         vars_to_output = {}
@@ -851,7 +905,8 @@ class VariableManager(PyAedtBase):
         for dict_var in dicts_to_add:
             for k, v in dict_var.items():
                 vars_to_output[k] = v
-        return vars_to_output
+        self.__cache[key] = (tuple(object_list), vars_to_output)
+        return dict(vars_to_output)
 
     @pyaedt_function_handler()
     def get_expression(self, name: str) -> str:  # TODO: Should be renamed to "evaluate"
@@ -982,16 +1037,7 @@ class VariableManager(PyAedtBase):
 
         >>> aedtapp.variable_manager.set_variable["$p1"] == "30mm"
         """
-        if name in self.independent_variables:
-            if name in self.__independent_design_variables:
-                del self.__independent_design_variables[name]
-            elif name in self.__independent_project_variables:
-                del self.__independent_project_variables[name]
-        elif name in self.dependent_variables:
-            if name in self.__dependent_design_variables:
-                del self.__dependent_design_variables[name]
-            elif name in self.__dependent_project_variables:
-                del self.__dependent_project_variables[name]
+        self._forget(name)
         if not description:
             description = ""
 
@@ -1039,6 +1085,7 @@ class VariableManager(PyAedtBase):
             try:
                 if self.delete_separator(name):
                     desktop_object.Undo()
+                    self._invalidate()
                     self._logger.clear_messages()
                     return
             except Exception:
@@ -1133,8 +1180,8 @@ class VariableManager(PyAedtBase):
                     ],
                 ]
             )
-            self._cleanup_variables()
-        var_list = self._get_var_list_from_aedt(desktop_object)
+        self._forget(name)
+        var_list = self._cached_var_list(desktop_object)
         lower_case_vars = [var_name.lower() for var_name in var_list]
         if name.lower() not in lower_case_vars:
             return False
@@ -1176,6 +1223,7 @@ class VariableManager(PyAedtBase):
                         ],
                     ]
                 )
+                self._invalidate()
                 return True
             except Exception:
                 self._logger.debug("Failed to change desktop object property.")
@@ -1237,6 +1285,7 @@ class VariableManager(PyAedtBase):
             except Exception:  # pragma: no cover
                 self._logger.debug("Failed to change desktop object property.")
             else:
+                self._invalidate()
                 self._cleanup_variables()
                 return True
         return False
@@ -1344,10 +1393,10 @@ class VariableManager(PyAedtBase):
                 return var_list
 
         if "GetVariables" in desktop_object.__dir__():
-            var_list += [i for i in list(desktop_object.GetVariables()) if i not in var_list]
+            var_list = list(dict.fromkeys([*var_list, *desktop_object.GetVariables()]))
         try:
             arr_vars = list(desktop_object.GetArrayVariables())
-            var_list += [i for i in arr_vars if i not in var_list]
+            var_list = list(dict.fromkeys([*var_list, *arr_vars]))
         except Exception:
             self._app.logger.debug("Could not retrieve array variables.")
         return var_list
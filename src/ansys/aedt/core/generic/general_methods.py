@@ -220,19 +220,30 @@ def raise_exception_or_return_false(e):
 
 
 def _function_handler_wrapper(user_function, **deprecated_kwargs):
+    # Everything that does not depend on the call arguments is computed once, when the function is decorated
+    func_name = user_function.__name__
+    qualified_name = getattr(user_function, "__qualname__", func_name)
+    deprecated_names = frozenset(deprecated_kwargs)
+
     def wrapper(*args, **kwargs):
-        if deprecated_kwargs and kwargs:
-            deprecate_kwargs(user_function.__name__, kwargs, deprecated_kwargs)
+        if kwargs and not deprecated_names.isdisjoint(kwargs):
+            deprecate_kwargs(func_name, kwargs, deprecated_kwargs)
         try:
+            if not settings._trace_methods:
+                return user_function(*args, **kwargs)
             settings.time_tick = time.time()
-            out = user_function(*args, **kwargs)
+            profiler = settings._method_profiler
+            if profiler is None:
+                out = user_function(*args, **kwargs)
+            else:
+                out = profiler.call(qualified_name, user_function, args, kwargs)
             _log_method(user_function, args, kwargs)
             return out
         except MethodNotSupportedError as e:
             message = "This method is not supported in current AEDT design type."
             if settings.enable_screen_logs:
                 pyaedt_logger.error("**************************************************************")
-                pyaedt_logger.error(f"PyAEDT error on method {user_function.__name__}:  {message}. Check again")
+                pyaedt_logger.error(f"PyAEDT error on method {func_name}:  {message}. Check again")
                 pyaedt_logger.error("**************************************************************")
                 pyaedt_logger.error("")
             if settings.enable_file_logs:
@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Opt-in profiler of the methods decorated with ``pyaedt_function_handler``.
+
+The profiler records the number of calls, the cumulative and self wall time of every decorated method and the
+number of calls made to the underlying AEDT ``oDesign``, ``oEditor`` and ``oModule`` objects. These objects are
+wrapped by :class:`AedtObjectProxy` instances on the applications attached to the profiler, so that every call
+going through COM or gRPC is counted and timed.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+import json
+from pathlib import Path
+import threading
+import time
+
+from ansys.aedt.core.base import PyAedtBase
+from ansys.aedt.core.generic.settings import settings
+from ansys.aedt.core.internal.errors import AEDTRuntimeError
+
+# Attributes of the applications holding AEDT objects, and the kind of object they hold
+AEDT_OBJECT_ATTRIBUTES = {
+    "_odesign": "oDesign",
+    "_oeditor": "oEditor",
+    "_layouteditor": "oEditor",
+    "_oanalysis": "oModule",
+    "_oboundary": "oModule",
+    "_oexcitation": "oModule",
+    "_ofieldsreporter": "oModule",
+    "_oimport_export": "oModule",
+    "_omatrix": "oModule",
+    "_omaxwell_parameters": "oModule",
+    "_omeshmodule": "oModule",
+    "_omodel_setup": "oModule",
+    "_omonitor": "oModule",
+    "_onetwork_data_explorer": "oModule",
+    "_ooptimetrics": "oModule",
+    "_ooutput_variable": "oModule",
+    "_oradfield": "oModule",
+    "_oreportsetup": "oModule",
+    "_osolution": "oModule",
+}
+# AEDT methods returning other AEDT objects, which are wrapped as well
+AEDT_OBJECT_GETTERS = {"GetModule": "oModule", "GetEditor": "oEditor", "SetActiveEditor": "oEditor"}
+SORT_KEYS = ["calls", "cumulative_time", "self_time", "aedt_calls", "cumulative_aedt_calls"]
+
+
+class AedtObjectProxy:
+    """Proxy counting the calls made to an AEDT object while a :class:`MethodProfiler` is running.
+
+    When no profiler is running, calls are forwarded to the AEDT object without being recorded.
+
+    Parameters
+    ----------
+    aedt_object : object
+        AEDT object to wrap, such as ``oDesign``, ``oEditor`` or a module.
+    kind : str
+        Kind of AEDT object, used to label the calls. For example, ``"oEditor"``.
+    """
+
+    __slots__ = ("_aedt_object", "_kind")
+
+    def __init__(self, aedt_object, kind: str) -> None:
+        object.__setattr__(self, "_aedt_object", aedt_object)
+        object.__setattr__(self, "_kind", kind)
+
+    def __getattr__(self, name):
+        attribute = getattr(self._aedt_object, name)
+        if not callable(attribute):
+            return attribute
+        kind = self._kind
+
+        def aedt_call(*args, **kwargs):
+            profiler = settings._method_profiler
+            if profiler is None:
+                return attribute(*args, **kwargs)
+            args = [arg._aedt_object if isinstance(arg, AedtObjectProxy) else arg for arg in args]
+            start = time.perf_counter()
+            try:
+                out = attribute(*args, **kwargs)
+            finally:
+                profiler.record_aedt_call(kind, name, time.perf_counter() - start)
+            if out is not None and name in AEDT_OBJECT_GETTERS:
+                out = AedtObjectProxy(out, AEDT_OBJECT_GETTERS[name])
+            return out
+
+        return aedt_call
+
+    def __setattr__(self, name, value) -> None:
+        setattr(self._aedt_object, name, value)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AedtObjectProxy):
+            other = other._aedt_object
+        return self._aedt_object == other
+
+    def __hash__(self) -> int:
+        return hash(self._aedt_object)
+
+    def __bool__(self) -> bool:
+        return bool(self._aedt_object)
+
+    def __repr__(self) -> str:
+        return repr(self._aedt_object)
+
+
+class MethodProfiler(PyAedtBase):
+    """Profiler of the methods decorated with ``pyaedt_function_handler``.
+
+    While the profiler is running, every decorated method records its number of calls, its cumulative wall time,
+    which includes the time spent in the methods it calls, and its self wall time, which excludes the time spent in
+    decorated methods and AEDT calls. The calls made to the ``oDesign``, ``oEditor`` and ``oModule`` objects of the
+    attached applications are counted and timed as well.
+
+    Parameters
+    ----------
+    apps : list, optional
+        Applications whose AEDT objects are wrapped while the profiler is running.
+        The default is ``None``, in which case only the decorated methods are profiled.
+
+    Examples
+    --------
+    >>> from ansys.aedt.core import Hfss
+    >>> from ansys.aedt.core.generic.profiler import MethodProfiler
+    >>> hfss = Hfss()
+    >>> with MethodProfiler(hfss) as profiler:
+    ...     hfss.modeler.create_box([0, 0, 0], [10, 10, 10])
+    >>> print(profiler.report())
+    >>> profiler.write_collapsed_stacks("pyaedt.folded")
+    >>> profiler.to_json("pyaedt_profile.json")
+    """
+
+    def __init__(self, apps=None) -> None:
+        if apps is not None and not isinstance(apps, (list, tuple)):
+            apps = [apps]
+        self._apps = list(apps) if apps else []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._functions = {}
+        self._aedt_calls = {}
+        self._stacks = defaultdict(float)
+
+    def __enter__(self) -> MethodProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the profiler is recording the calls."""
+        return settings._method_profiler is self
+
+    @property
+    def functions(self) -> dict:
+        """Statistics of the decorated methods, keyed by qualified name.
+
+        Each entry contains the ``calls``, ``cumulative_time`` and ``self_time`` in seconds, the ``aedt_calls``
+        made directly by the method, and the ``cumulative_aedt_calls`` including the ones made by the methods it calls.
+        """
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._functions.items()}
+
+    @property
+    def aedt_calls(self) -> dict:
+        """Number of calls and wall time of the AEDT methods, keyed by ``"<kind>.<method>"``."""
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._aedt_calls.items()}
+
+    @property
+    def stacks(self) -> dict:
+        """Self wall time in seconds of every call stack, keyed by the ``;`` separated names of the stack."""
+        with self._lock:
+            return dict(self._stacks)
+
+    def start(self) -> None:
+        """Start recording the calls and wrap the AEDT objects of the attached applications."""
+        if settings._method_profiler is not None and not self.is_running:
+            raise AEDTRuntimeError("Another method profiler is already running.")
+        for app in self._apps:
+            self._wrap(app)
+        settings._method_profiler = self
+        settings._trace_methods = True
+
+    def stop(self) -> None:
+        """Stop recording the calls and restore the AEDT objects of the attached applications."""
+        if self.is_running:
+            settings._method_profiler = None
+            settings._trace_methods = bool(settings.enable_debug_logger or settings.enable_debug_edb_logger)
+        for app in self._apps:
+            self._unwrap(app)
+
+    def attach(self, app) -> None:
+        """Attach an application, whose AEDT objects are wrapped while the profiler is running.
+
+        Parameters
+        ----------
+        app : :class:`ansys.aedt.core.application.design.Design`
+            Application to attach.
+        """
+        if app not in self._apps:
+            self._apps.append(app)
+            if self.is_running:
+                self._wrap(app)
+
+    def reset(self) -> None:
+        """Clear the recorded statistics."""
+        with self._lock:
+            self._functions.clear()
+            self._aedt_calls.clear()
+            self._stacks.clear()
+
+    def call(self, name: str, function, args, kwargs):
+        """Call a function and record its statistics.
+
+        Parameters
+        ----------
+        name : str
+            Qualified name of the function.
+        function : callable
+            Function to call.
+        args : tuple
+            Positional arguments of the call.
+        kwargs : dict
+            Keyword arguments of the call.
+
+        Returns
+        -------
+        object
+            Output of the function.
+        """
+        stack = self._stack()
+        # Name, time spent in the callees, AEDT calls made directly and AEDT calls made by the whole call tree
+        frame = [name, 0.0, 0, 0]
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            self._record(stack, frame, elapsed)
+
+    def record_aedt_call(self, kind: str, method: str, elapsed: float) -> None:
+        """Record a call made to an AEDT object.
+
+        The call is attributed to the decorated method currently running, if any.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of AEDT object. For example, ``"oEditor"``.
+        method : str
+            Name of the AEDT method.
+        elapsed : float
+            Wall time of the call in seconds.
+        """
+        label = f"{kind}.{method}"
+        stack = self._stack()
+        if stack:
+            caller = stack[-1]
+            caller[1] += elapsed
+            caller[2] += 1
+            caller[3] += 1
+        path = ";".join([frame[0] for frame in stack] + [label])
+        with self._lock:
+            entry = self._aedt_calls.setdefault(label, {"calls": 0, "time": 0.0})
+            entry["calls"] += 1
+            entry["time"] += elapsed
+            self._stacks[path] += elapsed
+
+    def report(self, sort_by: str = "cumulative_time", limit: int | None = None) -> str:
+        """Format the statistics of the decorated methods as a table.
+
+        Parameters
+        ----------
+        sort_by : str, optional
+            Statistic used to sort the methods in descending order. Options are ``"calls"``,
+            ``"cumulative_time"``, ``"self_time"``, ``"aedt_calls"`` and ``"cumulative_aedt_calls"``.
+            The default is ``"cumulative_time"``.
+        limit : int, optional
+            Maximum number of methods to report. The default is ``None``, in which case all methods are reported.
+
+        Returns
+        -------
+        str
+            Table of the methods statistics, followed by the table of the AEDT calls sorted by wall time.
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Invalid sort key '{sort_by}'. Options are: {', '.join(SORT_KEYS)}.")
+        functions = sorted(self.functions.items(), key=lambda item: item[1][sort_by], reverse=True)[:limit]
+        aedt_calls = sorted(self.aedt_calls.items(), key=lambda item: item[1]["time"], reverse=True)
+        width = max([len(name) for name, _ in functions + aedt_calls] + [len("AEDT method")])
+        lines = [
+            f"{'Method':<{width}} {'Calls':>9} {'Cumulative (s)':>15} {'Self (s)':>12} {'AEDT calls':>11} "
+            f"{'Cumulative AEDT calls':>22}"
+        ]
+        for name, entry in functions:
+            lines.append(
+                f"{name:<{width}} {entry['calls']:>9} {entry['cumulative_time']:>15.6f} {entry['self_time']:>12.6f} "
+                f"{entry['aedt_calls']:>11} {entry['cumulative_aedt_calls']:>22}"
+            )
+        if aedt_calls:
+            lines.extend(["", f"{'AEDT method':<{width}} {'Calls':>9} {'Time (s)':>15}"])
+            for name, entry in aedt_calls:
+                lines.append(f"{name:<{width}} {entry['calls']:>9} {entry['time']:>15.6f}")
+        return "\n".join(lines)
+
+    def write_collapsed_stacks(self, output_file: str | Path) -> Path:
+        """Write the call stacks in the collapsed format used by flamegraph tools.
+
+        Each line contains the ``;`` separated names of a stack followed by its self wall time in microseconds.
+        The AEDT calls appear as the leaves of the stacks.
+
+        Parameters
+        ----------
+        output_file : str or :class:`pathlib.Path`
+            Full path of the output file.
+
+        Returns
+        -------
+        :class:`pathlib.Path`
+            Path of the output file.
+        """
+        output_file = Path(output_file)
+        with open(output_file, "w") as file:
+            for path, elapsed in self.stacks.items():
+                file.write(f"{path} {round(elapsed * 1e6)}\n")
+        return output_file
+
+    def to_json(self, output_file: str | Path | None = None) -> dict:
+        """Export the statistics to a dictionary, and optionally to a JSON file.
+
+        Parameters
+        ----------
+        output_file : str or :class:`pathlib.Path`, optional
+            Full path of the JSON file. The default is ``None``, in which case no file is written.
+
+        Returns
+        -------
+        dict
+            Dictionary with the ``functions``, ``aedt_calls`` and ``stacks`` statistics.
+        """
+        data = {"functions": self.functions, "aedt_calls": self.aedt_calls, "stacks": self.stacks}
+        if output_file:
+            with open(output_file, "w") as file:
+                json.dump(data, file, indent=4)
+        return data
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, stack, frame, elapsed) -> None:
+        name, child_time, aedt_calls, cumulative_aedt_calls = frame
+        names = [caller[0] for caller in stack]
+        if stack:
+            caller = stack[-1]
+            caller[1] += elapsed
+            caller[3] += cumulative_aedt_calls
+        with self._lock:
+            entry = self._functions.setdefault(
+                name,
+                {"calls": 0, "cumulative_time": 0.0, "self_time": 0.0, "aedt_calls": 0, "cumulative_aedt_calls": 0},
+            )
+            entry["calls"] += 1
+            entry["self_time"] += elapsed - child_time
+            entry["aedt_calls"] += aedt_calls
+            # Recursive calls are already included in the cumulative statistics of the outermost call
+            if name not in names:
+                entry["cumulative_time"] += elapsed
+                entry["cumulative_aedt_calls"] += cumulative_aedt_calls
+            self._stacks[";".join(names + [name])] += elapsed - child_time
+
+    @staticmethod
+    def _wrap(app) -> None:
+        attributes = vars(app)
+        for attribute, kind in AEDT_OBJECT_ATTRIBUTES.items():
+            aedt_object = attributes.get(attribute)
+            if aedt_object is not None and not isinstance(aedt_object, AedtObjectProxy):
+                setattr(app, attribute, AedtObjectProxy(aedt_object, kind))
+
+    @staticmethod
+    def _unwrap(app) -> None:
+        attributes = vars(app)
+        for attribute in AEDT_OBJECT_ATTRIBUTES:
+            aedt_object = attributes.get(attribute)
+            if isinstance(aedt_object, AedtObjectProxy):
+                setattr(app, attribute, aedt_object._aedt_object)
@@ -86,6 +86,9 @@ ALLOWED_LSF_SETTINGS = [
 ALLOWED_GENERAL_SETTINGS = [
     "lazy_load",
     "objects_lazy_load",
+    "aedt_file_cache_dir",
+    "aedt_file_cache_size",
+    "ffd_cache",
     "aedt_version",
     "desktop_launch_timeout",
     "disable_bounding_box_sat",
@@ -172,6 +175,10 @@ class Settings(PyAedtBase):
         self.__enable_debug_geometry_operator_logger: bool = False
         self.__enable_debug_internal_methods_logger: bool = False
         self.__enable_debug_logger: bool = False
+        # Single gate checked on every call of the methods decorated with ``pyaedt_function_handler``
+        self._trace_methods: bool = False
+        # Active ``MethodProfiler`` recording the methods decorated with ``pyaedt_function_handler``
+        self._method_profiler = None
         self.__global_log_file_name: str = generate_log_filename()
         self.__enable_global_log_file: bool = True
         self.__enable_local_log_file: bool = False
@@ -223,6 +230,9 @@ class Settings(PyAedtBase):
         self.__wait_for_license: bool = False
         self.__lazy_load: bool = True
         self.__objects_lazy_load: bool = True
+        self.__aedt_file_cache_dir: str | None = None
+        self.__aedt_file_cache_size: float = 1024
+        self.__ffd_cache: bool = False
         self.__skip_license_check: bool = True
         # Previously 'public' attributes
         self.__formatter: logging.Formatter | None = None
@@ -454,6 +464,7 @@ class Settings(PyAedtBase):
     @enable_debug_edb_logger.setter
     def enable_debug_edb_logger(self, val: bool) -> None:
         self.__enable_debug_edb_logger = val
+        self._trace_methods = bool(self.__enable_debug_logger or val or self._method_profiler)
 
     @property
     def enable_debug_grpc_api_logger(self) -> bool:
@@ -496,6 +507,7 @@ class Settings(PyAedtBase):
     @enable_debug_logger.setter
     def enable_debug_logger(self, val: bool) -> None:
         self.__enable_debug_logger = val
+        self._trace_methods = bool(val or self.__enable_debug_edb_logger or self._method_profiler)
 
     @property
     def aedt_log_file(self) -> str:
@@ -706,6 +718,45 @@ class Settings(PyAedtBase):
     def lazy_load(self, value: bool) -> None:
         self.__lazy_load = value
 
+    @property
+    def aedt_file_cache_dir(self) -> str | None:
+        """Directory of the persistent cache of the parsed AEDT files.
+
+        The default is ``None``, in which case the cache is disabled. The cache stores
+        pickled data, so the directory must not be writable by other users.
+        """
+        return self.__aedt_file_cache_dir
+
+    @aedt_file_cache_dir.setter
+    def aedt_file_cache_dir(self, value: str | Path | None) -> None:
+        self.__aedt_file_cache_dir = str(value) if value else None
+
+    @property
+    def aedt_file_cache_size(self) -> float:
+        """Maximum size in megabytes of the persistent cache of the parsed AEDT files.
+
+        The least recently used entries are removed when the size is exceeded. The default value is ``1024``.
+        """
+        return self.__aedt_file_cache_size
+
+    @aedt_file_cache_size.setter
+    def aedt_file_cache_size(self, value: float) -> None:
+        self.__aedt_file_cache_size = value
+
+    @property
+    def ffd_cache(self) -> bool:
+        """Flag for enabling and disabling the side-car cache of the decoded far field pattern files.
+
+        When enabled, the fields of each ``.ffd`` file are saved next to it in ``.ffd.npz`` files
+        that are reused while the ``.ffd`` file is unchanged. The folder of the ``.ffd`` files must be
+        writable. The default value is ``False``.
+        """
+        return self.__ffd_cache
+
+    @ffd_cache.setter
+    def ffd_cache(self, value: bool) -> None:
+        self.__ffd_cache = value
+
     @property
     def wait_for_license(self) -> bool:
         """Enable or disable the use of the flag `-waitforlicense` when launching Electronic Desktop.
@@ -23,38 +23,82 @@
 # SOFTWARE.
 from __future__ import annotations
 
+import bisect
+from collections.abc import MutableMapping
+from collections.abc import MutableSequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import functools
+import hashlib
+import mmap
+import os
 from pathlib import Path
+import pickle  # nosec
 import re
+import tempfile
+import weakref
+
+import numpy as np
 
 from ansys.aedt.core.generic.file_utils import open_file
 from ansys.aedt.core.generic.general_methods import settings
+from ansys.aedt.core.internal.errors import AEDTRuntimeError
 
 # --------------------------------------------------------------------
 # public interface
 
 
-def load_entire_aedt_file(filename: str | Path) -> dict:
+def load_entire_aedt_file(filename: str | Path, lazy: bool = False, typed_arrays: bool = False) -> dict:
     """Load the entire AEDT file and return the dictionary
 
     Parameters
     ----------
     filename :
         AEDT filename with path
+    lazy : bool, optional
+        Whether to index the file and parse each block only when it is first accessed.
+        The default is ``False``, in which case the whole file is parsed.
+    typed_arrays : bool, optional
+        Whether to decode the lists made only of numbers, like ``Faces(...)`` or ``Edges(...)``,
+        as NumPy arrays instead of lists. The default is ``False``.
+
+    Notes
+    -----
+    When ``settings.aedt_file_cache_dir`` is set, the decoded file is stored in a persistent
+    cache and reused as long as the file path, size and modification time do not change.
+    Lazy loads use the cache if an entry exists, but do not populate it.
 
     Returns
     -------
     dict
-        dictionary containing the decoded AEDT file
+        dictionary containing the decoded AEDT file. When ``lazy=True``, it is an
+        :class:`AedtLazyDict` instance.
 
     """
     settings.logger.reset_timer()
     settings.logger.info(f"Parsing {filename}.")
-    f_d = _load_entire_aedt_file(Path(filename).resolve(strict=False))
+    file_path = Path(filename).resolve(strict=False)
+    cache_entry = _cache_entry(file_path, typed_arrays)
+    if cache_entry:
+        f_d = _read_cache_entry(cache_entry)
+        if f_d is not None:
+            settings.logger.info_timer(f"File {filename} correctly loaded from cache.")
+            return f_d
+    if lazy and file_path.is_file():
+        f_d = _load_lazy_aedt_file(file_path, typed_arrays)
+        settings.logger.info_timer(f"File {filename} correctly indexed.")
+        return f_d
+    f_d = _load_entire_aedt_file(file_path, typed_arrays)
+    if cache_entry:
+        _write_cache_entry(cache_entry, f_d)
     settings.logger.info_timer(f"File {filename} correctly loaded.")
     return f_d
 
 
-def load_keyword_in_aedt_file(filename: str | Path, keyword: str, design_name: str | None = None) -> dict:
+def load_keyword_in_aedt_file(
+    filename: str | Path, keyword: str, design_name: str | None = None, typed_arrays: bool = False
+) -> dict:
     """Load s specific keyword in the AEDT file and return the dictionary
 
     Parameters
@@ -63,6 +107,11 @@ def load_keyword_in_aedt_file(filename: str | Path, keyword: str, design_name: s
         AEDT filename with path
     keyword :
         keyword to search and load
+    design_name : str, optional
+        Name of the design containing the keyword. The default is ``None``.
+    typed_arrays : bool, optional
+        Whether to decode the lists made only of numbers as NumPy arrays instead of lists.
+        The default is ``False``.
 
     Returns
     -------
@@ -70,7 +119,90 @@ def load_keyword_in_aedt_file(filename: str | Path, keyword: str, design_name: s
         dictionary containing the decoded AEDT file
 
     """
-    return _load_keyword_in_aedt_file(filename, keyword, design_name)
+    if Path(filename).is_file():
+        return _load_indexed_keyword_in_aedt_file(filename, keyword, design_name, typed_arrays)
+    return _load_keyword_in_aedt_file(filename, keyword, design_name, typed_arrays)
+
+
+def index_aedt_file(filename: str | Path) -> AedtFileIndex:
+    """Build the byte-offset index of the blocks of an AEDT file.
+
+    The index is cached and reused as long as the size and the modification
+    time of the file do not change.
+
+    Parameters
+    ----------
+    filename : str or :class:`pathlib.Path`
+        AEDT filename with path.
+
+    Returns
+    -------
+    :class:`AedtFileIndex`
+        Index of the ``$begin``/``$end`` blocks of the file.
+    """
+    file_path = Path(filename).resolve(strict=False)
+    stat = file_path.stat()
+    return _cached_index(str(file_path), stat.st_size, stat.st_mtime_ns)
+
+
+def refresh_aedt_file(data: dict, filename: str | Path) -> dict:
+    """Update the dictionary of an AEDT file after the file changed.
+
+    Only the top-level blocks and the designs whose content changed are parsed again. The other
+    values are taken from the previous dictionary.
+
+    Parameters
+    ----------
+    data : dict
+        Dictionary previously returned by :func:`load_entire_aedt_file` with ``lazy=True``.
+    filename : str or :class:`pathlib.Path`
+        AEDT filename with path.
+
+    Returns
+    -------
+    dict
+        Dictionary containing the decoded AEDT file. When ``data`` is not an :class:`AedtLazyDict`
+        instance, the whole file is loaded again.
+    """
+    file_path = Path(filename).resolve(strict=False)
+    if not isinstance(data, AedtLazyDict) or not file_path.is_file():
+        return load_entire_aedt_file(filename, lazy=True)
+    settings.logger.reset_timer()
+    index = index_aedt_file(file_path)
+    if index is data._index:
+        return data
+    f_d = _load_lazy_aedt_file(file_path, data._typed_arrays)
+    _merge_unchanged_blocks(f_d, data)
+    settings.logger.info_timer(f"File {filename} correctly refreshed.")
+    return f_d
+
+
+def load_aedt_files(
+    filenames: list[str | Path], max_workers: int | None = None, use_processes: bool = False
+) -> list[dict]:
+    """Load several AEDT files concurrently.
+
+    Parameters
+    ----------
+    filenames : list
+        List of AEDT filenames with path.
+    max_workers : int, optional
+        Maximum number of workers. The default is ``None``, in which case
+        the default of :mod:`concurrent.futures` executors is used.
+    use_processes : bool, optional
+        Whether to parse the files in separate processes instead of threads.
+        Processes avoid the contention on the Python global interpreter lock
+        but the decoded dictionaries must be transferred back to the caller.
+        The default is ``False``.
+
+    Returns
+    -------
+    list of dict
+        Dictionaries containing the decoded AEDT files, in the same order as ``filenames``.
+    """
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=max_workers) as executor:
+        return list(executor.map(load_entire_aedt_file, filenames))
 
 
 # --------------------------------------------------------------------
@@ -88,6 +220,8 @@ _key_parse = re.compile(r"(^'(?P<KEY1>.+?)')(?<=')=(?P<VAL1>.+$)|(?P<KEY2>^.+?)=
 _value_parse1 = re.compile(r"\s")
 _value_parse2 = re.compile(r"^'([^']*\s[^']*)(?=')")
 _begin_search = re.compile(r"\$begin '(.+)'")
+_idmap_search = re.compile(r"^\w+IDMap\(.*\)$", re.IGNORECASE)
+_idmap_list = re.compile(r"^(?P<SKEY>[^\s=]+?)\((?P<LIST>.*)\)")
 
 # set recognized keywords
 _recognized_keywords = [
@@ -100,11 +234,7 @@ _recognized_keywords = [
     "PostProcessingCells",
 ]
 _recognized_subkeys = ["simple(", "IDMap(", "WireSeg(", "PC(", "Range("]
-
-# global variables
-_all_lines = []
-_len_all_lines = 0
-_count = 0
+_recognized_subkeys_lower = [subkey.lower() for subkey in _recognized_subkeys]
 
 
 def get_designs(filename: str | Path) -> list[str]:
@@ -149,26 +279,71 @@ def _parse_value(v):
     return pv
 
 
-def _separate_list_elements(v):
-    """
+def _separate_list_elements(v, typed_arrays=False):
+    """Decode the elements of a comma separated list.
 
     Parameters
     ----------
-    v :
-
+    v : str
+        Content of the list.
+    typed_arrays : bool, optional
+        Whether to return lists made only of numbers as NumPy arrays. The default is ``False``.
 
     Returns
     -------
-
+    list or :class:`numpy.ndarray`
+        Decoded elements.
     """
     if "(" in v or "=" in v:
         l1 = _split_list_elements.split(v)
     else:
         l1 = v.split(",")
+        numbers = _parse_numbers(l1, typed_arrays)
+        if numbers is not None:
+            return numbers
     l2 = [_parse_value(i.strip()) for i in l1]
     return l2
 
 
+def _parse_numbers(elements, typed_arrays=False):
+    """Decode at once a list of numbers.
+
+    Integers and floats are decoded as they are by ``_parse_value``.
+
+    Parameters
+    ----------
+    elements : list of str
+        Elements of the list.
+    typed_arrays : bool, optional
+        Whether to return a NumPy array. The default is ``False``.
+
+    Returns
+    -------
+    list or :class:`numpy.ndarray` or None
+        Decoded numbers, ``None`` if one of the elements is not a number.
+    """
+    if typed_arrays:
+        try:
+            return np.array(elements, dtype=np.int64)
+        except OverflowError:
+            return None
+        except ValueError:
+            pass
+        try:
+            return np.array(elements, dtype=np.float64)
+        except ValueError:
+            return None
+    try:
+        return list(map(int, elements))
+    except ValueError:
+        pass
+    try:
+        # int() only fails on these characters among the ones accepted by float()
+        return [float(e) if "." in e or "e" in e or "E" in e else int(e) for e in elements]
+    except ValueError:
+        return None
+
+
 def _decode_recognized_subkeys(sk, d) -> bool:
     """Special decodings for sub-keys belonging to _recognized_subkeys.
 
@@ -193,8 +368,8 @@ def _decode_recognized_subkeys(sk, d) -> bool:
                 elems[0] = "thermal_expansion_coefficient"  # fix a typo in the AMAT files. AEDT supports both strings!
             d[elems[0]] = str(elems[1])  # convert to string as it is dedicated to material props
             return True
-    elif re.search(r"^\w+IDMap\(.*\)$", sk, re.IGNORECASE):  # check if the format is AAKeyIDMap('10'=56802, '7'=56803)
-        m = re.search(r"^(?P<SKEY>[^\s=]+?)\((?P<LIST>.*)\)", sk)
+    elif _idmap_search.search(sk):  # check if the format is AAKeyIDMap('10'=56802, '7'=56803)
+        m = _idmap_list.search(sk)
         if m and "idmap" in m.group("SKEY").lower():  # extra verification.
             k = m.group("SKEY")
             if m.group("LIST"):
@@ -230,109 +405,7 @@ def _decode_recognized_subkeys(sk, d) -> bool:
     return False
 
 
-def _decode_recognized_key(keyword, line, d) -> bool:
-    """Special decodings for keys belonging to _recognized_keywords
-
-    Parameters
-    ----------
-    keyword : str
-        dictionary key recognized
-
-    line : str
-        The line following the recognized key
-
-    d : dict
-        Active dictionary.
-
-    Returns
-    -------
-    bool
-        Returns ``True`` if it confirms and decodes a recognized key, ``False`` otherwise.
-
-    """
-    global _count
-    if keyword == _recognized_keywords[0]:  # 'CurvesInfo'
-        m = re.search(r"\'(\d+)\'\((.*)\)$", line)
-        if m:
-            k = m.group(1)
-            v = m.group(2)
-            v2 = v.replace("\\'", '"')
-            v3 = _separate_list_elements(v2)
-            d[k] = v3
-        else:  # pragma: no cover
-            return False
-    elif keyword == _recognized_keywords[1]:  # 'Sweep Operations'
-        d["add"] = []
-        line = _all_lines[_count + 1]
-        while line.startswith("add("):
-            d["add"].append(line.replace("add", "").translate({ord(i): None for i in " ()'"}).split(","))
-            _count += 1
-            line = _all_lines[_count + 1]
-    elif keyword == _recognized_keywords[2]:  # PropDisplayMap
-        pattern = r".+\((.+) Text\((.+) ExtentRect\((.+)\)\)\)"
-        match = re.search(pattern, line)
-        d["Name"] = []
-        for i in match.group(1).split(", "):
-            d["Name"].append(_parse_value(i))
-        d["Name"].append("Text:=")
-        temp_list = []
-        for i in match.group(2).split(", "):
-            temp_list.append(_parse_value(i))
-        temp_list.append("ExtentRect:=")
-        temp_list.append([_parse_value(i) for i in match.group(3).split(", ")])
-        d["Name"].append(temp_list)
-    elif keyword in _recognized_keywords[3:6]:  # Cells, Active, Rotation
-        li = _count
-        line_m = _all_lines[li]
-        li += 1
-        line_n = _all_lines[li]
-        if line_m[:2] != "m=" or line_n[:2] != "n=":  # pragma: no cover
-            return False
-        m = int(re.search(r"[m|n]=(\d+)", line_m).group(1))
-        d["rows"] = m
-        n = int(re.search(r"[m|n]=(\d+)", line_n).group(1))
-        d["columns"] = n
-        d["matrix"] = []
-        for i in range(m):
-            li += 1
-            r = re.search(r"\$begin 'r(\d+)'", _all_lines[li])
-            if not r or i != int(r.group(1)):  # pragma: no cover
-                return False  # there should be a row definition
-            d["matrix"].append([])
-            for _ in range(n):
-                li += 1
-                c = re.search(r"c\((.+)\)", _all_lines[li])
-                if not c:  # pragma: no cover
-                    return False  # there should be a column definition
-                if keyword == "Cells":
-                    c = int(c.group(1))
-                elif keyword == "Active":
-                    c = c.group(1).lower() == "true"
-                elif keyword == "Rotation":
-                    c = int(c.group(1)) * 90
-                d["matrix"][i].append(c)
-            li += 1
-            r = re.search(r"\$end 'r(\d+)'", _all_lines[li])
-            if not r or i != int(r.group(1)):  # pragma: no cover
-                return False  # there should be a row definition
-        _count = li
-    elif keyword == _recognized_keywords[6]:  # PostProcessingCells
-        li = _count
-        while _all_lines[li].startswith("OneCell"):
-            m = re.search(r"OneCell\((\d+), '(\d+)', '(\d+)'\)", _all_lines[li])
-            if m:
-                try:
-                    d[int(m.group(1))] = [int(m.group(2)), int(m.group(3))]
-                except ValueError:  # pragma: no cover
-                    continue
-            li += 1
-        _count = li - 1
-    else:  # pragma: no cover
-        raise AttributeError(f"Keyword {keyword} is supposed to be in the recognized_keywords list")
-    return True
-
-
-def _decode_subkey(line, d) -> None:
+def _decode_subkey(line, d, typed_arrays=False) -> None:
     """
 
     Parameters
@@ -347,20 +420,21 @@ def _decode_subkey(line, d) -> None:
 
     """
     # send recognized sub-keys to _decode_recognized_subkeys (Case insensitive search, detailed search is inside)
-    for rsk in _recognized_subkeys:
-        if rsk.lower() in line.lower():  # here we simply search if one of the _recognized_subkeys is in line
+    line_lower = line.lower()
+    for rsk in _recognized_subkeys_lower:
+        if rsk in line_lower:  # here we simply search if one of the _recognized_subkeys is in line
             if _decode_recognized_subkeys(line, d):  # the exact search is done inside the _decode_recognized_subkeys
                 return  # if there is a match we stop the _decode_key, otherwise we keep going
 
     # create a list for subkey(l1, l2, l3)
     m = _round_bracket_list.search(line)
     if m and m.group("SKEY1"):
-        v = _separate_list_elements(m.group("LIST1"))
+        v = _separate_list_elements(m.group("LIST1"), typed_arrays)
         k = m.group("SKEY1")
         d[k] = v
         return  # if there is a match we stop the _decode_key, otherwise we keep going
     elif m and m.group("SKEY2"):
-        v = _separate_list_elements(m.group("LIST2"))
+        v = _separate_list_elements(m.group("LIST2"), typed_arrays)
         k = m.group("SKEY2")
         d[k] = v
         return  # if there is a match we stop the _decode_key, otherwise we keep going
@@ -368,12 +442,12 @@ def _decode_subkey(line, d) -> None:
     # create a list for subkey[n: 1, 2, ...n]
     m = _square_bracket_list.search(line)
     if m and m.group("SKEY1"):
-        v = _separate_list_elements(m.group("LIST1"))
+        v = _separate_list_elements(m.group("LIST1"), typed_arrays)
         k = m.group("SKEY1")
         d[k] = v
         return  # if there is a match we stop the _decode_key, otherwise we keep going
     elif m and m.group("SKEY2"):
-        v = _separate_list_elements(m.group("LIST2"))
+        v = _separate_list_elements(m.group("LIST2"), typed_arrays)
         k = m.group("SKEY2")
         d[k] = v
         return  # if there is a match we stop the _decode_key, otherwise we keep going
@@ -411,109 +485,297 @@ def _decode_subkey(line, d) -> None:
         d[k] = None
 
 
-def _walk_through_structure(keyword, save_dict, design_name=None):
-    """
+def _decode_aedt_lines(content: bytes) -> list[str]:
+    """Decode the ASCII lines of an AEDT file content and discard the binary ones.
 
     Parameters
     ----------
-    keyword :
-
-    save_dict :
-
+    content : bytes
+        Raw content of the AEDT file or of a portion of it.
 
     Returns
     -------
-
-    """
-    global _count
-    begin_key = f"$begin '{keyword}'"
-    end_key = f"$end '{keyword}'"
-    design_key = None
-    design_found = True
-    if design_name:
-        design_key = f"Name='{design_name}'"
-        design_found = False
-    found = False
-    saved_value = None
-    while _count < _len_all_lines:
-        line = _all_lines[_count]
-        if design_key and design_key in line:
-            design_found = True
-        # begin_key is found
-        if begin_key == line and design_found:
-            found = True
-            saved_value = save_dict.get(keyword)  # if the keyword is already present, save it
-            save_dict[keyword] = {}
-            _count += 1
-            continue
-        # end_key is found
-        if end_key == line and design_found:
-            break
-        # between begin_key and end_key
-        if found:
-            b = _begin_search.search(line)
-            if b:  # walk down a level
-                nextlvl_begin_key = b.group(1)
-                _walk_through_structure(nextlvl_begin_key, save_dict[keyword])
-            elif keyword in _recognized_keywords:
-                confirmed = _decode_recognized_key(keyword, line, save_dict[keyword])
-                if not confirmed:  # pragma: no cover
-                    # decode the line normally, since recognized key is not successful
-                    _decode_subkey(line, save_dict[keyword])
-            else:  # decode key
-                _decode_subkey(line, save_dict[keyword])
-        _count += 1
-    # recompose value if list
-    if saved_value:
-        # makes the value a list, if it's not already
-        if not isinstance(saved_value, list):
-            saved_value = [saved_value]
-        saved_value.append(save_dict[keyword])
-        save_dict[keyword] = saved_value
-    return _count
-
-
-def _read_aedt_file(filename: str | Path) -> None:
-    """Read the entire AEDT file discard binary and put ascii line in a list.
-
-    Parameters
-    ----------
-    filename : str | Path
-        AEDT filename with path
-
-        AEDT filename with path
-
-    Returns
-    -------
-
+    list of str
+        Decoded lines, stripped of the leading indentation.
     """
-    global _all_lines
-    global _len_all_lines
-    global _count
-
-    # read the AEDT file
-    with open_file(filename, "rb") as aedt_fh:
-        raw_lines = aedt_fh.read().splitlines()
     ascii_lines = []
-    for raw_line in raw_lines:
+    for raw_line in content.splitlines():
         try:
             ascii_lines.append(raw_line.decode("utf-8").lstrip(" \t"))
         except UnicodeDecodeError:
             continue
     ascii_content = "\n".join(ascii_lines)
     # combine subsequent lines when the line ends in \
-    _all_lines = ascii_content.replace("\\\n", "").splitlines()
-    _len_all_lines = len(_all_lines)
-    _count = 0
+    return ascii_content.replace("\\\n", "").splitlines()
 
 
-def _load_entire_aedt_file(filename):
+class _AedtParser:
+    """Sequential parser of the lines of an AEDT file.
+
+    The lines and the cursor are kept in the instance, so that different files
+    can be parsed at the same time from different threads.
+
+    Parameters
+    ----------
+    lines : list of str
+        Decoded lines of the AEDT file.
+    typed_arrays : bool, optional
+        Whether to decode the lists made only of numbers as NumPy arrays. The default is ``False``.
+    """
+
+    def __init__(self, lines: list[str], typed_arrays: bool = False) -> None:
+        self.lines = lines
+        self.count = 0
+        self.typed_arrays = typed_arrays
+
+    @classmethod
+    def from_file(cls, filename: str | Path, typed_arrays: bool = False) -> _AedtParser:
+        """Read the entire AEDT file, discard binary data and create the parser of the ASCII lines.
+
+        Parameters
+        ----------
+        filename : str | Path
+            AEDT filename with path
+        typed_arrays : bool, optional
+            Whether to decode the lists made only of numbers as NumPy arrays. The default is ``False``.
+
+        Returns
+        -------
+        :class:`_AedtParser`
+            Parser of the file.
+        """
+        with open_file(filename, "rb") as aedt_fh:
+            return cls(_decode_aedt_lines(aedt_fh.read()), typed_arrays)
+
+    @classmethod
+    def from_bytes(cls, content: bytes, typed_arrays: bool = False) -> _AedtParser:
+        """Create the parser of the ASCII lines of an AEDT file content.
+
+        Parameters
+        ----------
+        content : bytes
+            Raw content of the AEDT file or of a portion of it.
+        typed_arrays : bool, optional
+            Whether to decode the lists made only of numbers as NumPy arrays. The default is ``False``.
+
+        Returns
+        -------
+        :class:`_AedtParser`
+            Parser of the content.
+        """
+        return cls(_decode_aedt_lines(content), typed_arrays)
+
+    def decode_recognized_key(self, keyword, line, d) -> bool:
+        """Special decodings for keys belonging to _recognized_keywords
+
+        Parameters
+        ----------
+        keyword : str
+            dictionary key recognized
+
+        line : str
+            The line following the recognized key
+
+        d : dict
+            Active dictionary.
+
+        Returns
+        -------
+        bool
+            Returns ``True`` if it confirms and decodes a recognized key, ``False`` otherwise.
+
+        """
+        if keyword == _recognized_keywords[0]:  # 'CurvesInfo'
+            m = re.search(r"\'(\d+)\'\((.*)\)$", line)
+            if m:
+                k = m.group(1)
+                v = m.group(2)
+                v2 = v.replace("\\'", '"')
+                v3 = _separate_list_elements(v2)
+                d[k] = v3
+            else:  # pragma: no cover
+                return False
+        elif keyword == _recognized_keywords[1]:  # 'Sweep Operations'
+            d["add"] = []
+            line = self.lines[self.count + 1]
+            while line.startswith("add("):
+                d["add"].append(line.replace("add", "").translate({ord(i): None for i in " ()'"}).split(","))
+                self.count += 1
+                line = self.lines[self.count + 1]
+        elif keyword == _recognized_keywords[2]:  # PropDisplayMap
+            pattern = r".+\((.+) Text\((.+) ExtentRect\((.+)\)\)\)"
+            match = re.search(pattern, line)
+            d["Name"] = []
+            for i in match.group(1).split(", "):
+                d["Name"].append(_parse_value(i))
+            d["Name"].append("Text:=")
+            temp_list = []
+            for i in match.group(2).split(", "):
+                temp_list.append(_parse_value(i))
+            temp_list.append("ExtentRect:=")
+            temp_list.append([_parse_value(i) for i in match.group(3).split(", ")])
+            d["Name"].append(temp_list)
+        elif keyword in _recognized_keywords[3:6]:  # Cells, Active, Rotation
+            li = self.count
+            line_m = self.lines[li]
+            li += 1
+            line_n = self.lines[li]
+            if line_m[:2] != "m=" or line_n[:2] != "n=":  # pragma: no cover
+                return False
+            m = int(re.search(r"[m|n]=(\d+)", line_m).group(1))
+            d["rows"] = m
+            n = int(re.search(r"[m|n]=(\d+)", line_n).group(1))
+            d["columns"] = n
+            d["matrix"] = []
+            for i in range(m):
+                li += 1
+                r = re.search(r"\$begin 'r(\d+)'", self.lines[li])
+                if not r or i != int(r.group(1)):  # pragma: no cover
+                    return False  # there should be a row definition
+                d["matrix"].append([])
+                for _ in range(n):
+                    li += 1
+                    c = re.search(r"c\((.+)\)", self.lines[li])
+                    if not c:  # pragma: no cover
+                        return False  # there should be a column definition
+                    if keyword == "Cells":
+                        c = int(c.group(1))
+                    elif keyword == "Active":
+                        c = c.group(1).lower() == "true"
+                    elif keyword == "Rotation":
+                        c = int(c.group(1)) * 90
+                    d["matrix"][i].append(c)
+                li += 1
+                r = re.search(r"\$end 'r(\d+)'", self.lines[li])
+                if not r or i != int(r.group(1)):  # pragma: no cover
+                    return False  # there should be a row definition
+            self.count = li
+        elif keyword == _recognized_keywords[6]:  # PostProcessingCells
+            li = self.count
+            while self.lines[li].startswith("OneCell"):
+                m = re.search(r"OneCell\((\d+), '(\d+)', '(\d+)'\)", self.lines[li])
+                if m:
+                    try:
+                        d[int(m.group(1))] = [int(m.group(2)), int(m.group(3))]
+                    except ValueError:  # pragma: no cover
+                        continue
+                li += 1
+            self.count = li - 1
+        else:  # pragma: no cover
+            raise AttributeError(f"Keyword {keyword} is supposed to be in the recognized_keywords list")
+        return True
+
+    def walk_through_structure(self, keyword, save_dict, design_name=None) -> int:
+        """Decode the block of a keyword starting from the current line.
+
+        Parameters
+        ----------
+        keyword : str
+            Name of the block to decode.
+        save_dict : dict
+            Dictionary where the decoded block is saved.
+        design_name : str, optional
+            Name of the design containing the block. The default is ``None``.
+
+        Returns
+        -------
+        int
+            Index of the last walked line.
+        """
+        begin_key = f"$begin '{keyword}'"
+        end_key = f"$end '{keyword}'"
+        design_key = None
+        design_found = True
+        if design_name:
+            design_key = f"Name='{design_name}'"
+            design_found = False
+        found = False
+        saved_value = None
+        len_lines = len(self.lines)
+        while self.count < len_lines:
+            line = self.lines[self.count]
+            if design_key and design_key in line:
+                design_found = True
+            # begin_key is found
+            if begin_key == line and design_found:
+                found = True
+                saved_value = save_dict.get(keyword)  # if the keyword is already present, save it
+                save_dict[keyword] = {}
+                self.count += 1
+                continue
+            # end_key is found
+            if end_key == line and design_found:
+                break
+            # between begin_key and end_key
+            if found:
+                b = _begin_search.search(line)
+                if b:  # walk down a level
+                    nextlvl_begin_key = b.group(1)
+                    self.walk_through_structure(nextlvl_begin_key, save_dict[keyword])
+                elif keyword in _recognized_keywords:
+                    confirmed = self.decode_recognized_key(keyword, line, save_dict[keyword])
+                    if not confirmed:  # pragma: no cover
+                        # decode the line normally, since recognized key is not successful
+                        _decode_subkey(line, save_dict[keyword], self.typed_arrays)
+                else:  # decode key
+                    _decode_subkey(line, save_dict[keyword], self.typed_arrays)
+            self.count += 1
+        # recompose value if list
+        if saved_value:
+            # makes the value a list, if it's not already
+            if not isinstance(saved_value, list):
+                saved_value = [saved_value]
+            saved_value.append(save_dict[keyword])
+            save_dict[keyword] = saved_value
+        return self.count
+
+    def load_all(self) -> dict:
+        """Decode all the top-level blocks.
+
+        Returns
+        -------
+        dict
+            Dictionary containing the decoded blocks.
+        """
+        main_dict = {}
+        len_lines = len(self.lines)
+        while self.count < len_lines:
+            line = self.lines[self.count]
+            m = _begin_search.search(line)
+            if m:
+                self.walk_through_structure(m.group(1), main_dict)
+            self.count += 1
+        return main_dict
+
+    def load_keyword(self, keyword: str, design_name: str | None = None) -> dict:
+        """Decode the first block of a keyword.
+
+        Parameters
+        ----------
+        keyword : str
+            Keyword to search and load.
+        design_name : str, optional
+            Name of the design. Default value is ``None``.
+
+        Returns
+        -------
+        dict
+            Dictionary containing the decoded block.
+        """
+        main_dict = {}
+        self.walk_through_structure(keyword, main_dict, design_name)
+        return main_dict
+
+
+def _load_entire_aedt_file(filename, typed_arrays=False):
     """Load the entire AEDT file and return the dictionary.
 
     Parameters
     ----------
     filename :
         AEDT filename with path
+    typed_arrays : bool, optional
+        Whether to decode the lists made only of numbers as NumPy arrays. The default is ``False``.
 
     Returns
     -------
@@ -521,24 +783,15 @@ def _load_entire_aedt_file(filename):
         dictionary containing the decoded AEDT file
 
     """
-    global _count
-    _read_aedt_file(filename)
-    main_dict = {}
-    # load the aedt file
-    while _count < _len_all_lines:
-        line = _all_lines[_count]
-        m = _begin_search.search(line)
-        if m:
-            _walk_through_structure(m.group(1), main_dict)
-        _count += 1
+    main_dict = _AedtParser.from_file(filename, typed_arrays).load_all()
     if settings.aedt_version and settings.aedt_version > "2022.2":
-        project_preview = load_keyword_in_aedt_file(filename, "ProjectPreview")
+        project_preview = load_keyword_in_aedt_file(filename, "ProjectPreview", typed_arrays=typed_arrays)
         if project_preview and "ProjectPreview" in project_preview:
             main_dict["ProjectPreview"] = project_preview["ProjectPreview"]
     return main_dict
 
 
-def _load_keyword_in_aedt_file(filename, keyword, design_name=None):
+def _load_keyword_in_aedt_file(filename, keyword, design_name=None, typed_arrays=False):
     """Load a specific keyword in the AEDT file and return the dictionary.
 
     Parameters
@@ -549,14 +802,912 @@ def _load_keyword_in_aedt_file(filename, keyword, design_name=None):
         keyword to search and load
     design_name : str, optional
         Name of the design. Default value is ``None``.
+    typed_arrays : bool, optional
+        Whether to decode the lists made only of numbers as NumPy arrays. The default is ``False``.
 
     Returns
     -------
     type
         dictionary containing the decoded AEDT file
     """
-    _read_aedt_file(filename)
-    # load the aedt file
+    return _AedtParser.from_file(filename, typed_arrays).load_keyword(keyword, design_name)
+
+
+# --------------------------------------------------------------------
+# indexed and lazy loading
+
+# lines delimiting the blocks, searched directly in the raw content of the file
+_block_marker = re.compile(rb"^[ \t]*\$(begin|end) '([^\r\n]*)'\r?$", re.MULTILINE)
+
+# blocks smaller than this size, in bytes, are parsed at once instead of lazily
+_LAZY_BLOCK_MIN_SIZE = 64 * 1024
+
+# blocks up to this depth are hashed while indexing, to refresh only the changed ones.
+# The designs are at depth 1, under the top-level ``AnsoftProject`` block.
+_HASHED_DEPTH = 2
+
+
+class AedtBlock:
+    """Location of a ``$begin``/``$end`` block in an AEDT file.
+
+    Parameters
+    ----------
+    name : str
+        Name of the block.
+    start : int
+        Offset of the first byte of the ``$begin`` line.
+    end : int, optional
+        Offset of the first byte after the ``$end`` line.
+
+    Attributes
+    ----------
+    digest : bytes or None
+        Hash of the content of the block. It is only computed for the top-level blocks
+        and their direct children.
+    """
+
+    __slots__ = ("name", "start", "end", "children", "digest")
+
+    def __init__(self, name: str, start: int, end: int = -1) -> None:
+        self.name = name
+        self.start = start
+        self.end = end
+        self.children = ()
+        self.digest = None
+
+    @property
+    def size(self) -> int:
+        """Size of the block in bytes."""
+        return self.end - self.start
+
+    def __repr__(self) -> str:
+        return f"AedtBlock({self.name!r}, {self.start}, {self.end})"
+
+
+class AedtFileIndex:
+    """Byte-offset index of all the ``$begin``/``$end`` blocks of an AEDT file.
+
+    The file is scanned once, without decoding it. The content of any block
+    can then be read back and parsed independently from the rest of the file.
+
+    Parameters
+    ----------
+    filename : str or :class:`pathlib.Path`
+        AEDT filename with path.
+    """
+
+    def __init__(self, filename: str | Path) -> None:
+        self.filename = Path(filename)
+        stat = self.filename.stat()
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime_ns
+        self.blocks = []
+        self._blocks = []
+        self._by_name = None
+        if self.size:
+            with open(self.filename, "rb") as aedt_fh:
+                with mmap.mmap(aedt_fh.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    self._scan(content)
+
+    def _scan(self, content) -> None:
+        """Build the block tree in a single pass over the file content."""
+        names = {}
+        stack = []
+        blocks = self._blocks
+        with memoryview(content) as view:
+            self._scan_blocks(content, view, names, stack, blocks)
+        # unterminated blocks extend to the end of the file
+        for block in stack:
+            block.end = self.size
+
+    def _scan_blocks(self, content, view, names, stack, blocks) -> None:
+        for m in _block_marker.finditer(content):
+            kind, raw_name = m.group(1, 2)
+            name = names.get(raw_name)
+            if name is None:
+                name = names[raw_name] = raw_name.decode("utf-8", errors="replace")
+            if kind == b"begin":
+                block = AedtBlock(name, m.start())
+                if stack:
+                    parent = stack[-1]
+                    if parent.children:
+                        parent.children.append(block)
+                    else:
+                        parent.children = [block]
+                else:
+                    self.blocks.append(block)
+                blocks.append(block)
+                stack.append(block)
+            elif stack and stack[-1].name == name:
+                end = m.end()
+                if content[end : end + 1] == b"\n":
+                    end += 1
+                block = stack.pop()
+                block.end = end
+                if len(stack) < _HASHED_DEPTH:
+                    block.digest = hashlib.blake2b(view[block.start : end], digest_size=16).digest()
+
+    def find(self, name: str, start: int = 0) -> AedtBlock | None:
+        """Find the first block with a given name after an offset.
+
+        Parameters
+        ----------
+        name : str
+            Name of the block.
+        start : int, optional
+            Offset to start the search from. The default is ``0``.
+
+        Returns
+        -------
+        :class:`AedtBlock` or None
+            First matching block in file order, ``None`` if no block is found.
+        """
+        if self._by_name is None:
+            by_name = {}
+            for block in self._blocks:
+                by_name.setdefault(block.name, []).append(block)
+            self._by_name = by_name
+        blocks = self._by_name.get(name, [])
+        position = bisect.bisect_left(blocks, start, key=lambda block: block.start)
+        if position < len(blocks):
+            return blocks[position]
+        return None
+
+    def find_text(self, text: str) -> int:
+        """Find the offset of the first occurrence of a text in the file.
+
+        Parameters
+        ----------
+        text : str
+            Text to search.
+
+        Returns
+        -------
+        int
+            Offset of the text, ``-1`` if it is not found.
+        """
+        if not self.size:
+            return -1
+        with open(self.filename, "rb") as aedt_fh:
+            with mmap.mmap(aedt_fh.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return content.find(text.encode("utf-8"))
+
+    def is_stale(self) -> bool:
+        """Check if the file changed since it was indexed.
+
+        Returns
+        -------
+        bool
+            ``True`` if the size or the modification time of the file changed, ``False`` otherwise.
+        """
+        stat = self.filename.stat()
+        return stat.st_size != self.size or stat.st_mtime_ns != self.mtime
+
+    def path(self, block: AedtBlock) -> list[tuple[str, int]]:
+        """Get the path of a block from the top of the file.
+
+        Parameters
+        ----------
+        block : :class:`AedtBlock`
+            Block of this index.
+
+        Returns
+        -------
+        list of tuple
+            ``(name, position)`` of each block enclosing the block, down to the block itself. ``position``
+            is the position among the sibling blocks with the same name.
+        """
+        path = []
+        siblings = self.blocks
+        while siblings:
+            position = bisect.bisect_right(siblings, block.start, key=lambda sibling: sibling.start) - 1
+            parent = siblings[position]
+            path.append((parent.name, sum(sibling.name == parent.name for sibling in siblings[:position])))
+            if parent is block:
+                return path
+            siblings = parent.children
+        raise ValueError(f"{block} is not a block of {self.filename}.")  # pragma: no cover
+
+    def locate(self, path: list[tuple[str, int]]) -> AedtBlock | None:
+        """Find the block at a given path, as returned by :meth:`path`.
+
+        Parameters
+        ----------
+        path : list of tuple
+            ``(name, position)`` of each block enclosing the block, down to the block itself.
+
+        Returns
+        -------
+        :class:`AedtBlock` or None
+            Block at the given path, ``None`` if no block is found.
+        """
+        block = None
+        siblings = self.blocks
+        for name, position in path:
+            homonyms = [sibling for sibling in siblings if sibling.name == name]
+            if position >= len(homonyms):
+                return None
+            block = homonyms[position]
+            siblings = block.children
+        return block
+
+    def read(self, spans: list[tuple[int, int]]) -> list[bytes]:
+        """Read portions of the file.
+
+        Parameters
+        ----------
+        spans : list of tuple
+            List of ``(start, end)`` byte offsets to read.
+
+        Returns
+        -------
+        list of bytes
+            Content of each portion.
+        """
+        if self.is_stale():
+            raise AEDTRuntimeError(f"File {self.filename} changed since it was indexed.")
+        chunks = []
+        with open(self.filename, "rb") as aedt_fh:
+            for start, end in spans:
+                aedt_fh.seek(start)
+                chunks.append(aedt_fh.read(end - start))
+        return chunks
+
+
+class _PendingBlocks:
+    """Placeholder of the blocks sharing the same name that are not parsed yet.
+
+    ``values`` maps the position of a block in ``blocks`` to its already decoded value.
+    """
+
+    __slots__ = ("blocks", "values")
+
+    def __init__(self, blocks: list[AedtBlock], values: dict | None = None) -> None:
+        self.blocks = blocks
+        self.values = values or {}
+
+    def load(self, index: AedtFileIndex, typed_arrays: bool = False):
+        value = None
+        for position, block in enumerate(self.blocks):
+            if position in self.values:
+                block_value = self.values[position]
+            else:
+                block_value = _load_block(index, block, typed_arrays)
+            # same merging rule of _walk_through_structure for repeated keywords
+            if value:
+                if not isinstance(value, list):
+                    value = [value]
+                value.append(block_value)
+            else:
+                value = block_value
+        return value
+
+
+class AedtLazyDict(dict):
+    """Dictionary of a decoded AEDT file whose sub-blocks are parsed on first access.
+
+    It behaves like the dictionary returned by :func:`load_entire_aedt_file`. The keys are
+    all known upfront, while the values coming from ``$begin``/``$end`` blocks are parsed
+    from the file only when they are accessed.
+
+    Parameters
+    ----------
+    index : :class:`AedtFileIndex`
+        Index of the AEDT file.
+    data : dict, optional
+        Initial content of the dictionary.
+    typed_arrays : bool, optional
+        Whether to decode the lists made only of numbers as NumPy arrays. The default is ``False``.
+    """
+
+    def __init__(self, index: AedtFileIndex, data: dict | None = None, typed_arrays: bool = False) -> None:
+        super().__init__(data or {})
+        self._index = index
+        self._typed_arrays = typed_arrays
+        # blocks of the values already parsed, used to refresh the dictionary
+        self._sources = {}
+
+    def _resolve(self, key, value):
+        if isinstance(value, _PendingBlocks):
+            if self._index.is_stale():
+                self._reindex()
+                value = dict.__getitem__(self, key)
+            self._sources[key] = value.blocks
+            value = value.load(self._index, self._typed_arrays)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def _reindex(self) -> None:
+        """Move the pending blocks to a new index of the file after it changed.
+
+        The blocks of each key are found again from the path of their parent in the file. Parsed values
+        whose blocks changed are made pending again, so that they are parsed from the new content on next access.
+        """
+        previous = self._index
+        index = self._index = index_aedt_file(previous.filename)
+
+        def relocate(blocks):
+            if not blocks:
+                return []
+            path = previous.path(blocks[0])
+            if len(path) == 1:
+                siblings = index.blocks
+            else:
+                parent = index.locate(path[:-1])
+                siblings = parent.children if parent else []
+            return [block for block in siblings if block.name == blocks[0].name]
+
+        for key, item in list(dict.items(self)):
+            if isinstance(item, _PendingBlocks):
+                dict.__setitem__(self, key, _PendingBlocks(relocate(item.blocks)))
+        for key, blocks in list(self._sources.items()):
+            relocated = relocate(blocks)
+            if len(relocated) == len(blocks) and all(
+                old.digest is not None and new.digest == old.digest for old, new in zip(blocks, relocated)
+            ):
+                self._sources[key] = relocated
+            else:
+                del self._sources[key]
+                dict.__setitem__(self, key, _PendingBlocks(relocated))
+
+    def _resolve_all(self) -> None:
+        for key, value in list(dict.items(self)):
+            self._resolve(key, value)
+
+    def is_loaded(self, key) -> bool:
+        """Check if the value of a key is already parsed.
+
+        Parameters
+        ----------
+        key : str
+            Key of the dictionary.
+
+        Returns
+        -------
+        bool
+            ``True`` if the value is parsed, ``False`` otherwise.
+        """
+        return not isinstance(dict.__getitem__(self, key), _PendingBlocks)
+
+    def to_dict(self) -> dict:
+        """Parse all the pending blocks and convert the content to plain dictionaries.
+
+        Returns
+        -------
+        dict
+            Decoded AEDT file.
+        """
+        return _to_plain(self)
+
+    def __getitem__(self, key):
+        return self._resolve(key, dict.__getitem__(self, key))
+
+    def __iter__(self):
+        return dict.__iter__(self)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self):
+        self._resolve_all()
+        return dict.items(self)
+
+    def values(self):
+        self._resolve_all()
+        return dict.values(self)
+
+    def pop(self, key, *args):
+        if key in self:
+            self[key]
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        self._resolve_all()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def copy(self) -> dict:
+        self._resolve_all()
+        return dict(dict.items(self))
+
+    def __eq__(self, other) -> bool:
+        self._resolve_all()
+        if isinstance(other, AedtLazyDict):
+            other._resolve_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        self._resolve_all()
+        return dict.__repr__(self)
+
+    def __copy__(self) -> dict:
+        return self.copy()
+
+    def __deepcopy__(self, memo) -> dict:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return dict, (self.to_dict(),)
+
+
+def _to_plain(value):
+    """Convert recursively lazy dictionaries to plain dictionaries."""
+    if isinstance(value, dict):
+        return {key: _to_plain(v) for key, v in value.items()}
+    if isinstance(value, list):
+        return [_to_plain(v) for v in value]
+    return value
+
+
+def _view(value, parent=None, key=None):
+    """Wrap dictionaries and lists into views, return the other values as they are."""
+    if isinstance(value, dict):
+        return AedtDictView(value, parent, key)
+    if isinstance(value, list):
+        return AedtListView(value, parent, key)
+    return value
+
+
+class _View:
+    """Common part of the copy-on-write views.
+
+    The views of nested values are created on access. The parent keeps a weak reference to
+    them, so that the same view is returned as long as it is in use, and they are discarded
+    after use. A view is attached to its parent, and the parent to its own parent, only when
+    it is modified.
+    """
+
+    __slots__ = ("_data", "_views", "_owned", "_parent", "_key", "_prune_size", "__weakref__")
+
+    def __init__(self, data, parent=None, key=None) -> None:
+        self._data = data
+        self._views = {}
+        self._owned = False
+        self._parent = parent
+        self._key = key
+        self._prune_size = 64
+
+    def _child(self, key, value):
+        view = self._views.get(key)
+        if isinstance(view, weakref.ref):
+            view = view()
+        if view is not None:
+            return view
+        view = _view(value, self, key)
+        if isinstance(view, _View):
+            self._views[key] = weakref.ref(view)
+            if len(self._views) > self._prune_size:
+                # remove the references to the views no longer in use
+                self._views = {
+                    k: v for k, v in self._views.items() if not isinstance(v, weakref.ref) or v() is not None
+                }
+                self._prune_size = max(64, 2 * len(self._views))
+        return view
+
+    def _attach(self) -> None:
+        if self._parent is not None:
+            parent, key = self._parent, self._key
+            self._parent = self._key = None
+            parent._adopt(key, self)
+            parent._attach()
+
+    def _adopt(self, key, view) -> None:
+        self._views[key] = view
+
+
+class AedtDictView(_View, MutableMapping):
+    """Copy-on-write view of a decoded AEDT dictionary.
+
+    The nested dictionaries and lists are returned as views too, so that the whole tree can
+    be walked without copying it. The lazy blocks of an :class:`AedtLazyDict` instance are
+    parsed only when they are accessed. Changes made through the view are applied to a
+    shallow copy of the modified level, and never to the original dictionary.
+
+    Parameters
+    ----------
+    data : dict
+        Decoded AEDT dictionary.
+    """
+
+    __slots__ = ()
+
+    def _own(self) -> None:
+        if not self._owned:
+            self._data = self._data.copy()
+            self._owned = True
+            self._attach()
+
+    def __getitem__(self, key):
+        return self._child(key, self._data[key])
+
+    def __setitem__(self, key, value) -> None:
+        self._own()
+        self._data[key] = value
+        self._views.pop(key, None)
+
+    def __delitem__(self, key) -> None:
+        self._own()
+        del self._data[key]
+        self._views.pop(key, None)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"AedtDictView({self.to_dict()!r})"
+
+    def to_dict(self) -> dict:
+        """Convert the view to plain dictionaries, including the changes made through it.
+
+        Returns
+        -------
+        dict
+            Independent copy of the content of the view.
+        """
+        return {key: _view_to_plain(value) for key, value in self.items()}
+
+
+class AedtListView(_View, MutableSequence):
+    """Copy-on-write view of a list of a decoded AEDT dictionary.
+
+    Parameters
+    ----------
+    data : list
+        List of values.
+    """
+
+    __slots__ = ()
+
+    def _own(self) -> None:
+        # the copy holds the views of the nested values, since the positions can then change
+        if not self._owned:
+            self._data = [self[position] for position in range(len(self._data))]
+            self._views = {}
+            self._owned = True
+            self._attach()
+
+    def _adopt(self, key, view) -> None:
+        if not self._owned:
+            self._views[key] = view
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self._data)))]
+        if position < 0:
+            position += len(self._data)
+        if self._owned:
+            value = self._data[position]
+            if isinstance(value, (dict, list)):
+                # value set through the view
+                value = self._data[position] = _view(value)
+            return value
+        return self._child(position, self._data[position])
+
+    def __setitem__(self, position, value) -> None:
+        self._own()
+        self._data[position] = value
+
+    def __delitem__(self, position) -> None:
+        self._own()
+        del self._data[position]
+
+    def insert(self, position, value) -> None:
+        self._own()
+        self._data.insert(position, value)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, AedtListView)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"AedtListView({self.to_list()!r})"
+
+    def to_list(self) -> list:
+        """Convert the view to a plain list, including the changes made through it.
+
+        Returns
+        -------
+        list
+            Independent copy of the content of the view.
+        """
+        return [_view_to_plain(value) for value in self]
+
+
+def _view_to_plain(value):
+    """Convert recursively views to plain dictionaries and lists."""
+    if isinstance(value, AedtDictView):
+        return value.to_dict()
+    if isinstance(value, AedtListView):
+        return value.to_list()
+    return copy.deepcopy(_to_plain(value))
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_index(filename: str, size: int, mtime: int) -> AedtFileIndex:
+    """Build the index of a file. The size and the modification time are part of the cache key."""
+    return AedtFileIndex(filename)
+
+
+def _parse_block_content(content: bytes, keyword: str, typed_arrays: bool = False) -> dict:
+    """Parse the content of a single block."""
+    return _AedtParser.from_bytes(content, typed_arrays).load_keyword(keyword).get(keyword, {})
+
+
+def _has_nested_homonym(block: AedtBlock) -> bool:
+    """Check if the block or one of its children directly contains a block with the same name.
+
+    The sequential parser does not nest such blocks, and the lines of the inner block end up
+    in the outer one. Those blocks are parsed at once to give the same result.
+    """
+    for child in block.children:
+        if child.name == block.name or any(grandchild.name == child.name for grandchild in child.children):
+            return True
+    return False
+
+
+def _load_block(index: AedtFileIndex, block: AedtBlock, typed_arrays: bool = False):
+    """Parse a block. Sub-blocks are left pending if the block is large enough."""
+    if (
+        not block.children
+        or block.size < _LAZY_BLOCK_MIN_SIZE
+        or block.name in _recognized_keywords
+        or _has_nested_homonym(block)
+    ):
+        return _parse_block_content(index.read([(block.start, block.end)])[0], block.name, typed_arrays)
+
+    # parse only the lines of the block itself. Each sub-block is replaced by an empty one
+    # so that the key order is kept.
+    spans = []
+    stubs = []
+    position = block.start
+    for child in block.children:
+        spans.append((position, child.start))
+        stubs.append(f"$begin '{child.name}'\n$end '{child.name}'\n".encode("utf-8"))
+        position = child.end
+    spans.append((position, block.end))
+    stubs.append(b"")
+    content = b"".join(chunk + stub for chunk, stub in zip(index.read(spans), stubs))
+    block_dict = _parse_block_content(content, block.name, typed_arrays)
+
+    children = {}
+    for child in block.children:
+        children.setdefault(child.name, []).append(child)
+    for name in children:
+        if type(block_dict.get(name)) is not dict or block_dict[name]:  # pragma: no cover
+            # a line defines a key with the same name of the block
+            return _parse_block_content(index.read([(block.start, block.end)])[0], block.name, typed_arrays)
+        block_dict[name] = _PendingBlocks(children[name])
+    return AedtLazyDict(index, block_dict, typed_arrays)
+
+
+def _load_lazy_aedt_file(filename, typed_arrays=False):
+    """Index the AEDT file and return the dictionary with all blocks pending.
+
+    Parameters
+    ----------
+    filename :
+        AEDT filename with path
+    typed_arrays : bool, optional
+        Whether to decode the lists made only of numbers as NumPy arrays. The default is ``False``.
+
+    Returns
+    -------
+    :class:`AedtLazyDict`
+        Dictionary containing the decoded AEDT file.
+    """
+    index = index_aedt_file(filename)
     main_dict = {}
-    _walk_through_structure(keyword, main_dict, design_name)
+    for block in index.blocks:
+        main_dict.setdefault(block.name, []).append(block)
+    main_dict = AedtLazyDict(index, {name: _PendingBlocks(blocks) for name, blocks in main_dict.items()}, typed_arrays)
+    if settings.aedt_version and settings.aedt_version > "2022.2":
+        project_preview = index.find("ProjectPreview")
+        if project_preview:
+            dict.__setitem__(main_dict, "ProjectPreview", _PendingBlocks([project_preview]))
     return main_dict
+
+
+def _block_values(blocks: list[AedtBlock], value) -> list | None:
+    """Split the merged value of blocks sharing the same name into the value of each block."""
+    if len(blocks) == 1:
+        return [value]
+    if isinstance(value, list) and len(value) == len(blocks):
+        return value
+    return None
+
+
+def _rebind(value, index: AedtFileIndex, offset: int, previous: AedtFileIndex):
+    """Move the pending blocks of a decoded value to a new index where they are shifted by an offset.
+
+    Only the dictionaries bound to the previous index are moved. The other ones were already moved to a newer index
+    by :meth:`AedtLazyDict._reindex`, and find their blocks from their path if needed.
+    """
+    if isinstance(value, list):
+        for item in value:
+            _rebind(item, index, offset, previous)
+    elif isinstance(value, AedtLazyDict) and value._index is previous:
+        value._index = index
+        for key, blocks in value._sources.items():
+            value._sources[key] = [index.find(block.name, block.start + offset) for block in blocks]
+        for key, item in dict.items(value):
+            if isinstance(item, _PendingBlocks):
+                blocks = [index.find(block.name, block.start + offset) for block in item.blocks]
+                values = {position: _rebind(v, index, offset, previous) for position, v in item.values.items()}
+                dict.__setitem__(value, key, _PendingBlocks(blocks, values))
+            else:
+                _rebind(item, index, offset, previous)
+    return value
+
+
+def _merge_unchanged_blocks(data: AedtLazyDict, previous: AedtLazyDict) -> None:
+    """Reuse in a new lazy dictionary the values of the previous one whose blocks did not change.
+
+    The blocks whose hash is unchanged are moved to the new index without being parsed again.
+    Changed blocks that were already parsed are parsed again, and this is repeated for their
+    own hashed sub-blocks. Blocks without hash are left pending.
+    """
+    index = data._index
+    for key, pending in list(dict.items(data)):
+        old_blocks = previous._sources.get(key)
+        if not isinstance(pending, _PendingBlocks) or not old_blocks or key not in previous:
+            continue
+        old_values = _block_values(old_blocks, dict.__getitem__(previous, key))
+        if old_values is None:
+            continue
+        unchanged = {}
+        for old_block, old_value in zip(old_blocks, old_values):
+            if old_block.digest is not None:
+                unchanged.setdefault(old_block.digest, []).append((old_block, old_value))
+        values = {}
+        for position, block in enumerate(pending.blocks):
+            if block.digest is not None and unchanged.get(block.digest):
+                old_block, old_value = unchanged[block.digest].pop(0)
+                values[position] = _rebind(old_value, index, block.start - old_block.start, previous._index)
+            elif (
+                block.digest is not None
+                and position < len(old_values)
+                and isinstance(old_values[position], AedtLazyDict)
+            ):
+                value = _load_block(index, block, data._typed_arrays)
+                if isinstance(value, AedtLazyDict):
+                    _merge_unchanged_blocks(value, old_values[position])
+                values[position] = value
+        if values:
+            dict.__setitem__(data, key, _PendingBlocks(pending.blocks, values))
+
+
+def _load_indexed_keyword_in_aedt_file(filename, keyword, design_name=None, typed_arrays=False):
+    """Load a specific keyword in the AEDT file using the block index.
+
+    Parameters
+    ----------
+    filename :
+        AEDT filename with path
+    keyword :
+        keyword to search and load
+    design_name : str, optional
+        Name of the design. Default value is ``None``.
+    typed_arrays : bool, optional
+        Whether to decode the lists made only of numbers as NumPy arrays. The default is ``False``.
+
+    Returns
+    -------
+    type
+        dictionary containing the decoded AEDT file
+    """
+    index = index_aedt_file(filename)
+    start = 0
+    if design_name:
+        start = index.find_text(f"Name='{design_name}'")
+        if start < 0:
+            return {}
+    block = index.find(keyword, start)
+    if block is None:
+        return {}
+    return {keyword: _parse_block_content(index.read([(block.start, block.end)])[0], keyword, typed_arrays)}
+
+
+# --------------------------------------------------------------------
+# persistent cache
+
+# version of the decoded dictionaries, to increase whenever the parser output changes
+_PARSER_VERSION = 1
+
+
+def _cache_entry(file_path: Path, typed_arrays: bool = False) -> Path | None:
+    """Get the cache entry of a file, ``None`` if the cache is disabled or the file is not local."""
+    if not settings.aedt_file_cache_dir or not file_path.is_file():
+        return None
+    stat = file_path.stat()
+    project_preview = bool(settings.aedt_version and settings.aedt_version > "2022.2")
+    path_key = hashlib.sha256(str(file_path).encode("utf-8")).hexdigest()[:32]
+    state = f"{stat.st_size}|{stat.st_mtime_ns}|{_PARSER_VERSION}|{project_preview}|{typed_arrays}"
+    state_key = hashlib.sha256(state.encode("utf-8")).hexdigest()[:16]
+    return Path(settings.aedt_file_cache_dir) / f"{path_key}_{state_key}.pkl"
+
+
+def _read_cache_entry(cache_entry: Path) -> dict | None:
+    """Read a cache entry, ``None`` if it does not exist or it is not readable."""
+    try:
+        with open(cache_entry, "rb") as cache_fh:
+            data = pickle.load(cache_fh)  # nosec
+    except FileNotFoundError:
+        return None
+    except Exception:
+        settings.logger.debug(f"Failed to read cache entry {cache_entry}.")
+        cache_entry.unlink(missing_ok=True)
+        return None
+    try:
+        # the modification time of the entries tracks the least recently used ones
+        os.utime(cache_entry)
+    except OSError:  # pragma: no cover
+        pass
+    return data
+
+
+def _write_cache_entry(cache_entry: Path, data: dict) -> bool:
+    """Write a cache entry atomically and trim the cache to its maximum size."""
+    cache_dir = cache_entry.parent
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # the entry is written to a temporary file and then renamed, so that other
+        # processes sharing the cache never read a partial entry
+        fd, temp_file = tempfile.mkstemp(dir=cache_dir, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as cache_fh:
+                pickle.dump(data, cache_fh, protocol=5)
+            Path(temp_file).replace(cache_entry)
+        except Exception:
+            Path(temp_file).unlink(missing_ok=True)
+            raise
+    except Exception:
+        settings.logger.debug(f"Failed to write cache entry {cache_entry}.")
+        return False
+    # remove the entries of previous versions of the same file
+    path_key = cache_entry.name.split("_")[0]
+    for stale_entry in cache_dir.glob(f"{path_key}_*.pkl"):
+        if stale_entry.name != cache_entry.name:
+            stale_entry.unlink(missing_ok=True)
+    _trim_cache(cache_dir, settings.aedt_file_cache_size * 1024 * 1024)
+    return True
+
+
+def _trim_cache(cache_dir: Path, max_size: float) -> None:
+    """Remove the least recently used cache entries until the cache fits in its maximum size."""
+    entries = []
+    for cache_entry in cache_dir.glob("*.pkl"):
+        try:
+            stat = cache_entry.stat()
+        except FileNotFoundError:  # pragma: no cover
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, cache_entry))
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, cache_entry in sorted(entries, key=lambda entry: entry[0]):
+        if total_size <= max_size:
+            break
+        cache_entry.unlink(missing_ok=True)
+        total_size -= size
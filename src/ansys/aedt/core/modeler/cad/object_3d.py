@@ -1133,9 +1133,9 @@ class Object3d(PyAedtBase):
             vGeo3d = ["NAME:Geometry3DAttributeTab", vPropServers, vChangedProps]
             vOut = ["NAME:AllTabs", vGeo3d]
             self._primitives.oeditor.ChangeProperty(vOut)
+            old_name = self._m_name
             self._m_name = obj_name
-            self._primitives.add_new_objects()
-            self._primitives.cleanup_objects()
+            self._primitives._rename_object(old_name, obj_name)
         else:
             self.logger.warning(f"{obj_name} is already used in current design.")
 
@@ -26,6 +26,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from collections.abc import MutableSequence
 import copy
 import fnmatch
 import math
@@ -52,6 +54,7 @@ from ansys.aedt.core.generic.numbers_utils import decompose_variable_value
 from ansys.aedt.core.generic.numbers_utils import is_number
 from ansys.aedt.core.generic.quaternion import Quaternion
 from ansys.aedt.core.internal.errors import GrpcApiError
+from ansys.aedt.core.internal.load_aedt_file import AedtDictView
 from ansys.aedt.core.modeler.cad.components_3d import UserDefinedComponent
 from ansys.aedt.core.modeler.cad.elements_3d import EdgePrimitive
 from ansys.aedt.core.modeler.cad.elements_3d import FacePrimitive
@@ -107,25 +110,27 @@ class Objects(dict):
             return len(self.__parent.user_defined_component_names)
 
     def __delitem__(self, key):
-        try:
-            name = [i for i, k in self.__parent._object_names_to_ids.items() if k == key or i == key][0]
-            key = [k for i, k in self.__parent._object_names_to_ids.items() if k == key or i == key][0]
-        except IndexError:
-            try:
-                dict.__delitem__(self, key)
-            except KeyError:
-                pass
+        if key in self.__parent._object_names_to_ids:
+            name = key
+            key = self.__parent._object_names_to_ids[name]
+        elif key in self.__parent._object_ids_to_names:
+            name = self.__parent._object_ids_to_names[key]
+        else:
+            dict.pop(self, key, None)
             return
-        try:
-            dict.__delitem__(self, key)
-        except KeyError:
-            pass
+        dict.pop(self, key, None)
         if name:
-            try:
-                del self.__obj_names[name]
-            except KeyError:
-                pass
-            del self.__parent._object_names_to_ids[name]
+            self.__obj_names.pop(name, None)
+            self.__parent._unregister_object(name)
+
+    def _get_by_name(self, name):
+        """Get an object already loaded from its name, ``None`` if it is not loaded."""
+        return self.__obj_names.get(name)
+
+    def _rename(self, old_name, new_name) -> None:
+        obj = self.__obj_names.pop(old_name, None)
+        if obj is not None:
+            self.__obj_names[new_name] = obj
 
     def __contains__(self, item) -> bool:
         if self.__refreshed:
@@ -162,7 +167,7 @@ class Objects(dict):
         dict.__setitem__(self, key, value)
         self.__obj_names[value.name] = value
         if self.__obj_type == "o":
-            self.__parent._object_names_to_ids[value.name] = key
+            self.__parent._register_object(value.name, key)
 
     def __getitem__(self, item) -> "Object3d":
         if item in dict.keys(self):
@@ -212,7 +217,7 @@ class Objects(dict):
                 dict.__setitem__(self, key, value)
                 self.__obj_names[value.name] = value
                 if self.__obj_type == "o":
-                    self.__parent._object_names_to_ids[value.name] = key
+                    self.__parent._register_object(value.name, key)
         self.__refreshed = False
 
 
@@ -285,14 +290,16 @@ class GeometryModeler(Modeler, PyAedtBase):
         self._user_lists = []
         self._planes = []
         self._is3d = is3d
-        self._solids = []
-        self._sheets = []
-        self._lines = []
-        self._points = []
-        self._unclassified = []
+        # names of each category of objects, stored as dictionary keys to keep their order
+        self._solids = {}
+        self._sheets = {}
+        self._lines = {}
+        self._points = {}
+        self._unclassified = {}
         self._all_object_names = []
         self._model_units = None
         self._object_names_to_ids = {}
+        self._object_ids_to_names = {}
         self.objects = Objects(self, "o")
         self.user_defined_components = Objects(self, "u")
         self.points = Objects(self, "p")
@@ -662,7 +669,7 @@ class GeometryModeler(Modeler, PyAedtBase):
         list
         """
         self._refresh_solids()
-        return self._solids
+        return list(self._solids)
 
     @property
     def sheet_names(self) -> list:
@@ -673,7 +680,7 @@ class GeometryModeler(Modeler, PyAedtBase):
         list
         """
         self._refresh_sheets()
-        return self._sheets
+        return list(self._sheets)
 
     @property
     def line_names(self) -> list:
@@ -684,7 +691,7 @@ class GeometryModeler(Modeler, PyAedtBase):
         list
         """
         self._refresh_lines()
-        return self._lines
+        return list(self._lines)
 
     @property
     def unclassified_names(self) -> list:
@@ -695,7 +702,7 @@ class GeometryModeler(Modeler, PyAedtBase):
         list
         """
         self._refresh_unclassified()
-        return self._unclassified
+        return list(self._unclassified)
 
     @property
     def object_names(self) -> list:
@@ -717,7 +724,7 @@ class GeometryModeler(Modeler, PyAedtBase):
         list
         """
         self._refresh_points()
-        return self._points
+        return list(self._points)
 
     @property
     def user_defined_component_names(self) -> list:
@@ -851,13 +858,14 @@ class GeometryModeler(Modeler, PyAedtBase):
     @pyaedt_function_handler()
     def refresh(self) -> None:
         """Refresh this object."""
-        self._solids = []
-        self._sheets = []
-        self._lines = []
-        self._points = []
-        self._unclassified = []
+        self._solids = {}
+        self._sheets = {}
+        self._lines = {}
+        self._points = {}
+        self._unclassified = {}
         self._all_object_names = []
         self._object_names_to_ids = {}
+        self._object_ids_to_names = {}
         self.objects = Objects(self, "o")
         self.user_defined_components = Objects(self, "u")
         self._refresh_object_types()
@@ -949,23 +957,29 @@ class GeometryModeler(Modeler, PyAedtBase):
     def _refresh_all_ids_from_aedt_file(self):
         self._app.logger.info("Refreshing objects from AEDT file")
 
-        dp = copy.deepcopy(self._app.design_properties)
+        dp = self._app.design_properties
         if not dp or "ModelSetup" not in dp:
             return False
+        # the design properties are shared with the application, walk them without copying
+        dp = AedtDictView(dp)
 
         try:
             groups = dp["ModelSetup"]["GeometryCore"]["GeometryOperations"]["Groups"]["Group"]
         except KeyError:
             groups = []
-        if not isinstance(groups, list):
+        if not isinstance(groups, MutableSequence):
             groups = [groups]
+        group_names = {}
+        for group in groups:
+            group_names[group["GroupID"]] = group["Attributes"]["Name"]
         try:
             dp["ModelSetup"]["GeometryCore"]["GeometryOperations"]["ToplevelParts"]["GeometryPart"]
         except KeyError:
             return 0
 
+        all_object_names = set(self._all_object_names)
         for el in dp["ModelSetup"]["GeometryCore"]["GeometryOperations"]["ToplevelParts"]["GeometryPart"]:
-            if isinstance(el, dict):
+            if isinstance(el, Mapping):
                 attribs = el["Attributes"]
                 operations = el.get("Operations", None)
             else:
@@ -975,15 +989,15 @@ class GeometryModeler(Modeler, PyAedtBase):
                 operations = dp["ModelSetup"]["GeometryCore"]["GeometryOperations"]["ToplevelParts"]["GeometryPart"][
                     "Operations"
                 ]
-            if attribs["Name"] in self._all_object_names:
+            if attribs["Name"] in all_object_names:
                 pid = 0
 
-                if operations and isinstance(operations.get("Operation", None), dict):
+                if operations and isinstance(operations.get("Operation", None), Mapping):
                     try:
                         pid = operations["Operation"]["ParentPartID"]
                     except Exception as e:  # pragma: no cover
                         self.logger.debug(e)
-                elif operations and isinstance(operations.get("Operation", None), list):
+                elif operations and isinstance(operations.get("Operation", None), MutableSequence):
                     try:
                         pid = operations["Operation"][0]["ParentPartID"]
                     except Exception as e:
@@ -1003,12 +1017,7 @@ class GeometryModeler(Modeler, PyAedtBase):
                     o._wireframe = True
                 else:
                     o._wireframe = False
-                groupname = ""
-                for group in groups:
-                    if attribs["GroupId"] == group["GroupID"]:
-                        groupname = group["Attributes"]["Name"]
-
-                o._m_groupName = groupname
+                o._m_groupName = group_names.get(attribs["GroupId"], "")
                 try:
                     o._color = tuple(int(x) for x in attribs["Color"][1:-1].split(" "))
                 except Exception:
@@ -1056,15 +1065,17 @@ class GeometryModeler(Modeler, PyAedtBase):
         """
         new_object_dict = {}
         all_objects = self.object_names
-        all_unclassified = self._unclassified
+        all_unclassified = list(self._unclassified)
         all_objs = all_objects + all_unclassified
         if sorted(all_objs) != sorted(list(self._object_names_to_ids.keys())):
+            all_objs = set(all_objs)
             for old_id, obj in self.objects.items():
                 if obj.name in all_objs:
                     # Check if ID can change in boolean operations
                     # updated_id = obj.id  # By calling the object property we get the new id
                     new_object_dict[old_id] = obj
             self._object_names_to_ids = {}
+            self._object_ids_to_names = {}
             self.objects = Objects(self, "o", new_object_dict)
 
     @pyaedt_function_handler()
@@ -1136,7 +1147,7 @@ class GeometryModeler(Modeler, PyAedtBase):
                 except Exception:
                     pid = 0
                 self._create_object(obj_name, pid=pid, use_cached=True)
-                self._object_names_to_ids[obj_name] = pid
+                self._register_object(obj_name, pid)
                 added_objects.append(obj_name)
 
         return added_objects
@@ -7474,9 +7485,10 @@ class GeometryModeler(Modeler, PyAedtBase):
         if assignment is None:
             assignment = self.object_names
         assignment = self._modeler.convert_to_selections(assignment, return_list=True)
+        object_names = set(self.object_names)
         for el in assignment:
             if (
-                el not in self.object_names
+                el not in object_names
                 and not list(self.oeditor.GetObjectsInGroup(el))
                 and not self.oeditor.GetObjectsInGroup("Unclassified")
             ):
@@ -7506,6 +7518,127 @@ class GeometryModeler(Modeler, PyAedtBase):
             self.logger.info(f"Deleted {num_objects} Objects: {objects_str}.")
         return True
 
+    @pyaedt_function_handler()
+    def delete_many(self, assignment: list, chunk_size: int = 100) -> bool:
+        """Delete many objects and update the modeler incrementally.
+
+        Unlike the :func:`delete` method, the objects are removed one by one from
+        the modeler instead of parsing again all the remaining objects, so the time
+        taken is proportional to the number of deleted objects. Groups are not supported.
+
+        Parameters
+        ----------
+        assignment : list
+            List of object names. Names of objects that do not exist are ignored.
+        chunk_size : int, optional
+            Number of objects deleted with each call to AEDT. The default is ``100``.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+
+        References
+        ----------
+        >>> oEditor.Delete
+
+        Examples
+        --------
+        >>> from ansys.aedt.core import Hfss
+        >>> hfss = Hfss()
+        >>> boxes = [hfss.modeler.create_box([i, 0, 0], [0.5, 0.5, 0.5]).name for i in range(100)]
+        >>> hfss.modeler.delete_many(boxes)
+        """
+        assignment = self._modeler.convert_to_selections(assignment, return_list=True)
+        existing_names = set(self.object_names).union(self._unclassified)
+        names = [name for name in dict.fromkeys(assignment) if name in existing_names]
+        if not names:
+            self.logger.warning("No objects to delete")
+            return False
+        deleted = []
+        for start in range(0, len(names), chunk_size):
+            objs = names[start : start + chunk_size]
+            objects_str = self._modeler.convert_to_selections(objs, return_list=False)
+            try:
+                self.oeditor.Delete(["NAME:Selections", "Selections:=", objects_str])
+            except Exception:
+                self.logger.warning(f"Failed to delete {objects_str}.")
+            else:
+                deleted.extend(objs)
+        for name in deleted:
+            del self.objects[name]
+        self.logger.info(f"Deleted {len(deleted)} objects.")
+        return len(deleted) == len(names)
+
+    @pyaedt_function_handler()
+    def rename_many(self, names: dict) -> bool:
+        """Rename many objects and update the modeler incrementally.
+
+        Parameters
+        ----------
+        names : dict
+            Dictionary mapping the current names of the objects to their new names.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+
+        References
+        ----------
+        >>> oEditor.ChangeProperty
+
+        Examples
+        --------
+        >>> from ansys.aedt.core import Hfss
+        >>> hfss = Hfss()
+        >>> box = hfss.modeler.create_box([0, 0, 0], [1, 1, 1], name="box")
+        >>> hfss.modeler.rename_many({"box": "new_box"})
+        """
+        existing_names = set(self.object_names).union(self._unclassified)
+        new_names = set(names.values())
+        if len(new_names) != len(names) or any(name in existing_names and name not in names for name in new_names):
+            self.logger.error("New names must be unique and not used by other objects.")
+            return False
+        for old_name in names:
+            if old_name not in existing_names:
+                self.logger.error(f"Object {old_name} does not exist.")
+                return False
+        # an object is renamed once its new name is released. The objects of a cycle, like a swap,
+        # wait for each other, so one of them is moved to a temporary name first.
+        pending = {old_name: new_name for old_name, new_name in names.items() if old_name != new_name}
+        waiting = {new_name: old_name for old_name, new_name in pending.items() if new_name in existing_names}
+        ready = [old_name for old_name, new_name in pending.items() if new_name not in existing_names]
+        while pending:
+            if ready:
+                old_name = ready.pop()
+                new_name = pending.pop(old_name)
+            else:
+                old_name, final_name = next(iter(pending.items()))
+                new_name = generate_unique_name(old_name)
+                while new_name in existing_names:  # pragma: no cover
+                    new_name = generate_unique_name(old_name)
+                del pending[old_name]
+                pending[new_name] = final_name
+                waiting[final_name] = new_name
+            self.oeditor.ChangeProperty(
+                [
+                    "NAME:AllTabs",
+                    [
+                        "NAME:Geometry3DAttributeTab",
+                        ["NAME:PropServers", old_name],
+                        ["NAME:ChangedProps", ["NAME:Name", "Value:=", new_name]],
+                    ],
+                ]
+            )
+            obj = self.objects._get_by_name(old_name)
+            if obj is not None:
+                obj._m_name = new_name
+            self._rename_object(old_name, new_name)
+            if old_name in waiting:
+                ready.append(waiting.pop(old_name))
+        return True
+
     @pyaedt_function_handler()
     def delete_objects_containing(self, contained_string: str, case_sensitive: bool = True) -> bool:
         """Delete all objects with a given prefix.
@@ -8984,11 +9117,11 @@ class GeometryModeler(Modeler, PyAedtBase):
         # TODO: To be checked (in IronPython True is supposed to be returned when no solids are present)
         elif objects is True or objects is None:
             setattr(
-                self, OBJECT_TYPE_TO_ATTRIBUTE[object_type], []
+                self, OBJECT_TYPE_TO_ATTRIBUTE[object_type], {}
             )  # In IronPython True is returned when no solids are present
         else:
-            setattr(self, OBJECT_TYPE_TO_ATTRIBUTE[object_type], list(objects))
-        self._all_object_names = self._solids + self._sheets + self._lines + self._points
+            setattr(self, OBJECT_TYPE_TO_ATTRIBUTE[object_type], dict.fromkeys(objects))
+        self._all_object_names = [*self._solids, *self._sheets, *self._lines, *self._points]
 
     @pyaedt_function_handler()
     def _refresh_solids(self) -> None:
@@ -9016,10 +9149,10 @@ class GeometryModeler(Modeler, PyAedtBase):
         if objects is False:
             raise RuntimeError("Get points is failing")
         elif objects is True or objects is None:
-            self._points = []  # In IronPython True is returned when no points are present
+            self._points = {}  # In IronPython True is returned when no points are present
         else:
-            self._points = list(objects)
-        self._all_object_names = self._solids + self._sheets + self._lines + self._points
+            self._points = dict.fromkeys(objects)
+        self._all_object_names = [*self._solids, *self._sheets, *self._lines, *self._points]
 
     @pyaedt_function_handler()
     def _refresh_planes(self) -> None:
@@ -9031,7 +9164,7 @@ class GeometryModeler(Modeler, PyAedtBase):
             }
         except (TypeError, AttributeError):
             self._planes = {}
-        self._all_object_names = self._solids + self._sheets + self._lines + self._points + list(self._planes.keys())
+        self._all_object_names = [*self._solids, *self._sheets, *self._lines, *self._points, *self._planes]
 
     @pyaedt_function_handler()
     def _refresh_object_types(self) -> None:
@@ -9041,7 +9174,39 @@ class GeometryModeler(Modeler, PyAedtBase):
         self._refresh_points()
         self._refresh_planes()
         self._refresh_unclassified()
-        self._all_object_names = self._solids + self._sheets + self._lines + self._points + self._unclassified
+        self._all_object_names = [*self._solids, *self._sheets, *self._lines, *self._points, *self._unclassified]
+
+    def _register_object(self, name: str, object_id: int) -> None:
+        """Map the name of an object to its ID and the ID to the name."""
+        old_id = self._object_names_to_ids.get(name)
+        if old_id is not None and self._object_ids_to_names.get(old_id) == name:
+            del self._object_ids_to_names[old_id]
+        self._object_names_to_ids[name] = object_id
+        self._object_ids_to_names[object_id] = name
+
+    def _unregister_object(self, name: str) -> None:
+        """Remove an object from the name and ID maps and from its category."""
+        object_id = self._object_names_to_ids.pop(name, None)
+        if object_id is not None and self._object_ids_to_names.get(object_id) == name:
+            del self._object_ids_to_names[object_id]
+        for names in (self._solids, self._sheets, self._lines, self._points, self._unclassified):
+            names.pop(name, None)
+
+    def _rename_object(self, old_name: str, new_name: str) -> None:
+        """Update the name of an object in the name and ID maps and in its category."""
+        categories = [
+            names
+            for names in (self._solids, self._sheets, self._lines, self._points, self._unclassified)
+            if old_name in names
+        ]
+        object_id = self._object_names_to_ids.get(old_name)
+        if object_id is not None:
+            self._unregister_object(old_name)
+            self._register_object(new_name, object_id)
+        for names in categories:
+            names.pop(old_name, None)
+            names[new_name] = None
+        self.objects._rename(old_name, new_name)
 
     @pyaedt_function_handler()
     def _create_object(self, name: str, pid: int = 0, use_cached: bool = False, is_polyline: bool = False, **kwargs):
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Amplitude tapers and complex excitation weights of phased arrays.
+
+The functions of this module work on the lattice indices of the array elements, so any
+set of elements placed on a 2-D lattice can be weighted, including arrays with missing
+elements. The taper of each lattice direction is a 1-D window sampled over the bounding box
+of the occupied indices, and the planar taper is the product of both windows.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ansys.aedt.core.generic.constants import SpeedOfLight
+
+TAPERS = ("flat", "uniform", "cosine", "triangular", "hamming", "hann", "chebyshev", "taylor")
+
+
+def taper_window(taper: str = "flat", size: int = 1, sidelobe_level: float = 30.0, nbar: int = 4) -> np.ndarray:
+    """Compute the amplitude window of a linear array.
+
+    Parameters
+    ----------
+    taper : str, optional
+        Taper type. Options are ``"chebyshev"`` (Dolph-Chebyshev), ``"cosine"``, ``"flat"``, ``"hamming"``,
+        ``"hann"``, ``"taylor"``, ``"triangular"``, and ``"uniform"``. The default is ``"flat"``.
+    size : int, optional
+        Number of elements. The default is ``1``.
+    sidelobe_level : float, optional
+        Sidelobe level in dB below the main lobe of the ``"chebyshev"`` and ``"taylor"`` tapers.
+        The default is ``30.0``.
+    nbar : int, optional
+        Number of nearly constant level sidelobes next to the main lobe of the ``"taylor"`` taper.
+        The default is ``4``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Element amplitudes normalized to a maximum of ``1``.
+
+    Examples
+    --------
+    >>> from ansys.aedt.core.visualization.advanced.array_weights import taper_window
+    >>> taper_window("chebyshev", 8, sidelobe_level=25)
+    """
+    taper = taper.lower()
+    if taper not in TAPERS:
+        raise ValueError(f"Taper '{taper}' is not implemented. Options are {', '.join(TAPERS)}.")
+    if size < 1:
+        raise ValueError("Window size must be positive.")
+    if size == 1 or taper in ("flat", "uniform"):
+        return np.ones(size)
+    if taper == "chebyshev":
+        return _chebyshev_window(size, sidelobe_level)
+    if taper == "taylor":
+        return _taylor_window(size, sidelobe_level, nbar)
+
+    # Offset of each element from the center, normalized to the array length
+    u = np.linspace(-0.5, 0.5, size)
+    if taper == "cosine":
+        return np.cos(np.pi * u)
+    if taper == "triangular":
+        return 1 - 2 * np.abs(u)
+    if taper == "hamming":
+        return 0.54 + 0.46 * np.cos(2 * np.pi * u)
+    return 0.5 + 0.5 * np.cos(2 * np.pi * u)
+
+
+def lattice_taper(indices: np.ndarray, taper: str = "flat", sidelobe_level: float = 30.0, nbar: int = 4) -> np.ndarray:
+    """Compute the amplitude taper of elements placed on a 2-D lattice.
+
+    Parameters
+    ----------
+    indices : :class:`numpy.ndarray`
+        Integer lattice indices of the elements with shape ``(elements, 2)``.
+    taper : str, optional
+        Taper type. See :func:`taper_window` for the options. The default is ``"flat"``.
+    sidelobe_level : float, optional
+        Sidelobe level in dB of the ``"chebyshev"`` and ``"taylor"`` tapers. The default is ``30.0``.
+    nbar : int, optional
+        Number of nearly constant level sidelobes of the ``"taylor"`` taper. The default is ``4``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Amplitude of each element.
+    """
+    indices = np.asarray(indices, dtype=int).reshape(-1, 2)
+    amplitude = np.ones(len(indices))
+    if not len(indices):
+        return amplitude
+    for axis in range(2):
+        offset = indices[:, axis] - indices[:, axis].min()
+        window = taper_window(taper, int(offset.max()) + 1, sidelobe_level, nbar)
+        amplitude *= window[offset]
+    return amplitude
+
+
+def steering_phase(
+    indices: np.ndarray, lattice_vector: list, frequency: float, phi_scan=0.0, theta_scan=0.0
+) -> np.ndarray:
+    """Compute the progressive phase that steers the main beam of a 2-D lattice.
+
+    Parameters
+    ----------
+    indices : :class:`numpy.ndarray`
+        Lattice indices of the elements with shape ``(elements, 2)``.
+    lattice_vector : list
+        Lattice vectors ``[a_x, a_y, a_z, b_x, b_y, b_z]`` in meters.
+    frequency : float
+        Frequency in hertz.
+    phi_scan : float or list, optional
+        Phi scan angles in degrees. The default is ``0.0``.
+    theta_scan : float or list, optional
+        Theta scan angles in degrees. It must have the same length as ``phi_scan``. The default is ``0.0``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Phase in radians with shape ``(scan angles, elements)``.
+    """
+    indices = np.asarray(indices, dtype=float).reshape(-1, 2)
+    theta = np.deg2rad(np.atleast_1d(np.asarray(theta_scan, dtype=float)))
+    phi = np.deg2rad(np.atleast_1d(np.asarray(phi_scan, dtype=float)))
+    k = 2 * np.pi * frequency / SpeedOfLight
+    a_x, a_y, b_x, b_y = [lattice_vector[i] for i in (0, 1, 3, 4)]
+    phase_shift_a = -k * np.sin(theta) * (a_x * np.cos(phi) + a_y * np.sin(phi))
+    phase_shift_b = -k * np.sin(theta) * (b_x * np.cos(phi) + b_y * np.sin(phi))
+    return np.outer(phase_shift_a, indices[:, 0]) + np.outer(phase_shift_b, indices[:, 1])
+
+
+def element_weights(
+    indices: np.ndarray,
+    lattice_vector: list = None,
+    frequency: float = None,
+    phi_scan=0.0,
+    theta_scan=0.0,
+    taper: str = "flat",
+    magnitude=None,
+    phase=None,
+    sidelobe_level: float = 30.0,
+    nbar: int = 4,
+) -> np.ndarray:
+    """Compute the complex excitation weights of an array for several scan angles in one call.
+
+    Parameters
+    ----------
+    indices : :class:`numpy.ndarray`
+        Lattice indices of the elements with shape ``(elements, 2)``.
+    lattice_vector : list, optional
+        Lattice vectors ``[a_x, a_y, a_z, b_x, b_y, b_z]`` in meters. The default is ``None``,
+        in which case the beam is not steered.
+    frequency : float, optional
+        Frequency in hertz. It is required to steer the beam. The default is ``None``.
+    phi_scan : float or list, optional
+        Phi scan angles in degrees. The default is ``0.0``.
+    theta_scan : float or list, optional
+        Theta scan angles in degrees. It must have the same length as ``phi_scan``. The default is ``0.0``.
+    taper : str, optional
+        Amplitude taper. See :func:`taper_window` for the options. The default is ``"flat"``.
+    magnitude : list, optional
+        Power applied on each element. The default is ``None``, in which case ``1`` is used.
+    phase : list, optional
+        Phase offset in degrees of each element. The default is ``None``, in which case ``0`` is used.
+    sidelobe_level : float, optional
+        Sidelobe level in dB of the ``"chebyshev"`` and ``"taylor"`` tapers. The default is ``30.0``.
+    nbar : int, optional
+        Number of nearly constant level sidelobes of the ``"taylor"`` taper. The default is ``4``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Complex weights with shape ``(scan angles, elements)``. The amplitude of the weights is the
+        square root of the element power times the taper.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ansys.aedt.core.visualization.advanced.array_weights import element_weights
+    >>> rows, columns = np.meshgrid(np.arange(8), np.arange(8), indexing="ij")
+    >>> indices = np.column_stack([rows.ravel(), columns.ravel()])
+    >>> weights = element_weights(indices, [0.015, 0, 0, 0, 0.015, 0], 10e9, [0, 0], [0, 30], taper="taylor")
+    >>> weights.shape
+    (2, 64)
+    """
+    indices = np.asarray(indices).reshape(-1, 2)
+    phi_scan = np.atleast_1d(np.asarray(phi_scan, dtype=float))
+    theta_scan = np.atleast_1d(np.asarray(theta_scan, dtype=float))
+    if phi_scan.shape != theta_scan.shape:
+        raise ValueError("Number of phi and theta scan angles must be equal.")
+
+    magnitude = np.ones(len(indices)) if magnitude is None else np.asarray(magnitude, dtype=float)
+    phase = np.zeros(len(indices)) if phase is None else np.deg2rad(np.asarray(phase, dtype=float))
+    phase = np.broadcast_to(phase, (len(phi_scan), len(indices)))
+    if lattice_vector is not None and len(lattice_vector) == 6 and frequency:
+        phase = phase + steering_phase(indices, lattice_vector, frequency, phi_scan, theta_scan)
+    amplitude = np.sqrt(magnitude) * lattice_taper(indices, taper, sidelobe_level, nbar)
+    return amplitude * np.exp(1j * phase)
+
+
+def _chebyshev_window(size: int, sidelobe_level: float) -> np.ndarray:
+    """Dolph-Chebyshev window computed from the inverse DFT of the Chebyshev polynomial."""
+    order = size - 1
+    beta = np.cosh(np.arccosh(10 ** (abs(sidelobe_level) / 20)) / order)
+    x = beta * np.cos(np.pi * np.arange(size) / size)
+    p = np.empty(size)
+    outer = np.abs(x) > 1
+    p[~outer] = np.cos(order * np.arccos(x[~outer]))
+    p[outer] = np.cosh(order * np.arccosh(np.abs(x[outer])))
+    # T_order(-x) = (-1) ** order * T_order(x)
+    p[x < -1] *= (-1) ** order
+    if size % 2:
+        w = np.real(np.fft.fft(p))
+        n = (size + 1) // 2
+        w = np.concatenate((w[n - 1 : 0 : -1], w[:n]))
+    else:
+        w = np.real(np.fft.fft(p * np.exp(1j * np.pi / size * np.arange(size))))
+        n = size // 2 + 1
+        w = np.concatenate((w[n - 1 : 0 : -1], w[1:n]))
+    return w / w.max()
+
+
+def _taylor_window(size: int, sidelobe_level: float, nbar: int) -> np.ndarray:
+    """N-bar Taylor window, whose first ``nbar - 1`` sidelobes are nearly at ``sidelobe_level``."""
+    a = np.arccosh(10 ** (abs(sidelobe_level) / 20)) / np.pi
+    sigma2 = nbar**2 / (a**2 + (nbar - 0.5) ** 2)
+    m = np.arange(1, nbar)
+    m2 = (m**2).astype(float)
+    signs = np.where(m % 2, 1.0, -1.0)
+    numerator = signs * np.prod(1 - m2[:, None] / sigma2 / (a**2 + (m[None, :] - 0.5) ** 2), axis=1)
+    ratio = 1 - m2[:, None] / m2[None, :]
+    np.fill_diagonal(ratio, 1)
+    coefficients = numerator / (2 * np.prod(ratio, axis=1))
+    n = np.arange(size) - (size - 1) / 2
+    w = 1 + 2 * coefficients @ np.cos(2 * np.pi * np.outer(m, n) / size)
+    return w / w.max()
@@ -24,12 +24,14 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 import json
 import math
 import os
 from pathlib import Path
+import re
 import shutil
-import sys
+import tempfile
 from typing import TYPE_CHECKING
 
 import defusedxml
@@ -49,7 +51,12 @@ from ansys.aedt.core.generic.file_utils import open_file
 from ansys.aedt.core.generic.general_methods import conversion_function
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.core.generic.numbers_utils import decompose_variable_value
+from ansys.aedt.core.generic.settings import settings
 from ansys.aedt.core.internal.checks import graphics_required
+from ansys.aedt.core.visualization.advanced.array_weights import TAPERS
+from ansys.aedt.core.visualization.advanced.array_weights import element_weights
+from ansys.aedt.core.visualization.advanced.array_weights import lattice_taper
+from ansys.aedt.core.visualization.advanced.array_weights import steering_phase
 from ansys.aedt.core.visualization.plot.matplotlib import ReportPlotter
 from ansys.aedt.core.visualization.plot.matplotlib import is_notebook
 from ansys.aedt.core.visualization.plot.pyvista import ModelPlotter
@@ -82,6 +89,11 @@ class FfdSolutionData(PyAedtBase):
         data = [1, 0.99]
     touchstone_file : str, optional
         Touchstone file name. The default is ``None``.
+    memory_budget : float, optional
+        Maximum memory in megabytes used by the far fields loaded from the pattern files.
+        The fields of each frequency are loaded when the frequency is activated, and the fields of the least
+        recently used frequencies are released when the budget is exceeded. The fields of the active
+        frequency are always kept. The default is ``1024``.
 
     Examples
     --------
@@ -103,6 +115,7 @@ class FfdSolutionData(PyAedtBase):
         model_info=None,
         incident_power=None,
         touchstone_file=None,
+        memory_budget: float = 1024,
     ) -> None:
         if isinstance(input_file, Path):
             input_file = str(input_file)
@@ -145,7 +158,10 @@ class FfdSolutionData(PyAedtBase):
         # Private
         self.__logger = logger
         self.__input_file = input_file
-        self.__raw_data = {}
+        self.__patterns = {}
+        self.__raw_data = OrderedDict()
+        self.__raw_data_size = 0
+        self.__memory_budget = memory_budget
         self.__freq_index = 0
         self.__model_units = "meter"
 
@@ -162,10 +178,8 @@ class FfdSolutionData(PyAedtBase):
         self.__array_dimension = None
         self.__cell_position = None
         self.__lattice_vector = None
-        self.__a_min = sys.maxsize
-        self.__a_max = 0
-        self.__b_min = sys.maxsize
-        self.__b_max = 0
+        self.__port_index = None
+        self.__sidelobe_level = 30.0
         self.__touchstone_data = None
         self.__weight = {}
         self.__phi_scan = 0.0
@@ -192,32 +206,32 @@ class FfdSolutionData(PyAedtBase):
             if incident_power:
                 for power_freq in incident_power:
                     value = incident_power[power_freq]
-                    frequency = power_freq
+                    power_frequency = power_freq
                     if isinstance(power_freq, str):
-                        frequency, units = decompose_variable_value(power_freq)
+                        power_frequency, units = decompose_variable_value(power_freq)
                         if units:  # pragma: no cover
-                            frequency = unit_converter(frequency, "Freq", units, "Hz")
-                    new_incident_power[frequency] = value
+                            power_frequency = unit_converter(power_frequency, "Freq", units, "Hz")
+                    new_incident_power[power_frequency] = value
 
             new_radiated_power = {}
             if radiated_power:
                 for power_freq in radiated_power:
-                    frequency = power_freq
+                    power_frequency = power_freq
                     if isinstance(power_freq, str):
-                        frequency, units = decompose_variable_value(power_freq)
+                        power_frequency, units = decompose_variable_value(power_freq)
                         if units:  # pragma: no cover
-                            frequency = unit_converter(frequency, "Freq", units, "Hz")
-                    new_radiated_power[frequency] = radiated_power[power_freq]
+                            power_frequency = unit_converter(power_frequency, "Freq", units, "Hz")
+                    new_radiated_power[power_frequency] = radiated_power[power_freq]
 
             new_accepted_power = {}
             if accepted_power:
                 for power_freq in accepted_power:
-                    frequency = power_freq
+                    power_frequency = power_freq
                     if isinstance(power_freq, str):
-                        frequency, units = decompose_variable_value(power_freq)
+                        power_frequency, units = decompose_variable_value(power_freq)
                         if units:  # pragma: no cover
-                            frequency = unit_converter(frequency, "Freq", units, "Hz")
-                    new_accepted_power[frequency] = accepted_power[power_freq]
+                            power_frequency = unit_converter(power_frequency, "Freq", units, "Hz")
+                    new_accepted_power[power_frequency] = accepted_power[power_freq]
 
             self.__element_info[element_name] = {
                 "pattern_file": pattern_file,
@@ -277,16 +291,6 @@ class FfdSolutionData(PyAedtBase):
         else:
             self.frequency = self.frequencies[0]
 
-        port_indices_array = np.array(list(port_indices.values()))
-
-        rows = port_indices_array[:, 0] - 1
-        cols = port_indices_array[:, 1] - 1
-
-        self.__a_min = min(self.__a_min, np.min(rows))
-        self.__a_max = max(self.__a_max, np.max(rows))
-        self.__b_min = min(self.__b_min, np.min(cols))
-        self.__b_max = max(self.__b_max, np.max(cols))
-
     @property
     def phi_scan(self) -> float:
         """Phi scan angle in degrees. It applies only for arrays."""
@@ -328,14 +332,7 @@ class FfdSolutionData(PyAedtBase):
     @property
     def incident_power_element(self) -> dict:
         """Incident power per element in watts."""
-        incident_power = {}
-        for element_name, element_props in self.element_info.items():
-            element_power = element_props.get("incident_power", None)
-            if element_power and element_power.get(self.frequency, None):
-                incident_power[element_name] = element_power.get(self.frequency) * self.magnitude[element_name]
-            else:  # pragma: no cover
-                incident_power[element_name] = 1.0 * self.magnitude[element_name]
-        self.__incident_power_element = incident_power
+        self.__incident_power_element = self.__element_power("incident_power")
         return self.__incident_power_element
 
     @property
@@ -348,14 +345,7 @@ class FfdSolutionData(PyAedtBase):
     @property
     def accepted_power_element(self) -> dict:
         """Accepted power per element in watts."""
-        power = {}
-        for element_name, element_props in self.element_info.items():
-            element_power = element_props.get("accepted_power", None)
-            if element_power and element_power.get(self.frequency, None):
-                power[element_name] = element_power.get(self.frequency) * self.magnitude[element_name]
-            else:  # pragma: no cover
-                power[element_name] = 1.0 * self.magnitude[element_name]
-        return power
+        return self.__element_power("accepted_power")
 
     @property
     def accepted_power(self) -> float:
@@ -367,14 +357,7 @@ class FfdSolutionData(PyAedtBase):
     @property
     def radiated_power_element(self) -> dict:
         """Radiated power per element in watts."""
-        power = {}
-        for element_name, element_props in self.element_info.items():
-            element_power = element_props.get("radiated_power", None)
-            if element_power and element_power.get(self.frequency, None):
-                power[element_name] = element_power.get(self.frequency) * self.magnitude[element_name]
-            else:  # pragma: no cover
-                power[element_name] = 1.0 * self.magnitude[element_name]
-        return power
+        return self.__element_power("radiated_power")
 
     @property
     def radiated_power(self) -> float:
@@ -383,6 +366,19 @@ class FfdSolutionData(PyAedtBase):
         if power_element:
             return sum(power_element.values())
 
+    def __element_power(self, power_type: str, magnitude: dict = None) -> dict:
+        """Power of each element scaled by the magnitude applied on the element."""
+        if magnitude is None:
+            magnitude = self.magnitude
+        power = {}
+        for element_name, element_props in self.element_info.items():
+            element_power = element_props.get(power_type, None)
+            if element_power and element_power.get(self.frequency, None):
+                power[element_name] = element_power.get(self.frequency) * magnitude[element_name]
+            else:  # pragma: no cover
+                power[element_name] = 1.0 * magnitude[element_name]
+        return power
+
     @property
     def active_s_parameters(self) -> dict:
         """Active s-parameters."""
@@ -458,9 +454,21 @@ class FfdSolutionData(PyAedtBase):
         if val in self.frequencies:
             self._frequency = val
             self.__freq_index = self.frequencies.index(val)
+            for element in self.all_element_names:
+                self.__element_data(element, val)
         else:  # pragma: no cover
             self.__logger.error("Frequency not available.")
 
+    @property
+    def memory_budget(self) -> float:
+        """Maximum memory in megabytes used by the far fields loaded from the pattern files."""
+        return self.__memory_budget
+
+    @memory_budget.setter
+    def memory_budget(self, val: float) -> None:
+        self.__memory_budget = val
+        self.__release_fields()
+
     @property
     def phase(self) -> list:
         """Phase offset in degrees on each port."""
@@ -491,9 +499,12 @@ class FfdSolutionData(PyAedtBase):
 
         Options are:
 
+        - ``"chebyshev"``
         - ``"cosine"``
         - ``"flat"``
         - ``"hamming"``
+        - ``"hann"``
+        - ``"taylor"``
         - ``"triangular"``
         - ``"uniform"``
         """
@@ -501,12 +512,21 @@ class FfdSolutionData(PyAedtBase):
 
     @taper.setter
     def taper(self, val: str) -> None:
-        if val.lower() in ("flat", "uniform", "cosine", "triangular", "hamming"):
+        if val.lower() in TAPERS:
             self.__taper = val
 
         else:
             self.__logger.error("This taper is not implemented")
 
+    @property
+    def sidelobe_level(self) -> float:
+        """Sidelobe level in dB below the main lobe of the ``"chebyshev"`` and ``"taylor"`` tapers."""
+        return self.__sidelobe_level
+
+    @sidelobe_level.setter
+    def sidelobe_level(self, val: float) -> None:
+        self.__sidelobe_level = abs(float(val))
+
     @property
     def origin(self) -> list:
         """Far field origin in meters."""
@@ -541,58 +561,165 @@ class FfdSolutionData(PyAedtBase):
         self.__phi_scan = phi_scan
         self.__element_weight()
 
-        port_positions = {}
+        for port in self.all_element_names:
+            if port not in self.weight:  # pragma: no cover
+                self.__weight[port] = np.sqrt(0) * np.exp(1j * 0)
+        weights = np.array([[self.weight[port] for port in self.all_element_names]])
+        rETheta_fields_sum, rEphi_fields_sum = self.__combine_fields(weights)
+        return self.__farfield_quantities(rETheta_fields_sum[0], rEphi_fields_sum[0])
 
-        for port_name in self.all_element_names:
-            port_positions[port_name] = self.element_info[port_name]["location"]
+    @pyaedt_function_handler()
+    def combine_farfield_batch(
+        self, phi_scan: list, theta_scan: list, chunk_size: int = None, use_numexpr: bool = False
+    ) -> dict:
+        """Compute the far field patterns calculated for several phi and theta scan angles at once.
 
-        # Combine farfield of each port
-        initial_port = self.all_element_names[0]
-        freq_name_key = self.frequencies[self.__freq_index]
-        data = self.__raw_data[initial_port][freq_name_key]
-        length_of_ff_data = len(data["rETheta"])
-        theta_range = data["Theta"]
-        phi_range = data["Phi"]
-        n_theta = len(theta_range)
-        n_phi = len(phi_range)
+        The element patterns of the active frequency are combined with one matrix product
+        for all the scan angles. The magnitude, phase and taper of the elements are applied as in
+        :func:`combine_farfield`, but they are not modified by this method.
 
-        incident_power = self.incident_power
-        radiated_power = self.radiated_power
-        accepted_power = self.accepted_power
+        Parameters
+        ----------
+        phi_scan : list or :class:`numpy.ndarray`
+            Phi scan angles in degrees.
+        theta_scan : list or :class:`numpy.ndarray`
+            Theta scan angles in degrees. It must have the same length as ``phi_scan``.
+        chunk_size : int, optional
+            Number of far field points combined at once. The memory used by the computation
+            is proportional to the number of elements times this value. The default is ``None``,
+            in which case the chunks take about 64 MB.
+        use_numexpr : bool, optional
+            Whether to evaluate the array factor with ``numexpr`` when it is installed. NumPy is used
+            otherwise. The default is ``False``.
+
+        Returns
+        -------
+        dict
+            Far field data dictionary. The fields and the derived quantities have a shape of
+            ``(scan angles, theta, phi)``.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from ansys.aedt.core.visualization.advanced.farfield_visualization import FfdSolutionData
+        >>> farfield_data = FfdSolutionData(input_file="pyaedt_antenna_metadata.json")
+        >>> theta_scan = np.linspace(0, 60, 61)
+        >>> data = farfield_data.combine_farfield_batch(np.zeros(61), theta_scan)
+        >>> data["RealizedGain"].shape
+        """
+        phi_scan = np.atleast_1d(np.asarray(phi_scan, dtype=float))
+        theta_scan = np.atleast_1d(np.asarray(theta_scan, dtype=float))
+        if phi_scan.shape != theta_scan.shape:
+            self.__logger.error("Number of phi and theta scan angles must be equal.")
+            return False
+
+        indices = self.__element_indices()
+        taper = self.taper if self.__is_array else "flat"
+        magnitude = np.array([self.magnitude[port] for port in self.all_element_names], dtype=float)
+        weights = element_weights(
+            indices,
+            lattice_vector=self.__lattice_vector if self.__is_array else None,
+            frequency=self.frequency,
+            phi_scan=phi_scan,
+            theta_scan=theta_scan,
+            taper=taper,
+            magnitude=magnitude,
+            phase=[self.phase[port] for port in self.all_element_names],
+            sidelobe_level=self.sidelobe_level,
+        )
+        # The taper is independent of the scan angle, so all the scan angles share the element powers
+        magnitude = dict(
+            zip(self.all_element_names, magnitude * lattice_taper(indices, taper, self.sidelobe_level) ** 2)
+        )
+
+        rETheta_fields_sum, rEphi_fields_sum = self.__combine_fields(weights, chunk_size, use_numexpr)
+        farfield_data = self.__farfield_quantities(rETheta_fields_sum, rEphi_fields_sum, magnitude)
+        farfield_data["phi_scan"] = phi_scan
+        farfield_data["theta_scan"] = theta_scan
+        return farfield_data
+
+    def __combine_fields(self, weights, chunk_size=None, use_numexpr=False):
+        """Combine the element patterns of the active frequency for each row of weights.
+
+        Parameters
+        ----------
+        weights : :class:`numpy.ndarray`
+            Complex weights with shape ``(scan angles, elements)``.
+        chunk_size : int, optional
+            Number of far field points combined at once.
+        use_numexpr : bool, optional
+            Whether to evaluate the array factor with ``numexpr``.
+
+        Returns
+        -------
+        tuple
+            rETheta and rEPhi with shape ``(scan angles, points)``.
+        """
+        freq_name_key = self.frequencies[self.__freq_index]
+        element_data = [self.__element_data(port, freq_name_key) for port in self.all_element_names]
+        positions = np.array([self.element_info[port]["location"] for port in self.all_element_names], dtype=float)
+        data = element_data[0]
+        n_points = len(data["rETheta"])
 
         ph, th = np.meshgrid(data["Phi"], data["Theta"])
-        ph = np.deg2rad(ph)
-        th = np.deg2rad(th)
+        ph = np.deg2rad(ph).ravel()
+        th = np.deg2rad(th).ravel()
         k = 2 * np.pi * self.frequency / SpeedOfLight
-        kx_grid = k * np.sin(th) * np.cos(ph)
-        ky_grid = k * np.sin(th) * np.sin(ph)
-        kz_grid = k * np.cos(th)
-        kx_flat = kx_grid.ravel()
-        ky_flat = ky_grid.ravel()
-        kz_flat = kz_grid.ravel()
-        rEphi_fields_sum = np.zeros(length_of_ff_data, dtype=complex)
-        rETheta_fields_sum = np.zeros(length_of_ff_data, dtype=complex)
-
-        # Farfield superposition
-        for _, port in enumerate(self.all_element_names):
-            data = self.__raw_data[port][freq_name_key]
-            if port not in self.weight:  # pragma: no cover
-                self.__weight[port] = np.sqrt(0) * np.exp(1j * 0)
-
-            xyz_pos = port_positions[port]
-            weight = self.weight[port]
-            array_factor = np.exp(1j * (xyz_pos[0] * kx_flat + xyz_pos[1] * ky_flat + xyz_pos[2] * kz_flat)) * weight
-            rEphi_fields_sum += array_factor * data["rEPhi"]
-            rETheta_fields_sum += array_factor * data["rETheta"]
+        k_vectors = k * np.stack([np.sin(th) * np.cos(ph), np.sin(th) * np.sin(ph), np.cos(th)])
+
+        numexpr = None
+        if use_numexpr:
+            try:
+                import numexpr
+            except ImportError:
+                logger.debug("numexpr is not installed, the array factor is evaluated with NumPy.")
+
+        if not chunk_size:
+            chunk_size = max(1, 2**22 // len(element_data))
+        rETheta_fields_sum = np.empty((len(weights), n_points), dtype=complex)
+        rEphi_fields_sum = np.empty((len(weights), n_points), dtype=complex)
+        for start in range(0, n_points, chunk_size):
+            chunk = slice(start, start + chunk_size)
+            # Farfield superposition
+            phase = positions @ k_vectors[:, chunk]
+            if numexpr is not None:
+                array_factor = numexpr.evaluate("exp(1j * phase)", local_dict={"phase": phase})
+            else:
+                array_factor = np.exp(1j * phase)
+            rETheta_fields_sum[:, chunk] = weights @ (
+                array_factor * np.stack([i["rETheta"][chunk] for i in element_data])
+            )
+            rEphi_fields_sum[:, chunk] = weights @ (array_factor * np.stack([i["rEPhi"][chunk] for i in element_data]))
 
         # Farfield origin shift
-        origin = self.origin
-        array_factor = np.exp(-1j * (origin[0] * kx_flat + origin[1] * ky_flat + origin[2] * kz_flat))
-        rETheta_fields_sum = array_factor * rETheta_fields_sum
-        rEphi_fields_sum = array_factor * rEphi_fields_sum
+        origin = np.asarray(self.origin, dtype=float)
+        array_factor = np.exp(-1j * (origin @ k_vectors))
+        return rETheta_fields_sum * array_factor, rEphi_fields_sum * array_factor
+
+    def __farfield_quantities(self, rETheta_fields_sum, rEphi_fields_sum, magnitude=None) -> dict:
+        """Compute the far field quantities from the combined fields of one or several scan angles.
+
+        The powers are scaled by ``magnitude`` when it is given, or by the magnitude of the elements otherwise.
+        """
+        freq_name_key = self.frequencies[self.__freq_index]
+        data = self.__element_data(self.all_element_names[0], freq_name_key)
+        theta_range = data["Theta"]
+        phi_range = data["Phi"]
+        n_theta = len(theta_range)
+        n_phi = len(phi_range)
+        shape = rETheta_fields_sum.shape[:-1] + (n_theta, n_phi)
+
+        if magnitude is None:
+            incident_power = self.incident_power
+            radiated_power = self.radiated_power
+            accepted_power = self.accepted_power
+        else:
+            incident_power = sum(self.__element_power("incident_power", magnitude).values())
+            radiated_power = sum(self.__element_power("radiated_power", magnitude).values())
+            accepted_power = sum(self.__element_power("accepted_power", magnitude).values())
 
-        rEtheta_fields_sum = np.reshape(rETheta_fields_sum, (n_theta, n_phi))
-        rEphi_fields_sum = np.reshape(rEphi_fields_sum, (n_theta, n_phi))
+        rEtheta_fields_sum = np.reshape(rETheta_fields_sum, shape)
+        rEphi_fields_sum = np.reshape(rEphi_fields_sum, shape)
 
         farfield_data = {}
         farfield_data["rEPhi"] = rEphi_fields_sum
@@ -655,142 +782,24 @@ class FfdSolutionData(PyAedtBase):
             total_accepted_power = sum(accepted_power.values())
             return total_accepted_power
 
-    @pyaedt_function_handler()
-    def __assign_weight_taper(self, a, b):  # pragma: no cover
-        """Assign weight to array.
-
-        Parameters
-        ----------
-        a : int
-            Index of array, column.
-        b : int
-            Index of array, row.
-
-        Returns
-        -------
-        float
-            Weight applied to specific index of the array.
-        """
-        taper = self.taper
-
-        if taper.lower() in ("flat", "uniform") or not self.__is_array:
-            return 1
-
-        cosinePow = 1
-        edgeTaper_dB = -200
-
-        edgeTaper = 10 ** ((float(edgeTaper_dB)) / 20)
-
-        threshold = 1e-10
-
-        # find the distance between current cell and array center in terms of index
-        lattice_vector = self.__lattice_vector[self.__freq_index]
-        if not lattice_vector or not len(lattice_vector) == 6:
-            return 1.0
-
-        center_a = (self.__a_min + self.__a_max) / 2
-        center_b = (self.__b_min + self.__b_max) / 2
-
-        length_in_direction1 = a - center_a
-        length_in_direction2 = b - center_b
-        max_length_in_dir1 = self.__a_max - self.__a_min
-        max_length_in_dir2 = self.__b_max - self.__b_min
-
-        if taper.lower() == "cosine":  # Cosine
-            if max_length_in_dir1 < threshold:
-                w1 = 1
-            else:
-                w1 = (1 - edgeTaper) * (
-                    math.cos(math.pi * length_in_direction1 / max_length_in_dir1)
-                ) ** cosinePow + edgeTaper
-            if max_length_in_dir2 < threshold:
-                w2 = 1
-            else:
-                w2 = (1 - edgeTaper) * (
-                    math.cos(math.pi * length_in_direction2 / max_length_in_dir2)
-                ) ** cosinePow + edgeTaper
-        elif taper.lower() == "triangular":  # Triangular
-            if max_length_in_dir1 < threshold:
-                w1 = 1
-            else:
-                w1 = (1 - edgeTaper) * (1 - (math.fabs(length_in_direction1) / (max_length_in_dir1 / 2))) + edgeTaper
-            if max_length_in_dir2 < threshold:
-                w2 = 1
-            else:
-                w2 = (1 - edgeTaper) * (1 - (math.fabs(length_in_direction2) / (max_length_in_dir2 / 2))) + edgeTaper
-        elif taper.lower() == "hamming":  # Hamming Window
-            if max_length_in_dir1 < threshold:
-                w1 = 1
-            else:
-                w1 = 0.54 - 0.46 * math.cos(2 * math.pi * (length_in_direction1 / max_length_in_dir1 - 0.5))
-            if max_length_in_dir2 < threshold:
-                w2 = 1
-            else:
-                w2 = 0.54 - 0.46 * math.cos(2 * math.pi * (length_in_direction2 / max_length_in_dir2 - 0.5))
-        else:
-            return 0
-
-        return w1 * w2
-
-    @pyaedt_function_handler()
-    def __phase_shift_steering(self, a, b, theta: float = 0.0, phi: float = 0.0):
-        """Shift element phase for a specific Theta and Phi scan angle in degrees.
-
-        This method calculates phase shifts between array elements in A and B directions given the lattice vector.
-
-        Parameters
-        ----------
-        a : int
-            Index of array, column.
-        b : int
-            Index of array, row.
-        theta : float, optional
-            Theta scan angle in degrees. The default is ``0.0``.
-        phi : float, optional
-            Phi scan angle in degrees. The default is ``0.0``.
-
-        Returns
-        -------
-        float
-            Phase shift in degrees.
-        """
-        k = (2 * math.pi * self.frequency) / SpeedOfLight
-        a = int(a)
-        b = int(b)
-        theta = np.deg2rad(theta)
-        phi = np.deg2rad(phi)
-
-        lattice_vector = self.__lattice_vector
-
-        a_x, a_y, b_x, b_y = [lattice_vector[0], lattice_vector[1], lattice_vector[3], lattice_vector[4]]
-
-        phase_shift_a = -((a_x * k * np.sin(theta) * np.cos(phi)) + (a_y * k * np.sin(theta) * np.sin(phi)))
-
-        phase_shift_b = -((b_x * k * np.sin(theta) * np.cos(phi)) + (b_y * k * np.sin(theta) * np.sin(phi)))
-
-        phase_shift = a * phase_shift_a + b * phase_shift_b
-
-        return np.rad2deg(phase_shift)
-
     @pyaedt_function_handler()
     def __element_weight(self) -> None:
         # Obtain weights for each element
-        for element_name in self.all_element_names:
-            amplitude = self.magnitude[element_name]
-            phase = self.phase[element_name]
-            if self.__is_array:
-                index_port = self.get_port_index()
-                index_str = index_port[element_name]
-                a = index_str[0] - 1
-                b = index_str[1] - 1
-                phase_steering = self.__phase_shift_steering(a, b, self.theta_scan, self.phi_scan)
-                phase += phase_steering
-                amplitude_taper = self.__assign_weight_taper(a=a, b=b)
-                amplitude *= amplitude_taper
-
-            self.__weight[element_name] = np.sqrt(amplitude) * np.exp(1j * np.deg2rad(phase))
-            self.__magnitude[element_name] = amplitude
-            self.__phase[element_name] = phase
+        amplitude = np.array([self.magnitude[port] for port in self.all_element_names], dtype=float)
+        phase = np.array([self.phase[port] for port in self.all_element_names], dtype=float)
+        if self.__is_array:
+            indices = self.__element_indices()
+            phase_steering = steering_phase(
+                indices, self.__lattice_vector, self.frequency, self.phi_scan, self.theta_scan
+            )
+            phase += np.rad2deg(phase_steering[0])
+            # The magnitude is a power, the taper applies to the excitation amplitude
+            amplitude *= lattice_taper(indices, self.taper, self.sidelobe_level) ** 2
+
+        weights = np.sqrt(amplitude) * np.exp(1j * np.deg2rad(phase))
+        self.__weight.update(zip(self.all_element_names, weights))
+        self.__magnitude.update(zip(self.all_element_names, amplitude))
+        self.__phase.update(zip(self.all_element_names, phase))
 
     @pyaedt_function_handler()
     def plot_contour(
@@ -1338,51 +1347,38 @@ class FfdSolutionData(PyAedtBase):
             ``True`` when successful, ``False`` when failed.
         """
         for element, element_data in element_info.items():
-            self.__raw_data[element] = {}
-            self.__frequencies = []
-            if Path(element_data["pattern_file"]).exists():
-                # Extract ports
-                with open_file(element_data["pattern_file"], "r") as reader:
-                    theta = [int(i) for i in reader.readline().split()]
-                    phi = [int(i) for i in reader.readline().split()]
-                reader.close()
-
-                # Extract ffd information
-                with open(element_data["pattern_file"], "r") as file:
-                    ffd_text = file.read()
-
-                segments = ffd_text.split("Frequency")
-                eep_text_list = {}
-                frequency_text_list = []
-
-                for i, segment in enumerate(segments[1:]):
-                    segment = segment.strip()
-                    if segment:
-                        lines = segment.split("\n")
-                        frequency_text_list.append(lines[0])
-                        eep_text_list[lines[0]] = lines[1:]
-
-                theta_range = np.linspace(*theta)
-                phi_range = np.linspace(*phi)
-
-                for freq in frequency_text_list:
-                    freq_hz = float(freq)
-                    self.__frequencies.append(freq_hz)
-                    temp_dict = {}
-                    self.__raw_data[element][freq_hz] = {}
-                    eep_txt = np.loadtxt(eep_text_list[freq])
-                    Etheta = np.vectorize(complex)(eep_txt[:, 0], eep_txt[:, 1])
-                    Ephi = np.vectorize(complex)(eep_txt[:, 2], eep_txt[:, 3])
-                    temp_dict["Theta"] = theta_range
-                    temp_dict["Phi"] = phi_range
-                    temp_dict["rETheta"] = Etheta
-                    temp_dict["rEPhi"] = Ephi
-                    self.__raw_data[element][freq_hz] = temp_dict
-            else:  # pragma: no cover
+            if not Path(element_data["pattern_file"]).exists():  # pragma: no cover
                 raise Exception("Wrong far fields were imported.")
-
+            self.__patterns[element] = _FfdPattern(element_data["pattern_file"])
+            self.__frequencies = self.__patterns[element].frequencies
         return True
 
+    def __element_data(self, element, frequency) -> dict:
+        """Get the far field of an element at a frequency, loading it from the pattern file if needed."""
+        key = (element, frequency)
+        data = self.__raw_data.get(key)
+        if data is not None:
+            self.__raw_data.move_to_end(key)
+            return data
+        pattern = self.__patterns[element]
+        fields = pattern.read(pattern.frequencies.index(frequency))
+        data = {"Theta": pattern.theta, "Phi": pattern.phi, "rETheta": fields[0], "rEPhi": fields[1]}
+        self.__raw_data[key] = data
+        self.__raw_data_size += fields.nbytes
+        self.__release_fields()
+        return data
+
+    def __release_fields(self) -> None:
+        """Release the least recently used far fields until the memory budget is met."""
+        budget = self.memory_budget * 1024 * 1024
+        for key in list(self.__raw_data):
+            if self.__raw_data_size <= budget:
+                break
+            if key[1] == self.frequency:
+                continue
+            data = self.__raw_data.pop(key)
+            self.__raw_data_size -= data["rETheta"].nbytes + data["rEPhi"].nbytes
+
     @pyaedt_function_handler()
     def get_far_field_mesh(self, quantity: str = "RealizedGain", quantity_format: str = "dB10") -> "UnstructuredGrid":
         """Generate a PyVista ``UnstructuredGrid`` object that represents the far field mesh.
@@ -1536,6 +1532,9 @@ class FfdSolutionData(PyAedtBase):
         list
             Element index.
         """
+        if self.__port_index:
+            return self.__port_index
+
         port_index = {}
 
         port_name = self.all_element_names
@@ -1561,8 +1560,14 @@ class FfdSolutionData(PyAedtBase):
                     last_value = list(port_index.values())[-1]
                     port_index[port] = [1, last_value[1] + 1]
 
+        self.__port_index = port_index
         return port_index
 
+    def __element_indices(self) -> np.ndarray:
+        """Zero based lattice indices of the elements with shape ``(elements, 2)``."""
+        port_index = self.get_port_index()
+        return np.array([port_index[port] for port in self.all_element_names], dtype=int) - 1
+
     @staticmethod
     @pyaedt_function_handler()
     def __find_nearest(array, value):
@@ -1870,3 +1875,164 @@ def antenna_metadata_from_xml(input_file: str) -> dict:
             sources.append(source_info)
             cont += 1
     return sources
+
+
+_FFD_CACHE_VERSION = 4
+
+
+def _scan_ffd(data: bytes) -> tuple[np.ndarray, np.ndarray, list]:
+    """Scan the header and the frequency blocks of a far field pattern file.
+
+    Parameters
+    ----------
+    data : bytes
+        Content of the ``.ffd`` file.
+
+    Returns
+    -------
+    tuple
+        Theta range, phi range and list of ``(frequency, start, end)`` tuples with the
+        offsets of the values of each frequency block.
+    """
+    theta, phi, _ = data.split(b"\n", 2)
+    theta = theta.split()
+    phi = phi.split()
+    theta_range = np.linspace(float(theta[0]), float(theta[1]), int(theta[2]))
+    phi_range = np.linspace(float(phi[0]), float(phi[1]), int(phi[2]))
+    markers = list(re.finditer(rb"Frequency\s+(\S+)", data))
+    ends = [marker.start() for marker in markers[1:]] + [len(data)]
+    blocks = [(float(marker.group(1)), marker.end(), end) for marker, end in zip(markers, ends)]
+    return theta_range, phi_range, blocks
+
+
+def _decode_ffd_block(data: bytes, n_points: int) -> np.ndarray:
+    """Decode the values of a frequency block into an array of shape ``(2, points)`` with rETheta and rEPhi."""
+    values = np.fromstring(data, sep=" ")
+    if values.size != 4 * n_points:
+        raise ValueError(f"Far field frequency block does not have {n_points} points.")
+    fields = np.empty((2, n_points), dtype=np.complex128)
+    fields[0].real = values[0::4]
+    fields[0].imag = values[1::4]
+    fields[1].real = values[2::4]
+    fields[1].imag = values[3::4]
+    return fields
+
+
+class _FfdPattern:
+    """Far field pattern file of one element, whose frequency blocks are decoded on demand.
+
+    When ``settings.ffd_cache`` is ``True``, the grid and the byte ranges of the frequency blocks are saved
+    next to the pattern file in an uncompressed ``.ffd.npz`` file. Each frequency block is saved in its own
+    ``.ffd.<index>.npz`` file the first time it is decoded, and it is read from it afterwards. The cache files
+    are keyed on the size and the modification time of the pattern file. Otherwise, each block is decoded from
+    the pattern file when it is read.
+
+    Parameters
+    ----------
+    pattern_file : str or :class:`pathlib.Path`
+        Path to the ``.ffd`` file.
+    """
+
+    def __init__(self, pattern_file: str | Path) -> None:
+        self.pattern_file = Path(pattern_file)
+        self.cache_file = None
+        self.__blocks = []
+        stat = self.pattern_file.stat()
+        self.__key = np.array([stat.st_size, stat.st_mtime_ns, _FFD_CACHE_VERSION], dtype=np.int64)
+        cache_file = self.pattern_file.with_name(self.pattern_file.name + ".npz")
+        if settings.ffd_cache and self.__read_cache_header(cache_file):
+            return
+        self.__scan()
+        if settings.ffd_cache and _write_ffd_cache(
+            cache_file,
+            key=self.__key,
+            theta=self.theta,
+            phi=self.phi,
+            frequencies=self.frequencies,
+            spans=np.array([(start, end) for _, start, end in self.__blocks], dtype=np.int64).reshape(-1, 2),
+        ):
+            self.cache_file = cache_file
+
+    @property
+    def n_points(self) -> int:
+        """Number of points of each frequency block."""
+        return len(self.theta) * len(self.phi)
+
+    def read(self, index: int) -> np.ndarray:
+        """Read the fields of a frequency block.
+
+        Parameters
+        ----------
+        index : int
+            Index of the frequency.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Array of shape ``(2, points)`` with the complex values of rETheta and rEPhi.
+        """
+        block_file = None
+        if self.cache_file is not None:
+            block_file = self.pattern_file.with_name(f"{self.pattern_file.name}.{index}.npz")
+            fields = self.__read_cache_block(block_file)
+            if fields is not None:
+                return fields
+        _, start, end = self.__blocks[index]
+        with open(self.pattern_file, "rb") as f:
+            f.seek(start)
+            fields = _decode_ffd_block(f.read(end - start), self.n_points)
+        if block_file is not None:
+            _write_ffd_cache(block_file, key=self.__key, fields=fields)
+        return fields
+
+    def __scan(self) -> None:
+        data = self.pattern_file.read_bytes()
+        self.theta, self.phi, self.__blocks = _scan_ffd(data)
+        self.frequencies = [block[0] for block in self.__blocks]
+
+    def __read_cache_header(self, cache_file: Path) -> bool:
+        if not cache_file.is_file():
+            return False
+        try:
+            with np.load(cache_file, allow_pickle=False) as cached:
+                if not np.array_equal(cached["key"], self.__key):
+                    return False
+                self.theta = cached["theta"]
+                self.phi = cached["phi"]
+                self.frequencies = cached["frequencies"].tolist()
+                spans = cached["spans"].tolist()
+        except Exception:
+            logger.debug(f"Failed to read far field cache {cache_file}.")
+            return False
+        self.__blocks = [(frequency, start, end) for frequency, (start, end) in zip(self.frequencies, spans)]
+        self.cache_file = cache_file
+        return True
+
+    def __read_cache_block(self, block_file: Path) -> np.ndarray | None:
+        if not block_file.is_file():
+            return None
+        try:
+            with np.load(block_file, allow_pickle=False) as cached:
+                if np.array_equal(cached["key"], self.__key):
+                    return cached["fields"]
+        except Exception:
+            logger.debug(f"Failed to read far field cache {block_file}.")
+        return None
+
+
+def _write_ffd_cache(cache_file: Path, **arrays) -> bool:
+    """Write a far field cache file, returning whether it is written."""
+    try:
+        # the cache is written to a temporary file and then renamed, so that a partial cache is never read
+        fd, temp_file = tempfile.mkstemp(dir=cache_file.parent, prefix=".", suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as cache_fh:
+                np.savez(cache_fh, **arrays)
+            Path(temp_file).replace(cache_file)
+        except Exception:
+            Path(temp_file).unlink(missing_ok=True)
+            raise
+    except Exception:
+        logger.debug(f"Failed to write far field cache {cache_file}.")
+        return False
+    return True
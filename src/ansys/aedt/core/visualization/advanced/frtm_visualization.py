@@ -53,6 +53,11 @@ class FRTMData(PyAedtBase):
     ----------
     input_file : str or :class:`pathlib.Path`
         Data in a FRTM file.
+    memory_map : bool, optional
+        Whether to map the binary data of the file in memory instead of reading it.
+        The samples are then read from the disk only when they are accessed, but the
+        file stays open as long as the data is referenced. On Windows, the file cannot be
+        moved or deleted in the meantime. The default is ``False``.
 
     Examples
     --------
@@ -61,7 +66,7 @@ class FRTMData(PyAedtBase):
     >>> data = RangeDopplerData(file)
     """
 
-    def __init__(self, input_file: str | Path) -> None:
+    def __init__(self, input_file: str | Path, memory_map: bool = False) -> None:
         input_file = Path(input_file)
 
         if not input_file.is_file():
@@ -100,6 +105,8 @@ class FRTMData(PyAedtBase):
         self.__receiver_position = {}
         self.__channel_names = []
         self.__all_data = {}
+        self.__data_cube = None
+        self.__memory_map = memory_map
         self.__data_conversion_function = None
         self.__read_frtm()
 
@@ -265,6 +272,14 @@ class FRTMData(PyAedtBase):
         """Complete dataset."""
         return self.__all_data
 
+    @property
+    def data_cube(self) -> np.ndarray:
+        """Complete dataset with shape ``(channels, pulses, samples)``.
+
+        The channels follow the order of :attr:`channel_names`. The array is shared with :attr:`all_data`.
+        """
+        return self.__data_cube
+
     @property
     def range_resolution(self) -> float:
         """Radar range resolution (meters)."""
@@ -350,10 +365,58 @@ class FRTMData(PyAedtBase):
         else:
             pulse = int(pulse)
 
-        data_array = np.stack(list(self.all_data.values()))
-        pulse_data = data_array[:, pulse]
+        pulse_data = self.data_cube[:, pulse].copy()
         return pulse_data
 
+    @pyaedt_function_handler()
+    def get_data(self, channel=None, pulse=None, frequency=None) -> np.ndarray:
+        """
+        Get a subset of the data without loading the complete dataset.
+
+        Each argument accepts an index, a slice, or a list of indices. An index removes the
+        corresponding dimension from the output. Slices return a view of :attr:`data_cube`.
+
+        Parameters
+        ----------
+        channel : int, str, slice or list, optional
+            Channel indices or names. The default is ``None``, in which case all channels are returned.
+        pulse : int, slice or list, optional
+            Pulse indices. The default is ``None``, in which case all pulses are returned.
+        frequency : int, slice or list, optional
+            Frequency sample indices. The default is ``None``, in which case all samples are returned.
+
+        Returns
+        -------
+        numpy.ndarray
+            Data with the ``(channels, pulses, samples)`` dimensions that are not indexed by an integer.
+
+        Examples
+        --------
+        >>> from ansys.aedt.core.visualization.advanced.frtm_visualization import FRTMData
+        >>> file = "RxSignal.frtm"
+        >>> data = FRTMData(file)
+        >>> first_pulses = data.get_data(channel=data.channel_names[0], pulse=slice(0, 10))
+        """
+        if isinstance(channel, str):
+            channel = self.channel_names.index(channel)
+        elif channel is not None and not isinstance(channel, slice) and np.ndim(channel):
+            channel = [self.channel_names.index(i) if isinstance(i, str) else i for i in channel]
+
+        data = self.data_cube
+        axis = 0
+        for key in (channel, pulse, frequency):
+            if key is None:
+                axis += 1
+            elif isinstance(key, slice):
+                data = data[(slice(None),) * axis + (key,)]
+                axis += 1
+            elif np.ndim(key) == 0:
+                data = data[(slice(None),) * axis + (int(key),)]
+            else:
+                data = np.take(data, key, axis=axis)
+                axis += 1
+        return data
+
     @pyaedt_function_handler()
     def convert_frequency_range(self, pulse: int = None, window: str = None, size: int = None) -> np.ndarray:
         """
@@ -495,7 +558,7 @@ class FRTMData(PyAedtBase):
         Returns
         -------
         numpy.ndarray
-            Range doppler array of shape (doppler_bins, range_bins), where:
+            Range doppler array of shape (range_bins, doppler_bins), where:
             - Each column corresponds to a Doppler velocity bin.
             - Each row corresponds to a range bin.
 
@@ -516,50 +579,7 @@ class FRTMData(PyAedtBase):
 
         data = self.all_data[channel]
 
-        num_cpi_frames, num_freq = data.shape
-
-        if doppler_bins is None:
-            doppler_bins = num_cpi_frames
-
-        if range_bins is None:
-            range_bins = num_freq
-
-        # range_profile_cpi_frame = np.zeros((doppler_bins, range_bins), dtype=complex)
-        # data_range_pulse_out = np.zeros((range_bins, doppler_bins), dtype=complex)
-        #
-        # for n, p in enumerate(data[:doppler_bins]):
-        #     rp = self.range_profile(p, window=window, oversampling=1, window_size=range_bins)
-        #     range_profile_cpi_frame[n] = rp
-
-        # Place doppler as first dimension
-        data = np.swapaxes(data, 0, 1)
-
-        # Swap first and second half to place zero at first index
-        data = np.fliplr(data)
-
-        # Doppler windowing
-        doppler_window = self.window_function(window, num_cpi_frames)
-        sample_factor_doppler = len(doppler_window) / np.sum(doppler_window)
-        up_sample_doppler = doppler_bins / num_cpi_frames
-
-        # Range windowing
-        range_window = self.window_function(window, num_freq)
-        sample_factor_range = len(range_window) / np.sum(range_window)
-        up_sample_range = range_bins / num_freq
-
-        doppler_window = doppler_window * sample_factor_doppler
-        range_window = range_window * sample_factor_range
-
-        fp_win = up_sample_doppler * np.multiply(data, doppler_window)
-        s1 = np.fft.ifft(fp_win, n=doppler_bins)
-        s1 = np.rot90(s1)
-
-        s1_win = up_sample_range * np.multiply(range_window, s1)
-        s2 = np.fft.ifft(s1_win, n=range_bins)
-        s2 = np.rot90(s2)
-        s2_shift = np.fft.fftshift(s2, axes=1)
-
-        range_doppler = np.flipud(s2_shift)
+        range_doppler = _range_doppler_maps(data[np.newaxis], window, range_bins, doppler_bins)[0]
 
         self.data_conversion_function = original_function
         if original_function is not None:
@@ -832,30 +852,24 @@ class FRTMData(PyAedtBase):
 
         if self.col_count == 2:
             dt = np.dtype([(self.col_header1, float), (self.col_header2, float)])
+            shape = (self.channel_number, self.cpi_frames, self.frequency_number)
         else:
             dt = np.dtype([(self.col_header1, float)])
-        raw_data = np.fromfile(self.__input_file, dtype=dt, offset=self.binary_start_byte)
+            shape = (self.channel_number, self.cpi_frames, int(self.frequency_number * 2))  # fmcw I channel
 
-        # cdat_real = np.moveaxis(cdat_real,-1,0)
-        if self.col_count == 2:
-            cdat_real = np.reshape(
-                raw_data[self.col_header1], (self.channel_number, self.cpi_frames, self.frequency_number)
-            )
-            cdat_imag = np.reshape(
-                raw_data[self.col_header2], (self.channel_number, self.cpi_frames, self.frequency_number)
-            )
-            # cdat_imag = np.moveaxis(cdat_imag,-1,0)
-            for n, ch in enumerate(self.channel_names):
-                self.__all_data[ch] = cdat_real[n] + cdat_imag[n] * 1j
+        if self.__memory_map:
+            # Copy on write keeps the file unchanged if the data is modified
+            raw_data = np.memmap(self.__input_file, dtype=dt, mode="c", offset=self.binary_start_byte, shape=shape)
         else:
-            cdat_real = np.reshape(
-                raw_data[self.col_header1], (self.channel_number, self.cpi_frames, int(self.frequency_number * 2))
-            )  # fmcw I channel
-            for n, ch in enumerate(self.channel_names):
-                temp = cdat_real[n]
-                # temp2 = temp.T[0::2] #every other sample for fmcw I channel only
-                # temp2 = temp.T[0:80]
-                self.__all_data[ch] = temp
+            raw_data = np.fromfile(
+                self.__input_file, dtype=dt, count=int(np.prod(shape)), offset=self.binary_start_byte
+            )
+            raw_data = raw_data.reshape(shape)
+
+        # The real and imaginary columns have the memory layout of complex numbers
+        self.__data_cube = np.asarray(raw_data).view(np.complex128 if self.col_count == 2 else float)
+        for n, ch in enumerate(self.channel_names):
+            self.__all_data[ch] = self.__data_cube[n]
 
 
 class FRTMPlotter(PyAedtBase):
@@ -1440,3 +1454,313 @@ def get_results_files(input_dir: str, var_name: str = "time_var") -> dict:
 
         all_frtm_dict = dict(sorted(all_frtm_dict.items()))
     return all_frtm_dict
+
+
+@pyaedt_function_handler()
+def range_doppler_batch(
+    input_files,
+    output_file: str | Path = None,
+    channel: str = None,
+    window: str = "Hann",
+    range_bins: int = None,
+    doppler_bins: int = None,
+    data_conversion_function: str = None,
+    batch_size: int = 8,
+    max_workers: int = None,
+    workers: int = -1,
+):
+    """Compute the range-Doppler maps of several FRTM files.
+
+    The files are read by a pool of threads while the previous batch is processed. Each batch is
+    windowed and transformed at once with the same processing as :func:`FRTMData.range_doppler`.
+
+    Parameters
+    ----------
+    input_files : list or dict
+        FRTM files. A dictionary like the one returned by :func:`get_results_files` maps each frame to its file.
+    output_file : str or :class:`pathlib.Path`, optional
+        HDF5 file where the maps are written. The default is ``None``, in which case the maps are returned.
+        The file contains the ``range_doppler`` array, chunked by frame, and the ``frames``, ``range``
+        and ``velocity`` axes. Writing the file requires the ``tables`` package.
+    channel : str, optional
+        Channel name. The default is the first one.
+    window : str, optional
+        Type of window to apply in both Doppler and range dimensions. The default is ``"Hann"``.
+    range_bins : int, optional
+        Number of output bins in range. The default is the number of frequencies.
+    doppler_bins : int, optional
+        Number of output bins in Doppler. The default is the number of CPI frames.
+    data_conversion_function : str, optional
+        Conversion applied to the maps. See :func:`FRTMData.data_conversion_function` for the options.
+        The default is ``None``, in which case the complex maps are returned.
+    batch_size : int, optional
+        Number of files processed together. The default is ``8``.
+    max_workers : int, optional
+        Maximum number of threads reading the files. The default is ``None``, in which case
+        the default of :class:`concurrent.futures.ThreadPoolExecutor` is used.
+    workers : int, optional
+        Number of workers of the ``scipy.fft`` transforms. The default is ``-1``, in which case all
+        CPUs are used. It is ignored if ``scipy`` is not installed.
+
+    Returns
+    -------
+    numpy.ndarray or :class:`pathlib.Path`
+        Maps with shape ``(frames, range_bins, doppler_bins)``, or the HDF5 file if ``output_file`` is given.
+
+    Examples
+    --------
+    >>> from ansys.aedt.core.visualization.advanced.frtm_visualization import get_results_files
+    >>> from ansys.aedt.core.visualization.advanced.frtm_visualization import range_doppler_batch
+    >>> frames = get_results_files(r"path_to_data")
+    >>> range_doppler_batch(frames, output_file="range_doppler.h5", data_conversion_function="dB20")
+    """
+
+    def process(batch):
+        maps = _range_doppler_maps(np.stack(batch), window, range_bins, doppler_bins, workers)
+        if data_conversion_function is not None:
+            maps = conversion_function(maps, data_conversion_function)
+        return maps
+
+    frames, files, first = _batch_frtm_files(input_files)
+    channel = channel or first.channel_names[0]
+    range_bins = range_bins or first.frequency_number
+    doppler_bins = doppler_bins or first.cpi_frames
+    shape = (len(files), range_bins, doppler_bins)
+    dtype = complex if data_conversion_function is None else float
+    axes = {
+        "frames": np.asarray(frames),
+        "range": np.linspace(0, first.range_maximum, range_bins),
+        "velocity": np.linspace(-first.velocity_maximum, first.velocity_maximum, doppler_bins),
+    }
+    return _stream_frtm_files(
+        files,
+        first=first,
+        read=lambda data: data.all_data[channel],
+        process=process,
+        name="range_doppler",
+        shape=shape,
+        dtype=dtype,
+        axes=axes,
+        output_file=output_file,
+        batch_size=batch_size,
+        max_workers=max_workers,
+    )
+
+
+@pyaedt_function_handler()
+def range_angle_batch(
+    input_files,
+    output_file: str | Path = None,
+    receiver_position: dict = None,
+    pulse: int = None,
+    window: str = None,
+    range_bins: int = None,
+    cross_range_bins: int = 181,
+    field_of_view: list = None,
+    data_conversion_function: str = None,
+    batch_size: int = 8,
+    max_workers: int = None,
+    workers: int = -1,
+):
+    """Compute the Bartlett range-angle maps of several FRTM files.
+
+    The files are read by a pool of threads while the previous batch is processed. The range profiles of
+    all the channels of a batch are computed at once and the Bartlett beamformer is evaluated as a single
+    matrix product.
+
+    Parameters
+    ----------
+    input_files : list or dict
+        FRTM files. A dictionary like the one returned by :func:`get_results_files` maps each frame to its file.
+    output_file : str or :class:`pathlib.Path`, optional
+        HDF5 file where the maps are written. The default is ``None``, in which case the maps are returned.
+        The file contains the ``range_angle`` array, chunked by frame, and the ``frames``, ``range``
+        and ``azimuth`` axes. Writing the file requires the ``tables`` package.
+    receiver_position : dict, optional
+        Position in meters of the receiver of each channel. The default is ``None``, in which case
+        :attr:`FRTMData.receiver_position` of the first file is used.
+    pulse : int, optional
+        Index of the pulse. The default is ``None``, in which case the center pulse is used.
+    window : str, optional
+        Type of window applied in the range dimension. The default is ``None``.
+    range_bins : int, optional
+        Number of output bins in range. The default is the number of frequencies.
+    cross_range_bins : int, optional
+        Number of bins in azimuth. The default is ``181``.
+    field_of_view : list, optional
+        Azimuth angular span in degrees. The default is ``[-90, 90]``.
+    data_conversion_function : str, optional
+        Conversion applied to the maps. See :func:`FRTMData.data_conversion_function` for the options.
+        The default is ``None``.
+    batch_size : int, optional
+        Number of files processed together. The default is ``8``.
+    max_workers : int, optional
+        Maximum number of threads reading the files. The default is ``None``.
+    workers : int, optional
+        Number of workers of the ``scipy.fft`` transforms. The default is ``-1``, in which case all CPUs are used.
+
+    Returns
+    -------
+    numpy.ndarray or :class:`pathlib.Path`
+        Maps with shape ``(frames, range_bins, cross_range_bins)``, or the HDF5 file if ``output_file`` is given.
+    """
+    frames, files, first = _batch_frtm_files(input_files)
+    if field_of_view is None:
+        field_of_view = [-90, 90]
+    if receiver_position is None:
+        receiver_position = first.receiver_position
+    pulse = int(first.cpi_frames / 2) if pulse is None else int(pulse)
+    range_bins = range_bins or first.frequency_number
+    num_freq = first.frequency_number
+
+    position = np.array([receiver_position[channel] for channel in first.channel_names], dtype=float)
+    doa = DirectionOfArrival(x_position=position[:, 0], y_position=position[:, 1], frequency=first.frequency_center)
+    azimuth = np.linspace(field_of_view[0], field_of_view[1], num=cross_range_bins)
+    scanning_vectors = doa.get_scanning_vectors(azimuth + 90)
+
+    range_window = FRTMData.window_function(window, num_freq) if window else np.ones(num_freq)
+    range_window = range_window * num_freq / np.sum(range_window)
+
+    def process(batch):
+        data = np.stack(batch) * range_window
+        channel_range = range_bins / num_freq * _ifft(data, range_bins, -1, workers)
+        # Range bins first, channels last
+        range_channel = np.swapaxes(channel_range[..., ::-1], 1, 2)
+        maps = (np.abs(range_channel @ scanning_vectors.conj()) ** 2).astype(complex)[:, ::-1]
+        if data_conversion_function is not None:
+            maps = conversion_function(maps, data_conversion_function)
+        return maps
+
+    shape = (len(files), range_bins, cross_range_bins)
+    dtype = complex if data_conversion_function is None else float
+    axes = {
+        "frames": np.asarray(frames),
+        "range": np.linspace(0, first.range_maximum, range_bins),
+        "azimuth": azimuth,
+    }
+    return _stream_frtm_files(
+        files,
+        first=first,
+        read=lambda data: data.data_cube[:, pulse],
+        process=process,
+        name="range_angle",
+        shape=shape,
+        dtype=dtype,
+        axes=axes,
+        output_file=output_file,
+        batch_size=batch_size,
+        max_workers=max_workers,
+    )
+
+
+def _ifft(data: np.ndarray, n: int, axis: int, workers: int = None) -> np.ndarray:
+    """Inverse FFT computed with ``scipy.fft`` when it is installed."""
+    try:
+        from scipy import fft
+    except ImportError:  # pragma: no cover
+        return np.fft.ifft(data, n=n, axis=axis)
+    return fft.ifft(data, n=n, axis=axis, workers=workers)
+
+
+def _range_doppler_maps(
+    data: np.ndarray, window: str, range_bins: int = None, doppler_bins: int = None, workers: int = None
+) -> np.ndarray:
+    """Range-Doppler maps of stacked data with shape ``(maps, cpi_frames, frequencies)``."""
+    num_cpi_frames, num_freq = data.shape[1:]
+
+    if doppler_bins is None:
+        doppler_bins = num_cpi_frames
+
+    if range_bins is None:
+        range_bins = num_freq
+
+    # Place doppler as last dimension and swap first and second half to place zero at first index
+    data = np.swapaxes(data, 1, 2)[..., ::-1]
+
+    # Doppler windowing
+    doppler_window = FRTMData.window_function(window, num_cpi_frames)
+    sample_factor_doppler = len(doppler_window) / np.sum(doppler_window)
+    up_sample_doppler = doppler_bins / num_cpi_frames
+
+    # Range windowing
+    range_window = FRTMData.window_function(window, num_freq)
+    sample_factor_range = len(range_window) / np.sum(range_window)
+    up_sample_range = range_bins / num_freq
+
+    doppler_window = doppler_window * sample_factor_doppler
+    range_window = range_window * sample_factor_range
+
+    fp_win = up_sample_doppler * np.multiply(data, doppler_window)
+    s1 = _ifft(fp_win, doppler_bins, -1, workers)
+    s1 = np.rot90(s1, axes=(1, 2))
+
+    s1_win = up_sample_range * np.multiply(range_window, s1)
+    s2 = _ifft(s1_win, range_bins, -1, workers)
+    s2 = np.rot90(s2, axes=(1, 2))
+    s2_shift = np.fft.fftshift(s2, axes=2)
+
+    return s2_shift[:, ::-1]
+
+
+def _batch_frtm_files(input_files) -> tuple:
+    """Frames and files of a batch, and the data of the first file."""
+    if isinstance(input_files, dict):
+        frames, files = list(input_files.keys()), list(input_files.values())
+    else:
+        files = list(input_files)
+        frames = list(range(len(files)))
+    if not files:
+        raise ValueError("No FRTM files to process.")
+    return frames, files, FRTMData(files[0])
+
+
+def _stream_frtm_files(files, first, read, process, name, shape, dtype, axes, output_file, batch_size, max_workers):
+    """Read the files by batches in a thread pool, process them, and store the results in ``name``.
+
+    The data read from each file must have the shape of the data read from ``first``. The next batch is
+    read while the current one is processed, so at most two batches are kept in memory.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def load(input_file):
+        data = read(FRTMData(input_file, memory_map=False))
+        if data.shape != shape_file:
+            raise ValueError(f"{input_file} does not have the dimensions of the first file.")
+        return data
+
+    shape_file = read(first).shape
+    batch_size = max(1, int(batch_size))
+
+    store = None
+    if output_file is None:
+        output = np.empty(shape, dtype=dtype)
+    else:
+        try:
+            import tables
+        except ImportError:  # pragma: no cover
+            raise ImportError("tables package is needed to write HDF5 files. Install it using 'pip install tables'.")
+        output_file = Path(output_file)
+        store = tables.open_file(str(output_file), mode="w")
+        output = store.create_carray(
+            "/",
+            name,
+            atom=tables.Atom.from_dtype(np.dtype(dtype)),
+            shape=shape,
+            chunkshape=(1,) + shape[1:],
+            filters=tables.Filters(complevel=1),
+        )
+        for axis, values in axes.items():
+            store.create_array("/", axis, values)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = [executor.submit(load, input_file) for input_file in files[:batch_size]]
+            for start in range(0, len(files), batch_size):
+                batch = [future.result() for future in pending]
+                next_files = files[start + batch_size : start + 2 * batch_size]
+                pending = [executor.submit(load, input_file) for input_file in next_files]
+                output[start : start + len(batch)] = process(batch)
+    finally:
+        if store is not None:
+            store.close()
+    return output if output_file is None else output_file
@@ -52,6 +52,7 @@ class HDMPlotter(CommonPlotter, PyAedtBase):
     def __init__(self) -> None:
         CommonPlotter.__init__(self)
         self._bundle = None
+        self._hdm_file = None
         self.show_as_standalone = True
         self.units = "meter"
         self.jupyter_backend = None
@@ -85,60 +86,81 @@ class HDMPlotter(CommonPlotter, PyAedtBase):
         return False
 
     @pyaedt_function_handler()
-    def add_hdm_bundle_from_file(self, filename: str, units: str = None):
-        """Add hdm bundle from file."""
+    def add_hdm_bundle_from_file(self, filename: str, units: str = None, lazy: bool = False):
+        """Add hdm bundle from file.
+
+        Parameters
+        ----------
+        filename : str
+            Full path to the ``hdm`` file.
+        units : str, optional
+            Length units of the bundle.
+        lazy : bool, optional
+            Whether to keep the bundle on the disk and parse its ray tracks in batches only when they are
+            plotted. This suits bundles larger than the available memory. The default is ``False``.
+        """
         from ansys.aedt.core.visualization.advanced.sbrplus.hdm_parser import Parser
 
         if os.path.exists(filename):
-            self._bundle = Parser(filename=filename).parse_message()
+            if lazy:
+                self._bundle = None
+                self._hdm_file = filename
+            else:
+                self._bundle = Parser(filename=filename).parse_message()
+                self._hdm_file = None
             self._bundle_units = units
 
     @pyaedt_function_handler()
-    def _add_rays(self):
-        from itertools import chain
+    def _add_rays(self, batch_size: int = 10000, **filters):
+        from ansys.aedt.core.visualization.advanced.sbrplus.hdm_utils import iter_ray_tracks
+        from ansys.aedt.core.visualization.advanced.sbrplus.hdm_utils import ray_segments
 
-        if not self._bundle:
+        bundle = self._bundle if self._bundle else self._hdm_file
+        if not bundle:
             return False
-        points = []
-        lines = []  # data structure for PyVista
-        depths = []  # track depth at each point in the track segments
-
-        def add_ray_segment(depth, bounce) -> None:
-            def add_ray_helper(depth, next_bounce) -> None:
-                lines.append([len(points) + i for i in range(2)])
-                depths.extend([depth, depth])
-                points.extend([bounce.hit_pt, next_bounce.hit_pt])
-                add_ray_segment(depth + 1, next_bounce)
-
-            # add more segments to the ray track rendering data
-            if bounce.refl_bounce:
-                add_ray_helper(depth, bounce.refl_bounce)
-            if bounce.trans_bounce:
-                add_ray_helper(depth, bounce.trans_bounce)
-
-        for track in self._bundle.ray_tracks:
-            if track.track_type == "UTD":
-                new_track_seg = [track.source_point, track.utd_point, track.first_bounce.hit_pt]
-            else:
-                new_track_seg = [track.source_point, track.first_bounce.hit_pt]
-            lines.append([len(points) + i for i in range(len(new_track_seg))])
-            depths.extend([1 for i in range(len(new_track_seg))])
-            points.extend(new_track_seg)
-            add_ray_segment(2, track.first_bounce)
-
-        lines = [[len(line), *line] for line in lines]
-        lines = [len(lines), *(chain.from_iterable(lines))]
-        return points, lines, depths
+        points = [np.empty((0, 3))]
+        lines = [np.empty(0, dtype=int)]  # data structure for PyVista
+        depths = [np.empty(0, dtype=int)]  # track depth at each point in the track segments
+        count = 0
+
+        # Line sets are built batch by batch, so only one batch of ray tracks is parsed at a time
+        for ray_tracks in iter_ray_tracks(bundle, batch_size, **filters):
+            segments, segment_depths, _ = ray_segments(ray_tracks)
+            indices = count + np.arange(2 * len(segments)).reshape(-1, 2)
+            count += 2 * len(segments)
+            lines.append(np.column_stack((np.full(len(segments), 2), indices)).ravel())
+            points.append(segments.reshape(-1, 3))
+            depths.append(np.repeat(segment_depths, 2))
+
+        return np.concatenate(points), np.concatenate(lines), np.concatenate(depths)
 
     @pyaedt_function_handler()
     @graphics_required
-    def plot_rays(self, snapshot_path: str = None) -> "Plotter":
+    def plot_rays(
+        self,
+        snapshot_path: str = None,
+        min_bounces: int = 0,
+        max_bounces: int | None = None,
+        bounding_box: list | None = None,
+        power_threshold: float | None = None,
+    ) -> "Plotter":
         """Plot Rays read from an ``hdm`` file.
 
         Parameters
         ----------
         snapshot_path : str, optional
             Full path to exported image file. If ``None`` the plot will be shown.
+        min_bounces : int, optional
+            Minimum number of bounces of the plotted ray tracks. The default is ``0``.
+        max_bounces : int, optional
+            Maximum number of bounces of the plotted ray tracks. The default is ``None``,
+            in which case the number of bounces is not limited.
+        bounding_box : list, optional
+            Lower and upper corners ``[[x_min, y_min, z_min], [x_max, y_max, z_max]]`` of a box in meters.
+            Only the ray tracks intersecting the box are plotted. The default is ``None``.
+        power_threshold : float, optional
+            Minimum power in dB of the incident magnetic field at one of the bounces of the plotted
+            ray tracks. The default is ``None``.
 
         Returns
         -------
@@ -161,12 +183,14 @@ class HDMPlotter(CommonPlotter, PyAedtBase):
             self.pv.off_screen = self.off_screen
 
         self._add_objects()
-        points, lines, depths = self._add_rays()
+        points, lines, depths = self._add_rays(
+            min_bounces=min_bounces, max_bounces=max_bounces, bounding_box=bounding_box, power_threshold=power_threshold
+        )
         try:
             conv = 1 / AEDT_UNITS["Length"][self.units]
         except Exception:
             conv = 1
-        points = [i * conv for i in points]
+        points = points * conv
         depth1 = pv.PolyData(points, lines=lines)
         annotations = {i: str(i) for i in range(1, 7)}
         self.pv.add_mesh(
@@ -186,15 +210,18 @@ class HDMPlotter(CommonPlotter, PyAedtBase):
 
     @pyaedt_function_handler()
     def _first_bounce_currents(self):
+        from ansys.aedt.core.visualization.advanced.sbrplus.hdm_utils import iter_ray_tracks
+
         bounces = defaultdict(lambda: np.ndarray(3, np.complex128))
-        for track in self._bundle.ray_tracks:
-            bounce = track.first_bounce
-            totalH = bounce.h_inc + bounce.h_refl
-            if bounce.h_trans:
-                totalH += bounce.h_trans
-            offset = 0.01 * bounce.surf_norm
-            bounceHash = tuple((i + offset).tobytes() for i in bounce.footprint_vertices)
-            bounces[bounceHash] += totalH
+        for ray_tracks in iter_ray_tracks(self._bundle if self._bundle else self._hdm_file):
+            for track in ray_tracks:
+                bounce = track.first_bounce
+                totalH = bounce.h_inc + bounce.h_refl
+                if bounce.h_trans:
+                    totalH += bounce.h_trans
+                offset = 0.01 * bounce.surf_norm
+                bounceHash = tuple((i + offset).tobytes() for i in bounce.footprint_vertices)
+                bounces[bounceHash] += totalH
         return bounces
 
     @pyaedt_function_handler()
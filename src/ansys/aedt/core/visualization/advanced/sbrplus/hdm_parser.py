@@ -23,6 +23,8 @@
 # SOFTWARE.
 
 import ast
+from contextlib import contextmanager
+import gc
 import struct
 
 import numpy as np
@@ -35,23 +37,58 @@ except ImportError:
 from ansys.aedt.core.aedt_logger import pyaedt_logger
 from ansys.aedt.core.base import PyAedtBase
 
+INTERNAL_DTYPES = {"B": "<u1", "h": "<i2", "i": "<i4", "f": "<f4", "d": "<f8"}
+COMPLEX_DTYPES = {"f": "<c8", "d": "<c16"}
+
+
+@contextmanager
+def _paused_gc():
+    """Pause the cyclic garbage collector, which building millions of containers repeatedly triggers for nothing."""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
+
 
 class Parser(PyAedtBase):
     """Parser class that loads an HDM-format export file from HFSS SBR+, interprets its header and its binary content.
 
     Except for the header, the binary content is not parsed until an explicit call to parse_message.
+    Contiguous lists of fixed-layout records are decoded in bulk with NumPy structured dtypes generated from
+    the header, while variable-length members are parsed recursively.
+
+    Parameters
+    ----------
+    filename : str or :class:`pathlib.Path`
+        Full path to the HDM file.
+    memory_map : bool, optional
+        Whether to map the binary content of the file in memory instead of reading it.
+        The content is then read from the disk only when it is parsed, which suits
+        :meth:`iter_batches`. The default is ``False``.
     """
 
-    def __init__(self, filename) -> None:
+    def __init__(self, filename, memory_map: bool = False) -> None:
         """Initialize parser object with the interpreted header and a pointer to the binary data."""
         self.parser_types = {}
         self.parser_flags = {}
         self.parser_enums = {}
         self.objects = {}
+        self._dtypes = {}
         self.idx = 0
         with open(filename, "rb") as file:
-            binarycontent = file.read(-1)
-        header, binarycontent = binarycontent.split(b"#header end\n")
+            if memory_map:
+                header = b""
+                for line in file:
+                    header += line
+                    if line == b"#header end\n":
+                        break
+                binarycontent = np.memmap(filename, dtype=np.uint8, mode="r", offset=len(header))
+            else:
+                binarycontent = file.read(-1)
+                header, binarycontent = binarycontent.split(b"#header end\n")
         header = header.decode().splitlines()[1:]
         header = [line for line in header if not line.startswith("#")]
         header = "".join(header)
@@ -68,6 +105,67 @@ class Parser(PyAedtBase):
         """Parse the binary content of the HDM file."""
         return self._parse(self.message["type"])
 
+    def iter_batches(self, field: str, batch_size: int = 10000):
+        """Parse the binary content lazily and yield the items of a list of the message in batches.
+
+        The fields of the message preceding the list are parsed first. The items of the list are
+        parsed only when the next batch is requested, and the fields following the list are not parsed.
+
+        Parameters
+        ----------
+        field : str
+            Name of the list in the message, for example ``"ray_tracks"`` for an SBR+ ray bundle.
+        batch_size : int, optional
+            Maximum number of items in each batch. The default is ``10000``.
+
+        Yields
+        ------
+        list
+            Parsed items of the list.
+
+        Examples
+        --------
+        >>> from ansys.aedt.core.visualization.advanced.sbrplus.hdm_parser import Parser
+        >>> parser = Parser("rays.hdm", memory_map=True)
+        >>> for ray_tracks in parser.iter_batches("ray_tracks", batch_size=1000):
+        ...     print(len(ray_tracks))
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be a positive integer.")
+        message = self.message["type"]
+        if self.parser_types[message]["type"] != "object":
+            raise ValueError(f"Message of type '{message}' is not an object.")
+        self.idx = 0
+        namesdict = {}
+        for layout in self.parser_types[message]["layout"]:
+            fields = layout["field_names"]
+            if isinstance(fields, str):
+                fields = (fields,)
+            if field not in fields:
+                self._parse_layout(layout, namesdict)
+                continue
+            self._parse_layout(layout, namesdict, fields[: fields.index(field)])
+
+            array = layout if layout["type"] in ("vector", "list") else self.parser_types[layout["type"]]
+            if array["type"] not in ("vector", "list"):
+                raise ValueError(f"Field '{field}' of the message is not a vector or a list.")
+            if self._is_skipped(layout, namesdict):
+                return
+            size = namesdict[array["size"]] if isinstance(array["size"], str) else array["size"]
+            dtype = self._fixed_dtype(array["base"])
+            for start in range(0, size, batch_size):
+                count = min(batch_size, size - start)
+                with _paused_gc():
+                    if dtype is not None:
+                        records = np.frombuffer(self.binarycontent, dtype=dtype, count=count, offset=self.idx)
+                        self.idx += count * dtype.itemsize
+                        batch = self._type_values(array["base"], records)
+                    else:
+                        batch = [self._parse(array["base"]) for _ in range(count)]
+                yield batch
+            return
+        raise ValueError(f"Message has no field '{field}'.")
+
     def _parse(self, type_name):
         """Use a generic parser method, which dispatches to appropriate and specialized parsers."""
         if self.parser_types[type_name]["type"] == "object":
@@ -119,6 +217,14 @@ class Parser(PyAedtBase):
         res = []
         bt = self.parser_types[base]
 
+        dtype = self._array_dtype(base, size)
+        if dtype is not None:
+            # Decode all fixed-layout items with a single buffer read
+            records = np.frombuffer(self.binarycontent, dtype=dtype, count=1, offset=self.idx)
+            self.idx += dtype.itemsize
+            with _paused_gc():
+                return self._array_values(type, base, records)[0]
+
         if bt["type"] == "internal":
             args = bt["args"]
             final_type = args["final_type"] if "final_type" in args else None
@@ -143,53 +249,168 @@ class Parser(PyAedtBase):
         """Parser for an object message."""
         namesdict = {}
         for layout in self.parser_types[name]["layout"]:
-            type_to_parse = layout["type"]
+            self._parse_layout(layout, namesdict)
+        return self.objects[name](namesdict)
+
+    @staticmethod
+    def _is_skipped(layout, namesdict) -> bool:
+        """Decide if a field needs to be parsed based on the optional data structure."""
+        if "optional" not in layout:
+            return False
+        var, cond = layout["optional"]
+        if isinstance(namesdict[var], Enum):
+            return namesdict[var].name != cond
+        return namesdict[var][cond] is False
+
+    def _parse_layout(self, layout, namesdict, fields=None) -> None:
+        """Parse the fields of a layout entry of an object message and store them in the fields dictionary."""
+        type_to_parse = layout["type"]
+        if fields is None:
             fields = layout["field_names"]
             if isinstance(fields, str):
                 fields = (fields,)
+        optional = self._is_skipped(layout, namesdict)
 
-            # Decide if a field needs to be parsed based on the optional data structure
-            optional = False
-            if "optional" in layout:
-                var, cond = layout["optional"]
-                if isinstance(namesdict[var], Enum):
-                    optional = namesdict[var].name != cond
+        for field in fields:
+            if optional:
+                # Skip parsing optional fields
+                namesdict[field] = None
+            elif type_to_parse in ("vector", "list"):
+                # Parse explicit vectors or lists in the layout and convert the size to a number if it's a string
+                if isinstance(layout["size"], str):
+                    namesdict[field] = self._parse_list(
+                        type=layout["type"], base=layout["base"], size=namesdict[layout["size"]]
+                    )
                 else:
-                    optional = namesdict[var][cond] is False
+                    namesdict[field] = self._parse_list(type=layout["type"], base=layout["base"], size=layout["size"])
+            else:
+                # Parse anything else that is not explicitly a list or a vector. In this case, the field type
+                # could be a custom type referring indirectly to a list or vector, so handle that directly for
+                # efficiency
+                if self.parser_types[type_to_parse]["type"] in ("vector", "list"):
+                    arrtype = self.parser_types[type_to_parse]["type"]
+                    arrbase = self.parser_types[type_to_parse]["base"]
+                    arrsize = self.parser_types[type_to_parse]["size"]
+                    if isinstance(arrsize, str):
+                        arrsize = namesdict[self.parser_types[type_to_parse]["size"]]
+                    namesdict[field] = self._parse_list(type=arrtype, base=arrbase, size=arrsize)
+                elif type_to_parse in self.parser_flags:
+                    flag_value = self._parse(type_to_parse)
+                    flag_type = self.parser_flags[type_to_parse]
+                    namesdict[field] = {k: bool(flag_value & v) for k, v in flag_type.items()}
+                else:
+                    namesdict[field] = self._parse(type_to_parse)
 
-            for field in fields:
-                if optional:
-                    # Skip parsing optional fields
-                    namesdict[field] = None
-                elif type_to_parse in ("vector", "list"):
-                    # Parse explicit vectors or lists in the layout and convert the size to a number if it's a string
-                    if isinstance(layout["size"], str):
-                        namesdict[field] = self._parse_list(
-                            type=layout["type"], base=layout["base"], size=namesdict[layout["size"]]
-                        )
-                    else:
-                        namesdict[field] = self._parse_list(
-                            type=layout["type"], base=layout["base"], size=layout["size"]
-                        )
+    def _fixed_dtype(self, type_name: str):
+        """Get the NumPy dtype of a type whose binary size does not depend on the content.
+
+        Returns ``None`` for types with optional members, sizes read from the content, or enumerations
+        inside vectors and lists. These types are parsed recursively.
+        """
+        if type_name in self._dtypes:
+            return self._dtypes[type_name]
+        # Placeholder preventing infinite recursion on self-referencing types
+        self._dtypes[type_name] = None
+        bt = self.parser_types[type_name]
+        dtype = None
+        if bt["type"] == "internal":
+            args = bt["args"]
+            if args.get("final_type") is complex:
+                dtype = np.dtype(COMPLEX_DTYPES[args["format"]])
+            else:
+                dtype = np.dtype(INTERNAL_DTYPES[args["format"]])
+        elif bt["type"] in ("vector", "list"):
+            dtype = self._array_dtype(bt["base"], bt["size"])
+        elif bt["type"] == "object":
+            fields = []
+            for layout in bt["layout"]:
+                if "optional" in layout:
+                    break
+                if layout["type"] in ("vector", "list"):
+                    field_dtype = self._array_dtype(layout["base"], layout["size"])
                 else:
-                    # Parse anything else that is not explicitly a list or a vector. In this case, the field type
-                    # could be a custom type referring indirectly to a list or vector, so handle that directly for
-                    # efficiency
-                    if self.parser_types[type_to_parse]["type"] in ("vector", "list"):
-                        arrtype = self.parser_types[type_to_parse]["type"]
-                        arrbase = self.parser_types[type_to_parse]["base"]
-                        arrsize = self.parser_types[type_to_parse]["size"]
-                        if isinstance(arrsize, str):
-                            arrsize = namesdict[self.parser_types[type_to_parse]["size"]]
-                        namesdict[field] = self._parse_list(type=arrtype, base=arrbase, size=arrsize)
-                    elif type_to_parse in self.parser_flags:
-                        flag_value = self._parse(type_to_parse)
-                        flag_type = self.parser_flags[type_to_parse]
-                        namesdict[field] = {k: bool(flag_value & v) for k, v in flag_type.items()}
-                    else:
-                        namesdict[field] = self._parse(type_to_parse)
+                    field_dtype = self._fixed_dtype(layout["type"])
+                if field_dtype is None:
+                    break
+                names = layout["field_names"]
+                if isinstance(names, str):
+                    names = (names,)
+                fields.extend((name, field_dtype) for name in names)
+            else:
+                if fields and len({name for name, _ in fields}) == len(fields):
+                    dtype = np.dtype(fields)
+        self._dtypes[type_name] = dtype
+        return dtype
 
-        return self.objects[name](namesdict)
+    def _array_dtype(self, base: str, size):
+        """Get the NumPy dtype of a fixed-size vector or list, or ``None`` if it must be parsed recursively."""
+        if not isinstance(size, int) or size < 1:
+            return None
+        bt = self.parser_types[base]
+        if bt["type"] == "internal" and bt["args"].get("final_type") not in (None, complex):
+            return None
+        base_dtype = self._fixed_dtype(base)
+        if base_dtype is None:
+            return None
+        return np.dtype((base_dtype, (size,)))
+
+    def _type_values(self, type_name: str, data):
+        """Convert decoded items of a type to the values returned by the recursive parser."""
+        bt = self.parser_types[type_name]
+        if bt["type"] == "object":
+            return self._records_to_objects(type_name, data)
+        elif bt["type"] == "internal":
+            final_type = bt["args"].get("final_type")
+            if final_type is None or final_type is complex:
+                return data.tolist()
+            values = data.tolist()
+            members = {value: final_type(value) for value in set(values)}
+            return [members[value] for value in values]
+        return self._array_values(bt["type"], bt["base"], data)
+
+    def _array_values(self, type: str, base: str, data):
+        """Convert decoded vectors or lists, stacked along the first axis, to parsed values."""
+        count, size = data.shape[:2]
+        if self.parser_types[base]["type"] == "internal":
+            if type == "vector":
+                if data.dtype.kind == "c":
+                    rows = data.astype(np.complex128)
+                elif data.dtype.kind == "f":
+                    rows = data.astype(np.float64)
+                else:
+                    rows = data.astype(int)
+                return list(rows[:, 0]) if size == 1 else list(rows)
+            if size == 1:
+                return data[:, 0].tolist()
+            rows = data.tolist()
+            return rows if data.dtype.kind == "c" else [tuple(row) for row in rows]
+        values = self._type_values(base, data.reshape((count * size,) + data.shape[2:]))
+        if size == 1:
+            return values
+        return [values[i : i + size] for i in range(0, count * size, size)]
+
+    def _records_to_objects(self, name: str, records):
+        """Convert an array of decoded fixed-layout records to objects."""
+        names = []
+        columns = []
+        for layout in self.parser_types[name]["layout"]:
+            fields = layout["field_names"]
+            if isinstance(fields, str):
+                fields = (fields,)
+            for field in fields:
+                if layout["type"] in ("vector", "list"):
+                    values = self._array_values(layout["type"], layout["base"], records[field])
+                elif layout["type"] in self.parser_flags:
+                    flag_type = self.parser_flags[layout["type"]]
+                    values = records[field].tolist()
+                    flags = {value: {k: bool(value & v) for k, v in flag_type.items()} for value in set(values)}
+                    values = [flags[value].copy() for value in values]
+                else:
+                    values = self._type_values(layout["type"], records[field])
+                names.append(field)
+                columns.append(values)
+        new_object = self.objects[name]
+        return [new_object(dict(zip(names, values))) for values in zip(*columns)]
 
     def _read_header(self) -> None:
         """Parse the header and prepare all data structures to interpret the binary content."""
@@ -242,8 +463,7 @@ class Parser(PyAedtBase):
                     __name__ = key
 
                     def __init__(self, dictionary) -> None:
-                        for k, v in dictionary.items():
-                            setattr(self, k, v)
+                        self.__dict__.update(dictionary)
 
                 self.objects[key] = NewClass
 
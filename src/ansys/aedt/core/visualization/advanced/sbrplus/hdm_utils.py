@@ -22,6 +22,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from pathlib import Path
+
+import numpy as np
+
+from ansys.aedt.core.visualization.advanced.sbrplus.hdm_parser import Parser
+
 
 def sort_bundle(bundle, monoPW_attrib: str = "sweep_angle_index") -> None:
     """
@@ -79,3 +85,153 @@ def sort_bundle(bundle, monoPW_attrib: str = "sweep_angle_index") -> None:
                 )
 
         bundle.ray_tracks.sort(key=key)
+
+
+def iter_ray_tracks(
+    bundle,
+    batch_size: int = 10000,
+    min_bounces: int = 0,
+    max_bounces: int | None = None,
+    bounding_box: list | None = None,
+    power_threshold: float | None = None,
+):
+    """Iterate over batches of ray tracks of an SBR+ bundle passing a set of filters.
+
+    When a file is given, it is memory mapped and only one batch of ray tracks is parsed at a time,
+    so bundles larger than the available memory can be processed.
+
+    Parameters
+    ----------
+    bundle : str, :class:`pathlib.Path` or object
+        Full path to an SBR+ ``hdm`` file or bundle already parsed by
+        :class:`ansys.aedt.core.visualization.advanced.sbrplus.hdm_parser.Parser`.
+    batch_size : int, optional
+        Maximum number of ray tracks parsed at a time. The default is ``10000``.
+    min_bounces : int, optional
+        Minimum number of bounces along a ray track. The default is ``0``.
+    max_bounces : int, optional
+        Maximum number of bounces along a ray track. The default is ``None``, in which
+        case the number of bounces is not limited.
+    bounding_box : list, optional
+        Lower and upper corners ``[[x_min, y_min, z_min], [x_max, y_max, z_max]]`` of a box in meters.
+        Only the ray tracks with a segment intersecting the box are kept. The default is ``None``.
+    power_threshold : float, optional
+        Minimum power in dB of the incident magnetic field at one of the bounces of a ray track,
+        where the power is the squared norm of ``h_inc``. The default is ``None``.
+
+    Yields
+    ------
+    list
+        Ray tracks of the batch passing the filters. Batches without any such ray track are skipped.
+
+    Examples
+    --------
+    >>> from ansys.aedt.core.visualization.advanced.sbrplus.hdm_utils import iter_ray_tracks
+    >>> for ray_tracks in iter_ray_tracks("rays.hdm", max_bounces=2, power_threshold=-60):
+    ...     print(len(ray_tracks))
+    """
+    if isinstance(bundle, (str, Path)):
+        batches = Parser(bundle, memory_map=True).iter_batches("ray_tracks", batch_size)
+    else:
+        tracks = bundle.ray_tracks if isinstance(bundle.ray_tracks, list) else [bundle.ray_tracks]
+        batches = (tracks[i : i + batch_size] for i in range(0, len(tracks), batch_size))
+    filtered = min_bounces > 0 or max_bounces is not None or bounding_box is not None or power_threshold is not None
+
+    for ray_tracks in batches:
+        if filtered:
+            keep = _ray_tracks_mask(ray_tracks, min_bounces, max_bounces, bounding_box, power_threshold)
+            ray_tracks = [track for track, kept in zip(ray_tracks, keep) if kept]
+        if ray_tracks:
+            yield ray_tracks
+
+
+def ray_segments(ray_tracks):
+    """Get the line segments of SBR+ ray tracks.
+
+    The bounces of each ray track are walked iteratively, so deep ray tracks do not
+    reach the recursion limit.
+
+    Parameters
+    ----------
+    ray_tracks : list
+        Ray tracks of a bundle parsed by :class:`ansys.aedt.core.visualization.advanced.sbrplus.hdm_parser.Parser`.
+
+    Returns
+    -------
+    tuple
+        Start and end points of the segments with shape ``(segments, 2, 3)``, depth of the segments,
+        and index of the ray track of each segment. The depth is ``1`` from the source to the first
+        bounce and increases by one at each bounce.
+    """
+    points, depths, indices, _, _ = _walk_ray_tracks(ray_tracks)
+    return points, depths, indices
+
+
+def _walk_ray_tracks(ray_tracks):
+    """Get the segments, number of bounces and maximum incident power of ray tracks."""
+    segments = []
+    depths = []
+    indices = []
+    bounces = [0] * len(ray_tracks)
+    powers = [0.0] * len(ray_tracks)
+    for index, track in enumerate(ray_tracks):
+        bounce = getattr(track, "first_bounce", None)
+        if bounce is None:
+            continue
+        utd_point = getattr(track, "utd_point", None)
+        if utd_point is not None:
+            segments.extend([(track.source_point, utd_point), (utd_point, bounce.hit_pt)])
+            depths.extend([1, 1])
+            indices.extend([index, index])
+        else:
+            segments.append((track.source_point, bounce.hit_pt))
+            depths.append(1)
+            indices.append(index)
+
+        stack = [(bounce, 1)]
+        while stack:
+            bounce, count = stack.pop()
+            bounces[index] = max(bounces[index], count)
+            h_inc = getattr(bounce, "h_inc", None)
+            if h_inc is not None:
+                powers[index] = max(powers[index], np.vdot(h_inc, h_inc).real)
+            for next_bounce in (getattr(bounce, "refl_bounce", None), getattr(bounce, "trans_bounce", None)):
+                if next_bounce is not None:
+                    segments.append((bounce.hit_pt, next_bounce.hit_pt))
+                    depths.append(count + 1)
+                    indices.append(index)
+                    stack.append((next_bounce, count + 1))
+
+    points = np.array(segments, dtype=float).reshape(-1, 2, 3)
+    return points, np.array(depths, dtype=int), np.array(indices, dtype=int), np.array(bounces), np.array(powers)
+
+
+def _ray_tracks_mask(ray_tracks, min_bounces=0, max_bounces=None, bounding_box=None, power_threshold=None):
+    """Get the mask of the ray tracks passing the filters."""
+    points, _, indices, bounces, powers = _walk_ray_tracks(ray_tracks)
+    keep = bounces >= min_bounces
+    if max_bounces is not None:
+        keep &= bounces <= max_bounces
+    if power_threshold is not None:
+        with np.errstate(divide="ignore"):
+            keep &= 10 * np.log10(powers) >= power_threshold
+    if bounding_box is not None:
+        hits = _segments_in_box(points, bounding_box)
+        keep &= np.bincount(indices[hits], minlength=len(ray_tracks)) > 0
+    return keep
+
+
+def _segments_in_box(points, bounding_box):
+    """Get the mask of the segments intersecting an axis-aligned box with the slab method."""
+    lower, upper = np.asarray(bounding_box, dtype=float).reshape(2, 3)
+    start = points[:, 0]
+    direction = points[:, 1] - start
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_lower = (lower - start) / direction
+        t_upper = (upper - start) / direction
+    # Segments parallel to a slab intersect it everywhere or nowhere
+    parallel = direction == 0
+    inside = (start >= lower) & (start <= upper)
+    t_enter = np.where(parallel, np.where(inside, -np.inf, np.inf), np.minimum(t_lower, t_upper))
+    t_exit = np.where(parallel, np.where(inside, np.inf, -np.inf), np.maximum(t_lower, t_upper))
+    return np.maximum(t_enter.max(axis=1), 0.0) <= np.minimum(t_exit.min(axis=1), 1.0)
@@ -25,8 +25,13 @@
 from __future__ import annotations
 
 import bisect
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
+from functools import partial
+import hashlib
 import itertools
+import json
 import os
 from pathlib import Path
 import re
@@ -71,6 +76,8 @@ DB_ANGLE = "DB"
 
 keys = {REAL_IMAG: ("real", "imag"), MAG_ANGLE: ("mag", "deg"), DB_ANGLE: ("db20", "deg")}
 
+TOUCHSTONE_CHECKS_CACHE = ".touchstone_checks.json"
+
 
 class TouchstoneData(_TouchstoneBase, PyAedtBase):
     """Contains data information from Touchstone Read call.
@@ -730,8 +737,362 @@ def read_touchstone(input_file: str) -> TouchstoneData:
     return data
 
 
+class TouchstoneStack(PyAedtBase):
+    """Contains the scattering parameters of several Touchstone files sharing frequencies and ports.
+
+    The metrics are computed at once for all the files of the stack.
+
+    Parameters
+    ----------
+    s : :class:`numpy.ndarray`
+        Scattering parameters as a complex array of shape ``(files, frequencies, ports, ports)``.
+    frequencies : list or :class:`numpy.ndarray`
+        Frequencies in Hz.
+    port_names : list, optional
+        Names of the ports. The default is ``None``, in which case the ports are numbered from ``"1"``.
+    file_names : list, optional
+        Names of the files. The default is ``None``, in which case the files are numbered from ``"0"``.
+    z0 : float, optional
+        Reference impedance of the ports. The default is ``50.0``.
+    """
+
+    def __init__(self, s, frequencies, port_names=None, file_names=None, z0: float = 50.0) -> None:
+        self.s = np.asarray(s, dtype=complex)
+        self.frequencies = np.asarray(frequencies, dtype=float)
+        if self.s.ndim != 4 or self.s.shape[2] != self.s.shape[3] or self.s.shape[1] != len(self.frequencies):
+            raise ValueError("Scattering parameters must be of shape (files, frequencies, ports, ports).")
+        self.port_names = list(port_names) if port_names else [f"{i + 1}" for i in range(self.s.shape[2])]
+        self.file_names = list(file_names) if file_names else [f"{i}" for i in range(self.s.shape[0])]
+        self.z0 = z0
+
+    @property
+    def s_db(self) -> np.ndarray:
+        """Magnitude of the scattering parameters in dB."""
+        with np.errstate(divide="ignore"):
+            return 20 * np.log10(np.abs(self.s))
+
+    def _ports(self, prefix: str) -> list:
+        return [i for i, name in enumerate(self.port_names) if prefix in name]
+
+    @pyaedt_function_handler()
+    def envelope(self, index_couples: list) -> tuple:
+        """Get the lower and upper envelopes in dB of a set of curves.
+
+        Parameters
+        ----------
+        index_couples : list
+            List of ``[m, n]`` index couples of the curves.
+
+        Returns
+        -------
+        tuple
+            Lower and upper envelopes as arrays of shape ``(files, frequencies)``.
+        """
+        rows, columns = np.asarray(index_couples, dtype=int).reshape(-1, 2).T
+        with np.errstate(divide="ignore"):
+            values = 20 * np.log10(np.abs(self.s[:, :, rows, columns]))
+        return values.min(axis=-1), values.max(axis=-1)
+
+    @pyaedt_function_handler()
+    def insertion_loss_envelope(self, tx_prefix: str, rx_prefix: str) -> tuple:
+        """Get the envelopes in dB of the insertion losses between transmitters and receivers.
+
+        Transmitters and receivers are paired in the order of the ports, like in
+        :meth:`TouchstoneData.get_insertion_loss_index_from_prefix`.
+
+        Parameters
+        ----------
+        tx_prefix : str
+            Prefix for TX (eg. "DIE").
+        rx_prefix : str
+            Prefix for RX (eg. "BGA").
+
+        Returns
+        -------
+        tuple
+            Lower and upper envelopes as arrays of shape ``(files, frequencies)``.
+        """
+        transmitters = self._ports(tx_prefix)
+        receivers = self._ports(rx_prefix)
+        if len(transmitters) != len(receivers):
+            raise ValueError("TX and RX should be same length lists.")
+        return self.envelope(list(zip(transmitters, receivers)))
+
+    @pyaedt_function_handler()
+    def return_loss_envelope(self, excitation_name_prefix: str = "") -> tuple:
+        """Get the envelopes in dB of the return losses.
+
+        Parameters
+        ----------
+        excitation_name_prefix : str, optional
+            Prefix of the excitations, whatever the case. The default value is ``""``.
+
+        Returns
+        -------
+        tuple
+            Lower and upper envelopes as arrays of shape ``(files, frequencies)``.
+        """
+        ports = [i for i, name in enumerate(self.port_names) if excitation_name_prefix.lower() in name.lower()]
+        return self.envelope([[i, i] for i in ports])
+
+    def _power_sum(self, victims: list, aggressors: np.ndarray) -> np.ndarray:
+        power = np.abs(self.s[:, :, victims, :]) ** 2
+        with np.errstate(divide="ignore"):
+            return 10 * np.log10(np.einsum("abvp,vp->abv", power, aggressors))
+
+    @pyaedt_function_handler()
+    def next_power_sum(self, tx_prefix: str = "") -> tuple:
+        """Get the power sum of the near end crosstalks on each transmitter.
+
+        Parameters
+        ----------
+        tx_prefix : str, optional
+            Prefix for TX (eg. "DIE"). The default value is ``""``, in which case all the ports are used.
+
+        Returns
+        -------
+        tuple
+            Indexes of the victim ports and power sums in dB as an array of shape
+            ``(files, frequencies, victims)``.
+        """
+        victims = self._ports(tx_prefix)
+        aggressors = np.zeros((len(victims), len(self.port_names)))
+        aggressors[:, victims] = 1
+        aggressors[np.arange(len(victims)), victims] = 0
+        return victims, self._power_sum(victims, aggressors)
+
+    @pyaedt_function_handler()
+    def fext_power_sum(self, tx_prefix: str, rx_prefix: str) -> tuple:
+        """Get the power sum of the far end crosstalks on each receiver.
+
+        The transmitter with the same index position as the receiver is considered the insertion loss
+        and excluded from the aggressors.
+
+        Parameters
+        ----------
+        tx_prefix : str
+            Prefix for TX (eg. "DIE").
+        rx_prefix : str
+            Prefix for RX (eg. "BGA").
+
+        Returns
+        -------
+        tuple
+            Indexes of the victim ports and power sums in dB as an array of shape
+            ``(files, frequencies, victims)``.
+        """
+        transmitters = self._ports(tx_prefix)
+        victims = self._ports(rx_prefix)
+        aggressors = np.zeros((len(victims), len(self.port_names)))
+        aggressors[:, transmitters] = 1
+        for k in range(min(len(victims), len(transmitters))):
+            aggressors[k, transmitters[k]] = 0
+        return victims, self._power_sum(victims, aggressors)
+
+    @pyaedt_function_handler()
+    def get_mixed_mode_stack(self, num_of_diff_ports: int = None, port_ordering: str = "1234") -> "TouchstoneStack":
+        """Transform the stack from single ended parameters to mixed mode parameters.
+
+        Consecutive ports are paired, and the differential and common mode impedances are twice and half
+        the single ended impedance, like in :meth:`TouchstoneData.get_mixed_mode_touchstone_data`.
+
+        Parameters
+        ----------
+        num_of_diff_ports : int, optional
+            The number of differential ports.
+        port_ordering : str, optional
+            The current port ordering. Options are ``"1234"``, ``"1324"``. The default
+            is ``1234``.
+
+        Returns
+        -------
+        :class:`TouchstoneStack`
+            Stack with the differential ports, the common mode ports and the remaining single ended ports.
+        """
+        port_count = len(self.port_names)
+        if num_of_diff_ports is None:
+            num_of_diff_ports = port_count // 4 * 2
+        order = np.arange(port_count)
+        if port_ordering == "1324":
+            # The second and third ports of each group of four are swapped
+            swapped = np.arange(1, port_count - 1, 4)
+            order[swapped], order[swapped + 1] = swapped + 1, swapped
+        elif port_ordering != "1234":
+            raise ValueError("Invalid input provided for 'port_ordering'.")
+        transform = np.zeros((port_count, port_count))
+        pairs = np.arange(num_of_diff_ports)
+        positive, negative = order[2 * pairs], order[2 * pairs + 1]
+        transform[pairs, positive] = transform[num_of_diff_ports + pairs, positive] = np.sqrt(0.5)
+        transform[pairs, negative] = -np.sqrt(0.5)
+        transform[num_of_diff_ports + pairs, negative] = np.sqrt(0.5)
+        single = np.arange(2 * num_of_diff_ports, port_count)
+        transform[single, order[single]] = 1
+        port_names = [f"D{i}" for i in pairs] + [f"C{i}" for i in pairs]
+        port_names += [self.port_names[i] for i in order[single]]
+        return TouchstoneStack(transform @ self.s @ transform.T, self.frequencies, port_names, self.file_names, self.z0)
+
+    @pyaedt_function_handler()
+    def rank_worst_curves(
+        self,
+        freq_min: float = None,
+        freq_max: float = None,
+        worst_is_higher: bool = True,
+        curve_list: list = None,
+    ) -> list:
+        """Rank the curves of all the files from the mean of their magnitude over a frequency range.
+
+        Parameters
+        ----------
+        freq_min : float, optional
+            Minimum frequency to analyze in GHz (None to 0). The default value is ``None``.
+        freq_max : float, optional
+            Maximum frequency to analyze in GHz (None to max freq). The default value is ``None``.
+        worst_is_higher : bool
+            Worst curve is the one with higher mean value. The default value is ``True``.
+        curve_list : list
+            List of [m,n] index of curves on which to search. None to search on all curves.
+            The default value is ``None``.
+
+        Returns
+        -------
+        list
+            List of ``(file name, (m, n), mean)`` tuples from the worst to the best curve.
+        """
+        if not curve_list:
+            curve_list = list(itertools.combinations(range(len(self.port_names)), 2))
+            curve_list += [(i, i) for i in range(len(self.port_names))]
+        rows, columns = np.asarray(curve_list, dtype=int).reshape(-1, 2).T
+        selected = np.ones(len(self.frequencies), dtype=bool)
+        if freq_min:
+            selected &= self.frequencies >= freq_min * 1e9
+        if freq_max:
+            selected &= self.frequencies <= freq_max * 1e9
+        means = np.abs(self.s[:, selected][:, :, rows, columns]).mean(axis=1)
+        order = np.argsort(-means if worst_is_higher else means, axis=None, kind="stable")
+        files, curves = np.unravel_index(order, means.shape)
+        return [
+            (self.file_names[i], (int(rows[j]), int(columns[j])), float(means[i, j])) for i, j in zip(files, curves)
+        ]
+
+
+@pyaedt_function_handler()
+def read_touchstone_files(
+    input_files: str | list, max_workers: int | None = None, use_processes: bool = False
+) -> TouchstoneStack:
+    """Read several Touchstone files concurrently into a stack.
+
+    Touchstone 1.0 files with scattering parameters are read with ``numpy``. The other files are read
+    with ``scikit-rf``.
+
+    Parameters
+    ----------
+    input_files : str, :class:`pathlib.Path` or list
+        Folder containing the Touchstone files, or list of Touchstone files.
+    max_workers : int, optional
+        Maximum number of workers. The default is ``None``, in which case
+        the default of :mod:`concurrent.futures` executors is used.
+    use_processes : bool, optional
+        Whether to read the files in separate processes instead of threads. The default is ``False``.
+
+    Returns
+    -------
+    :class:`TouchstoneStack`
+        Stack of the scattering parameters of the files. The port names are the ones of the first file.
+
+    Examples
+    --------
+    >>> from ansys.aedt.core.visualization.advanced.touchstone_parser import read_touchstone_files
+    >>> stack = read_touchstone_files("touchstone_files")
+    >>> lower, upper = stack.return_loss_envelope()
+    """
+    if isinstance(input_files, (str, Path)):
+        input_files = sorted(find_touchstone_files(input_files).values())
+    input_files = [Path(i) for i in input_files]
+    if not input_files:
+        raise ValueError("No Touchstone file to read.")
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=max_workers) as executor:
+        networks = list(executor.map(_read_s_parameters, input_files))
+    frequencies, _, z0, port_names = networks[0]
+    for input_file, network in zip(input_files, networks):
+        if network[1].shape[1:] != networks[0][1].shape[1:] or not np.allclose(network[0], frequencies):
+            raise ValueError(f"File {input_file} does not share the frequencies and ports of the other files.")
+    return TouchstoneStack(
+        np.stack([i[1] for i in networks]), frequencies, port_names, [i.name for i in input_files], z0
+    )
+
+
+_FREQUENCY_UNITS = {"hz": 1.0, "khz": 1e3, "mhz": 1e6, "ghz": 1e9}
+_port_name_comment = re.compile(r"\s*port\[\d+\]\s*=(.*)$", re.IGNORECASE)
+
+
+def _read_s_parameters(input_file) -> tuple:
+    """Read the frequencies in Hz, scattering parameters, reference impedance and port names of a file."""
+    input_file = Path(input_file)
+    match = re.search(r"\.s(\d+)p$", input_file.name, re.IGNORECASE)
+    unit, parameter, data_format, z0 = "ghz", "s", "ma", 50.0
+    data = []
+    port_names = []
+    with open(input_file, "r") as f:
+        for line in f:
+            line, _, comment = line.partition("!")
+            port_name = _port_name_comment.match(comment)
+            if port_name:
+                port_names.append(port_name.group(1).strip())
+            line = line.strip()
+            if line.startswith("#"):
+                options = line[1:].lower().split()
+                for i, option in enumerate(options):
+                    if option in _FREQUENCY_UNITS:
+                        unit = option
+                    elif option in ["s", "y", "z", "h", "g"]:
+                        parameter = option
+                    elif option in ["ri", "ma", "db"]:
+                        data_format = option
+                    elif option == "r" and i + 1 < len(options):
+                        z0 = float(options[i + 1])
+            elif line.startswith("["):
+                # Touchstone 2.0 keyword
+                match = None
+                break
+            elif line:
+                data.append(line)
+    if not match or parameter != "s":
+        network = rf.Network(str(input_file))
+        port_names = [i.strip() for i in network.port_names] if network.port_names else port_names
+        if len(port_names) != network.nports:
+            port_names = _port_numbers(network.nports)
+        return network.f, network.s, float(np.real(network.z0[0, 0])), port_names
+    ports = int(match.group(1))
+    values = np.array(" ".join(data).split(), dtype=float).reshape(-1, 1 + 2 * ports**2)
+    first, second = values[:, 1::2], values[:, 2::2]
+    if data_format == "ri":
+        s = first + 1j * second
+    else:
+        magnitude = 10 ** (first / 20) if data_format == "db" else first
+        s = magnitude * np.exp(1j * np.radians(second))
+    s = s.reshape(-1, ports, ports)
+    if ports == 2:
+        # Two-port data is written in the S11, S21, S12, S22 order
+        s = s.transpose(0, 2, 1)
+    if len(port_names) != ports:
+        port_names = _port_numbers(ports)
+    return values[:, 0] * _FREQUENCY_UNITS[unit], s, z0, port_names
+
+
+def _port_numbers(ports: int) -> list:
+    return [f"{i + 1}" for i in range(ports)]
+
+
 @pyaedt_function_handler()
-def check_touchstone_files(input_dir: str = "", passivity: bool = True, causality: bool = True) -> dict:
+def check_touchstone_files(
+    input_dir: str = "",
+    passivity: bool = True,
+    causality: bool = True,
+    checker: str = "genequiv",
+    max_workers: int = 4,
+    use_cache: bool = False,
+) -> dict:
     """Check passivity and causality for all Touchstone files included in the folder.
 
     .. warning::
@@ -748,6 +1109,14 @@ def check_touchstone_files(input_dir: str = "", passivity: bool = True, causalit
         Whether the passivity check is enabled, The default is ``True``.
     causality : bool, optional
         Whether the causality check is enabled. The default is ``True``.
+    checker : str, optional
+        Checker to use. Options are ``"genequiv"``, which runs the AEDT ``genequiv`` executable,
+        and ``"numpy"``, which only checks the passivity. The default is ``"genequiv"``.
+    max_workers : int, optional
+        Maximum number of files checked concurrently. The default is ``4``.
+    use_cache : bool, optional
+        Whether to reuse the results of the files checked before, which are stored in the
+        ``.touchstone_checks.json`` file of the folder. The default is ``False``.
 
     Returns
     -------
@@ -758,54 +1127,233 @@ def check_touchstone_files(input_dir: str = "", passivity: bool = True, causalit
         is a string with the log information.
 
     """
-    import subprocess  # nosec
+    out = {}
+    results = validate_touchstone_files(
+        input_dir,
+        passivity=passivity,
+        causality=causality,
+        checker=checker,
+        max_workers=max_workers,
+        use_cache=use_cache,
+    )
+    for file_name, result in results.items():
+        out[file_name] = []
+        for check in ["passivity", "causality"]:
+            for entry in result.get(check, []):
+                out[file_name].append([check, entry["status"] == "passed", entry["log"]])
+    return out
+
+
+@pyaedt_function_handler()
+def validate_touchstone_files(
+    input_dir: str = "",
+    passivity: bool = True,
+    causality: bool = True,
+    checker: str = "genequiv",
+    max_workers: int = 4,
+    use_cache: bool = False,
+    tolerance: float = 1e-6,
+) -> dict:
+    """Check passivity and causality for all Touchstone files included in the folder.
+
+    The files are checked concurrently. When ``use_cache=True``, the results are cached in the
+    ``.touchstone_checks.json`` file of the folder and keyed on the content of the files and on the
+    checker settings, so that unchanged files are not checked again.
+
+    .. warning::
+
+        Do not execute this function with untrusted function argument, environment
+        variables or pyaedt global settings.
+        See the :ref:`security guide<ref_security_consideration>` for details.
 
+    Parameters
+    ----------
+    input_dir : str or :class:'pathlib.Path', optional
+        Folder path. The default is ``""``.
+    passivity : bool, optional
+        Whether the passivity check is enabled, The default is ``True``.
+    causality : bool, optional
+        Whether the causality check is enabled. The default is ``True``.
+    checker : str, optional
+        Checker to use. Options are ``"genequiv"``, which runs the AEDT ``genequiv`` executable,
+        and ``"numpy"``, which only checks the passivity with :func:`check_passivity`.
+        The default is ``"genequiv"``.
+    max_workers : int, optional
+        Maximum number of files checked concurrently. The default is ``4``.
+    use_cache : bool, optional
+        Whether to reuse the results of the files checked before. The folder must be writable.
+        The default is ``False``.
+    tolerance : float, optional
+        Tolerance on the singular values of the ``"numpy"`` checker. The default is ``1e-6``.
+
+    Returns
+    -------
+    dict
+        Dictionary with the SNP file name as the key and a dictionary of the check results as the value.
+        The ``"passivity"`` and ``"causality"`` keys give the list of the reported checks. Each check is a
+        dictionary with the ``"status"`` (``"passed"``, ``"failed"`` or ``"inconclusive"``), the
+        ``"violated_frequencies"`` in Hz, the ``"worst_singular_value"`` when available, and the ``"log"``
+        information.
+
+    Examples
+    --------
+    >>> from ansys.aedt.core.visualization.advanced.touchstone_parser import validate_touchstone_files
+    >>> results = validate_touchstone_files("touchstone_files", causality=False, checker="numpy")
+    >>> results["channel.s4p"]["passivity"][0]["status"]
+    'passed'
+    """
+    if checker not in ["genequiv", "numpy"]:
+        raise ValueError(f"Unknown checker '{checker}'. Options are 'genequiv' and 'numpy'.")
+    if max_workers < 1:
+        raise ValueError("The maximum number of workers must be positive.")
     out = {}
     snp_files = find_touchstone_files(input_dir)
     if not snp_files:
         return out
-    aedt_install_folder = list(aedt_versions.installed_versions.values())[0]
-    for file_name, path in snp_files.items():
-        out[file_name] = []
-        if os.name == "nt":
-            genequiv_path = Path(aedt_install_folder) / "genequiv.exe"
+    if checker == "genequiv":
+        aedt_version, aedt_install_folder = list(aedt_versions.installed_versions.items())[0]
+        genequiv_path = Path(aedt_install_folder) / ("genequiv.exe" if os.name == "nt" else "genequiv")
+        check = partial(_genequiv_check, str(genequiv_path), passivity, causality)
+        # Results of another AEDT installation are not reused
+        settings_key = f"{checker}:{passivity}:{causality}:{aedt_version}:{genequiv_path}"
+    else:
+        check = partial(_numpy_check, passivity, tolerance)
+        settings_key = f"{checker}:{passivity}:{causality}:{tolerance}"
+    cache_path = Path(input_dir) / TOUCHSTONE_CHECKS_CACHE
+    cache = _read_checks_cache(cache_path) if use_cache else {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if use_cache:
+            hashes = dict(zip(snp_files, executor.map(_file_hash, snp_files.values())))
+            cache_keys = {file_name: f"{settings_key}:{file_hash}" for file_name, file_hash in hashes.items()}
         else:
-            genequiv_path = Path(aedt_install_folder) / "genequiv"
-        cmd = [str(genequiv_path)]
-        if passivity:
-            cmd.append("-checkpassivity")
-        if causality:
-            cmd.append("-checkcausality")
-
-        cmd.append(path)
-        my_env = os.environ.copy()
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=my_env, text=True, check=True)  # nosec
-        output_lst = result.stdout.splitlines()
-
-        for line in output_lst:
-            if "Input data" in line and passivity:
-                msg_log = line[17:]
-                is_passive = True
-                if "non-passive" in msg_log:
-                    is_passive = False
-                out[file_name].append(["passivity", is_passive, msg_log])
-            if "Maximum causality" in line and causality:
-                msg_log = line[17:]
-                is_causal = True
-                try:
-                    causality_check = float(msg_log.split("Maximum causality error: ")[-1].split("for entry")[0])
-                    if not causality_check == 0.0:
-                        is_causal = False
-                except Exception:
-                    is_causal = False
-                    raise Exception("Failed evaluating causality value.")
-                out[file_name].append(["causality", is_causal, msg_log])
-            if "Causality check is inconclusive" in line and causality:
-                is_causal = False
-                out[file_name].append(["causality", is_causal, line[17:]])
+            # The files are only read by the checker when the results are not cached
+            cache_keys = {file_name: file_name for file_name in snp_files}
+        missing = [file_name for file_name in snp_files if cache_keys[file_name] not in cache]
+        for file_name, result in zip(missing, executor.map(check, [snp_files[i] for i in missing])):
+            cache[cache_keys[file_name]] = result
+    for file_name in snp_files:
+        out[file_name] = cache[cache_keys[file_name]]
+    if use_cache and missing:
+        # Results of the files no longer in the folder are dropped
+        current = set(hashes.values())
+        _write_checks_cache(cache_path, {k: v for k, v in cache.items() if k.rsplit(":", 1)[-1] in current})
+    return out
+
+
+@pyaedt_function_handler()
+def check_passivity(input_file: str, tolerance: float = 1e-6) -> dict:
+    """Check the passivity of a Touchstone file from the singular values of its scattering matrices.
+
+    A network is passive when the largest singular value of its scattering matrix does not exceed one
+    at any frequency.
+
+    Parameters
+    ----------
+    input_file : str or :class:'pathlib.Path'
+        Path of the Touchstone file.
+    tolerance : float, optional
+        Tolerance on the singular values. The default is ``1e-6``.
+
+    Returns
+    -------
+    dict
+        Dictionary with the ``"status"`` (``"passed"`` or ``"failed"``), the ``"violated_frequencies"``
+        in Hz, the ``"worst_singular_value"``, and the ``"log"`` information.
+    """
+    network = rf.Network(str(input_file))
+    return _passivity_result(network.s, network.f, tolerance)
+
+
+def _passivity_result(s_parameters, frequencies, tolerance: float = 1e-6) -> dict:
+    """Check the passivity of scattering matrices given as an array of shape ``(frequencies, ports, ports)``."""
+    frequencies = np.asarray(frequencies, dtype=float)
+    singular_values = np.linalg.svd(np.asarray(s_parameters), compute_uv=False)[:, 0]
+    violated = singular_values > 1 + tolerance
+    worst = int(np.argmax(singular_values))
+    status = "failed" if violated.any() else "passed"
+    log = (
+        f"Input data is {'non-passive' if violated.any() else 'passive'}: {int(violated.sum())} frequencies "
+        f"violated. Maximum singular value: {singular_values[worst]:.6g} at {frequencies[worst]:.6g} Hz."
+    )
+    return {
+        "status": status,
+        "violated_frequencies": frequencies[violated].tolist(),
+        "worst_singular_value": float(singular_values[worst]),
+        "log": log,
+    }
+
+
+def _numpy_check(passivity: bool, tolerance: float, input_file) -> dict:
+    out = {}
+    if passivity:
+        out["passivity"] = [check_passivity(input_file, tolerance)]
+    return out
+
+
+def _genequiv_check(genequiv_path: str, passivity: bool, causality: bool, input_file) -> dict:
+    import subprocess  # nosec
+
+    cmd = [genequiv_path]
+    if passivity:
+        cmd.append("-checkpassivity")
+    if causality:
+        cmd.append("-checkcausality")
+
+    cmd.append(str(input_file))
+    my_env = os.environ.copy()
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=my_env, text=True, check=True)  # nosec
+    return _parse_genequiv_output(result.stdout, passivity, causality)
+
+
+def _parse_genequiv_output(output: str, passivity: bool, causality: bool) -> dict:
+    out = {}
+    for line in output.splitlines():
+        if "Input data" in line and passivity:
+            msg_log = line[17:]
+            status = "failed" if "non-passive" in msg_log else "passed"
+            out.setdefault("passivity", []).append(_check_entry(status, msg_log))
+        if "Maximum causality" in line and causality:
+            msg_log = line[17:]
+            try:
+                causality_check = float(msg_log.split("Maximum causality error: ")[-1].split("for entry")[0])
+            except Exception:
+                raise Exception("Failed evaluating causality value.")
+            status = "passed" if causality_check == 0.0 else "failed"
+            out.setdefault("causality", []).append(_check_entry(status, msg_log))
+        if "Causality check is inconclusive" in line and causality:
+            out.setdefault("causality", []).append(_check_entry("inconclusive", line[17:]))
     return out
 
 
+def _check_entry(status: str, log: str) -> dict:
+    return {"status": status, "violated_frequencies": [], "worst_singular_value": None, "log": log}
+
+
+def _file_hash(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_checks_cache(cache_path: Path) -> dict:
+    try:
+        with open(cache_path, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_checks_cache(cache_path: Path, cache: dict) -> None:
+    try:
+        with open(cache_path, "w") as f:
+            json.dump(cache, f, indent=2)
+    except OSError:  # pragma: no cover
+        logger.debug(f"Unable to write the Touchstone checks cache {cache_path}.")
+
+
 @pyaedt_function_handler()
 def find_touchstone_files(input_dir: str) -> dict:
     """Get all Touchstone files in a directory.
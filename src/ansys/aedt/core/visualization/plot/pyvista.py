@@ -24,12 +24,13 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import csv
 from datetime import datetime
 import math
 import os
 from pathlib import Path
+import re
 import tempfile
 import time
 from typing import TYPE_CHECKING
@@ -115,59 +116,103 @@ def is_float(istring: str) -> float:
         return 0
 
 
+# Characters of the decimal numbers that ``np.fromstring`` parses, such as ``-1.5e-3``
+_NUMERIC_TEXT = re.compile(r"[0-9eE+\-.,\s]*")
+
+# Triangles drawn for each element, given as node positions in the element and keyed by
+# the number of nodes per element and whether all the nodes are taken
+_TRIANGLE_PATTERNS = {
+    (10, True): [
+        [0, 1, 3],
+        [1, 2, 4],
+        [1, 4, 3],
+        [3, 4, 5],
+        [9, 6, 8],
+        [6, 0, 3],
+        [6, 3, 8],
+        [8, 3, 5],
+        [9, 7, 8],
+        [7, 2, 4],
+        [7, 4, 8],
+        [8, 4, 5],
+        [9, 7, 6],
+        [7, 2, 1],
+        [7, 1, 6],
+        [6, 1, 0],
+    ],
+    (10, False): [[0, 2, 5], [9, 0, 5], [9, 2, 0], [9, 2, 5]],
+    (6, True): [[0, 1, 3], [1, 2, 4], [1, 4, 3], [3, 4, 5]],
+    (6, False): [[0, 2, 5]],
+    (4, True): [[0, 1, 3], [1, 2, 3], [0, 1, 2], [0, 2, 3]],
+}
+
+
 def _triangle_vertex(elements_nodes, num_nodes_per_element, take_all_nodes: bool = True):
-    trg_vertex = []
-    if num_nodes_per_element == 10 and take_all_nodes:
-        for e in elements_nodes:
-            trg_vertex.append([e[0], e[1], e[3]])
-            trg_vertex.append([e[1], e[2], e[4]])
-            trg_vertex.append([e[1], e[4], e[3]])
-            trg_vertex.append([e[3], e[4], e[5]])
-
-            trg_vertex.append([e[9], e[6], e[8]])
-            trg_vertex.append([e[6], e[0], e[3]])
-            trg_vertex.append([e[6], e[3], e[8]])
-            trg_vertex.append([e[8], e[3], e[5]])
-
-            trg_vertex.append([e[9], e[7], e[8]])
-            trg_vertex.append([e[7], e[2], e[4]])
-            trg_vertex.append([e[7], e[4], e[8]])
-            trg_vertex.append([e[8], e[4], e[5]])
-
-            trg_vertex.append([e[9], e[7], e[6]])
-            trg_vertex.append([e[7], e[2], e[1]])
-            trg_vertex.append([e[7], e[1], e[6]])
-            trg_vertex.append([e[6], e[1], e[0]])
-
-    elif num_nodes_per_element == 10 and not take_all_nodes:
-        for e in elements_nodes:
-            trg_vertex.append([e[0], e[2], e[5]])
-            trg_vertex.append([e[9], e[0], e[5]])
-            trg_vertex.append([e[9], e[2], e[0]])
-            trg_vertex.append([e[9], e[2], e[5]])
-
-    elif num_nodes_per_element == 6 and not take_all_nodes:
-        for e in elements_nodes:
-            trg_vertex.append([e[0], e[2], e[5]])
-
-    elif num_nodes_per_element == 6 and take_all_nodes:
-        for e in elements_nodes:
-            trg_vertex.append([e[0], e[1], e[3]])
-            trg_vertex.append([e[1], e[2], e[4]])
-            trg_vertex.append([e[1], e[4], e[3]])
-            trg_vertex.append([e[3], e[4], e[5]])
-
-    elif num_nodes_per_element == 4 and take_all_nodes:
-        for e in elements_nodes:
-            trg_vertex.append([e[0], e[1], e[3]])
-            trg_vertex.append([e[1], e[2], e[3]])
-            trg_vertex.append([e[0], e[1], e[2]])
-            trg_vertex.append([e[0], e[2], e[3]])
-
-    elif num_nodes_per_element == 3:
-        trg_vertex = elements_nodes
-
-    return trg_vertex
+    elements_nodes = np.asarray(elements_nodes, dtype=np.int64).reshape(-1, num_nodes_per_element)
+    if num_nodes_per_element == 3:
+        return elements_nodes
+    pattern = _TRIANGLE_PATTERNS.get((num_nodes_per_element, take_all_nodes))
+    if pattern is None:
+        return np.empty((0, 3), dtype=np.int64)
+    return elements_nodes[:, pattern].reshape(-1, 3)
+
+
+def _unique_triangles(triangles):
+    """Remove the duplicated triangles, whatever the order of their vertices."""
+    if triangles.size == 0 or triangles.max() >= 2**21:
+        return np.unique(np.sort(triangles, axis=1), axis=0)
+    # Packing the three sorted vertices of each triangle in one integer is much faster than comparing rows
+    first = triangles.min(axis=1)
+    last = triangles.max(axis=1)
+    keys = np.unique((first << 42) | ((triangles.sum(axis=1) - first - last) << 21) | last)
+    return np.column_stack((keys >> 42, (keys >> 21) & (2**21 - 1), keys & (2**21 - 1)))
+
+
+def _parse_values(text: str, dtype, convert):
+    """Convert comma-separated values to an array, falling back to ``convert`` when a value is invalid."""
+    values = None
+    # AEDT writes invalid numbers such as ``1.#QNAN``, which are converted one by one
+    if _NUMERIC_TEXT.fullmatch(text):
+        try:
+            values = np.fromstring(text, dtype=dtype, sep=",")
+        except ValueError:
+            values = None
+    if values is None or values.size != text.count(",") + 1:
+        values = np.array([convert(value) for value in text.split(",")], dtype=dtype)
+    return values
+
+
+def _ordered_sum(values):
+    """Sum the columns of a 2D array one after the other, as the built-in ``sum`` does for each row."""
+    total = np.zeros(values.shape[0])
+    for column in values.T:
+        total += column
+    return total
+
+
+def _node_average(elements_nodes, solutions):
+    """Average element solutions at their nodes.
+
+    Each node value is halved with the value of every new element sharing the node, in the order of the
+    elements. The contribution of every element is therefore weighted by a power of two, which makes the
+    weighted sum equal to the running average.
+    """
+    count = min(len(elements_nodes), solutions.shape[-1])
+    nodes = elements_nodes[:count].ravel()
+    order = np.argsort(nodes, kind="stable")
+    sorted_nodes = nodes[order]
+    first = np.flatnonzero(np.concatenate(([True], sorted_nodes[1:] != sorted_nodes[:-1])))
+    counts = np.diff(np.append(first, nodes.size))
+    node_index = np.empty(nodes.size, dtype=np.int64)
+    node_index[order] = np.repeat(np.arange(first.size), counts)
+    rank = np.empty(nodes.size, dtype=np.int64)
+    rank[order] = np.arange(nodes.size) - np.repeat(first, counts)
+    weights = np.ldexp(1.0, -(counts[node_index] - np.maximum(rank, 1)))
+    # The weighted sums are accumulated in the order of the elements, like the running average
+    contributions = np.repeat(solutions[..., :count], elements_nodes.shape[1], axis=-1) * weights
+    if contributions.ndim == 1:
+        return np.bincount(node_index, weights=contributions, minlength=first.size)
+    return [np.bincount(node_index, weights=i, minlength=first.size) for i in contributions]
 
 
 def _parse_aedtplt(filepath):
@@ -190,91 +235,46 @@ def _parse_aedtplt(filepath):
                 l_tmp.append(line)
                 continue
     for drawing_lines in lines:
-        bounding = []
         elements = []
         nodes_list = []
-        solution = []
+        solution = None
         for line in drawing_lines:
-            if "BoundingBox(" in line:
-                bounding = line[line.find("(") + 1 : -2].split(",")
-                bounding = [i.strip() for i in bounding]
             if "Elements(" in line:
-                elements = line[line.find("(") + 1 : -2].split(",")
-                elements = [int(i.strip()) for i in elements]
+                elements = _parse_values(line[line.find("(") + 1 : -2], np.int64, lambda i: int(i.strip()))
             if "Nodes(" in line:
-                nodes_list = line[line.find("(") + 1 : -2].split(",")
-                nodes_list = [float(i.strip()) for i in nodes_list]
+                nodes_list = _parse_values(line[line.find("(") + 1 : -2], float, lambda i: float(i.strip()))
             if "ElemSolution(" in line:
-                # convert list of strings to list of floats
-                sols = line[line.find("(") + 1 : -2].split(",")
-                sols = [is_float(value) for value in sols]
-                # sols = [float(i.strip()) for i in sols]
+                sols = _parse_values(line[line.find("(") + 1 : -2], float, is_float)
                 num_solution_per_element = int(sols[2])
                 num_nodes = elements[6]
                 sols = sols[3:]
+                # Pad the last element with zeros, which leave its sum unchanged
+                sols = np.concatenate((sols, np.zeros(-sols.size % num_solution_per_element)))
+                sols = sols.reshape(-1, num_solution_per_element)
                 if num_nodes == num_solution_per_element or num_solution_per_element // num_nodes < 3:
-                    sols = [
-                        sols[i : i + num_solution_per_element] for i in range(0, len(sols), num_solution_per_element)
-                    ]
-                    solution = [sum(i) / num_solution_per_element for i in sols]
+                    solution = _ordered_sum(sols) / num_solution_per_element
                 else:
-                    sols = [
-                        sols[i : i + num_solution_per_element] for i in range(0, len(sols), num_solution_per_element)
-                    ]
-                    solution = [
-                        [sum(i[::3]) / num_solution_per_element * 3 for i in sols],
-                        [sum(i[1::3]) / num_solution_per_element * 3 for i in sols],
-                        [sum(i[2::3]) / num_solution_per_element * 3 for i in sols],
-                    ]
-
-        nodes = [[nodes_list[i], nodes_list[i + 1], nodes_list[i + 2]] for i in range(0, len(nodes_list), 3)]
-        num_nodes = elements[0]
+                    solution = np.array([_ordered_sum(sols[:, i::3]) / num_solution_per_element * 3 for i in range(3)])
+
+        nodes = np.reshape(nodes_list, (-1, 3))
         elements = elements[2:]
-        num_nodes_per_element = elements[4]
+        num_nodes_per_element = int(elements[4])
         header_length = 5
-        elements_nodes = []
         # TODO: AEDT 23R2 supports mixed elements size. To be implemented.
-        for i in range(0, len(elements), num_nodes_per_element + header_length):
-            elements_nodes.append([elements[i + header_length + n] for n in range(num_nodes_per_element)])
-        if solution:
-            take_all_nodes = True  # solution case
-        else:
-            take_all_nodes = False  # mesh case
-        trg_vertex = _triangle_vertex(elements_nodes, num_nodes_per_element, take_all_nodes)
-        # remove duplicates
-        nodup_list = [list(i) for i in list(set([frozenset(t) for t in trg_vertex]))]
+        elements_nodes = elements.reshape(-1, num_nodes_per_element + header_length)[:, header_length:]
+        has_solution = solution is not None and solution.size > 0
+        # All nodes are taken in the solution case, and only the corners in the mesh case
+        trg_vertex = _triangle_vertex(elements_nodes, num_nodes_per_element, has_solution)
+        nodup_list = _unique_triangles(trg_vertex)
         log = True
-        if solution:
-            if isinstance(solution[0], list):
-                temps = []
-                for sol in solution:
-                    sv = {}
-                    sv_i = {}
-                    sv = defaultdict(lambda: 0, sv)
-                    sv_i = defaultdict(lambda: 1, sv_i)
-                    for els, s in zip(elements_nodes, sol):
-                        for el in els:
-                            sv[el] = (sv[el] + s) / sv_i[el]
-                            sv_i[el] = 2
-                    temps.append(np.array([sv[v] for v in sorted(sv.keys())]))
-            else:
-                sv = {}
-                sv_i = {}
-                sv = defaultdict(lambda: 0, sv)
-                sv_i = defaultdict(lambda: 1, sv_i)
-
-                for els, s in zip(elements_nodes, solution):
-                    for el in els:
-                        sv[el] = (sv[el] + s) / sv_i[el]
-                        sv_i[el] = 2
-                temps = np.array([sv[v] for v in sorted(sv.keys())])
+        if has_solution:
+            temps = _node_average(elements_nodes, solution)
             scalars.append(temps)
             if np.min(temps) <= 0:
                 log = False
-        array = [[3] + [j - 1 for j in i] for i in nodup_list]
 
-        faces.append(np.hstack(array))
-        vertices.append(np.array(nodes))
+        faces.append(np.column_stack((np.full(len(nodup_list), 3), nodup_list - 1)).ravel())
+        vertices.append(nodes)
 
     return vertices, faces, scalars, log
 
@@ -297,6 +297,210 @@ def _parse_streamline(filepath):
     return streamlines
 
 
+def _read_table(filepath, header_lines: int, delimiter):
+    """Read a table of floats, with ``pandas`` and ``pyarrow`` when available for delimited files."""
+    if delimiter:
+        try:
+            import pandas as pd
+            import pyarrow  # noqa: F401
+
+            return pd.read_csv(filepath, sep=delimiter, header=None, skiprows=header_lines, engine="pyarrow").to_numpy(
+                dtype=float
+            )
+        except Exception:  # pragma: no cover
+            pass
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        return np.loadtxt(filepath, dtype=float, delimiter=delimiter, skiprows=header_lines, ndmin=2)
+
+
+def _read_rows(filepath, header_lines: int, delimiter):
+    """Read the rows of a field file line by line, skipping the lines that do not match the first valid one."""
+    rows = []
+    with open_file(filepath, "r") as f:
+        lines = f.read().splitlines()[header_lines:]
+    for line in lines:
+        tmp = [i for i in line.strip().split(delimiter) if i and i.lower() != "nan"]
+        if len(tmp) in [4, 6, 9] and (not rows or len(tmp) == len(rows[0])):
+            rows.append([float(i) for i in tmp])
+    return np.array(rows, dtype=float).reshape(len(rows), -1)
+
+
+def _parse_fld(filepath, header_lines: int = 2, unique: bool = False):
+    """Read the nodes and values of a field file exported on points.
+
+    Each line holds the node coordinates followed by a scalar value, the three components of a real
+    vector, or the real and imaginary parts of the three components of a complex vector.
+    Lines with ``nan`` values are skipped.
+
+    Parameters
+    ----------
+    filepath : str or :class:`pathlib.Path`
+        Path to the ``.fld`` or ``.csv`` file.
+    header_lines : int, optional
+        Number of header lines to skip. The default is ``2``.
+    unique : bool, optional
+        Whether to remove the duplicated lines. The default is ``False``.
+
+    Returns
+    -------
+    tuple
+        Nodes as an ``(N, 3)`` array and values as an ``(N,)`` array for scalar fields or an ``(N, 3)``
+        real or complex array for vector fields.
+    """
+    filepath = str(filepath)
+    delimiter = None
+    if filepath.endswith(".csv"):
+        with open_file(filepath, "r") as f:
+            lines = [f.readline() for _ in range(header_lines + 1)]
+        delimiter = csv.Sniffer().sniff(lines[-1]).delimiter if lines[-1].strip() else None
+        if delimiter and delimiter.isspace():
+            delimiter = None
+    try:
+        data = _read_table(filepath, header_lines, delimiter)
+    except ValueError:
+        data = _read_rows(filepath, header_lines, delimiter)
+    if data.shape[1] not in [4, 6, 9]:
+        return np.empty((0, 3)), np.empty(0)
+    data = data[~np.isnan(data).any(axis=1)]
+    if unique:
+        data = data[np.sort(np.unique(data, axis=0, return_index=True)[1])]
+    nodes = data[:, :3]
+    if data.shape[1] == 4:
+        return nodes, data[:, 3]
+    elif data.shape[1] == 6:
+        return nodes, data[:, 3:]
+    # Complex vector as Re_x, Im_x, Re_y, Im_y, Re_z, Im_z
+    return nodes, data[:, 3::2] + 1j * data[:, 4::2]
+
+
+def _grid_axes(points, tolerance: float = 1e-9):
+    """Detect whether points lie on a full Cartesian grid.
+
+    Parameters
+    ----------
+    points : :class:`numpy.ndarray`
+        Points as an ``(N, 3)`` array.
+    tolerance : float, optional
+        Tolerance on the coordinates relative to the size of the point cloud. The default is ``1e-9``.
+
+    Returns
+    -------
+    tuple or None
+        Sorted coordinates of the grid along each axis and indices sorting the points in the grid order,
+        where the ``x`` coordinate varies the fastest. ``None`` when the points are not on a grid.
+    """
+    points = np.asarray(points, dtype=float)
+    if len(points) < 2:
+        return None
+    extent = np.ptp(points, axis=0).max()
+    if not extent > 0:
+        return None
+    keys = np.round((points - points.min(axis=0)) / (extent * tolerance)).astype(np.int64)
+    axes = []
+    indices = []
+    for key, coordinates in zip(keys.T, points.T):
+        _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+        axes.append(coordinates[first])
+        indices.append(inverse.ravel())
+    shape = [len(axis) for axis in axes]
+    if math.prod(shape) != len(points):
+        return None
+    flat = indices[0] + shape[0] * (indices[1] + shape[1] * indices[2])
+    if np.bincount(flat, minlength=len(points)).max() > 1:
+        return None
+    order = np.empty(len(points), dtype=np.int64)
+    order[flat] = np.arange(len(points))
+    return axes, order
+
+
+def _grid_mesh(axes):
+    """Create an image data for evenly spaced axes, or a structured grid otherwise."""
+    steps = [np.diff(axis) for axis in axes]
+    if all(np.allclose(step, step.mean(), rtol=1e-6, atol=0) for step in steps if step.size):
+        return pv.ImageData(
+            dimensions=[len(axis) for axis in axes],
+            spacing=[step.mean() if step.size else 1.0 for step in steps],
+            origin=[axis[0] for axis in axes],
+        )
+    return pv.StructuredGrid(*np.meshgrid(*axes, indexing="ij"))
+
+
+_FRAME_FILES = [".aedtplt", ".fld", ".csv"]
+
+
+def _frame_cache_path(filepath) -> Path:
+    """Path of the cache of a parsed frame, next to the frame file."""
+    filepath = Path(filepath)
+    return filepath.with_name(filepath.name + ".npz")
+
+
+def _parse_frame(filepath, header_lines: int = 2, use_cache: bool = False) -> dict:
+    """Parse an animation frame file.
+
+    When ``use_cache=True``, the arrays parsed from the file are cached in a ``.npz`` file next to it and read
+    back on the next calls. The cache is keyed on the size and the modification time of the frame file.
+
+    Parameters
+    ----------
+    filepath : str or :class:`pathlib.Path`
+        Path to the ``.aedtplt``, ``.fld`` or ``.csv`` file.
+    header_lines : int, optional
+        Number of header lines of ``.fld`` and ``.csv`` files. The default is ``2``.
+    use_cache : bool, optional
+        Whether to read and write the cache. The folder of the frame file must be writable.
+        The default is ``False``.
+
+    Returns
+    -------
+    dict
+        Arrays of the frame: ``"vertices"``, ``"faces"``, ``"log"`` and ``"scalars"`` for ``.aedtplt``
+        files, ``"nodes"`` and ``"values"`` for the other files.
+    """
+    filepath = Path(filepath)
+    cache = _frame_cache_path(filepath)
+    if use_cache:
+        stat = filepath.stat()
+        key = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+        if cache.is_file():
+            try:
+                with np.load(cache, allow_pickle=False) as data:
+                    if np.array_equal(data["key"], key):
+                        return {name: data[name] for name in data.files if name != "key"}
+            except Exception:
+                pyaedt_logger.debug(f"Unable to read the cache of frame {filepath}.")
+    if filepath.suffix == ".aedtplt":
+        vertices, faces, scalars, log = _parse_aedtplt(filepath)
+        frame = {"vertices": vertices[0], "faces": faces[0], "log": np.array(log)}
+        if scalars:
+            frame["scalars"] = np.asarray(scalars[0])
+    else:
+        nodes, values = _parse_fld(filepath, header_lines)
+        frame = {"nodes": nodes, "values": values}
+    if use_cache:
+        try:
+            # the cache is written to a temporary file and then renamed, so that a partial cache is never read
+            fd, temp_file = tempfile.mkstemp(dir=cache.parent, prefix=".", suffix=".npz")
+            try:
+                with os.fdopen(fd, "wb") as cache_fh:
+                    np.savez(cache_fh, key=key, **frame)
+                Path(temp_file).replace(cache)
+            except Exception:
+                Path(temp_file).unlink(missing_ok=True)
+                raise
+        except OSError:  # pragma: no cover
+            pyaedt_logger.debug(f"Unable to cache frame {filepath}.")
+    return frame
+
+
+def _same_topology(frame, other) -> bool:
+    """Check whether two parsed frames have the same points and faces."""
+    keys = ["vertices", "faces"] if "faces" in frame else ["nodes"]
+    if any(np.shape(frame.get(key)) != np.shape(other.get(key)) for key in ["scalars", "values"]):
+        return False
+    return all(key in other and np.array_equal(frame[key], other[key]) for key in keys)
+
+
 class ObjClass(PyAedtBase):
     """Manages mesh files to be plotted in pyvista.
 
@@ -790,6 +994,11 @@ class ModelPlotter(CommonPlotter):
 
     def __init__(self) -> None:
         CommonPlotter.__init__(self)
+        # Parsed frames are cached next to the frame files only when requested
+        self.cache_frames = False
+        # Frames are parsed in separate processes only when more than one worker is requested, because
+        # the worker processes import the ``__main__`` module again on platforms spawning them
+        self.frame_workers = 1
 
     @property
     def fields(self) -> list[FieldClass]:
@@ -1031,11 +1240,21 @@ class ModelPlotter(CommonPlotter):
             field.scalar_name = field._cached_polydata.point_data.active_scalars_name
 
     @pyaedt_function_handler()
-    def _read_aedtplt(self, field):
-        vertices, faces, scalars, log1 = _parse_aedtplt(field.path)
+    def _read_aedtplt(self, field, frame=None, mesh=None):
+        if frame is None:
+            vertices, faces, scalars, log1 = _parse_aedtplt(field.path)
+        else:
+            vertices, faces, log1 = [frame["vertices"]], [frame["faces"]], bool(frame["log"])
+            scalars = []
+            if "scalars" in frame:
+                scalars = [list(frame["scalars"]) if frame["scalars"].ndim == 2 else frame["scalars"]]
         if self.convert_fields_in_db:
             scalars = [np.multiply(np.log10(i), self.log_multiplier) for i in scalars]
-        fields_vals = pv.PolyData(vertices[0], faces[0])
+        if mesh is not None:
+            # Frames sharing the mesh only differ by their point data
+            fields_vals = mesh.copy(deep=False)
+        else:
+            fields_vals = pv.PolyData(vertices[0], faces[0])
         field._cached_polydata = fields_vals
         if isinstance(scalars[0], list):
             field.vector_scale = (max(fields_vals.bounds) - min(fields_vals.bounds)) / (
@@ -1058,76 +1277,55 @@ class ModelPlotter(CommonPlotter):
         field.log = log1
 
     @pyaedt_function_handler()
-    def _read_fld(self, field):
-        nodes = []
-        values = []
-        is_vector = False
-        with open_file(field.path, "r") as f:
-            try:
-                lines = f.read().splitlines()[field.header_lines :]
-                if field.path and field.path.endswith(".csv"):
-                    sniffer = csv.Sniffer()
-                    delimiter = sniffer.sniff(lines[0]).delimiter
-                else:
-                    delimiter = " "
-                if len(lines) > 2000 and not field._is_frame:
-                    lines = list(dict.fromkeys(lines))
-            except Exception:
-                lines = []
-                message = "Unable to update mesh because it is\n"
-                message += "already defined."
-                pyaedt_logger.warning(message)
-            for line in lines:
-                tmp = line.strip().split(delimiter)
-                tmp = [i for i in tmp if i and i.lower() != "nan"]
-                if len(tmp) not in [6, 9, 4]:
-                    continue
-                nodes.append([float(tmp[0]), float(tmp[1]), float(tmp[2])])
-                if len(tmp) == 6:  # Real vector
-                    values.append([float(tmp[3]), float(tmp[4]), float(tmp[5])])
-                    is_vector = field.is_vector = True
-                elif len(tmp) == 9:  # Complex vector as Re_x, Im_x, Re_y, Im_y, Re_z, Im_z
-                    values.append(
-                        [
-                            complex(float(tmp[3]), float(tmp[4])),
-                            complex(float(tmp[5]), float(tmp[6])),
-                            complex(float(tmp[7]), float(tmp[8])),
-                        ]
-                    )
-                    is_vector = field.is_vector = True
-                elif len(tmp) == 4:
-                    values.append(float(tmp[3]))
-        if self.convert_fields_in_db:
-            if not isinstance(values[0], list):
-                values = [self.log_multiplier * math.log10(abs(i)) for i in values]
+    def _read_fld(self, field, frame=None, mesh=None):
+        try:
+            if frame is None:
+                nodes, values = _parse_fld(field.path, field.header_lines, unique=not field._is_frame)
             else:
-                values = [[self.log_multiplier * math.log10(abs(i)) for i in value] for value in values]
-        if nodes:
+                nodes, values = frame["nodes"], frame["values"]
+        except Exception:
+            nodes, values = np.empty((0, 3)), np.empty(0)
+            message = "Unable to update mesh because it is\n"
+            message += "already defined."
+            pyaedt_logger.warning(message)
+        is_vector = values.ndim == 2
+        if is_vector:
+            field.is_vector = True
+        if self.convert_fields_in_db and values.size:
+            with np.errstate(divide="ignore"):
+                values = self.log_multiplier * np.log10(np.abs(values))
+        if nodes.size:
             try:
                 conv = 1 / AEDT_UNITS["Length"][self.units]
             except Exception:
                 conv = 1
-            vertices = np.array(nodes) * conv
-            filedata = pv.PolyData(vertices)
+            vertices = nodes * conv
             if is_vector:
+                filedata = mesh.copy(deep=False) if mesh is not None else pv.PolyData(vertices)
                 field.vector_scale = np.abs(
-                    (max(filedata.bounds) - min(filedata.bounds))
-                    / (50 * (np.vstack(values).max() - np.vstack(values).min()))
+                    (max(filedata.bounds) - min(filedata.bounds)) / (50 * (values.max() - values.min()))
                 )
-                if isinstance(values[0][0], complex):
-                    values_np = np.array(values, dtype=np.complex128)
-                    filedata["real_vector"] = values_np.real
-                    filedata["imag_vector"] = values_np.imag
-                    filedata["vector_mag"] = np.linalg.norm(values_np.real**2 + values_np.imag**2, axis=1) ** 0.5
+                if np.iscomplexobj(values):
+                    filedata["real_vector"] = values.real
+                    filedata["imag_vector"] = values.imag
+                    filedata["vector_mag"] = np.linalg.norm(values.real**2 + values.imag**2, axis=1) ** 0.5
                     field.scalar_name = "real_vector"
                 else:
-                    values_np = np.array(values, dtype=np.float64)
-                    filedata["vector_mag"] = values_np
+                    filedata["vector_mag"] = values
                     field.scalar_name = "vector_mag"
 
             else:
-                filedata = filedata.delaunay_2d(tol=field.surface_mapping_tolerance)
-                filedata.point_data["magnitude"] = np.array(values)
+                grid = _grid_axes(vertices)
+                if grid:
+                    values = values[grid[1]]
+                if mesh is not None:
+                    filedata = mesh.copy(deep=False)
+                elif grid:
+                    # Points exported on a regular grid do not need to be triangulated
+                    filedata = _grid_mesh(grid[0])
+                else:
+                    filedata = pv.PolyData(vertices).delaunay_2d(tol=field.surface_mapping_tolerance)
+                filedata.point_data["magnitude"] = values
                 field.scalar_name = "magnitude"
             field._cached_polydata = filedata  # Update field data
 
@@ -1141,6 +1339,7 @@ class ModelPlotter(CommonPlotter):
             cad._cached_mesh = self.pv.add_mesh(cad._cached_polydata, color=color_cad, opacity=cad.opacity)
         obj_to_iterate = [i for i in self._fields]
         if read_frames:
+            self._read_frames()
             for i in self.frames:
                 obj_to_iterate.append(i)
         for field in obj_to_iterate:
@@ -1153,6 +1352,38 @@ class ModelPlotter(CommonPlotter):
                 elif field_path.suffix in [".fld", ".csv"]:
                     self._read_fld(field)
 
+    @pyaedt_function_handler()
+    def _read_frames(self):
+        """Read the ``.aedtplt``, ``.fld`` and ``.csv`` frames.
+
+        Frame files are parsed concurrently in separate processes when ``frame_workers`` is not ``1``,
+        and the mesh is built once for consecutive frames sharing the same points and faces.
+        """
+        frames = [i for i in self.frames if i.path and not i._cached_polydata and Path(i.path).suffix in _FRAME_FILES]
+        if not frames:
+            return
+        arguments = ([i.path for i in frames], [i.header_lines for i in frames], [self.cache_frames] * len(frames))
+        parsed = None
+        if len(frames) > 1 and self.frame_workers != 1:
+            try:
+                with ProcessPoolExecutor(max_workers=self.frame_workers) as executor:
+                    parsed = list(executor.map(_parse_frame, *arguments))
+            except (OSError, RuntimeError):  # pragma: no cover
+                pyaedt_logger.debug("Unable to parse the frames in separate processes.")
+        if parsed is None:
+            parsed = list(map(_parse_frame, *arguments))
+        reference = None
+        for field, frame in zip(frames, parsed):
+            mesh = None
+            if reference is not None and _same_topology(frame, reference[0]):
+                mesh = reference[1]
+            if "faces" in frame:
+                self._read_aedtplt(field, frame, mesh)
+            else:
+                self._read_fld(field, frame, mesh)
+            if mesh is None:
+                reference = (frame, field._cached_polydata)
+
     @pyaedt_function_handler()
     def _add_buttons(self) -> None:
         size = int(self.pv.window_size[1] / 40)
@@ -1623,8 +1854,9 @@ class ModelPlotter(CommonPlotter):
 
             # If they have the same points just update the scalars
             if displayed_mesh.n_points == new_mesh.n_points:
-                # Update the points just in case
-                displayed_mesh.points[:] = new_mesh.points
+                # Update the points just in case, frames sharing the mesh already have the same points
+                if not np.shares_memory(displayed_mesh.points, new_mesh.points):
+                    displayed_mesh.points[:] = new_mesh.points
 
                 # Update scalars
                 displayed_mesh.point_data[self.frames[0].scalar_name] = new_mesh.point_data[self.frames[i].scalar_name]
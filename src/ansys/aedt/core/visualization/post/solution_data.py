@@ -22,6 +22,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from collections.abc import Mapping
 import math
 import os
 from typing import TYPE_CHECKING
@@ -41,6 +42,29 @@ if TYPE_CHECKING:
     from ansys.aedt.core.visualization.plot.matplotlib import ReportPlotter
 
 
+class _DerivedBlocks(Mapping):
+    """Mapping of expressions to solution blocks derived on first access and then reused."""
+
+    def __init__(self, source: dict, function) -> None:
+        self._source = source
+        self._function = function
+        self._blocks = {}
+
+    def __getitem__(self, expression):
+        block = self._blocks.get(expression)
+        if block is None:
+            if expression not in self._source:
+                raise KeyError(expression)
+            block = self._blocks[expression] = self._function(expression)
+        return block
+
+    def __iter__(self):
+        return iter(self._source)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+
 class SolutionData(PyAedtBase):
     """Contains information from the :func:`GetSolutionDataPerVariation` method."""
 
@@ -287,86 +311,81 @@ class SolutionData(PyAedtBase):
 
     @pyaedt_function_handler()
     def init_solutions_data(self) -> None:
-        """Initialize the database and store info in variables."""
-        self._solutions_real = self._init_solution_data_real()
-        self._solutions_imag = self._init_solution_data_imag()
-        self._solutions_mag = self._init_solution_data_mag()
-        self._solutions_phase = self._init_solution_data_phase()
+        """Initialize the database and store info in variables.
 
-    @pyaedt_function_handler()
-    def _full_keys(self, comb, solution, variation):
-        values = [np.array(val, dtype=float) for val in self.intrinsics_by_variation(variation).values()]
-        grids = np.meshgrid(*values, indexing="ij")
-        param_combinations = np.stack(grids, axis=-1).reshape(-1, len(values))  # shape: (N, num_intrinsics)
-        # Convert comb dict to NumPy array
-        comb_values = np.array([float(comb[k]) for k in comb], dtype=float)
-
-        # Broadcast comb_values to match param_combinations
-        full_keys = np.hstack([np.tile(comb_values, (param_combinations.shape[0], 1)), param_combinations])
-        combined_array = np.hstack([full_keys, solution.reshape(-1, 1)])
-        return combined_array
+        Real and imaginary parts are read into one preallocated block per expression.
+        Magnitude and phase are derived from them on first access.
+        """
+        self.units_data = {expr: self.nominal_variation.GetDataUnits(expr) for expr in self.expressions}
+        self._rows = self._variation_rows()
+        self._row_indexes = {}
+        self._sorted_values = {}
+        keys = self._sweep_keys()
+        self._solutions_real = self._init_solution_data_real(keys)
+        self._solutions_imag = self._init_solution_data_imag(keys)
+        self._solutions_mag = _DerivedBlocks(self._solutions_real, self._init_solution_data_mag)
+        self._solutions_phase = _DerivedBlocks(self._solutions_real, self._init_solution_data_phase)
+
+    def _variation_rows(self):
+        """Get the slice of rows that each variation occupies in the solution blocks."""
+        sizes = [
+            math.prod(len(v) for v in self.intrinsics_by_variation(idx).values()) for idx in range(len(self.variations))
+        ]
+        offsets = np.concatenate(([0], np.cumsum(sizes, dtype=int)))
+        return [slice(int(start), int(stop)) for start, stop in zip(offsets[:-1], offsets[1:])]
+
+    def _sweep_keys(self):
+        """Build the sweep columns shared by all the solution blocks."""
+        n_columns = len(self.variations[0]) + len(self.intrinsics_by_variation(0))
+        keys = np.empty((self._rows[-1].stop, n_columns), dtype=float)
+        for idx, (comb, rows) in enumerate(zip(self.variations, self._rows)):
+            values = [np.array(val, dtype=float) for val in self.intrinsics_by_variation(idx).values()]
+            comb_values = np.array([float(comb[k]) for k in comb], dtype=float)
+            keys[rows, : len(comb_values)] = comb_values
+            if values:
+                grids = np.meshgrid(*values, indexing="ij")
+                keys[rows, len(comb_values) :] = np.stack(grids, axis=-1).reshape(-1, len(values))
+        return keys
+
+    def _new_block(self, keys):
+        block = np.empty((keys.shape[0], keys.shape[1] + 1), dtype=float)
+        block[:, :-1] = keys
+        return block
 
     @pyaedt_function_handler()
-    def _init_solution_data_real(self):
+    def _init_solution_data_real(self, keys):
         """Initialize the real part of the solution data."""
         sols_data = {}
-
         for expression in self.expressions:
-            solution_numpy = None
-            for idx, (data, comb) in enumerate(zip(self._original_data, self.variations)):
-                solution = np.array(data.GetRealDataValues(expression, False), dtype=float)
-                solution_numpy_temp = self._full_keys(comb, solution, idx)
-                solution_numpy = (
-                    np.vstack([solution_numpy, solution_numpy_temp])
-                    if solution_numpy is not None
-                    else solution_numpy_temp
-                )
-            sols_data[expression] = solution_numpy
+            block = self._new_block(keys)
+            for data, rows in zip(self._original_data, self._rows):
+                block[rows, -1] = data.GetRealDataValues(expression, False)
+            sols_data[expression] = block
         return sols_data
 
     @pyaedt_function_handler()
-    def _init_solution_data_imag(self):
+    def _init_solution_data_imag(self, keys):
         """Initialize the imaginary part of the solution data."""
         sols_data = {}
-
         for expression in self.expressions:
-            solution_numpy = None
-            for idx, (data, comb) in enumerate(zip(self._original_data, self.variations)):
+            block = self._new_block(keys)
+            for data, rows in zip(self._original_data, self._rows):
                 if data.IsDataComplex(expression):
-                    solution = np.array(data.GetImagDataValues(expression, False), dtype=float)
+                    block[rows, -1] = data.GetImagDataValues(expression, False)
                 else:
-                    real_data_length = len(list(data.GetRealDataValues(expression, False)))
-                    solution = np.array([0] * real_data_length, dtype=float)
-                solution_numpy_temp = self._full_keys(comb, solution, idx)
-                solution_numpy = (
-                    np.vstack([solution_numpy, solution_numpy_temp])
-                    if solution_numpy is not None
-                    else solution_numpy_temp
-                )
-            sols_data[expression] = solution_numpy
+                    block[rows, -1] = 0.0
+            sols_data[expression] = block
         return sols_data
 
-    @pyaedt_function_handler()
-    def _init_solution_data_phase(self):
-        data_phase = {}
-        for expr in self.expressions:
-            data_phase[expr] = np.copy(self._solutions_real[expr])
-            data_phase[expr][:, -1] = np.arctan2(self._solutions_imag[expr][:, -1], self._solutions_real[expr][:, -1])
-        return data_phase
+    def _init_solution_data_phase(self, expr):
+        block = np.copy(self._solutions_real[expr])
+        block[:, -1] = np.arctan2(self._solutions_imag[expr][:, -1], self._solutions_real[expr][:, -1])
+        return block
 
-    @pyaedt_function_handler()
-    def _init_solution_data_mag(self):
-        _solutions_mag = {}
-        self.units_data = {}
-
-        for expr in self.expressions:
-            _solutions_mag[expr] = np.copy(self._solutions_real[expr])
-            self.units_data[expr] = self.nominal_variation.GetDataUnits(expr)
-            _solutions_mag[expr][:, -1] = np.sqrt(
-                self._solutions_real[expr][:, -1] * self._solutions_real[expr][:, -1]
-                + self._solutions_imag[expr][:, -1] * self._solutions_imag[expr][:, -1]
-            )
-        return _solutions_mag
+    def _init_solution_data_mag(self, expr):
+        block = np.copy(self._solutions_real[expr])
+        block[:, -1] = np.hypot(self._solutions_real[expr][:, -1], self._solutions_imag[expr][:, -1])
+        return block
 
     @property
     def full_matrix_real_imag(self) -> tuple:
@@ -388,8 +407,82 @@ class SolutionData(PyAedtBase):
         tuple of dicts
             (Mag Dict, Phase Dict).
         """
+        # Magnitude and phase of all the expressions are derived on the first call
+        if not isinstance(self._solutions_mag, dict):
+            self._solutions_mag = dict(self._solutions_mag)
+            self._solutions_phase = dict(self._solutions_phase)
         return self._solutions_mag, self._solutions_phase
 
+    def _expression_values(self, expression):
+        real = self._solutions_real[expression][:, -1]
+        imag = self._solutions_imag[expression][:, -1]
+        if np.any(imag):
+            return real + 1j * imag
+        return real
+
+    @pyaedt_function_handler()
+    def to_dataframe(self, expressions: list | str = None):
+        """Export the solution data to a pandas DataFrame.
+
+        The DataFrame has one row per solution point, one column per sweep and one
+        column per expression. Expressions with an imaginary part are exported as complex values.
+
+        Parameters
+        ----------
+        expressions : list, str, optional
+            Expressions to export. The default is ``None``, in which case all expressions are exported.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            Solution data.
+        """
+        try:
+            import pandas as pd
+        except ImportError:  # pragma: no cover
+            raise ImportError(
+                "The Pandas module is required to export solution data to a DataFrame.\n"
+                "Install with:\n\n"
+                "pip install pandas"
+            )
+        if not expressions:
+            expressions = self.expressions
+        elif isinstance(expressions, str):
+            expressions = [expressions]
+        keys = self._solutions_real[self.expressions[0]]
+        columns = {name: keys[:, idx] for idx, name in enumerate(self._sweeps_names)}
+        for expression in expressions:
+            columns[expression] = self._expression_values(expression)
+        return pd.DataFrame(columns, copy=False)
+
+    @pyaedt_function_handler()
+    def to_xarray(self, expressions: list | str = None):
+        """Export the solution data to an xarray Dataset.
+
+        The Dataset has one dimension per sweep and one data variable per expression.
+        Points missing from the sweep grid are set to ``NaN``.
+
+        Parameters
+        ----------
+        expressions : list, str, optional
+            Expressions to export. The default is ``None``, in which case all expressions are exported.
+
+        Returns
+        -------
+        :class:`xarray.Dataset`
+            Solution data.
+        """
+        try:
+            import xarray as xr
+        except ImportError:  # pragma: no cover
+            raise ImportError(
+                "The xarray module is required to export solution data to a Dataset.\n"
+                "Install with:\n\n"
+                "pip install xarray"
+            )
+        dataframe = self.to_dataframe(expressions).set_index(list(self._sweeps_names))
+        return xr.Dataset.from_dataframe(dataframe)
+
     @staticmethod
     @pyaedt_function_handler()
     def to_degrees(input_list: list) -> list:
@@ -515,6 +608,113 @@ class SolutionData(PyAedtBase):
             matched_rows[:, output_column] if len(output_column) > 1 else matched_rows[:, output_column[0]]
         )  # last column
 
+    def _row_index(self, columns):
+        """Get the index of the solution rows grouped by their values in some sweep columns.
+
+        The index is built on first use for each set of columns. Each group of rows is
+        stored as a slice when the rows are contiguous, so that selections are views.
+        """
+        columns = tuple(columns)
+        index = self._row_indexes.get(columns)
+        if index is None:
+            keys = self._solutions_real[self.expressions[0]][:, list(columns)]
+            unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+            inverse = inverse.ravel()
+            order = np.argsort(inverse, kind="stable")
+            bounds = np.cumsum(np.bincount(inverse, minlength=len(unique)))[:-1]
+            index = {}
+            for values, rows in zip(map(tuple, unique.tolist()), np.split(order, bounds)):
+                if rows[-1] - rows[0] + 1 == len(rows):
+                    rows = slice(int(rows[0]), int(rows[-1]) + 1)
+                index[values] = rows
+            self._row_indexes[columns] = index
+        return index
+
+    def _lookup_rows(self, columns, values):
+        """Get the rows whose sweep columns match the values, or ``None`` if no row matches."""
+        if not columns:
+            return slice(None)
+        return self._row_index(columns).get(tuple(float(i) for i in values))
+
+    @pyaedt_function_handler()
+    def nearest_value(self, sweep: str, value: float, tolerance: float = None) -> float | None:
+        """Get the available value of a sweep that is nearest to a value.
+
+        Parameters
+        ----------
+        sweep : str
+            Name of the sweep or design variable.
+        value : float
+            Value to look for.
+        tolerance : float, optional
+            Maximum distance between the value and the available value.
+            The default is ``None``, in which case the nearest value is always returned.
+
+        Returns
+        -------
+        float or None
+            Nearest available value, or ``None`` if no value is within the tolerance.
+        """
+        values = self._sorted_values.get(sweep)
+        if values is None:
+            column = list(self._sweeps_names).index(sweep)
+            values = np.unique(self._solutions_real[self.expressions[0]][:, column])
+            self._sorted_values[sweep] = values
+        position = int(np.searchsorted(values, value))
+        candidates = values[max(position - 1, 0) : position + 1]
+        nearest = candidates[np.argmin(np.abs(candidates - value))]
+        if tolerance is not None and abs(nearest - value) > tolerance:
+            return None
+        return float(nearest)
+
+    @pyaedt_function_handler()
+    def select(self, expressions: list | str = None, tolerance: float = None, **variations) -> dict:
+        """Select the solution data matching sweep and design variable values.
+
+        Parameters
+        ----------
+        expressions : list, str, optional
+            Expressions to select. The default is ``None``, in which case all expressions are selected.
+        tolerance : float, optional
+            Tolerance used to match each value with the nearest available value.
+            The default is ``None``, in which case values must match exactly.
+        **variations
+            Values of the sweeps and design variables to select, for example ``Freq=1.0``.
+
+        Returns
+        -------
+        dict
+            Dictionary of expressions and arrays of the matching rows. Each array has one column
+            per sweep followed by the real values. Arrays are views of the solution data when
+            the matching rows are contiguous, which is the case when selecting
+            design variations and the outer sweeps.
+
+        Examples
+        --------
+        >>> data = hfss.post.get_solution_data(expressions="S(1,1)")
+        >>> rows = data.select(Freq=2.5, tolerance=1e-3)["S(1,1)"]
+        """
+        if not expressions:
+            expressions = self.expressions
+        elif isinstance(expressions, str):
+            expressions = [expressions]
+        columns = []
+        values = []
+        for sweep, value in variations.items():
+            if sweep not in self._sweeps_names:
+                settings.logger.error(f"Sweep '{sweep}' not found.")
+                return {}
+            if tolerance is not None:
+                value = self.nearest_value(sweep, value, tolerance)
+                if value is None:
+                    return {}
+            columns.append(list(self._sweeps_names).index(sweep))
+            values.append(value)
+        rows = self._lookup_rows(columns, values)
+        if rows is None:
+            return {}
+        return {expression: self._solutions_real[expression][rows] for expression in expressions}
+
     @pyaedt_function_handler()
     def get_expression_data(
         self,
@@ -591,17 +791,13 @@ class SolutionData(PyAedtBase):
         else:
             position = [list(self._sweeps_names).index(self.primary_sweep)]
 
-        sol = self.lookup_column_value(
-            solution_data,
-            [i for i, _ in enumerate(temp) if i not in position],
-            [i for i in temp if temp.index(i) not in position],
-        )
-        x_axis = self.lookup_column_value(
-            solution_data,
-            [i for i, _ in enumerate(temp) if i not in position],
-            [i for i in temp if temp.index(i) not in position],
-            position,
-        )
+        match_columns = [i for i, _ in enumerate(temp) if i not in position]
+        rows = self._lookup_rows(match_columns, [v for i, v in enumerate(temp) if i not in position])
+        if rows is None:
+            sol = x_axis = None
+        else:
+            sol = solution_data[rows, -1].copy()
+            x_axis = solution_data[rows][:, position] if len(position) > 1 else solution_data[rows, position[0]].copy()
 
         if convert_to_SI and self._quantity(self.units_data[expression]):
             sol = self._convert_list_to_SI(
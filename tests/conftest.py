@@ -123,7 +123,11 @@ else:
 
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
     """Hook used to apply marker on tests."""
+    run_benchmarks = "benchmark" in config.getoption("markexpr", "")
     for item in items:
+        # Benchmarks are long and timing based, they only run when explicitly selected
+        if not run_benchmarks and item.get_closest_marker("benchmark"):
+            item.add_marker(pytest.mark.skip(reason="Benchmarks only run when selected with '-m benchmark'."))
         # Mark unit, integration and system tests
         if item.nodeid.startswith(UNIT_TEST_PREFIX):
             item.add_marker(pytest.mark.unit)
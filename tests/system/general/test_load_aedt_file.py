@@ -176,3 +176,16 @@ def test_3dcomponents_array(test_tmp_dir) -> None:
     assert array["Rotation"]["columns"] == 8
     assert array["Rotation"]["matrix"] == rotation
     assert array["PostProcessingCells"] == onecell
+
+
+@pytest.mark.parametrize(
+    "project_name", [TEST_PROJECT_NAME + ".aedt", "Cassegrain.aedt", "phased_array.aedt", "material_sample.amat"]
+)
+def test_lazy_load(project_name, test_tmp_dir) -> None:
+    aedt_file = TESTS_GENERAL_PATH / "example_models" / TEST_SUBFOLDER / project_name
+    file = shutil.copy2(aedt_file, test_tmp_dir / project_name)
+
+    project_dict = load_entire_aedt_file(file)
+    lazy_dict = load_entire_aedt_file(file, lazy=True)
+    assert list(lazy_dict.keys()) == list(project_dict.keys())
+    assert lazy_dict.to_dict() == project_dict
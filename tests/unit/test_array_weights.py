@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import numpy as np
+import pytest
+
+from ansys.aedt.core.visualization.advanced.array_weights import TAPERS
+from ansys.aedt.core.visualization.advanced.array_weights import element_weights
+from ansys.aedt.core.visualization.advanced.array_weights import lattice_taper
+from ansys.aedt.core.visualization.advanced.array_weights import steering_phase
+from ansys.aedt.core.visualization.advanced.array_weights import taper_window
+
+# Direction cosines sampled finely enough to resolve the sidelobe peaks of the arrays under test
+U = np.linspace(0, 1, 20001)
+
+
+def array_factor_db(amplitude, positions=None):
+    """Normalized array factor in dB of a half-wavelength spaced linear array over ``U``."""
+    amplitude = np.asarray(amplitude, dtype=complex)
+    positions = np.arange(len(amplitude)) if positions is None else np.asarray(positions)
+    af = np.abs(np.exp(1j * np.pi * np.outer(U, positions)) @ amplitude)
+    return 20 * np.log10(af / af.max())
+
+
+def peak_sidelobe_db(af_db):
+    """Highest level outside the main lobe centered at ``U = 0``."""
+    first_null = np.argmax(np.diff(af_db) > 0)
+    return af_db[first_null:].max()
+
+
+def planar_indices(rows, columns):
+    a, b = np.meshgrid(np.arange(rows), np.arange(columns), indexing="ij")
+    return np.column_stack([a.ravel(), b.ravel()])
+
+
+def test_uniform_linear_array_sidelobe() -> None:
+    # First sidelobe of a uniform array: |sin(N x) / (N sin x)| at N x = 1.4303 pi
+    size = 16
+    x = 1.4303 * np.pi / size
+    expected = 20 * np.log10(abs(np.sin(size * x) / (size * np.sin(x))))
+    assert peak_sidelobe_db(array_factor_db(taper_window("uniform", size))) == pytest.approx(expected, abs=0.01)
+    assert expected == pytest.approx(-13.2, abs=0.1)
+
+
+@pytest.mark.parametrize("size", [9, 16])
+@pytest.mark.parametrize("sidelobe_level", [20.0, 30.0, 40.0])
+def test_chebyshev_linear_array_sidelobe(size, sidelobe_level) -> None:
+    af_db = array_factor_db(taper_window("chebyshev", size, sidelobe_level=sidelobe_level))
+    first_null = np.argmax(np.diff(af_db) > 0)
+    sidelobes = af_db[first_null:]
+    # All the sidelobes of a Dolph-Chebyshev array reach the design level
+    peaks = sidelobes[1:-1][(sidelobes[1:-1] > sidelobes[:-2]) & (sidelobes[1:-1] > sidelobes[2:])]
+    assert len(peaks) >= (size - 1) // 2 - 1
+    assert np.allclose(peaks, -sidelobe_level, atol=0.01)
+
+
+@pytest.mark.parametrize("sidelobe_level", [25.0, 35.0])
+def test_taylor_linear_array_sidelobe(sidelobe_level) -> None:
+    af_db = array_factor_db(taper_window("taylor", 32, sidelobe_level=sidelobe_level, nbar=5))
+    assert peak_sidelobe_db(af_db) == pytest.approx(-sidelobe_level, abs=0.3)
+
+
+@pytest.mark.parametrize(
+    "taper, expected",
+    [("hamming", -42.0), ("hann", -31.0), ("cosine", -22.5), ("triangular", -26.5)],
+)
+def test_window_linear_array_sidelobe(taper, expected) -> None:
+    # Continuous aperture values, approached by large sampled arrays
+    af_db = array_factor_db(taper_window(taper, 64))
+    assert peak_sidelobe_db(af_db) == pytest.approx(expected, abs=1.5)
+
+
+def test_taper_window() -> None:
+    for taper in TAPERS:
+        window = taper_window(taper, 11)
+        assert window.max() == pytest.approx(1.0)
+        assert np.allclose(window, window[::-1])
+        assert np.all(window[:5] <= window[1:6] + 1e-12)
+    assert np.allclose(taper_window("hamming", 8), np.hamming(8))
+    assert np.allclose(taper_window("hann", 8), np.hanning(8))
+    assert np.array_equal(taper_window("chebyshev", 1), [1.0])
+    with pytest.raises(ValueError):
+        taper_window("kaiser", 8)
+    with pytest.raises(ValueError):
+        taper_window("flat", 0)
+
+
+def test_taper_window_scipy() -> None:
+    windows = pytest.importorskip("scipy.signal.windows")
+    for size in (2, 7, 16):
+        assert np.allclose(taper_window("chebyshev", size, sidelobe_level=50), windows.chebwin(size, 50))
+        taylor = windows.taylor(size, nbar=4, sll=30)
+        assert np.allclose(taper_window("taylor", size), taylor / taylor.max())
+
+
+@pytest.mark.parametrize("taper", ["flat", "chebyshev", "taylor"])
+def test_planar_array_sidelobe(taper) -> None:
+    indices = planar_indices(8, 12)
+    amplitude = lattice_taper(indices, taper, sidelobe_level=30).reshape(8, 12)
+    # The planar taper is separable and the principal cuts have the sidelobes of the linear arrays
+    for axis, size in enumerate((8, 12)):
+        window = taper_window(taper, size, sidelobe_level=30)
+        assert np.allclose(amplitude.sum(axis=1 - axis), window * amplitude.sum(axis=1 - axis).max())
+        cut = array_factor_db(amplitude.sum(axis=1 - axis))
+        assert peak_sidelobe_db(cut) == pytest.approx(peak_sidelobe_db(array_factor_db(window)), abs=1e-6)
+    if taper == "chebyshev":
+        assert peak_sidelobe_db(array_factor_db(amplitude.sum(axis=1))) == pytest.approx(-30, abs=0.01)
+
+
+def test_lattice_taper_sparse() -> None:
+    # Missing elements and offset indices use the window of the bounding box
+    indices = np.array([[3, 5], [4, 5], [6, 5], [3, 7], [6, 7]])
+    window_a = taper_window("taylor", 4)
+    window_b = taper_window("taylor", 3)
+    expected = window_a[indices[:, 0] - 3] * window_b[indices[:, 1] - 5]
+    assert np.allclose(lattice_taper(indices, "taylor"), expected)
+    assert np.array_equal(lattice_taper(np.empty((0, 2)), "taylor"), [])
+
+
+def test_element_weights() -> None:
+    indices = planar_indices(4, 4)
+    lattice_vector = [0.015, 0, 0, 0, 0.015, 0]
+    frequency = 10e9
+    phi_scan = [0.0, 45.0, 90.0]
+    theta_scan = [0.0, 30.0, 15.0]
+    magnitude = np.linspace(1, 2, 16)
+    phase = np.linspace(0, 90, 16)
+    weights = element_weights(
+        indices, lattice_vector, frequency, phi_scan, theta_scan, "chebyshev", magnitude, phase, sidelobe_level=20
+    )
+    assert weights.shape == (3, 16)
+    assert weights.dtype == complex
+
+    taper = lattice_taper(indices, "chebyshev", sidelobe_level=20)
+    assert np.allclose(np.abs(weights), np.sqrt(magnitude) * taper)
+    assert np.allclose(np.angle(weights[0]), np.angle(np.exp(1j * np.deg2rad(phase))))
+
+    # The steered beam points to the scan direction
+    k = 2 * np.pi * frequency / 299792458
+    for idx, (phi, theta) in enumerate(zip(np.deg2rad(phi_scan), np.deg2rad(theta_scan))):
+        positions = indices * 0.015
+        path = k * np.sin(theta) * (positions[:, 0] * np.cos(phi) + positions[:, 1] * np.sin(phi))
+        steered = weights[idx] * np.exp(1j * path) * np.exp(-1j * np.deg2rad(phase))
+        assert np.allclose(np.angle(steered), 0.0)
+
+    phases = steering_phase(indices, lattice_vector, frequency, phi_scan, theta_scan)
+    assert np.allclose(np.angle(weights / np.exp(1j * phases)), np.angle(weights[0]))
+    assert np.allclose(element_weights(indices), np.ones((1, 16)))
+    with pytest.raises(ValueError):
+        element_weights(indices, lattice_vector, frequency, [0.0, 1.0], [0.0])
@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pytest
+
+from ansys.aedt.core.generic.settings import settings
+from ansys.aedt.core.visualization.advanced import farfield_visualization
+from ansys.aedt.core.visualization.advanced.array_weights import taper_window
+from ansys.aedt.core.visualization.advanced.farfield_visualization import FfdSolutionData
+from ansys.aedt.core.visualization.advanced.farfield_visualization import _FfdPattern
+
+
+def write_synthetic_ffd(path, theta=(0, 180, 91), phi=(-180, 180, 181), frequencies=(1e9,), seed=0):
+    """Write a synthetic far field pattern file and return its complex rETheta and rEPhi values."""
+    rng = np.random.default_rng(seed)
+    n_points = theta[2] * phi[2]
+    values = rng.standard_normal((len(frequencies), n_points, 4))
+    with open(path, "w") as f:
+        f.write(f"{theta[0]} {theta[1]} {theta[2]}\n{phi[0]} {phi[1]} {phi[2]}\nFrequencies {len(frequencies)}\n")
+        for frequency, block in zip(frequencies, values):
+            f.write(f"Frequency {frequency:.15e}\n")
+            np.savetxt(f, block, fmt="%.15e")
+    fields = np.stack([values[..., 0] + 1j * values[..., 1], values[..., 2] + 1j * values[..., 3]], axis=1)
+    return fields
+
+
+def read_ffd_text(path):
+    """Reference loader reading each frequency block with ``np.loadtxt``."""
+    with open(path) as f:
+        text = f.read()
+    fields = {}
+    for segment in text.split("Frequency")[1:]:
+        lines = segment.strip().split("\n")
+        values = np.loadtxt(lines[1:])
+        fields[float(lines[0])] = (
+            np.vectorize(complex)(values[:, 0], values[:, 1]),
+            np.vectorize(complex)(values[:, 2], values[:, 3]),
+        )
+    return fields
+
+
+def read_ffd(pattern_file):
+    pattern = _FfdPattern(pattern_file)
+    fields = np.stack([pattern.read(idx) for idx in range(len(pattern.frequencies))])
+    return pattern.theta, pattern.phi, pattern.frequencies, fields
+
+
+def write_array_metadata(path, elements=4, frequencies=(1e9, 2e9, 3e9), rows=None, spacing=0.05, grid=None):
+    """Write the metadata of an array of synthetic elements and return its path.
+
+    Elements are on a line, or on a ``rows x (elements / rows)`` lattice when ``rows`` is given.
+    """
+    theta, phi = grid or ((0, 180, 19), (0, 350, 36))
+    element_pattern = {}
+    columns = elements // rows if rows else elements
+    for idx in range(elements):
+        row, column = divmod(idx, columns)
+        write_synthetic_ffd(path / f"element_{idx}.ffd", theta=theta, phi=phi, frequencies=frequencies, seed=idx)
+        power = {str(frequency): 1.0 for frequency in frequencies}
+        name = f"A[{row + 1},{column + 1}]" if rows else f"Port{idx + 1}"
+        element_pattern[name] = {
+            "file_name": f"element_{idx}.ffd",
+            "location": [str(row * spacing), str(column * spacing), "0.0"],
+            "incident_power": power,
+            "accepted_power": power,
+            "radiated_power": power,
+        }
+    metadata = {"element_pattern": element_pattern, "touchstone_file": ""}
+    if rows:
+        metadata.update(
+            {
+                "array_dimension": [rows * spacing, columns * spacing, spacing, spacing],
+                "component_objects": {},
+                "lattice_vector": [spacing, 0.0, 0.0, 0.0, spacing, 0.0],
+                "cell_position": [],
+            }
+        )
+    metadata_file = path / "pyaedt_antenna_metadata.json"
+    metadata_file.write_text(json.dumps(metadata))
+    return metadata_file
+
+
+@pytest.fixture
+def ffd_cache():
+    previous = settings.ffd_cache
+    settings.ffd_cache = True
+    yield
+    settings.ffd_cache = previous
+
+
+@pytest.fixture
+def decoded_blocks(monkeypatch):
+    """Record the number of points of every decoded frequency block."""
+    decoded = []
+    decode_ffd_block = farfield_visualization._decode_ffd_block
+
+    def decode(data, n_points):
+        decoded.append(n_points)
+        return decode_ffd_block(data, n_points)
+
+    monkeypatch.setattr(farfield_visualization, "_decode_ffd_block", decode)
+    return decoded
+
+
+@pytest.fixture
+def read_blocks(monkeypatch):
+    """Record the pattern file and the frequency index of every block read."""
+    reads = []
+    read = _FfdPattern.read
+
+    def record(pattern, index):
+        reads.append((pattern.pattern_file.name, pattern.frequencies[index]))
+        return read(pattern, index)
+
+    monkeypatch.setattr(_FfdPattern, "read", record)
+    return reads
+
+
+def test_read_ffd(tmp_path, ffd_cache) -> None:
+    pattern_file = tmp_path / "element.ffd"
+    expected = write_synthetic_ffd(pattern_file, theta=(0, 90, 10), phi=(0, 350, 36), frequencies=(1e9, 2e9, 3e9))
+    theta, phi, frequencies, fields = read_ffd(pattern_file)
+    assert np.array_equal(theta, np.linspace(0, 90, 10))
+    assert np.array_equal(phi, np.linspace(0, 350, 36))
+    assert frequencies == [1e9, 2e9, 3e9]
+    assert fields.dtype == np.complex128
+    assert np.allclose(fields, expected, rtol=1e-14)
+    reference = read_ffd_text(pattern_file)
+    for idx, frequency in enumerate(frequencies):
+        assert np.array_equal(fields[idx, 0], reference[frequency][0])
+        assert np.array_equal(fields[idx, 1], reference[frequency][1])
+
+
+def test_read_ffd_cache(tmp_path, ffd_cache, decoded_blocks) -> None:
+    pattern_file = tmp_path / "element.ffd"
+    write_synthetic_ffd(pattern_file, theta=(0, 90, 10), phi=(0, 350, 36), frequencies=(1e9, 2e9))
+
+    first = read_ffd(pattern_file)
+    assert (tmp_path / "element.ffd.npz").is_file()
+    assert len(decoded_blocks) == 2
+    second = read_ffd(pattern_file)
+    assert len(decoded_blocks) == 2
+    assert second[2] == first[2]
+    assert np.array_equal(second[3], first[3])
+
+    # A modified pattern file invalidates the cache.
+    expected = write_synthetic_ffd(pattern_file, theta=(0, 90, 10), phi=(0, 350, 36), frequencies=(1e9, 2e9), seed=1)
+    stat = pattern_file.stat()
+    os.utime(pattern_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    assert np.allclose(read_ffd(pattern_file)[3], expected)
+    assert len(decoded_blocks) == 4
+
+    # A corrupted cache is ignored and rewritten.
+    (tmp_path / "element.ffd.npz").write_bytes(b"corrupted")
+    (tmp_path / "element.ffd.1.npz").write_bytes(b"corrupted")
+    assert np.allclose(read_ffd(pattern_file)[3], expected)
+    assert len(decoded_blocks) == 5
+    assert np.allclose(read_ffd(pattern_file)[3], expected)
+    assert len(decoded_blocks) == 5
+
+    # Without cache, each block is decoded when it is read.
+    settings.ffd_cache = False
+    pattern = _FfdPattern(pattern_file)
+    assert len(decoded_blocks) == 5
+    assert np.allclose(pattern.read(1), expected[1])
+    assert len(decoded_blocks) == 6
+
+
+def test_read_ffd_cache_on_demand(tmp_path, ffd_cache, decoded_blocks) -> None:
+    pattern_file = tmp_path / "element.ffd"
+    expected = write_synthetic_ffd(pattern_file, theta=(0, 90, 10), phi=(0, 350, 36), frequencies=(1e9, 2e9, 3e9))
+    cache_file = tmp_path / "element.ffd.npz"
+
+    # Only the grid and the block ranges are cached when the file is opened.
+    pattern = _FfdPattern(pattern_file)
+    assert not decoded_blocks
+    assert cache_file.is_file()
+    assert sorted(i.name for i in tmp_path.iterdir()) == ["element.ffd", "element.ffd.npz"]
+
+    # Each block is cached when it is first decoded.
+    assert np.allclose(pattern.read(1), expected[1])
+    assert sorted(i.name for i in tmp_path.iterdir()) == ["element.ffd", "element.ffd.1.npz", "element.ffd.npz"]
+    pattern = _FfdPattern(pattern_file)
+    assert pattern.frequencies == [1e9, 2e9, 3e9]
+    assert np.allclose(pattern.read(1), expected[1])
+    assert len(decoded_blocks) == 1
+    assert np.allclose(pattern.read(2), expected[2])
+    assert np.allclose(_FfdPattern(pattern_file).read(2), expected[2])
+    assert len(decoded_blocks) == 2
+
+
+def test_read_ffd_cache_shared(tmp_path, monkeypatch, ffd_cache, decoded_blocks) -> None:
+    pattern_file = tmp_path / "element.ffd"
+    expected = write_synthetic_ffd(pattern_file, theta=(0, 90, 10), phi=(0, 350, 36), frequencies=(1e9, 2e9))
+    first = _FfdPattern(pattern_file)
+    second = _FfdPattern(pattern_file)
+
+    # The blocks cached by one pattern are read by the other one.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert np.allclose(first.read(0), expected[0])
+        assert np.allclose(second.read(0), expected[0])
+        assert np.allclose(second.read(1), expected[1])
+        assert np.allclose(first.read(1), expected[1])
+    assert len(decoded_blocks) == 2
+
+    # Both patterns decode and cache the same block when they read it at the same time.
+    (tmp_path / "element.ffd.0.npz").unlink()
+    with monkeypatch.context() as m:
+        m.setattr(_FfdPattern, "_FfdPattern__read_cache_block", lambda self, block_file: None)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert np.allclose(first.read(0), expected[0])
+            assert np.allclose(second.read(0), expected[0])
+    assert len(decoded_blocks) == 4
+
+    with np.load(tmp_path / "element.ffd.0.npz") as cached:
+        assert sorted(cached.files) == ["fields", "key"]
+    assert sorted(i.name for i in tmp_path.iterdir()) == [
+        "element.ffd",
+        "element.ffd.0.npz",
+        "element.ffd.1.npz",
+        "element.ffd.npz",
+    ]
+    assert np.allclose(_FfdPattern(pattern_file).read(0), expected[0])
+    assert len(decoded_blocks) == 4
+
+
+def test_read_ffd_wrong_block(tmp_path, ffd_cache) -> None:
+    pattern_file = tmp_path / "element.ffd"
+    write_synthetic_ffd(pattern_file, theta=(0, 90, 10), phi=(0, 350, 36))
+    with open(pattern_file, "a") as f:
+        f.write("Frequency 2e9\n1 2 3 4\n")
+    with pytest.raises(ValueError):
+        read_ffd(pattern_file)
+
+
+@pytest.mark.benchmark
+def test_read_ffd_benchmark(tmp_path, ffd_cache) -> None:
+    pattern_files = []
+    for idx in range(16):
+        pattern_file = tmp_path / f"element_{idx}.ffd"
+        write_synthetic_ffd(pattern_file, frequencies=(1e9, 2e9), seed=idx)
+        pattern_files.append(pattern_file)
+
+    start = time.perf_counter()
+    for pattern_file in pattern_files:
+        read_ffd_text(pattern_file)
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for pattern_file in pattern_files:
+        read_ffd(pattern_file)
+    parse_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for pattern_file in pattern_files:
+        read_ffd(pattern_file)
+    cached_time = time.perf_counter() - start
+
+    assert cached_time < parse_time
+    assert cached_time < reference_time
+
+
+@pytest.mark.parametrize("cache", [True, False])
+def test_farfield_loads_active_frequency(tmp_path, read_blocks, cache) -> None:
+    previous = settings.ffd_cache
+    settings.ffd_cache = cache
+    try:
+        ffdata = FfdSolutionData(input_file=write_array_metadata(tmp_path), frequency=2e9)
+        assert ffdata.frequencies == [1e9, 2e9, 3e9]
+        assert sorted(read_blocks) == [(f"element_{idx}.ffd", 2e9) for idx in range(4)]
+
+        read_blocks.clear()
+        farfield = ffdata.combine_farfield()
+        assert farfield["rETheta"].shape == (19, 36)
+        assert not read_blocks
+
+        ffdata.frequency = 3e9
+        assert sorted(read_blocks) == [(f"element_{idx}.ffd", 3e9) for idx in range(4)]
+        read_blocks.clear()
+        ffdata.frequency = 2e9
+        assert not read_blocks
+    finally:
+        settings.ffd_cache = previous
+
+
+def test_farfield_memory_budget(tmp_path, ffd_cache, read_blocks) -> None:
+    # Each frequency of the four elements takes 4 * 2 * 19 * 36 * 16 bytes, about 0.08 MB.
+    ffdata = FfdSolutionData(input_file=write_array_metadata(tmp_path), memory_budget=0.1)
+    ffdata.frequency = 2e9
+    ffdata.frequency = 3e9
+    read_blocks.clear()
+
+    # The first frequency was released, the active one is kept even if the budget is too small.
+    ffdata.frequency = 1e9
+    assert sorted(read_blocks) == [(f"element_{idx}.ffd", 1e9) for idx in range(4)]
+    read_blocks.clear()
+    ffdata.memory_budget = 0.01
+    assert ffdata.combine_farfield()
+    assert not read_blocks
+    ffdata.frequency = 3e9
+    assert len(read_blocks) == 4
+
+    read_blocks.clear()
+    ffdata.memory_budget = 1024
+    ffdata.frequency = 1e9
+    ffdata.frequency = 3e9
+    assert sorted(read_blocks) == [(f"element_{idx}.ffd", 1e9) for idx in range(4)]
+
+
+@pytest.mark.parametrize("taper", ["flat", "hamming", "chebyshev", "taylor"])
+def test_combine_farfield_batch(tmp_path, ffd_cache, taper) -> None:
+    ffdata = FfdSolutionData(input_file=write_array_metadata(tmp_path, elements=16, rows=4, frequencies=(1e9,)))
+    ffdata.taper = taper
+    magnitude = {port: 1.0 + idx / 10 for idx, port in enumerate(ffdata.all_element_names)}
+    phase = {port: 5.0 * idx for idx, port in enumerate(ffdata.all_element_names)}
+    ffdata.origin = [0.01, 0.02, 0.0]
+    phi_scan = np.array([0.0, 30.0, 45.0, 90.0])
+    theta_scan = np.array([0.0, 10.0, 25.0, 40.0])
+
+    ffdata.magnitude = dict(magnitude)
+    ffdata.phase = dict(phase)
+    batch = ffdata.combine_farfield_batch(phi_scan, theta_scan, chunk_size=100)
+    assert batch["rETheta"].shape == (4, 19, 36)
+    assert ffdata.magnitude == magnitude
+    assert ffdata.phase == phase
+    for idx, (phi, theta) in enumerate(zip(phi_scan, theta_scan)):
+        # combine_farfield accumulates the steering in the phases of the elements
+        ffdata.magnitude = dict(magnitude)
+        ffdata.phase = dict(phase)
+        farfield = ffdata.combine_farfield(phi_scan=phi, theta_scan=theta)
+        for quantity in ("rETheta", "rEPhi", "rETotal", "RealizedGain", "Directivity_dB"):
+            assert np.allclose(batch[quantity][idx], farfield[quantity], rtol=1e-10, atol=0)
+
+    assert not ffdata.combine_farfield_batch([0.0, 1.0], [0.0])
+
+
+@pytest.mark.parametrize("numexpr_installed", [True, False])
+def test_combine_farfield_batch_numexpr(tmp_path, monkeypatch, numexpr_installed) -> None:
+    if numexpr_installed:
+        pytest.importorskip("numexpr")
+    else:
+        # a None entry makes the import fail as if the package was missing
+        monkeypatch.setitem(sys.modules, "numexpr", None)
+    ffdata = FfdSolutionData(input_file=write_array_metadata(tmp_path, elements=16, rows=4, frequencies=(1e9,)))
+    phi_scan = np.array([0.0, 30.0, 90.0])
+    theta_scan = np.array([0.0, 25.0, 40.0])
+
+    reference = ffdata.combine_farfield_batch(phi_scan, theta_scan, chunk_size=100)
+    batch = ffdata.combine_farfield_batch(phi_scan, theta_scan, chunk_size=100, use_numexpr=True)
+    for quantity in ("rETheta", "rEPhi", "RealizedGain"):
+        assert np.allclose(batch[quantity], reference[quantity], rtol=1e-12, atol=0)
+
+
+def test_combine_farfield_taper(tmp_path, ffd_cache) -> None:
+    ffdata = FfdSolutionData(input_file=write_array_metadata(tmp_path, elements=16, rows=4, frequencies=(1e9,)))
+    ffdata.taper = "chebyshev"
+    ffdata.sidelobe_level = -25
+    assert ffdata.sidelobe_level == 25
+    ffdata.combine_farfield()
+
+    window = taper_window("chebyshev", 4, sidelobe_level=25)
+    for port, (row, column) in ffdata.get_port_index().items():
+        expected = (window[row - 1] * window[column - 1]) ** 2
+        assert ffdata.magnitude[port] == pytest.approx(expected)
+        assert abs(ffdata.weight[port]) == pytest.approx(np.sqrt(expected))
+    assert ffdata.get_port_index() is ffdata.get_port_index()
+
+    ffdata.taper = "kaiser"
+    assert ffdata.taper == "chebyshev"
+
+
+@pytest.mark.benchmark
+def test_combine_farfield_batch_benchmark(tmp_path, ffd_cache) -> None:
+    grid = ((0, 180, 10), (0, 350, 36))
+    metadata_file = write_array_metadata(tmp_path, elements=1024, rows=32, frequencies=(1e9,), spacing=0.15, grid=grid)
+    ffdata = FfdSolutionData(input_file=metadata_file)
+    rng = np.random.default_rng(0)
+    phi_scan = rng.uniform(0, 360, 1000)
+    theta_scan = rng.uniform(0, 60, 1000)
+
+    start = time.perf_counter()
+    batch = ffdata.combine_farfield_batch(phi_scan, theta_scan)
+    batch_time = time.perf_counter() - start
+    assert batch["rETheta"].shape == (1000, 10, 36)
+
+    start = time.perf_counter()
+    for idx in range(2):
+        ffdata.magnitude = {port: 1.0 for port in ffdata.all_element_names}
+        ffdata.phase = {port: 0.0 for port in ffdata.all_element_names}
+        farfield = ffdata.combine_farfield(phi_scan=phi_scan[idx], theta_scan=theta_scan[idx])
+        assert np.allclose(batch["rETheta"][idx], farfield["rETheta"], rtol=1e-10, atol=0)
+        assert np.allclose(batch["rEPhi"][idx], farfield["rEPhi"], rtol=1e-10, atol=0)
+    loop_time = (time.perf_counter() - start) / 2
+    assert batch_time < loop_time * 1000 / 10
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import logging
+import time
+
+import numpy as np
+import pytest
+
+from ansys.aedt.core.generic.constants import SpeedOfLight
+from ansys.aedt.core.visualization.advanced.frtm_visualization import FRTMData
+from ansys.aedt.core.visualization.advanced.frtm_visualization import range_angle_batch
+from ansys.aedt.core.visualization.advanced.frtm_visualization import range_doppler_batch
+
+FRTM_HEADER = """# Blank lines and lines starting with '#' are ignored
+@ DlxCdVersion = "1"
+@ DlxDataType = "NxNCouplingCpiResponse"
+@ RowCount = "{rows}"
+@ ColumnCount = "2"
+@ ColHead1 = "ScatSgnlReal sqrt(watts) false na na na na"
+@ ColHead2 = "ScatSgnlImag sqrt(watts) false na na na na"
+@ DataFormat = "Binary"
+@ BinaryVersion = "1"
+@ BinaryRecordLength = "16"
+@ BinaryIncludeDomainColumns = "true"
+@ BinaryEndian = "LittleEndian"
+@ BinaryStartByte = "{start:07d}"
+@ BinaryRecordSchema = "double double"
+@ RadarWaveform = "PulseDoppler"
+@ RadarChannels = "I+QLead"
+@ TimeSteps = "{time_start:.7e} {time_stop:.7e} {time_steps}"
+@ FreqDomainType = "LinearSweep"
+@ FreqSweep = "{frequency_start} {frequency_stop} {frequency_steps}"
+@ AntennaNames = "{antennas}"
+@ CouplingCombos = "{channels} {combos}"
+
+@ BeginData
+"""
+
+
+def write_frtm(
+    path,
+    data=None,
+    shape=None,
+    frequency_start=76.5e9,
+    frequency_stop=77.5e9,
+    prf=10e3,
+):
+    """Write a pulse Doppler FRTM file with one transmitter and one receiver per channel.
+
+    Either the complex ``data`` with shape ``(channels, pulses, frequencies)`` is written, or a sparse file
+    of zeros with the given ``shape`` is created.
+    """
+    channels, pulses, frequencies = data.shape if data is not None else shape
+    antennas = ["tx1"] + [f"rx{i + 1}" for i in range(channels)]
+    fields = {
+        "rows": pulses * frequencies,
+        "time_start": 0.0,
+        "time_stop": (pulses - 1) / prf,
+        "time_steps": pulses - 1,
+        "frequency_start": frequency_start,
+        "frequency_stop": frequency_stop,
+        "frequency_steps": frequencies - 1,
+        "antennas": ";".join(antennas),
+        "channels": channels,
+        "combos": ";".join(f"{i + 2}:1,1:1" for i in range(channels)),
+    }
+    header = FRTM_HEADER.format(start=0, **fields)
+    header = FRTM_HEADER.format(start=len(header), **fields).encode("ascii")
+    with open(path, "wb") as f:
+        f.write(header)
+        if data is not None:
+            np.asarray(data, dtype=np.complex128).tofile(f)
+        else:
+            f.truncate(len(header) + channels * pulses * frequencies * 16)
+    return path
+
+
+def point_target(frequencies, times, distance, velocity=0.0, azimuth=0.0, receivers=1):
+    """Samples of a point target seen by receivers spaced by half a wavelength along the y axis."""
+    wavelength = SpeedOfLight / frequencies[len(frequencies) // 2]
+    delay = 2 * np.outer(distance + velocity * np.asarray(times), frequencies) / SpeedOfLight
+    steering = np.pi * np.arange(receivers) * np.sin(np.deg2rad(azimuth))
+    return np.exp(-2j * np.pi * delay)[np.newaxis] * np.exp(-1j * steering)[:, np.newaxis, np.newaxis], wavelength
+
+
+def range_bin(frtm, distance, range_bins):
+    """Range bin of a target, the inverse FFT over the frequencies has bins of ``c / (2 * bins * df)``."""
+    return distance * 2 * frtm.frequency_delta * range_bins / SpeedOfLight
+
+
+@pytest.fixture
+def moving_target_files(tmp_path):
+    """Frames of a target moving away at 4 m/s, with the analytical range of each frame."""
+    frequencies = np.linspace(76.5e9, 77.5e9, 128)
+    prf = 10e3
+    times = np.arange(64) / prf
+    files = {}
+    distances = {}
+    for frame in np.arange(5) * 0.5:
+        distances[frame] = 5.0 + 4.0 * frame
+        data, _ = point_target(frequencies, frame + times, 5.0, 4.0)
+        files[frame] = write_frtm(tmp_path / f"frame_{frame}.frtm", data, prf=prf)
+    return files, distances
+
+
+@pytest.fixture
+def frtm_data(tmp_path):
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((3, 16, 32)) + 1j * rng.standard_normal((3, 16, 32))
+    return write_frtm(tmp_path / "synthetic.frtm", data), data
+
+
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_frtm_data_cube(frtm_data, memory_map) -> None:
+    input_file, data = frtm_data
+    frtm = FRTMData(input_file, memory_map=memory_map)
+    assert frtm.cpi_frames == 16
+    assert frtm.frequency_number == 32
+    assert frtm.channel_names == ["rx1:tx1", "rx2:tx1", "rx3:tx1"]
+    assert frtm.data_cube.shape == (3, 16, 32)
+    assert np.array_equal(frtm.data_cube, data)
+    for n, channel in enumerate(frtm.channel_names):
+        assert np.array_equal(frtm.all_data[channel], data[n])
+        assert np.shares_memory(frtm.all_data[channel], frtm.data_cube)
+
+    pulse = frtm.get_data_pulse(5)
+    assert np.array_equal(pulse, data[:, 5])
+    pulse[:] = 0
+    assert np.array_equal(frtm.data_cube, data)
+
+
+def test_frtm_memory_map_copy_on_write(frtm_data) -> None:
+    input_file, data = frtm_data
+    content = input_file.read_bytes()
+    frtm = FRTMData(input_file, memory_map=True)
+    frtm.all_data["rx1:tx1"][:] = 0
+    assert not frtm.data_cube[0].any()
+    assert input_file.read_bytes() == content
+
+
+def test_frtm_get_data(frtm_data) -> None:
+    input_file, data = frtm_data
+    frtm = FRTMData(input_file)
+    assert np.array_equal(frtm.get_data(), data)
+    assert np.array_equal(frtm.get_data(channel="rx2:tx1"), data[1])
+    assert np.array_equal(frtm.get_data(channel=["rx3:tx1", 0]), data[[2, 0]])
+    assert np.array_equal(frtm.get_data(pulse=4), data[:, 4])
+    assert np.array_equal(frtm.get_data(frequency=[1, 5, 7]), data[:, :, [1, 5, 7]])
+    assert np.array_equal(frtm.get_data(channel=1, pulse=slice(2, 8), frequency=3), data[1, 2:8, 3])
+    assert np.array_equal(
+        frtm.get_data(channel=[0, 2], pulse=[1, 3], frequency=slice(None, None, 2)), data[[0, 2]][:, [1, 3], ::2]
+    )
+    assert np.shares_memory(frtm.get_data(pulse=slice(0, 4)), frtm.data_cube)
+
+
+@pytest.mark.benchmark
+def test_frtm_memory_map_benchmark(tmp_path) -> None:
+    # 4 GB of samples, the file is sparse on most Linux file systems so only the header is written to the disk
+    shape = (4, 1024, 65536)
+    input_file = write_frtm(tmp_path / "large.frtm", shape=shape)
+    pulse = np.arange(shape[2]) * (1 + 1j)
+    with open(input_file, "r+b") as f:
+        f.seek(-pulse.nbytes, 2)
+        pulse.tofile(f)
+
+    start = time.perf_counter()
+    frtm = FRTMData(input_file, memory_map=True)
+    data_pulse = frtm.get_data_pulse(shape[1] - 1)
+    elapsed = time.perf_counter() - start
+
+    assert frtm.data_cube.shape == shape
+    assert np.array_equal(data_pulse[-1], pulse)
+    assert not data_pulse[:-1].any()
+    assert np.array_equal(frtm.get_data(channel=3, pulse=-1, frequency=slice(0, 10)), pulse[:10])
+    logging.getLogger(__name__).info(f"Last pulse of a 4 GB memory mapped file read in {elapsed:.3f} s")
+
+
+def test_range_doppler_batch(moving_target_files) -> None:
+    files, distances = moving_target_files
+    maps = range_doppler_batch(files, range_bins=512, doppler_bins=256, batch_size=2, max_workers=2)
+    assert maps.shape == (5, 512, 256)
+
+    frtm = FRTMData(files[0.0])
+    velocity_axis = np.linspace(-frtm.velocity_maximum, frtm.velocity_maximum, 256)
+    for n, (frame, input_file) in enumerate(files.items()):
+        expected = FRTMData(input_file).range_doppler(range_bins=512, doppler_bins=256)
+        assert np.allclose(maps[n], expected)
+        range_index, velocity_index = np.unravel_index(np.abs(maps[n]).argmax(), maps[n].shape)
+        assert range_index == pytest.approx(range_bin(frtm, distances[frame], 512), abs=1)
+        assert velocity_axis[velocity_index] == pytest.approx(4.0, abs=frtm.velocity_resolution)
+
+    maps_db = range_doppler_batch(
+        list(files.values()), data_conversion_function="dB20", range_bins=512, doppler_bins=256
+    )
+    assert maps_db.dtype == float
+    assert np.allclose(maps_db, 20 * np.log10(np.abs(maps)))
+
+
+def test_range_doppler_batch_shape_mismatch(moving_target_files, tmp_path) -> None:
+    files, _ = moving_target_files
+    other = write_frtm(tmp_path / "other.frtm", np.ones((1, 32, 128)))
+    with pytest.raises(ValueError, match="dimensions"):
+        range_doppler_batch(list(files.values()) + [other])
+    with pytest.raises(ValueError):
+        range_doppler_batch([])
+
+
+def test_range_angle_batch(tmp_path) -> None:
+    frequencies = np.linspace(76.5e9, 77.5e9, 128)
+    targets = [(10.0, 20.0), (5.0, -35.0), (15.0, 0.0)]
+    files = []
+    for n, (distance, azimuth) in enumerate(targets):
+        data, wavelength = point_target(frequencies, np.zeros(4), distance, azimuth=azimuth, receivers=8)
+        files.append(write_frtm(tmp_path / f"target_{n}.frtm", data))
+
+    frtm = FRTMData(files[0])
+    positions = {channel: [0.0, n * wavelength / 2] for n, channel in enumerate(frtm.channel_names)}
+    maps = range_angle_batch(files, receiver_position=positions, window="Hann", batch_size=2)
+    assert maps.shape == (3, 128, 181)
+
+    azimuth_axis = np.linspace(-90, 90, 181)
+    for n, (distance, azimuth) in enumerate(targets):
+        frtm = FRTMData(files[n])
+        frtm.receiver_position = positions
+        assert np.allclose(maps[n], frtm.range_angle_map(window="Hann"))
+        range_index, azimuth_index = np.unravel_index(np.abs(maps[n]).argmax(), maps[n].shape)
+        assert range_index == pytest.approx(range_bin(frtm, distance, 128), abs=1)
+        assert azimuth_axis[azimuth_index] == pytest.approx(azimuth, abs=1.0)
+
+
+def test_range_doppler_batch_hdf5(moving_target_files, tmp_path) -> None:
+    tables = pytest.importorskip("tables")
+    files, _ = moving_target_files
+    output_file = range_doppler_batch(files, output_file=tmp_path / "maps.h5", batch_size=2)
+    assert output_file == tmp_path / "maps.h5"
+    with tables.open_file(str(output_file)) as store:
+        assert store.root.range_doppler.chunkshape == (1, 128, 64)
+        assert np.allclose(store.root.range_doppler[:], range_doppler_batch(files))
+        assert np.array_equal(store.root.frames[:], list(files))
+        assert len(store.root.range[:]) == 128
+        assert len(store.root.velocity[:]) == 64
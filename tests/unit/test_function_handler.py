@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the overhead and behavior of the ``pyaedt_function_handler`` decorator."""
+
+import logging
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ansys.aedt.core.generic import general_methods
+from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
+from ansys.aedt.core.generic.settings import settings
+
+CALLS = 1_000_000
+
+
+@pytest.fixture(scope="module", autouse=True)
+def desktop() -> None:
+    """Override the desktop fixture to DO NOT open the Desktop when running this test class"""
+    return
+
+
+@pytest.fixture
+def debug_logger():
+    enable_debug_logger = settings.enable_debug_logger
+    settings.enable_debug_logger = True
+    yield
+    settings.enable_debug_logger = enable_debug_logger
+
+
+def raw_function(value=1):
+    return value
+
+
+def legacy_function_handler(user_function, **deprecated_kwargs):
+    """Wrapper of the previous implementation, checking the settings on every call."""
+
+    def wrapper(*args, **kwargs):
+        if deprecated_kwargs and kwargs:
+            general_methods.deprecate_kwargs(user_function.__name__, kwargs, deprecated_kwargs)
+        try:
+            settings.time_tick = time.time()
+            out = user_function(*args, **kwargs)
+            general_methods._log_method(user_function, args, kwargs)
+            return out
+        except Exception:  # pragma: no cover
+            raise
+
+    return wrapper
+
+
+def measure_per_call(function, calls=CALLS, repeat=3):
+    """Best time in seconds of a call to ``function`` over several rounds, like ``pytest-benchmark``."""
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function(value=2)
+        rounds.append(time.perf_counter() - start)
+    return min(rounds) / calls
+
+
+@pytest.mark.benchmark
+def test_function_handler_overhead() -> None:
+    handled = pyaedt_function_handler(raw_function)
+    handled_with_aliases = pyaedt_function_handler(raw_function, old_value="value")
+    legacy = legacy_function_handler(raw_function, old_value="value")
+
+    raw_time = measure_per_call(raw_function)
+    handler_overhead = measure_per_call(handled) - raw_time
+    aliases_overhead = measure_per_call(handled_with_aliases) - raw_time
+    legacy_overhead = measure_per_call(legacy) - raw_time
+
+    assert handler_overhead < legacy_overhead
+    assert aliases_overhead < legacy_overhead
+    logging.getLogger(__name__).info(f"Function handler overhead: {handler_overhead * 1e9:.1f} ns per call")
+
+
+def test_function_handler_deprecated_arguments() -> None:
+    handled = pyaedt_function_handler(raw_function, old_value="value")
+
+    assert handled(3) == 3
+    assert handled(value=4) == 4
+    with patch.object(general_methods.pyaedt_logger, "warning") as mock_warning:
+        assert handled(old_value=5) == 5
+    mock_warning.assert_called_once_with(
+        "Argument `old_value` is deprecated for method `raw_function`; use `value` instead."
+    )
+    with pytest.raises(TypeError, match="received both old_value and value"):
+        handled(old_value=5, value=6)
+
+
+def test_function_handler_debug_logging(debug_logger) -> None:
+    handled = pyaedt_function_handler(raw_function)
+    settings.time_tick = 0
+
+    with patch.object(general_methods, "_log_method") as mock_log:
+        assert handled(value=7) == 7
+
+    mock_log.assert_called_once_with(raw_function, (), {"value": 7})
+    assert settings.time_tick > 0
+
+
+def test_function_handler_logging_gate() -> None:
+    handled = pyaedt_function_handler(raw_function)
+    enable_debug_edb_logger = settings.enable_debug_edb_logger
+
+    with patch.object(general_methods, "_log_method") as mock_log:
+        handled()
+        settings.enable_debug_edb_logger = True
+        assert settings._trace_methods
+        handled()
+        settings.enable_debug_edb_logger = enable_debug_edb_logger
+        assert settings._trace_methods == settings.enable_debug_logger
+        handled()
+
+    assert mock_log.call_count == 1 + settings.enable_debug_logger * 2
@@ -22,7 +22,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import copy
 import logging
+import time
+import tracemalloc
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 from unittest.mock import PropertyMock
 from unittest.mock import patch
@@ -31,6 +35,7 @@ import pytest
 
 from ansys.aedt.core import Hfss
 from ansys.aedt.core.modeler.cad.primitives import GeometryModeler
+from ansys.aedt.core.modeler.cad.primitives import Objects
 
 
 @pytest.fixture
@@ -68,3 +73,179 @@ def test_delete_all_points_failure(mock_hfss_app, caplog: pytest.LogCaptureFixtu
 
     assert not res
     assert any("Failed to delete points." in record.getMessage() for record in caplog.records)
+
+
+def synthetic_design_properties(solids=50000) -> dict:
+    """Build the design properties of a design with a flat ``GeometryCore`` made of solids."""
+    parts = []
+    for solid in range(solids):
+        parts.append(
+            {
+                "Attributes": {
+                    "Name": f"Box{solid}",
+                    "Flags": "",
+                    "Color": "(143 175 143)",
+                    "Transparency": 0,
+                    "PartCoordinateSystem": 1,
+                    "UDMId": "",
+                    "GroupId": 2 + solid % 2,
+                    "MaterialValue": '"copper"',
+                    "SurfaceMaterialValue": '""',
+                    "SolveInside": False,
+                },
+                "Operations": {"Operation": {"OperationType": "Box", "ID": solid, "ParentPartID": solid}},
+            }
+        )
+    groups = [{"GroupID": 2, "Attributes": {"Name": "Group2"}}, {"GroupID": 3, "Attributes": {"Name": "Group3"}}]
+    geometry_operations = {"Groups": {"Group": groups}, "ToplevelParts": {"GeometryPart": parts}}
+    return {"Name": "HFSSDesign1", "ModelSetup": {"GeometryCore": {"GeometryOperations": geometry_operations}}}
+
+
+def refresh_all_ids(mock_hfss_app, design_properties, object_names) -> dict:
+    """Refresh the objects of a geometry modeler from design properties and return the created objects."""
+    gm = GeometryModeler(mock_hfss_app)
+    gm._all_object_names = object_names
+    created = {}
+
+    def create_object(name, pid=0, use_cached=False, is_polyline=False):
+        created[name] = SimpleNamespace(pid=pid)
+        return created[name]
+
+    gm._create_object = create_object
+    with patch.object(Hfss, "design_properties", new_callable=PropertyMock, return_value=design_properties):
+        gm._refresh_all_ids_from_aedt_file()
+    return created
+
+
+def test_refresh_all_ids_from_aedt_file_without_copy(mock_hfss_app) -> None:
+    """Refresh solids from the design properties without copying or changing them."""
+    design_properties = synthetic_design_properties(solids=200)
+    expected = copy.deepcopy(design_properties)
+    geometry_operations = design_properties["ModelSetup"]["GeometryCore"]["GeometryOperations"]
+    parts = geometry_operations["ToplevelParts"]["GeometryPart"]
+
+    with patch("ansys.aedt.core.modeler.cad.primitives.copy.deepcopy", side_effect=AssertionError("Copied")):
+        created = refresh_all_ids(mock_hfss_app, design_properties, [f"Box{solid}" for solid in range(0, 200, 10)])
+
+    assert len(created) == 20
+    assert created["Box10"].pid == 10
+    assert created["Box10"]._m_groupName == "Group2"
+    assert created["Box10"]._material_name == "copper"
+    assert created["Box10"]._color == (143, 175, 143)
+    assert design_properties == expected
+    assert design_properties["ModelSetup"]["GeometryCore"]["GeometryOperations"] is geometry_operations
+    assert geometry_operations["ToplevelParts"]["GeometryPart"] is parts
+
+
+@pytest.mark.benchmark
+def test_refresh_all_ids_from_aedt_file_benchmark(mock_hfss_app) -> None:
+    """Refresh 50k solids from the design properties and measure the time and the allocations."""
+    design_properties = synthetic_design_properties()
+    expected = copy.deepcopy(design_properties)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    created = refresh_all_ids(mock_hfss_app, design_properties, [f"Box{solid}" for solid in range(0, 50000, 10)])
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(created) == 5000
+    assert created["Box10"].pid == 10
+    assert design_properties == expected
+    logging.getLogger(__name__).info(f"Refresh of 50000 solids: {elapsed:.3f} s, {peak / 1024**2:.1f} MB peak")
+
+
+@pytest.fixture
+def modeler_with_solids(mock_hfss_app):
+    """Geometry modeler whose mocked editor contains 100k solids."""
+    solids = dict.fromkeys(f"Box{solid}" for solid in range(100000))
+    editor = MagicMock()
+    editor.GetObjectsInGroup.side_effect = lambda group: list(solids) if group == "Solids" else []
+    editor.GetPoints.return_value = []
+    editor.GetChildNames.return_value = []
+
+    def delete(selections):
+        for name in selections[2].split(","):
+            del solids[name]
+
+    def change_property(all_tabs):
+        old_name = all_tabs[1][1][1]
+        new_name = all_tabs[1][2][1][2]
+        if new_name in solids:
+            raise Exception(f"Name {new_name} is already used.")
+        solids[new_name] = solids.pop(old_name)
+
+    editor.Delete.side_effect = delete
+    editor.ChangeProperty.side_effect = change_property
+    mock_hfss_app._oeditor = editor
+    gm = GeometryModeler(mock_hfss_app)
+    objects = {solid_id: SimpleNamespace(name=name, _m_name=name) for solid_id, name in enumerate(solids, 1)}
+    gm.objects = Objects(gm, "o", objects)
+    yield gm
+
+
+def test_delete_many(modeler_with_solids) -> None:
+    gm = modeler_with_solids
+    with patch.object(gm, "_unregister_object", wraps=gm._unregister_object) as mock_unregister:
+        for count in (5000, 20000):
+            assert gm.delete_many(list(gm._object_names_to_ids)[:count] + ["NotAnObject"])
+
+    assert mock_unregister.call_count == 25000
+    assert gm._modeler.oeditor.Delete.call_count == 250
+    assert len(gm.solid_names) == 75000
+    assert len(gm._object_names_to_ids) == len(gm._object_ids_to_names) == 75000
+    assert "Box0" not in gm._object_names_to_ids
+    assert "Box24999" not in gm._solids
+    assert 1 not in gm._object_ids_to_names
+    assert gm._object_ids_to_names[25001] == "Box25000"
+    assert gm.objects._get_by_name("Box24999") is None
+    assert gm.objects._get_by_name("Box30000").name == "Box30000"
+
+
+def test_delete_object_by_id_and_name(modeler_with_solids) -> None:
+    gm = modeler_with_solids
+    del gm.objects[1]
+    del gm.objects["Box1"]
+    del gm.objects["NotAnObject"]
+
+    assert "Box0" not in gm._object_names_to_ids
+    assert 2 not in gm._object_ids_to_names
+    assert "Box1" not in gm._solids
+    assert gm.objects._get_by_name("Box1") is None
+    assert len(gm._object_names_to_ids) == 99998
+
+
+def test_rename_many(modeler_with_solids) -> None:
+    gm = modeler_with_solids
+    names = {f"Box{solid}": f"Renamed{solid}" for solid in range(10000)}
+    names.update({"Box10000": "Box10001", "Box10001": "Box10000"})
+
+    assert gm.rename_many(names)
+    assert gm._object_names_to_ids["Renamed0"] == 1
+    assert gm._object_ids_to_names[1] == "Renamed0"
+    assert gm._object_names_to_ids["Box10001"] == 10001
+    assert gm._object_names_to_ids["Box10000"] == 10002
+    assert gm.objects._get_by_name("Renamed9999")._m_name == "Renamed9999"
+    assert "Box0" not in gm._solids
+    assert "Renamed0" in gm.solid_names
+    assert not gm.rename_many({"Renamed0": "Box20000"})
+    assert not gm.rename_many({"Missing": "NewName"})
+
+
+def test_rename_many_chain_and_cycle(modeler_with_solids) -> None:
+    gm = modeler_with_solids
+    # chain: Box1 -> Box2 -> Box3 -> Free3, cycle: Box10 -> Box11 -> Box12 -> Box10
+    names = {"Box1": "Box2", "Box2": "Box3", "Box3": "Free3", "Box10": "Box11", "Box11": "Box12", "Box12": "Box10"}
+
+    assert gm.rename_many(names)
+    assert [gm._object_names_to_ids[name] for name in ("Box2", "Box3", "Free3")] == [2, 3, 4]
+    assert [gm._object_names_to_ids[name] for name in ("Box11", "Box12", "Box10")] == [11, 12, 13]
+    assert [gm._object_ids_to_names[solid_id] for solid_id in (2, 3, 4, 11, 12, 13)] == list(names.values())
+    assert "Box1" not in gm._object_names_to_ids
+    assert len(gm._object_names_to_ids) == len(gm._object_ids_to_names) == 100000
+    assert set(gm._solids) == set(gm._object_names_to_ids)
+    assert gm.objects._get_by_name("Box12")._m_name == "Box12"
+    assert gm.objects[13]._m_name == "Box10"
+    # two renames for the cycle, one for each object of the chain
+    assert gm._modeler.oeditor.ChangeProperty.call_count == 7
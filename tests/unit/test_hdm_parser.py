@@ -23,9 +23,13 @@
 # SOFTWARE.
 
 import builtins
+from enum import Enum
+import struct
+import time
 from unittest.mock import mock_open
 
 from mock import patch
+import numpy as np
 import pytest
 
 from ansys.aedt.core.visualization.advanced.sbrplus.hdm_parser import Parser
@@ -74,3 +78,178 @@ def test_hdm_parser_header_loading_failure(mock_file_open) -> None:
     """Test that HDM parser fails to load header."""
     with pytest.raises(SyntaxError):
         Parser(DUMMY_PATH)
+
+
+RAY_BUNDLE_HEADER = b"""
+# Synthetic SBR+ ray bundle. The binary data starts immediately after the '#header end' line.
+{
+  'types':
+  {
+  'Int32': {'type': 'int', 'size': 4, },
+  'Float': {'type': 'float', 'size': 4, },
+  'Double': {'type': 'float', 'size': 8, },
+  'Complex': {'type': 'complex', 'size': 8, },
+  'Vec3': {'type': 'vector', 'base': 'Float', 'size': 3, },
+  'TrackType': {'type': 'enum', 'size': 4, 'start': 0, 'values': ('TX', 'RX', 'DIFFRACTION'), },
+  'BounceFlags': {'type': 'flag', 'size': 1, 'values': {'has_reflection': 0, 'has_transmission': 1}, },
+  'Ray': {'type': 'object', 'layout': (
+     {'type': 'TrackType', 'field_names': ('track_type', ), },
+     {'type': 'Vec3', 'field_names': ('source_point', 'direction', ), },
+     {'type': 'BounceFlags', 'field_names': ('flags', ), },
+     {'type': 'vector', 'base': 'Complex', 'size': 2, 'field_names': ('e_field', ), },
+     {'type': 'list', 'base': 'Int32', 'size': 2, 'field_names': ('pixel', ), },
+     {'type': 'Double', 'field_names': ('power', ), },
+     ),
+  },
+  'Bounce': {'type': 'object', 'layout': (
+     {'type': 'Vec3', 'field_names': ('hit_pt', 'surf_norm', ), },
+     {'type': 'BounceFlags', 'field_names': ('flags', ), },
+     {'type': 'Bounce', 'field_names': ('refl_bounce', ), 'optional': ('flags', 'has_reflection'), },
+     {'type': 'Int32', 'field_names': ('num_vertices', ), },
+     {'type': 'list', 'base': 'Vec3', 'size': 'num_vertices', 'field_names': ('footprint_vertices', ), },
+     ),
+  },
+  'RayTrack': {'type': 'object', 'layout': (
+     {'type': 'TrackType', 'field_names': ('track_type', ), },
+     {'type': 'Vec3', 'field_names': ('source_point', ), },
+     {'type': 'Bounce', 'field_names': ('first_bounce', ), 'optional': ('track_type', 'TX'), },
+     ),
+  },
+  'Bundle': {'type': 'object', 'layout': (
+     {'type': 'Int32', 'field_names': ('version', 'num_rays', ), },
+     {'type': 'list', 'base': 'Ray', 'size': 'num_rays', 'field_names': ('rays', ), },
+     {'type': 'Int32', 'field_names': ('num_tracks', ), },
+     {'type': 'list', 'base': 'RayTrack', 'size': 'num_tracks', 'field_names': ('ray_tracks', ), },
+     {'type': 'list', 'base': 'Complex', 'size': 3, 'field_names': ('coefficients', ), },
+     {'type': 'vector', 'base': 'Int32', 'size': 1, 'field_names': ('id', ), },
+     ),
+  },
+  },
+'message': {'type': 'Bundle'}
+}
+#header end
+"""
+RAY_DTYPE = np.dtype(
+    [
+        ("track_type", "<i4"),
+        ("source_point", "<f4", (3,)),
+        ("direction", "<f4", (3,)),
+        ("flags", "<u1"),
+        ("e_field", "<c8", (2,)),
+        ("pixel", "<i4", (2,)),
+        ("power", "<f8"),
+    ]
+)
+
+
+def random_rays(count, seed=0):
+    rng = np.random.default_rng(seed)
+    rays = np.zeros(count, dtype=RAY_DTYPE)
+    rays["track_type"] = rng.integers(0, 3, count)
+    rays["source_point"] = rng.standard_normal((count, 3))
+    rays["direction"] = rng.standard_normal((count, 3))
+    rays["flags"] = rng.integers(0, 4, count)
+    rays["e_field"] = rng.standard_normal((count, 2)) + 1j * rng.standard_normal((count, 2))
+    rays["pixel"] = rng.integers(-1000, 1000, (count, 2))
+    rays["power"] = rng.random(count)
+    return rays
+
+
+def bounce_bytes(rng, depth):
+    reflection = depth > 0
+    content = struct.pack("<6fB", *rng.standard_normal(6), reflection | 2 * int(rng.integers(0, 2)))
+    if reflection:
+        content += bounce_bytes(rng, depth - 1)
+    vertices = rng.standard_normal((int(rng.integers(0, 4)), 3)).astype("<f4")
+    return content + struct.pack("<i", len(vertices)) + vertices.tobytes()
+
+
+def write_ray_bundle(path, rays, tracks=0, seed=0):
+    rng = np.random.default_rng(seed)
+    content = struct.pack("<ii", 3, len(rays)) + rays.tobytes() + struct.pack("<i", tracks)
+    for track in range(tracks):
+        track_type = track % 3
+        content += struct.pack("<i3f", track_type, *rng.standard_normal(3))
+        if track_type == 0:
+            content += bounce_bytes(rng, track % 4)
+    content += np.array([1 + 2j, -3j, 0.5], dtype="<c8").tobytes() + struct.pack("<i", 42)
+    with open(path, "wb") as file:
+        file.write(RAY_BUNDLE_HEADER + content)
+    return path
+
+
+def as_plain(value):
+    """Convert parsed HDM content to nested built-in values, keeping track of the value types."""
+    if isinstance(value, np.ndarray):
+        return "ndarray", value.dtype.str, value.tolist()
+    elif isinstance(value, np.generic):
+        return type(value).__name__, value.item()
+    elif isinstance(value, Enum):
+        return type(value).__name__, value.name
+    elif isinstance(value, (list, tuple)):
+        return type(value).__name__, [as_plain(item) for item in value]
+    elif isinstance(value, dict):
+        return {key: as_plain(item) for key, item in value.items()}
+    elif hasattr(value, "__dict__"):
+        return type(value).__name__, {key: as_plain(item) for key, item in vars(value).items()}
+    return type(value).__name__, value
+
+
+def parse_recursively(filename):
+    with patch.object(Parser, "_fixed_dtype", lambda self, type_name: None):
+        return Parser(filename).parse_message()
+
+
+def test_hdm_parser_fixed_dtypes(tmp_path) -> None:
+    """Test the structured dtypes generated from the header type descriptions."""
+    hdm_parser = Parser(write_ray_bundle(tmp_path / "bundle.hdm", random_rays(1)))
+
+    assert hdm_parser._fixed_dtype("Vec3") == np.dtype(("<f4", (3,)))
+    assert hdm_parser._fixed_dtype("Complex") == np.dtype("<c8")
+    assert hdm_parser._fixed_dtype("Ray") == RAY_DTYPE
+    assert hdm_parser._fixed_dtype("Bounce") is None
+    assert hdm_parser._fixed_dtype("RayTrack") is None
+    assert hdm_parser._fixed_dtype("Bundle") is None
+
+
+@pytest.mark.parametrize("count", [1, 2, 100])
+def test_hdm_parser_bulk_decoding_equivalence(tmp_path, count) -> None:
+    """Test that bulk decoding returns the same content as the recursive parser."""
+    rays = random_rays(count)
+    filename = write_ray_bundle(tmp_path / "bundle.hdm", rays, tracks=12)
+
+    hdm_parser = Parser(filename)
+    bundle = hdm_parser.parse_message()
+
+    assert hdm_parser.idx == len(hdm_parser.binarycontent)
+    assert as_plain(bundle) == as_plain(parse_recursively(filename))
+    if count == 1:
+        bundle.rays = [bundle.rays]
+    assert [ray.track_type.name for ray in bundle.rays] == [("TX", "RX", "DIFFRACTION")[i] for i in rays["track_type"]]
+    assert [ray.flags["has_reflection"] for ray in bundle.rays] == (rays["flags"] & 1 == 1).tolist()
+    assert np.array_equal([ray.e_field for ray in bundle.rays], rays["e_field"].reshape(count, 2))
+    assert len(bundle.ray_tracks) == 12
+    assert bundle.ray_tracks[3].first_bounce.refl_bounce.refl_bounce.refl_bounce.refl_bounce is None
+
+
+@pytest.mark.benchmark
+def test_hdm_parser_bulk_decoding_benchmark(tmp_path) -> None:
+    """Test decoding of a synthetic bundle with one million rays."""
+    count = 1_000_000
+    sample = 10_000
+    rays = random_rays(count)
+    filename = write_ray_bundle(tmp_path / "bundle.hdm", rays)
+    sample_filename = write_ray_bundle(tmp_path / "sample.hdm", rays[:sample])
+
+    start = time.perf_counter()
+    recursive_sample = parse_recursively(sample_filename)
+    recursive_time = (time.perf_counter() - start) * count / sample
+    start = time.perf_counter()
+    bundle = Parser(filename).parse_message()
+    elapsed = time.perf_counter() - start
+
+    assert len(bundle.rays) == count
+    assert as_plain(bundle.rays[:sample]) == as_plain(recursive_sample.rays)
+    assert np.array_equal(bundle.rays[-1].direction, rays["direction"][-1])
+    assert bundle.rays[-1].power == rays["power"][-1]
+    assert elapsed < recursive_time
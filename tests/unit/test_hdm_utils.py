@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import struct
+
+import numpy as np
+import pytest
+
+from ansys.aedt.core.visualization.advanced.hdm_plot import HDMPlotter
+from ansys.aedt.core.visualization.advanced.sbrplus.hdm_parser import Parser
+from ansys.aedt.core.visualization.advanced.sbrplus.hdm_utils import _segments_in_box
+from ansys.aedt.core.visualization.advanced.sbrplus.hdm_utils import iter_ray_tracks
+from ansys.aedt.core.visualization.advanced.sbrplus.hdm_utils import ray_segments
+
+SBR_HEADER = b"""
+# Synthetic SBR+ ray tracks. The binary data starts immediately after the '#header end' line.
+{
+  'types':
+  {
+  'Int32': {'type': 'int', 'size': 4, },
+  'Double': {'type': 'float', 'size': 8, },
+  'Complex': {'type': 'complex', 'size': 16, },
+  'Vec3': {'type': 'vector', 'base': 'Double', 'size': 3, },
+  'CVec3': {'type': 'vector', 'base': 'Complex', 'size': 3, },
+  'TrackType': {'type': 'enum', 'size': 4, 'start': 0, 'values': ('SBR', 'UTD'), },
+  'BounceFlags': {'type': 'flag', 'size': 1, 'values': {'has_refl': 0, 'has_trans': 1}, },
+  'Bounce': {'type': 'object', 'layout': (
+     {'type': 'Vec3', 'field_names': ('hit_pt', 'surf_norm', ), },
+     {'type': 'BounceFlags', 'field_names': ('flags', ), },
+     {'type': 'CVec3', 'field_names': ('h_inc', ), },
+     {'type': 'Bounce', 'field_names': ('refl_bounce', ), 'optional': ('flags', 'has_refl'), },
+     {'type': 'Bounce', 'field_names': ('trans_bounce', ), 'optional': ('flags', 'has_trans'), },
+     ),
+  },
+  'RayTrack': {'type': 'object', 'layout': (
+     {'type': 'TrackType', 'field_names': ('track_type', ), },
+     {'type': 'Vec3', 'field_names': ('source_point', ), },
+     {'type': 'Vec3', 'field_names': ('utd_point', ), 'optional': ('track_type', 'UTD'), },
+     {'type': 'Bounce', 'field_names': ('first_bounce', ), },
+     ),
+  },
+  'Bundle': {'type': 'object', 'layout': (
+     {'type': 'Int32', 'field_names': ('version', 'num_tracks', ), },
+     {'type': 'list', 'base': 'RayTrack', 'size': 'num_tracks', 'field_names': ('ray_tracks', ), },
+     {'type': 'Int32', 'field_names': ('checksum', ), },
+     ),
+  },
+  },
+'message': {'type': 'Bundle'}
+}
+#header end
+"""
+TRACKS = 100
+
+
+def track_bounces(index):
+    """Number of reflections along the main branch and whether the first bounce is also transmitted."""
+    return index % 5 + 1, index % 7 == 0
+
+
+def track_power(index):
+    """Power in dB of the incident magnetic field of all bounces of a ray track."""
+    return -20.0 * (index % 4)
+
+
+def bounce_bytes(x, y, reflections, transmission, amplitude):
+    flags = int(reflections > 1) | 2 * int(transmission)
+    content = struct.pack("<6dB", x, y, 0.0, 0.0, 0.0, 1.0, flags)
+    content += np.array([amplitude, 0.5j * amplitude, 0.0], dtype="<c16").tobytes()
+    if reflections > 1:
+        content += bounce_bytes(x + 1.0, y, reflections - 1, False, amplitude)
+    if transmission:
+        content += bounce_bytes(x + 0.5, y, 1, False, amplitude)
+    return content
+
+
+@pytest.fixture
+def sbr_bundle(tmp_path):
+    """Write ray tracks where track ``i`` lies in the plane ``y = i``, and is a UTD track when ``i % 3 == 0``."""
+    content = struct.pack("<ii", 1, TRACKS)
+    for index in range(TRACKS):
+        utd = index % 3 == 0
+        content += struct.pack("<i3d", int(utd), -1.0, float(index), 5.0)
+        if utd:
+            content += struct.pack("<3d", -0.5, float(index), 2.0)
+        reflections, transmission = track_bounces(index)
+        amplitude = 10 ** (track_power(index) / 20) / abs(1 + 0.5j)
+        content += bounce_bytes(0.0, float(index), reflections, transmission, amplitude)
+    content += struct.pack("<i", 12345)
+    filename = tmp_path / "rays.hdm"
+    filename.write_bytes(SBR_HEADER + content)
+    return filename
+
+
+def expected_bounces(index):
+    reflections, transmission = track_bounces(index)
+    return max(reflections, 2 if transmission else 1)
+
+
+def expected_segments(index):
+    reflections, transmission = track_bounces(index)
+    return (2 if index % 3 == 0 else 1) + reflections - 1 + int(transmission)
+
+
+def test_parser_iter_batches(sbr_bundle) -> None:
+    bundle = Parser(sbr_bundle).parse_message()
+    parser = Parser(sbr_bundle, memory_map=True)
+
+    batches = list(parser.iter_batches("ray_tracks", batch_size=16))
+
+    assert [len(batch) for batch in batches] == [16] * 6 + [4]
+    ray_tracks = [track for batch in batches for track in batch]
+    assert [track.track_type.name for track in ray_tracks] == [track.track_type.name for track in bundle.ray_tracks]
+    assert all(
+        np.array_equal(track.first_bounce.h_inc, reference.first_bounce.h_inc)
+        for track, reference in zip(ray_tracks, bundle.ray_tracks)
+    )
+    assert bundle.checksum == 12345
+    with pytest.raises(ValueError, match="no field"):
+        next(parser.iter_batches("rays"))
+    with pytest.raises(ValueError, match="not a vector or a list"):
+        next(parser.iter_batches("version"))
+
+
+def test_ray_segments(sbr_bundle) -> None:
+    ray_tracks = Parser(sbr_bundle).parse_message().ray_tracks
+
+    points, depths, indices = ray_segments(ray_tracks)
+
+    assert points.shape == (sum(expected_segments(i) for i in range(TRACKS)), 2, 3)
+    assert np.array_equal(np.bincount(indices), [expected_segments(i) for i in range(TRACKS)])
+    assert np.all(points[:, :, 1] == indices[:, np.newaxis])
+    assert depths.max() == 5
+    assert np.array_equal(points[indices == 3][0], [[-1.0, 3.0, 5.0], [-0.5, 3.0, 2.0]])
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+@pytest.mark.parametrize(
+    "filters, expected",
+    [
+        ({}, range(TRACKS)),
+        ({"min_bounces": 3}, [i for i in range(TRACKS) if expected_bounces(i) >= 3]),
+        ({"max_bounces": 1}, [i for i in range(TRACKS) if expected_bounces(i) <= 1]),
+        ({"power_threshold": -30.0}, [i for i in range(TRACKS) if track_power(i) >= -30.0]),
+        ({"bounding_box": [[-10.0, 10.5, -10.0], [10.0, 20.5, 10.0]]}, range(11, 21)),
+        ({"bounding_box": [[3.5, -1.0, -1.0], [3.6, 200.0, 1.0]]}, [i for i in range(TRACKS) if i % 5 == 4]),
+        (
+            {"min_bounces": 2, "power_threshold": -10.0, "bounding_box": [[-2, -0.5, -2], [2, 49.5, 20]]},
+            [i for i in range(50) if expected_bounces(i) >= 2 and i % 4 == 0],
+        ),
+    ],
+)
+def test_iter_ray_tracks_filters(sbr_bundle, lazy, filters, expected) -> None:
+    bundle = sbr_bundle if lazy else Parser(sbr_bundle).parse_message()
+
+    batches = list(iter_ray_tracks(bundle, batch_size=16, **filters))
+
+    assert all(0 < len(batch) <= 16 for batch in batches)
+    assert [int(track.source_point[1]) for batch in batches for track in batch] == list(expected)
+
+
+def test_segments_in_box() -> None:
+    points = np.array(
+        [
+            [[-1.0, 0.5, 0.5], [2.0, 0.5, 0.5]],  # crosses the box without an end point inside
+            [[0.2, 0.2, 0.2], [0.3, 0.3, 0.3]],  # inside the box
+            [[2.0, 0.5, 0.5], [3.0, 0.5, 0.5]],  # on the line of the first segment, outside the box
+            [[-1.0, 2.0, 0.5], [2.0, 2.0, 0.5]],  # parallel to the box faces, outside
+            [[-1.0, -1.0, 0.5], [2.0, 2.0, 0.5]],  # crosses diagonally
+            [[1.0, 1.0, 1.0], [1.0, 1.0, 1.0]],  # degenerate on a corner
+        ]
+    )
+
+    assert _segments_in_box(points, [[0, 0, 0], [1, 1, 1]]).tolist() == [True, True, False, False, True, True]
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_hdm_plotter_add_rays(sbr_bundle, lazy) -> None:
+    plotter = HDMPlotter()
+    assert not plotter._add_rays()
+    plotter.add_hdm_bundle_from_file(str(sbr_bundle), lazy=lazy)
+    segments = sum(expected_segments(i) for i in range(TRACKS))
+
+    points, lines, depths = plotter._add_rays(batch_size=7)
+
+    assert points.shape == (2 * segments, 3)
+    assert lines.shape == (3 * segments,)
+    assert np.array_equal(lines.reshape(-1, 3)[:, 1:].ravel(), np.arange(2 * segments))
+    assert depths.shape == (2 * segments,)
+    pv = pytest.importorskip("pyvista")
+    assert pv.PolyData(points, lines=lines).n_lines == segments
+
+    points, lines, depths = plotter._add_rays(max_bounces=1)
+    assert points.shape == (2 * sum(expected_segments(i) for i in range(TRACKS) if expected_bounces(i) == 1), 3)
+    assert depths.max() == 1
@@ -0,0 +1,492 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+import psutil
+import pytest
+
+from ansys.aedt.core.generic.settings import settings
+from ansys.aedt.core.internal import load_aedt_file
+from ansys.aedt.core.internal.errors import AEDTRuntimeError
+from ansys.aedt.core.internal.load_aedt_file import AedtDictView
+from ansys.aedt.core.internal.load_aedt_file import AedtLazyDict
+from ansys.aedt.core.internal.load_aedt_file import AedtListView
+from ansys.aedt.core.internal.load_aedt_file import index_aedt_file
+from ansys.aedt.core.internal.load_aedt_file import load_aedt_files
+from ansys.aedt.core.internal.load_aedt_file import load_entire_aedt_file
+from ansys.aedt.core.internal.load_aedt_file import load_keyword_in_aedt_file
+
+
+def write_synthetic_project(file_path, designs=2, objects=10, faces=6) -> None:
+    """Write a synthetic AEDT project with HFSS designs made of boxes.
+
+    About 1 MB of file is written every 2500 objects with the default number of faces.
+    """
+    with open(file_path, "w") as f:
+        f.write("$begin 'AnsoftProject'\n\tCreated='Mon Jan 01 00:00:00 2024'\n")
+        for design in range(designs):
+            f.write(f"\t$begin 'HFSSModel'\n\t\tName='Design{design}'\n\t\t$begin 'ModelSetup'\n")
+            f.write("\t\t\t$begin 'GeometryCore'\n")
+            for obj in range(objects):
+                face_ids = ", ".join(str(obj * 20 + i) for i in range(faces))
+                f.write(
+                    "\t\t\t\t$begin 'GeometryPart'\n"
+                    "\t\t\t\t\t$begin 'Attributes'\n"
+                    f"\t\t\t\t\t\tName='Box{obj}'\n"
+                    "\t\t\t\t\t\tMaterialValue='\"copper\"'\n"
+                    "\t\t\t\t\t\tSolveInside=true\n"
+                    "\t\t\t\t\t$end 'Attributes'\n"
+                    "\t\t\t\t\t$begin 'Operations'\n"
+                    f"\t\t\t\t\t\tID={obj}\n"
+                    f"\t\t\t\t\t\tFaces({face_ids})\n"
+                    "\t\t\t\t\t$end 'Operations'\n"
+                    "\t\t\t\t$end 'GeometryPart'\n"
+                )
+            f.write("\t\t\t$end 'GeometryCore'\n")
+            f.write(
+                "\t\t\t$begin 'Cells'\n\t\t\t\tm=1\n\t\t\t\tn=2\n\t\t\t\t$begin 'r0'\n"
+                "\t\t\t\t\tc(1)\n\t\t\t\t\tc(2)\n\t\t\t\t$end 'r0'\n\t\t\t$end 'Cells'\n"
+            )
+            f.write("\t\t$end 'ModelSetup'\n")
+            f.write(f"\t\t$begin 'FieldsPlotManagerID'\n\t\t\tPlotFolder='Folder{design}'\n")
+            f.write("\t\t$end 'FieldsPlotManagerID'\n\t$end 'HFSSModel'\n")
+        f.write("\t$begin 'Empty'\n\t$end 'Empty'\n\t$begin 'Empty'\n\t$end 'Empty'\n")
+        f.write("$end 'AnsoftProject'\n")
+        f.write("$begin 'AllReferencedFilesForProject'\n$end 'AllReferencedFilesForProject'\n")
+
+
+def measure(function):
+    """Call a function and return its result, its wall time and the peak resident memory growth in bytes."""
+    process = psutil.Process()
+    baseline = process.memory_info().rss
+    peak = baseline
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak
+        while not done.wait(0.005):
+            peak = max(peak, process.memory_info().rss)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        result = function()
+    finally:
+        elapsed = time.perf_counter() - start
+        done.set()
+        sampler.join()
+    return result, elapsed, max(peak, process.memory_info().rss) - baseline
+
+
+@pytest.fixture
+def project_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(load_aedt_file, "_LAZY_BLOCK_MIN_SIZE", 0)
+    file_path = tmp_path / "synthetic.aedt"
+    write_synthetic_project(file_path, designs=3, objects=20)
+    return file_path
+
+
+def test_lazy_load_matches_full_load(project_file) -> None:
+    full = load_entire_aedt_file(project_file)
+    lazy = load_entire_aedt_file(project_file, lazy=True)
+
+    assert isinstance(lazy, AedtLazyDict)
+    assert lazy == full
+    assert lazy.to_dict() == full
+    assert list(lazy["AnsoftProject"]) == list(full["AnsoftProject"])
+    cells = lazy["AnsoftProject"]["HFSSModel"][0]["ModelSetup"]["Cells"]
+    assert cells == {"rows": 1, "columns": 2, "matrix": [[1, 2]]}
+
+
+def test_lazy_load_parses_only_accessed_blocks(project_file) -> None:
+    lazy = load_entire_aedt_file(project_file, lazy=True)
+    assert not lazy.is_loaded("AnsoftProject")
+
+    designs = lazy["AnsoftProject"]["HFSSModel"]
+    assert [design["Name"] for design in designs] == ["Design0", "Design1", "Design2"]
+    assert all(not design.is_loaded("ModelSetup") for design in designs)
+    assert not lazy.is_loaded("AllReferencedFilesForProject")
+
+    geometry = designs[1]["ModelSetup"]["GeometryCore"]
+    assert len(geometry["GeometryPart"]) == 20
+    assert not designs[0].is_loaded("ModelSetup")
+    assert not designs[2].is_loaded("ModelSetup")
+
+
+def test_lazy_load_copy(project_file) -> None:
+    lazy = load_entire_aedt_file(project_file, lazy=True)
+    full = load_entire_aedt_file(project_file)
+
+    copied = copy.deepcopy(lazy)
+    assert type(copied) is dict
+    assert copied == full
+    assert type(lazy.copy()) is dict
+    assert dict(lazy)["AnsoftProject"] == full["AnsoftProject"]
+
+
+def test_lazy_load_changed_file(project_file) -> None:
+    lazy = load_entire_aedt_file(project_file, lazy=True)
+    designs = lazy["AnsoftProject"]["HFSSModel"]
+    assert designs[0]["FieldsPlotManagerID"]["PlotFolder"] == "Folder0"
+
+    # the project is saved between two reads, with blocks moving in the file
+    content = project_file.read_text()
+    project_file.write_text(content.replace("PlotFolder='Folder0'", "PlotFolder='SavedFolder0'"))
+    stat = project_file.stat()
+    os.utime(project_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    assert designs[1]["ModelSetup"]["GeometryCore"]["GeometryPart"][3]["Attributes"]["Name"] == "Box3"
+    assert designs[2]["FieldsPlotManagerID"]["PlotFolder"] == "Folder2"
+    assert designs[0]["FieldsPlotManagerID"]["PlotFolder"] == "Folder0"
+    # reading a pending block moves the dictionary to the new content
+    assert designs[0]["ModelSetup"]["Cells"]["matrix"] == [[1, 2]]
+    assert designs[0]["FieldsPlotManagerID"]["PlotFolder"] == "SavedFolder0"
+    assert lazy["AllReferencedFilesForProject"] == {}
+    assert lazy == load_entire_aedt_file(project_file)
+
+    # blocks removed by the save are dropped
+    lazy = load_entire_aedt_file(project_file, lazy=True)
+    project = lazy["AnsoftProject"]
+    project_file.write_text(content.replace("\t$begin 'Empty'\n\t$end 'Empty'\n", ""))
+    os.utime(project_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2000000000))
+    assert project["Empty"] is None
+    assert project["HFSSModel"][2]["FieldsPlotManagerID"]["PlotFolder"] == "Folder2"
+
+    index = index_aedt_file(project_file)
+    with open(project_file, "a") as f:
+        f.write("$begin 'Other'\n$end 'Other'\n")
+    with pytest.raises(AEDTRuntimeError):
+        index.read([(0, 1)])
+
+
+def test_load_keyword_with_design_name(project_file) -> None:
+    folder = load_keyword_in_aedt_file(project_file, "FieldsPlotManagerID", design_name="Design1")
+    assert folder == {"FieldsPlotManagerID": {"PlotFolder": "Folder1"}}
+    assert load_keyword_in_aedt_file(project_file, "FieldsPlotManagerID", design_name="Missing") == {}
+    assert load_keyword_in_aedt_file(project_file, "Missing") == {}
+
+
+def test_index_aedt_file(project_file) -> None:
+    index = index_aedt_file(project_file)
+    assert index is index_aedt_file(project_file)
+    assert [block.name for block in index.blocks] == ["AnsoftProject", "AllReferencedFilesForProject"]
+    design = index.find("HFSSModel", index.find_text("Name='Design2'"))
+    assert design is None
+    design = index.find("HFSSModel", index.find("HFSSModel").end)
+    with open(project_file, "rb") as f:
+        f.seek(design.start)
+        assert f.readline().strip() == b"$begin 'HFSSModel'"
+
+    stat = os.stat(project_file)
+    os.utime(project_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+    assert index is not index_aedt_file(project_file)
+
+
+def test_concurrent_load_matches_serial_load(tmp_path) -> None:
+    files = []
+    for i in range(50):
+        file_path = tmp_path / f"project_{i}.aedt"
+        write_synthetic_project(file_path, designs=1 + i % 3, objects=5 + i)
+        files.append(file_path)
+    serial = [load_entire_aedt_file(file_path) for file_path in files]
+
+    assert load_aedt_files(files, max_workers=8) == serial
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        keywords = list(executor.map(lambda f: load_keyword_in_aedt_file(f, "AnsoftProject"), files))
+        lazy = list(executor.map(lambda f: load_entire_aedt_file(f, lazy=True).to_dict(), files))
+    assert [keyword["AnsoftProject"] for keyword in keywords] == [data["AnsoftProject"] for data in serial]
+    assert lazy == serial
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(settings, "aedt_file_cache_dir", str(cache_dir))
+    return cache_dir
+
+
+def test_cache_load(project_file, cache_dir, monkeypatch) -> None:
+    full = load_entire_aedt_file(project_file)
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    def fail(*args):
+        raise AssertionError("The file must be loaded from the cache.")
+
+    with monkeypatch.context() as m:
+        m.setattr(load_aedt_file._AedtParser, "from_file", fail)
+        assert load_entire_aedt_file(project_file) == full
+        assert load_entire_aedt_file(project_file, lazy=True) == full
+
+
+def test_cache_invalidation(project_file, cache_dir) -> None:
+    load_entire_aedt_file(project_file)
+    entry = next(cache_dir.glob("*.pkl"))
+
+    with open(project_file, "a") as f:
+        f.write("$begin 'Other'\n\tName='Touched'\n$end 'Other'\n")
+    assert load_entire_aedt_file(project_file)["Other"] == {"Name": "Touched"}
+    entries = list(cache_dir.glob("*.pkl"))
+    assert len(entries) == 1
+    assert entries[0] != entry
+
+    stat = os.stat(project_file)
+    os.utime(project_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+    assert load_entire_aedt_file(project_file)["Other"] == {"Name": "Touched"}
+    assert next(cache_dir.glob("*.pkl")) != entries[0]
+
+
+def test_cache_corrupted_entry(project_file, cache_dir) -> None:
+    full = load_entire_aedt_file(project_file)
+    entry = next(cache_dir.glob("*.pkl"))
+    entry.write_bytes(b"corrupted")
+    assert load_entire_aedt_file(project_file) == full
+    assert load_entire_aedt_file(project_file) == full
+
+
+def test_cache_size_limit(tmp_path, cache_dir, monkeypatch) -> None:
+    files = []
+    for i in range(3):
+        file_path = tmp_path / f"project_{i}.aedt"
+        write_synthetic_project(file_path, designs=1, objects=10)
+        files.append(file_path)
+    load_entire_aedt_file(files[0])
+    entry_size = next(cache_dir.glob("*.pkl")).stat().st_size
+    monkeypatch.setattr(settings, "aedt_file_cache_size", 2.5 * entry_size / 1024 / 1024)
+
+    load_entire_aedt_file(files[1])
+    # the first entry becomes the most recently used
+    os.utime(load_aedt_file._cache_entry(files[0]), ns=(0, 2 * 10**18))
+    load_entire_aedt_file(files[2])
+
+    entries = sorted(entry.name for entry in cache_dir.glob("*.pkl"))
+    expected = sorted(load_aedt_file._cache_entry(file_path).name for file_path in (files[0], files[2]))
+    assert entries == expected
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "1, 2, 3",
+        "-1, +2, 30000000000",
+        "1.5, 2, -3e-05, 4E+2, .5",
+        "1, 'a', 2",
+        "true, false, 1",
+        "1, , 2",
+        "inf, nan",
+        "0x10, 1",
+        "'1.5', 2",
+    ],
+)
+def test_separate_list_elements(content) -> None:
+    expected = [load_aedt_file._parse_value(element.strip()) for element in content.split(",")]
+    values = load_aedt_file._separate_list_elements(content)
+    assert repr(values) == repr(expected)
+
+    typed_values = load_aedt_file._separate_list_elements(content, typed_arrays=True)
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in expected):
+        assert isinstance(typed_values, np.ndarray)
+        np.testing.assert_array_equal(typed_values, np.array(expected, dtype=float))
+    else:
+        assert repr(typed_values) == repr(expected)
+
+
+def test_typed_arrays(project_file) -> None:
+    full = load_entire_aedt_file(project_file)
+    typed = load_entire_aedt_file(project_file, typed_arrays=True)
+    lazy = load_entire_aedt_file(project_file, lazy=True, typed_arrays=True)
+
+    for data in (typed, lazy):
+        parts = data["AnsoftProject"]["HFSSModel"][0]["ModelSetup"]["GeometryCore"]["GeometryPart"]
+        for part, expected in zip(
+            parts, full["AnsoftProject"]["HFSSModel"][0]["ModelSetup"]["GeometryCore"]["GeometryPart"]
+        ):
+            faces = part["Operations"]["Faces"]
+            assert isinstance(faces, np.ndarray)
+            assert faces.dtype == np.int64
+            assert faces.tolist() == expected["Operations"]["Faces"]
+            assert part["Attributes"] == expected["Attributes"]
+
+
+@pytest.mark.benchmark
+def test_typed_arrays_benchmark(tmp_path, monkeypatch) -> None:
+    """Compare the decoding of a large ``GeometryCore`` element by element, as lists and as typed arrays."""
+    monkeypatch.setattr(settings, "aedt_file_cache_dir", None)
+    file_path = tmp_path / "synthetic.aedt"
+    write_synthetic_project(file_path, designs=1, objects=20000, faces=50)
+
+    def geometry_parts(typed_arrays=False):
+        geometry = load_keyword_in_aedt_file(file_path, "GeometryCore", typed_arrays=typed_arrays)
+        return geometry["GeometryCore"]["GeometryPart"]
+
+    with monkeypatch.context() as m:
+        # Lists of numbers are decoded element by element, as they were before the single pass decoding
+        m.setattr(load_aedt_file, "_parse_numbers", lambda elements, typed_arrays=False: None)
+        start = time.perf_counter()
+        reference = geometry_parts()
+        reference_time = time.perf_counter() - start
+    start = time.perf_counter()
+    lists = geometry_parts()
+    list_time = time.perf_counter() - start
+    start = time.perf_counter()
+    typed = geometry_parts(typed_arrays=True)
+    typed_time = time.perf_counter() - start
+
+    assert lists == reference
+    assert len(typed) == 20000
+    for part, expected in zip(typed, reference):
+        assert part["Operations"]["Faces"].dtype == np.int64
+        assert part["Operations"]["Faces"].tolist() == expected["Operations"]["Faces"]
+    logging.getLogger(__name__).info(
+        f"GeometryCore with 20000 parts decoded in {reference_time:.3f} s element by element, "
+        f"{list_time:.3f} s as lists and {typed_time:.3f} s as typed arrays"
+    )
+
+
+def test_refresh_parses_only_changed_blocks(project_file, monkeypatch) -> None:
+    previous = load_entire_aedt_file(project_file, lazy=True)
+    designs = previous["AnsoftProject"]["HFSSModel"]
+    assert [design["ModelSetup"]["GeometryCore"]["GeometryPart"][0]["Attributes"]["Name"] for design in designs]
+    content = project_file.read_text()
+    project_file.write_text(content.replace("PlotFolder='Folder1'", "PlotFolder='NewFolder1'"))
+    stat = project_file.stat()
+    os.utime(project_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    parsed = []
+    parse_block_content = load_aedt_file._parse_block_content
+
+    def spy(content, keyword, typed_arrays=False):
+        parsed.append(keyword)
+        return parse_block_content(content, keyword, typed_arrays)
+
+    monkeypatch.setattr(load_aedt_file, "_parse_block_content", spy)
+    refreshed = load_aedt_file.refresh_aedt_file(previous, project_file)
+    new_designs = refreshed["AnsoftProject"]["HFSSModel"]
+
+    assert parsed.count("HFSSModel") == 1
+    assert "GeometryCore" not in parsed
+    assert new_designs[0] is designs[0]
+    assert new_designs[2] is designs[2]
+    assert new_designs[1] is not designs[1]
+    assert new_designs[1]["FieldsPlotManagerID"]["PlotFolder"] == "NewFolder1"
+    assert refreshed == load_entire_aedt_file(project_file)
+    assert load_aedt_file.refresh_aedt_file(refreshed, project_file) is refreshed
+
+
+@pytest.mark.benchmark
+def test_refresh_benchmark(tmp_path, monkeypatch) -> None:
+    """Compare a reload and a refresh of a synthetic project of about 60 MB after one design changed."""
+    monkeypatch.setattr(settings, "aedt_file_cache_dir", None)
+    file_path = tmp_path / "synthetic.aedt"
+    write_synthetic_project(file_path, designs=10, objects=21000)
+
+    def part_counts(data):
+        designs = data["AnsoftProject"]["HFSSModel"]
+        return [len(design["ModelSetup"]["GeometryCore"]["GeometryPart"]) for design in designs]
+
+    previous = load_entire_aedt_file(file_path, lazy=True)
+    assert part_counts(previous) == [21000] * 10
+    content = file_path.read_text()
+    file_path.write_text(content.replace("PlotFolder='Folder3'", "PlotFolder='NewFolder3'"))
+    stat = file_path.stat()
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    load_aedt_file._cached_index.cache_clear()
+    start = time.perf_counter()
+    refreshed = load_aedt_file.refresh_aedt_file(previous, file_path)
+    refreshed_counts = part_counts(refreshed)
+    refresh_time = time.perf_counter() - start
+    load_aedt_file._cached_index.cache_clear()
+    start = time.perf_counter()
+    reloaded = load_entire_aedt_file(file_path, lazy=True)
+    reloaded_counts = part_counts(reloaded)
+    reload_time = time.perf_counter() - start
+
+    assert refreshed_counts == reloaded_counts == [21000] * 10
+    assert refreshed["AnsoftProject"]["HFSSModel"][3]["FieldsPlotManagerID"]["PlotFolder"] == "NewFolder3"
+    assert refreshed["AnsoftProject"]["HFSSModel"][0] is previous["AnsoftProject"]["HFSSModel"][0]
+    logging.getLogger(__name__).info(
+        f"Project of {stat.st_size / 1024**2:.0f} MB with one of 10 designs changed: reload {reload_time:.3f} s, "
+        f"refresh {refresh_time:.3f} s"
+    )
+
+
+def test_dict_view_copy_on_write(project_file) -> None:
+    lazy = load_entire_aedt_file(project_file, lazy=True)
+    full = load_entire_aedt_file(project_file)
+    view = AedtDictView(lazy)
+
+    designs = view["AnsoftProject"]["HFSSModel"]
+    assert isinstance(designs, AedtListView)
+    assert view["AnsoftProject"]["HFSSModel"] is designs
+    assert designs[1]["Name"] == "Design1"
+    assert not lazy["AnsoftProject"]["HFSSModel"][1].is_loaded("ModelSetup")
+    assert view == full
+
+    view["AnsoftProject"]["HFSSModel"][0]["Name"] = "Renamed"
+    del designs[0]["FieldsPlotManagerID"]
+    designs.append({"Name": "NewDesign"})
+    view["AnsoftProject"]["Created"] = None
+
+    assert designs[0]["Name"] == "Renamed"
+    assert "FieldsPlotManagerID" not in designs[0]
+    assert designs[-1] == {"Name": "NewDesign"}
+    assert view["AnsoftProject"]["Created"] is None
+    assert lazy == full
+    plain = view.to_dict()
+    assert type(plain["AnsoftProject"]["HFSSModel"]) is list
+    assert plain["AnsoftProject"]["HFSSModel"][0]["Name"] == "Renamed"
+    assert len(plain["AnsoftProject"]["HFSSModel"]) == 4
+
+
+@pytest.mark.benchmark
+def test_lazy_load_benchmark(tmp_path, monkeypatch) -> None:
+    """Compare the full and the lazy loads of a synthetic project of about 200 MB."""
+    monkeypatch.setattr(settings, "aedt_file_cache_dir", None)
+    file_path = tmp_path / "synthetic.aedt"
+    write_synthetic_project(file_path, designs=10, objects=71000)
+    size = file_path.stat().st_size / 1024**2
+
+    def design_names(data):
+        return [design["Name"] for design in data["AnsoftProject"]["HFSSModel"]]
+
+    full_names, full_time, full_memory = measure(lambda: design_names(load_entire_aedt_file(file_path)))
+    load_aedt_file._cached_index.cache_clear()
+    lazy, lazy_time, lazy_memory = measure(lambda: load_entire_aedt_file(file_path, lazy=True))
+    lazy_names, access_time, _ = measure(lambda: design_names(lazy))
+
+    assert isinstance(lazy, AedtLazyDict)
+    assert lazy_names == full_names == [f"Design{i}" for i in range(10)]
+    assert not lazy["AnsoftProject"]["HFSSModel"][0].is_loaded("ModelSetup")
+    logging.getLogger(__name__).info(
+        f"Load of a {size:.0f} MB project: full {full_time:.3f} s and {full_memory / 1024**2:.1f} MB peak, "
+        f"lazy {lazy_time:.3f} s and {lazy_memory / 1024**2:.1f} MB peak, design names read in {access_time:.3f} s"
+    )
@@ -0,0 +1,480 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from collections import defaultdict
+import logging
+import os
+import time
+from unittest.mock import patch
+import warnings
+
+import numpy as np
+import pytest
+
+from ansys.aedt.core.visualization.plot import pyvista as pyvista_plot
+from ansys.aedt.core.visualization.plot.pyvista import ModelPlotter
+from ansys.aedt.core.visualization.plot.pyvista import _frame_cache_path
+from ansys.aedt.core.visualization.plot.pyvista import _grid_axes
+from ansys.aedt.core.visualization.plot.pyvista import _parse_aedtplt
+from ansys.aedt.core.visualization.plot.pyvista import _parse_fld
+from ansys.aedt.core.visualization.plot.pyvista import _parse_frame
+from ansys.aedt.core.visualization.plot.pyvista import _parse_values
+from tests import TESTS_VISUALIZATION_PATH
+
+AEDTPLT_FILES = [
+    TESTS_VISUALIZATION_PATH / "example_models" / "T12" / "test_vector.aedtplt",
+    TESTS_VISUALIZATION_PATH / "example_models" / "T12" / "test_vector_no_solutions.aedtplt",
+    TESTS_VISUALIZATION_PATH / "example_models" / "T50" / "vector_field" / "SurfaceAcForceDensity.aedtplt",
+]
+FLD_FILES = [
+    TESTS_VISUALIZATION_PATH / "example_models" / "T50" / "E_xyz.fld",
+    TESTS_VISUALIZATION_PATH / "example_models" / "T50" / "vector_field" / "SurfaceAcForceDensity.fld",
+]
+LEGACY_TRIANGLES = {
+    (10, True): "013 124 143 345 968 603 638 835 978 724 748 845 976 721 716 610",
+    (10, False): "025 905 920 925",
+    (6, True): "013 124 143 345",
+    (6, False): "025",
+    (4, True): "013 123 012 023",
+}
+
+
+def legacy_parse_aedtplt(filepath):
+    """Element by element implementation the parser is compared to."""
+    vertices, faces, scalars, log = [], [], [], True
+    with open(filepath) as f:
+        drawings = f.read().split("$begin Drawing")[1:]
+    for drawing in drawings:
+        solution = []
+        for line in drawing.splitlines(keepends=True):
+            values = line[line.find("(") + 1 : -2].split(",")
+            if "Elements(" in line:
+                elements = [int(i) for i in values]
+            if "Nodes(" in line:
+                nodes = [float(i) for i in values]
+            if "ElemSolution(" in line:
+                sols = [float(i) if i.strip() != "1.#QNAN" else 0 for i in values]
+                size, num_nodes, sols = int(sols[2]), elements[6], sols[3:]
+                sols = [sols[i : i + size] for i in range(0, len(sols), size)]
+                if num_nodes == size or size // num_nodes < 3:
+                    solution = [sum(i) / size for i in sols]
+                else:
+                    solution = [[sum(i[j::3]) / size * 3 for i in sols] for j in range(3)]
+        elements = elements[2:]
+        per_element = elements[4]
+        elements_nodes = [elements[i + 5 : i + 5 + per_element] for i in range(0, len(elements), per_element + 5)]
+        if per_element == 3:
+            triangles = elements_nodes
+        else:
+            pattern = [[int(i) for i in t] for t in LEGACY_TRIANGLES.get((per_element, bool(solution)), "").split()]
+            triangles = [[e[i] for i in t] for e in elements_nodes for t in pattern]
+        faces.append({frozenset(t) for t in triangles})
+        vertices.append(np.array([nodes[i : i + 3] for i in range(0, len(nodes), 3)]))
+        log = True
+        if solution:
+            temps = []
+            for sol in solution if isinstance(solution[0], list) else [solution]:
+                sv, sv_i = defaultdict(lambda: 0), defaultdict(lambda: 1)
+                for els, s in zip(elements_nodes, sol):
+                    for el in els:
+                        sv[el] = (sv[el] + s) / sv_i[el]
+                        sv_i[el] = 2
+                temps.append(np.array([sv[v] for v in sorted(sv.keys())]))
+            temps = temps if isinstance(solution[0], list) else temps[0]
+            scalars.append(temps)
+            log = np.min(temps) > 0
+    return vertices, faces, scalars, log
+
+
+def assert_same_fields(parsed, reference) -> None:
+    vertices, faces, scalars, log = parsed
+    assert len(vertices) == len(reference[0])
+    for a, b in zip(vertices, reference[0]):
+        assert np.array_equal(a, b)
+    for a, b in zip(faces, reference[1]):
+        assert np.all(a.reshape(-1, 4)[:, 0] == 3)
+        assert {frozenset(i) for i in (a.reshape(-1, 4)[:, 1:] + 1).tolist()} == b
+        assert len(a) == 4 * len(b)
+    assert len(scalars) == len(reference[2])
+    for a, b in zip(scalars, reference[2]):
+        assert type(a) is type(b)
+        # Exact equality, the node values are not only close
+        assert np.array_equal(np.asarray(a), np.asarray(b))
+    assert log == reference[3]
+
+
+def digits(values, width):
+    """Zero-padded decimal representation of non-negative integers as a byte matrix."""
+    return (np.asarray(values)[:, np.newaxis] // 10 ** np.arange(width - 1, -1, -1) % 10 + ord("0")).astype(np.uint8)
+
+
+def records(*columns):
+    """Join byte matrices and constant separators into comma-separated records."""
+    rows = len(next(column for column in columns if not isinstance(column, bytes)))
+    columns = [np.tile(np.frombuffer(i, np.uint8), (rows, 1)) if isinstance(i, bytes) else i for i in columns]
+    return np.hstack(columns).tobytes()[:-2]
+
+
+def write_triangles(path, count, invalid=False, shift=0):
+    """Write a planar mesh of triangles with three solution values per element."""
+    side = int(np.ceil(np.sqrt(count / 2))) + 1
+    ids = np.arange(side * side).reshape(side, side) + 1
+    lower = np.stack((ids[:-1, :-1], ids[:-1, 1:], ids[1:, :-1]), axis=-1).reshape(-1, 3)
+    upper = np.stack((ids[1:, 1:], ids[1:, :-1], ids[:-1, 1:]), axis=-1).reshape(-1, 3)
+    triangles = np.stack((lower, upper), axis=1).reshape(-1, 3)[:count]
+    y, x = np.divmod(np.arange(side * side), side)
+    values = (np.arange(count * 3).reshape(-1, 3) + shift) % 7 + 1
+    with open(path, "wb") as f:
+        f.write(b"$begin Drawing_1\n\tElements(%d, %d, " % (side * side, count))
+        f.write(records(b"2, 3, 3, 0, 3, ", *(j for i in triangles.T for j in (digits(i, 7), b", "))))
+        f.write(b")\n\tNodes(")
+        f.write(records(digits(x, 5), b", ", digits(y, 5), b", 0, "))
+        f.write(b")\n\tElemSolution(0, 1, 3, " + (b"1.#QNAN, " if invalid else b""))
+        f.write(records(*(j for i in values.T for j in (b"0.", digits(i, 1), b", "))))
+        f.write(b")\n$end Drawing_1\n")
+    return path
+
+
+@pytest.mark.parametrize("aedtplt_file", AEDTPLT_FILES, ids=lambda i: i.stem)
+def test_parse_aedtplt_fixtures(aedtplt_file) -> None:
+    assert_same_fields(_parse_aedtplt(aedtplt_file), legacy_parse_aedtplt(aedtplt_file))
+
+
+@pytest.mark.parametrize("invalid", [False, True])
+def test_parse_aedtplt_scalar(tmp_path, invalid) -> None:
+    aedtplt_file = write_triangles(tmp_path / "triangles.aedtplt", 101, invalid)
+
+    if invalid:
+        with pytest.warns(UserWarning, match="Unable to convert"):
+            vertices, faces, scalars, log = _parse_aedtplt(aedtplt_file)
+    else:
+        vertices, faces, scalars, log = _parse_aedtplt(aedtplt_file)
+
+    assert_same_fields((vertices, faces, scalars, log), legacy_parse_aedtplt(aedtplt_file))
+    assert vertices[0].shape == (81, 3)
+    assert faces[0].shape == (4 * 101,)
+    assert scalars[0].shape == (len(np.unique(faces[0].reshape(-1, 4)[:, 1:])),)
+
+
+def test_parse_values_invalid_tokens(monkeypatch) -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        values = _parse_values("1.5, 1.#QNAN, 2", float, lambda i: float(i) if "#" not in i else 0.0)
+        assert np.array_equal(values, [1.5, 0.0, 2.0])
+        values = _parse_values("1.5, nan_value, 2", float, lambda i: float(i) if "_" not in i else 0.0)
+        assert np.array_equal(values, [1.5, 0.0, 2.0])
+
+    def fromstring(*args, **kwargs):
+        raise ValueError("string size must be a multiple of element size")
+
+    # future NumPy versions raise instead of returning the values parsed before the invalid one
+    monkeypatch.setattr(pyvista_plot.np, "fromstring", fromstring)
+    assert np.array_equal(_parse_values("3, 4", np.int64, int), [3, 4])
+
+
+@pytest.mark.benchmark
+def test_parse_aedtplt_benchmark(tmp_path) -> None:
+    """Parse a synthetic field plot with five million elements."""
+    count = 5_000_000
+    aedtplt_file = write_triangles(tmp_path / "triangles.aedtplt", count)
+
+    start = time.perf_counter()
+    vertices, faces, scalars, log = _parse_aedtplt(aedtplt_file)
+    elapsed = time.perf_counter() - start
+
+    assert faces[0].shape == (4 * count,)
+    assert vertices[0].shape == (1583**2, 3)
+    assert np.all(faces[0].reshape(-1, 4)[:, 1:] < len(vertices[0]))
+    assert scalars[0].min() > 0 and log
+    logging.getLogger(__name__).info(f"Field plot with {count} elements parsed in {elapsed:.3f} s")
+
+
+def legacy_parse_fld(filepath, unique):
+    """Line by line implementation the field point reader is compared to."""
+    nodes, values = [], []
+    with open(filepath) as f:
+        lines = f.read().splitlines()[2:]
+    if unique:
+        lines = list(dict.fromkeys(lines))
+    for line in lines:
+        tmp = [float(i) for i in line.strip().split(" ") if i and i.lower() != "nan"]
+        if len(tmp) in [4, 6, 9]:
+            nodes.append(tmp[:3])
+            values.append(
+                tmp[3] if len(tmp) == 4 else tmp[3:] if len(tmp) == 6 else tmp[3::2] + 1j * np.array(tmp[4::2])
+            )
+    return np.array(nodes), np.array(values)
+
+
+def write_grid_fld(path, axes, order="zyx", shuffle=False, delimiter=" "):
+    """Write a scalar field on a Cartesian grid, as exported by ``export_field_file_on_grid``."""
+    grids = np.meshgrid(*[axes["xyz".index(i)] for i in order], indexing="ij")
+    points = np.column_stack([grids[order.index(i)].ravel() for i in "xyz"])
+    if shuffle:
+        points = np.random.default_rng(0).permutation(points)
+    values = np.hypot(points[:, 0], points[:, 1]) + points[:, 2] + 1
+    header = "Grid Output Min: [0m 0m 0m] Max: [1m 1m 1m] Grid Size: [0.1m 0.1m 0.1m]\nX Y Z Mag_E"
+    np.savetxt(path, np.column_stack((points, values)), fmt="%.16e", delimiter=delimiter, header=header, comments="")
+    return points, values
+
+
+@pytest.mark.parametrize("fld_file", FLD_FILES, ids=lambda i: i.stem)
+@pytest.mark.parametrize("unique", [False, True])
+def test_parse_fld_fixtures(fld_file, unique) -> None:
+    nodes, values = _parse_fld(fld_file, unique=unique)
+    legacy_nodes, legacy_values = legacy_parse_fld(fld_file, unique)
+
+    assert np.array_equal(nodes, legacy_nodes)
+    assert np.array_equal(values, legacy_values)
+    assert _grid_axes(nodes) is None
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_parse_fld_grid(tmp_path, shuffle) -> None:
+    axes = [np.linspace(-0.5, 0.5, 11), np.array([0.0, 0.1, 0.3, 0.7]), np.array([2e-3])]
+    points, values = write_grid_fld(tmp_path / "grid.fld", axes, shuffle=shuffle)
+    with open(tmp_path / "grid.fld", "a") as f:
+        f.write("0.1 0.2 nan nan\n")
+
+    nodes, parsed_values = _parse_fld(tmp_path / "grid.fld")
+    grid_axes, order = _grid_axes(nodes)
+
+    assert np.array_equal(nodes, points)
+    assert np.array_equal(parsed_values, values)
+    for grid_axis, axis in zip(grid_axes, axes):
+        assert np.allclose(grid_axis, axis, rtol=0, atol=1e-15)
+    # The x coordinate varies the fastest in the grid order
+    x, y, z = np.meshgrid(*axes, indexing="ij")
+    expected = np.column_stack((x.ravel(order="F"), y.ravel(order="F"), z.ravel(order="F")))
+    assert np.allclose(nodes[order], expected, rtol=0, atol=1e-15)
+
+
+def test_parse_fld_csv(tmp_path) -> None:
+    axes = [np.arange(3.0), np.arange(4.0), np.arange(2.0)]
+    points, values = write_grid_fld(tmp_path / "grid.csv", axes, delimiter=",")
+
+    nodes, parsed_values = _parse_fld(tmp_path / "grid.csv")
+
+    assert np.array_equal(nodes, points)
+    assert np.array_equal(parsed_values, values)
+    assert _grid_axes(nodes) is not None
+
+
+def test_parse_fld_scattered(tmp_path) -> None:
+    """Test a spherical grid, which is not a Cartesian grid once exported."""
+    radius, theta, phi = np.meshgrid([1.0, 2.0], np.radians([30, 60, 90]), np.radians([0, 90, 180, 270]), indexing="ij")
+    points = np.column_stack(
+        (
+            (radius * np.sin(theta) * np.cos(phi)).ravel(),
+            (radius * np.sin(theta) * np.sin(phi)).ravel(),
+            (radius * np.cos(theta)).ravel(),
+        )
+    )
+    vectors = np.random.default_rng(0).standard_normal((len(points), 6))
+    np.savetxt(
+        tmp_path / "sphere.fld", np.column_stack((points, vectors)), header="Complex Vector\nNumElems", comments=""
+    )
+
+    nodes, values = _parse_fld(tmp_path / "sphere.fld")
+
+    assert np.allclose(nodes, points)
+    assert np.allclose(values, vectors[:, ::2] + 1j * vectors[:, 1::2])
+    assert _grid_axes(nodes) is None
+    assert _grid_axes(np.random.default_rng(0).random((64, 3))) is None
+    assert _grid_axes(np.zeros((4, 3))) is None
+
+
+@pytest.mark.parametrize("in_db", [False, True])
+def test_read_fld_grid(tmp_path, monkeypatch, in_db) -> None:
+    pv = pytest.importorskip("pyvista")
+    monkeypatch.setattr(pyvista_plot, "pv", pv, raising=False)
+    axes = [np.linspace(0, 1, 5), np.linspace(0, 2, 3), np.array([0.0, 0.5, 2.0])]
+    points, values = write_grid_fld(tmp_path / "grid.fld", axes, shuffle=True)
+
+    plotter = ModelPlotter()
+    plotter.convert_fields_in_db = in_db
+    plotter.add_field_from_file(str(tmp_path / "grid.fld"))
+    field = plotter.fields[0]
+    plotter._read_fld(field)
+    mesh = field._cached_polydata
+
+    assert isinstance(mesh, pv.StructuredGrid)
+    assert mesh.n_points == len(points)
+    expected = np.log10(values) * plotter.log_multiplier if in_db else values
+    indices = [np.abs(points - point).sum(axis=1).argmin() for point in mesh.points]
+    assert np.allclose(mesh.point_data["magnitude"], expected[indices])
+
+    write_grid_fld(tmp_path / "image.fld", [np.linspace(0, 1, 5), np.linspace(0, 2, 3), np.array([0.0])])
+    plotter.add_field_from_file(str(tmp_path / "image.fld"))
+    plotter._read_fld(plotter.fields[1])
+    assert isinstance(plotter.fields[1]._cached_polydata, pv.ImageData)
+    assert plotter.fields[1]._cached_polydata.dimensions == (5, 3, 1)
+
+
+@pytest.mark.benchmark
+def test_parse_fld_benchmark(tmp_path) -> None:
+    """Test reading a field exported on a grid of one million points."""
+    axes = [np.linspace(0, 1, 100), np.linspace(0, 1, 100), np.linspace(0, 1, 100)]
+    points, values = write_grid_fld(tmp_path / "grid.fld", axes)
+
+    start = time.perf_counter()
+    legacy_parse_fld(tmp_path / "grid.fld", True)
+    legacy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    nodes, parsed_values = _parse_fld(tmp_path / "grid.fld", unique=True)
+    grid = _grid_axes(nodes)
+    elapsed = time.perf_counter() - start
+
+    assert np.array_equal(nodes, points)
+    assert np.array_equal(parsed_values, values)
+    assert [len(axis) for axis in grid[0]] == [100, 100, 100]
+    logging.getLogger(__name__).info(f"Field grid parsed in {elapsed:.3f} s, legacy parser in {legacy_time:.3f} s")
+
+
+class CountingPyvista:
+    """Proxy of the ``pyvista`` module counting the meshes built from points."""
+
+    def __init__(self, pv) -> None:
+        self._pv = pv
+        self.built = 0
+
+    def __getattr__(self, name):
+        return getattr(self._pv, name)
+
+    def PolyData(self, *args, **kwargs):
+        self.built += 1
+        return self._pv.PolyData(*args, **kwargs)
+
+
+@pytest.fixture
+def counting_pyvista(monkeypatch):
+    counting = CountingPyvista(pytest.importorskip("pyvista"))
+    monkeypatch.setattr(pyvista_plot, "pv", counting, raising=False)
+    return counting
+
+
+def test_parse_frame_cache(tmp_path) -> None:
+    aedtplt_file = write_triangles(tmp_path / "frame.aedtplt", 50)
+    reference = _parse_aedtplt(aedtplt_file)
+
+    frame = _parse_frame(aedtplt_file, use_cache=True)
+    assert _frame_cache_path(aedtplt_file).is_file()
+    with patch.object(pyvista_plot, "_parse_aedtplt", side_effect=AssertionError("Cache not used")):
+        cached = _parse_frame(aedtplt_file, use_cache=True)
+
+    assert sorted(cached) == sorted(frame)
+    for parsed in [frame, cached]:
+        assert np.array_equal(parsed["vertices"], reference[0][0])
+        assert np.array_equal(parsed["faces"], reference[1][0])
+        assert np.array_equal(parsed["scalars"], reference[2][0])
+        assert bool(parsed["log"]) == reference[3]
+
+    # A frame exported again within the timestamp resolution is parsed again
+    stat = aedtplt_file.stat()
+    write_triangles(aedtplt_file, 52, shift=1)
+    os.utime(aedtplt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert np.array_equal(_parse_frame(aedtplt_file, use_cache=True)["scalars"], _parse_aedtplt(aedtplt_file)[2][0])
+
+    # A frame copied with an older modification time is parsed again
+    write_triangles(aedtplt_file, 52, shift=2)
+    os.utime(aedtplt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+    assert np.array_equal(_parse_frame(aedtplt_file, use_cache=True)["scalars"], _parse_aedtplt(aedtplt_file)[2][0])
+
+    # A corrupted cache is ignored
+    _frame_cache_path(aedtplt_file).write_bytes(b"corrupted")
+    assert np.array_equal(_parse_frame(aedtplt_file, use_cache=True)["scalars"], _parse_aedtplt(aedtplt_file)[2][0])
+
+    _frame_cache_path(aedtplt_file).unlink()
+    _parse_frame(aedtplt_file)
+    assert not _frame_cache_path(aedtplt_file).exists()
+
+
+@pytest.mark.parametrize("frame_workers", [1, 2])
+def test_animation_frames_share_mesh(tmp_path, counting_pyvista, frame_workers) -> None:
+    """Test that the mesh of frames sharing the same points and faces is built once."""
+    frames = [write_triangles(tmp_path / f"frame{i}.aedtplt", 72, shift=i) for i in range(5)]
+    plotter = ModelPlotter()
+    plotter.frame_workers = frame_workers
+    plotter.cache_frames = True
+    plotter.add_frames_from_file([str(i) for i in frames])
+
+    plotter._read_mesh_files(read_frames=True)
+
+    assert counting_pyvista.built == 1
+    meshes = [i._cached_polydata for i in plotter.frames]
+    for frame, mesh in zip(frames, meshes):
+        assert np.shares_memory(mesh.points, meshes[0].points)
+        assert np.array_equal(mesh.point_data["Field"], _parse_aedtplt(frame)[2][0])
+    assert not np.array_equal(meshes[0].point_data["Field"], meshes[1].point_data["Field"])
+    assert all(_frame_cache_path(i).is_file() for i in frames)
+
+    # The frames are read from the cache by a new plotter
+    plotter = ModelPlotter()
+    plotter.cache_frames = True
+    plotter.add_frames_from_file([str(i) for i in frames])
+    with patch.object(pyvista_plot, "_parse_aedtplt", side_effect=AssertionError("Cache not used")):
+        plotter._read_mesh_files(read_frames=True)
+    assert counting_pyvista.built == 2
+
+
+def test_animation_frames_default_in_process(tmp_path, counting_pyvista) -> None:
+    frames = [write_triangles(tmp_path / f"frame{i}.aedtplt", 72, shift=i) for i in range(3)]
+    plotter = ModelPlotter()
+    plotter.add_frames_from_file([str(i) for i in frames])
+
+    with patch.object(pyvista_plot, "ProcessPoolExecutor", side_effect=AssertionError("Pool started")):
+        plotter._read_mesh_files(read_frames=True)
+    assert counting_pyvista.built == 1
+    assert not any(_frame_cache_path(i).exists() for i in frames)
+
+
+def test_animation_frames_changing_mesh(tmp_path, counting_pyvista) -> None:
+    frames = [write_triangles(tmp_path / f"frame{i}.aedtplt", 72 + 26 * (i // 2), shift=i) for i in range(4)]
+    plotter = ModelPlotter()
+    plotter.add_frames_from_file([str(i) for i in frames])
+
+    plotter._read_mesh_files(read_frames=True)
+
+    assert counting_pyvista.built == 2
+    assert [i._cached_polydata.n_cells for i in plotter.frames] == [72, 72, 98, 98]
+
+
+def test_animation_fld_frames_share_mesh(tmp_path, counting_pyvista) -> None:
+    axes = [np.linspace(0, 1, 5), np.linspace(0, 2, 3), np.array([0.0, 0.5, 2.0])]
+    frames = []
+    for i in range(3):
+        frames.append(tmp_path / f"frame{i}.fld")
+        points, values = write_grid_fld(frames[-1], axes)
+        np.savetxt(frames[-1], np.column_stack((points, values * (i + 1))), header="\n", comments="")
+    plotter = ModelPlotter()
+    plotter.add_frames_from_file([str(i) for i in frames])
+
+    plotter._read_mesh_files(read_frames=True)
+
+    meshes = [i._cached_polydata for i in plotter.frames]
+    assert isinstance(meshes[0], counting_pyvista.StructuredGrid)
+    for i, mesh in enumerate(meshes):
+        assert np.shares_memory(mesh.points, meshes[0].points)
+        assert np.allclose(mesh.point_data["magnitude"], meshes[0].point_data["magnitude"] * (i + 1))
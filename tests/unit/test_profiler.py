@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import time
+
+import pytest
+
+from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
+from ansys.aedt.core.generic.profiler import AedtObjectProxy
+from ansys.aedt.core.generic.profiler import MethodProfiler
+from ansys.aedt.core.generic.settings import settings
+from ansys.aedt.core.internal.errors import AEDTRuntimeError
+
+RPC_LATENCY = 0.002
+
+
+@pytest.fixture(scope="module", autouse=True)
+def desktop() -> None:
+    """Override the desktop fixture to DO NOT open the Desktop when running this test class"""
+    return
+
+
+class FakeModule:
+    def __init__(self, name) -> None:
+        self.name = name
+        self.boundaries = []
+
+    def AssignBoundary(self, arguments):
+        self.boundaries.append(arguments)
+        return True
+
+
+class FakeEditor:
+    def __init__(self) -> None:
+        self.objects = []
+
+    def CreateBox(self, parameters, attributes):
+        time.sleep(RPC_LATENCY)
+        self.objects.append(attributes["Name"])
+        return attributes["Name"]
+
+    def GetObjectsInGroup(self, group):
+        return list(self.objects)
+
+
+class FakeDesign:
+    def __init__(self) -> None:
+        self.editor = FakeEditor()
+        self.modules = {}
+
+    def GetModule(self, name):
+        return self.modules.setdefault(name, FakeModule(name))
+
+    def SetActiveEditor(self, name):
+        return self.editor
+
+
+class FakeApp:
+    """Application holding a fake AEDT object tree, with the same attributes as the PyAEDT applications."""
+
+    def __init__(self) -> None:
+        self._odesign = FakeDesign()
+        self._oeditor = None
+        self._oboundary = None
+
+    @property
+    def oeditor(self):
+        if not self._oeditor:
+            self._oeditor = self._odesign.SetActiveEditor("3D Modeler")
+        return self._oeditor
+
+    @property
+    def oboundary(self):
+        if not self._oboundary:
+            self._oboundary = self._odesign.GetModule("BoundarySetup")
+        return self._oboundary
+
+    @pyaedt_function_handler()
+    def create_box(self, name):
+        return self.oeditor.CreateBox({"XSize": "1mm"}, {"Name": name})
+
+    @pyaedt_function_handler()
+    def assign_radiation(self, count):
+        names = [self.create_box(f"Box{i}") for i in range(count)]
+        return self.oboundary.AssignBoundary(["NAME:Rad1", "Objects:=", names])
+
+    @pyaedt_function_handler()
+    def count_objects(self, depth):
+        if depth:
+            return self.count_objects(depth - 1)
+        return len(self.oeditor.GetObjectsInGroup("Solids"))
+
+
+@pytest.fixture
+def app():
+    return FakeApp()
+
+
+def test_profiler_counts(app) -> None:
+    with MethodProfiler(app) as profiler:
+        assert isinstance(app._odesign, AedtObjectProxy)
+        assert app.assign_radiation(3)
+        app.create_box("Box3")
+        assert app.count_objects(2) == 4
+
+    functions = profiler.functions
+    assert functions["FakeApp.create_box"]["calls"] == 4
+    assert functions["FakeApp.create_box"]["aedt_calls"] == 5
+    assert functions["FakeApp.assign_radiation"]["calls"] == 1
+    assert functions["FakeApp.assign_radiation"]["aedt_calls"] == 2
+    assert functions["FakeApp.assign_radiation"]["cumulative_aedt_calls"] == 6
+    assert functions["FakeApp.count_objects"]["calls"] == 3
+    assert functions["FakeApp.count_objects"]["cumulative_aedt_calls"] == 1
+    assert {name: entry["calls"] for name, entry in profiler.aedt_calls.items()} == {
+        "oDesign.SetActiveEditor": 1,
+        "oEditor.CreateBox": 4,
+        "oDesign.GetModule": 1,
+        "oModule.AssignBoundary": 1,
+        "oEditor.GetObjectsInGroup": 1,
+    }
+    assert app._odesign.modules["BoundarySetup"].boundaries == [["NAME:Rad1", "Objects:=", ["Box0", "Box1", "Box2"]]]
+    assert type(app._odesign) is FakeDesign
+    assert type(app._oeditor) is FakeEditor
+    assert type(app._oboundary) is FakeModule
+    assert settings._method_profiler is None
+    assert not settings._trace_methods
+
+
+def test_profiler_times(app) -> None:
+    with MethodProfiler(app) as profiler:
+        start = time.perf_counter()
+        app.assign_radiation(2)
+        elapsed = time.perf_counter() - start
+        app.count_objects(3)
+
+    functions = profiler.functions
+    stacks = profiler.stacks
+    assign_radiation = functions["FakeApp.assign_radiation"]
+    create_box = functions["FakeApp.create_box"]
+    assert 2 * RPC_LATENCY < assign_radiation["cumulative_time"] <= elapsed
+    assert create_box["cumulative_time"] >= profiler.aedt_calls["oEditor.CreateBox"]["time"] >= 2 * RPC_LATENCY
+    assert create_box["self_time"] < RPC_LATENCY
+    assert assign_radiation["self_time"] < assign_radiation["cumulative_time"] - create_box["cumulative_time"] + 1e-9
+    assert functions["FakeApp.count_objects"]["cumulative_time"] >= functions["FakeApp.count_objects"]["self_time"]
+    assert stacks["FakeApp.assign_radiation;FakeApp.create_box;oEditor.CreateBox"] >= 2 * RPC_LATENCY
+    assert "FakeApp.count_objects;FakeApp.count_objects;FakeApp.count_objects;FakeApp.count_objects" in stacks
+    assert sum(stacks.values()) == pytest.approx(
+        assign_radiation["cumulative_time"] + functions["FakeApp.count_objects"]["cumulative_time"]
+    )
+
+
+def test_profiler_reports(app, tmp_path) -> None:
+    with MethodProfiler(app) as profiler:
+        app.assign_radiation(3)
+
+    lines = profiler.report(sort_by="calls").splitlines()
+    assert lines[0].split()[:3] == ["Method", "Calls", "Cumulative"]
+    assert lines[1].split()[:2] == ["FakeApp.create_box", "3"]
+    assert lines[2].split()[:2] == ["FakeApp.assign_radiation", "1"]
+    assert lines[4].split()[0] == "AEDT"
+    assert lines[5].split()[:2] == ["oEditor.CreateBox", "3"]
+    assert len(profiler.report(limit=1).splitlines()) == 2 + 1 + 1 + 4
+    with pytest.raises(ValueError):
+        profiler.report(sort_by="time")
+
+    collapsed = profiler.write_collapsed_stacks(tmp_path / "pyaedt.folded").read_text().splitlines()
+    folded = dict(line.rsplit(" ", 1) for line in collapsed)
+    assert set(folded) == set(profiler.stacks)
+    assert int(folded["FakeApp.assign_radiation;FakeApp.create_box;oEditor.CreateBox"]) >= 3 * RPC_LATENCY * 1e6
+
+    data = profiler.to_json(tmp_path / "pyaedt_profile.json")
+    with open(tmp_path / "pyaedt_profile.json") as file:
+        assert json.load(file) == data
+    assert data["functions"]["FakeApp.create_box"]["calls"] == 3
+    assert data["aedt_calls"]["oDesign.GetModule"]["calls"] == 1
+
+
+def test_profiler_lifecycle(app) -> None:
+    app.create_box("Box0")
+    profiler = MethodProfiler()
+    profiler.start()
+    try:
+        with pytest.raises(AEDTRuntimeError):
+            MethodProfiler().start()
+        app.create_box("Box1")
+        profiler.attach(app)
+        app.create_box("Box2")
+        assert isinstance(app._oeditor, AedtObjectProxy)
+    finally:
+        profiler.stop()
+    app.create_box("Box3")
+
+    assert profiler.functions["FakeApp.create_box"]["calls"] == 2
+    assert profiler.functions["FakeApp.create_box"]["aedt_calls"] == 1
+    assert type(app._oeditor) is FakeEditor
+    assert app._oeditor.objects == ["Box0", "Box1", "Box2", "Box3"]
+    profiler.reset()
+    assert profiler.to_json() == {"functions": {}, "aedt_calls": {}, "stacks": {}}
+
+    enable_debug_logger = settings.enable_debug_logger
+    settings.enable_debug_logger = True
+    try:
+        with MethodProfiler():
+            assert settings._trace_methods
+        assert settings._trace_methods
+    finally:
+        settings.enable_debug_logger = enable_debug_logger
+    assert not settings._trace_methods
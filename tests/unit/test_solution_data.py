@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import logging
+import time
+
+import numpy as np
+import pytest
+
+from ansys.aedt.core.visualization.post.solution_data import SolutionData
+
+
+class MockSolution:
+    """Solution of one variation as returned by ``GetSolutionDataPerVariation``."""
+
+    def __init__(self, variation, sweeps, expressions, calls):
+        self._variation = variation
+        self._sweeps = sweeps
+        self._expressions = expressions
+        self._calls = calls
+        # AEDT lists the sweeps in reverse order of the solution data layout.
+        grids = np.meshgrid(*[sweeps[name] for name in reversed(sweeps)], indexing="ij")
+        self._grid = dict(zip(reversed(sweeps), [grid.ravel() for grid in grids]))
+
+    def GetDesignVariableNames(self):
+        return list(self._variation)
+
+    def GetDesignVariableValue(self, name, _):
+        return self._variation[name]
+
+    def GetDesignVariableUnits(self, name):
+        return "mm"
+
+    def GetSweepNames(self):
+        return list(self._sweeps)
+
+    def GetSweepValues(self, name, _):
+        return self._grid[name] if len(self._sweeps) > 1 else self._sweeps[name]
+
+    def GetSweepUnits(self, name):
+        return ""
+
+    def GetDataExpressions(self):
+        return list(self._expressions)
+
+    def GetDataUnits(self, expression):
+        return ""
+
+    def IsDataComplex(self, expression):
+        return self._expressions[expression]
+
+    def _values(self, expression, offset):
+        self._calls.append(expression)
+        values = sum(grid * 10**idx for idx, grid in enumerate(self._grid.values()))
+        return values * (sum(self._variation.values()) + offset)
+
+    def GetRealDataValues(self, expression, _):
+        return self._values(expression, 0.0)
+
+    def GetImagDataValues(self, expression, _):
+        return self._values(expression, 1.0)
+
+
+def make_solution_data(points, variations, calls=None):
+    sweeps = {"Freq": np.linspace(1.0, 10.0, points)}
+    expressions = {"S(1,1)": True, "Z0": False}
+    calls = [] if calls is None else calls
+    return SolutionData([MockSolution({"w": float(w)}, sweeps, expressions, calls) for w in range(variations)])
+
+
+def make_multi_sweep_data():
+    sweeps = {"Phi": np.arange(0.0, 360.0, 30.0), "Theta": np.arange(-90.0, 91.0, 15.0), "Freq": np.array([1.0, 2.5])}
+    variations = [{"w": float(w), "h": float(h)} for w in range(3) for h in (0.5, 1.5)]
+    return SolutionData([MockSolution(variation, sweeps, {"rETotal": False}, []) for variation in variations])
+
+
+def test_blocks_layout() -> None:
+    calls = []
+    data = make_solution_data(5, 3, calls)
+    real, imag = data.full_matrix_real_imag
+    assert real["S(1,1)"].shape == (15, 3)
+    assert np.array_equal(real["S(1,1)"][:, 0], np.repeat([0.0, 1.0, 2.0], 5))
+    assert np.array_equal(real["S(1,1)"][:5, 1], np.linspace(1.0, 10.0, 5))
+    assert np.allclose(imag["S(1,1)"][5:10, -1], np.linspace(1.0, 10.0, 5) * 2)
+    assert not np.any(imag["Z0"][:, -1])
+    # One real read per expression and one imaginary read for the complex expression only.
+    assert len(calls) == 3 * 3
+
+    data.set_active_variation(2)
+    x, y = data.get_expression_data("S(1,1)", formula="imag")
+    assert np.array_equal(x, np.linspace(1.0, 10.0, 5))
+    assert np.allclose(y, x * 3)
+
+
+def test_derived_quantities_memoized() -> None:
+    data = make_solution_data(5, 3)
+    assert not data._solutions_mag._blocks
+    _, db20 = data.get_expression_data("S(1,1)", formula="db20")
+    first = data._solutions_mag["S(1,1)"]
+    assert data._solutions_mag["S(1,1)"] is first
+    assert list(data._solutions_mag._blocks) == ["S(1,1)"]
+    assert not data._solutions_phase._blocks
+    real = data._solutions_real["S(1,1)"][:, -1]
+    imag = data._solutions_imag["S(1,1)"][:, -1]
+    assert np.allclose(first[:, -1], np.abs(real + 1j * imag))
+    assert np.allclose(db20, 20 * np.log10(first[:5, -1]))
+
+    # The full matrices are plain dictionaries reusing the derived blocks
+    mag, phase = data.full_matrix_mag_phase
+    assert type(mag) is dict and type(phase) is dict
+    assert data.full_matrix_mag_phase[0] is mag
+    assert list(mag) == list(data._solutions_real)
+    assert mag["S(1,1)"] is first
+    assert np.allclose(phase["S(1,1)"][:, -1], np.angle(real + 1j * imag))
+    assert mag.copy() == mag
+
+
+def test_to_dataframe() -> None:
+    data = make_solution_data(5, 3)
+    dataframe = data.to_dataframe()
+    assert list(dataframe.columns) == ["w", "Freq", "S(1,1)", "Z0"]
+    assert len(dataframe) == 15
+    assert np.iscomplexobj(dataframe["S(1,1)"].to_numpy())
+    assert not np.iscomplexobj(dataframe["Z0"].to_numpy())
+    assert list(data.to_dataframe("Z0").columns) == ["w", "Freq", "Z0"]
+
+
+def test_to_xarray() -> None:
+    pytest.importorskip("xarray")
+    data = make_solution_data(5, 3)
+    dataset = data.to_xarray()
+    assert dataset["S(1,1)"].shape == (3, 5)
+    assert np.allclose(dataset["Z0"].sel(w=2.0).values, np.linspace(1.0, 10.0, 5) * 2)
+
+
+def test_blocks_are_preallocated() -> None:
+    data = make_solution_data(200, 20)
+    assert data._solutions_real["S(1,1)"].shape == (4000, 3)
+    assert data._solutions_real["S(1,1)"].flags.c_contiguous
+    assert not data._solutions_mag._blocks
+
+
+@pytest.mark.benchmark
+def test_large_sweep_benchmark() -> None:
+    # Scaled down from 1e6 points x 200 variations to stay within memory.
+    start = time.perf_counter()
+    data = make_solution_data(20000, 200)
+    elapsed = time.perf_counter() - start
+    assert data._solutions_real["S(1,1)"].shape == (4000000, 3)
+    assert not data._solutions_mag._blocks
+    logging.getLogger(__name__).info(f"Solution data with 4e6 rows built in {elapsed:.3f} s")
+
+
+def test_select_matches_mask() -> None:
+    data = make_multi_sweep_data()
+    block = data._solutions_real["rETotal"]
+    assert data._sweeps_names == ["w", "h", "Freq", "Theta", "Phi"]
+    assert block.shape == (6 * 2 * 13 * 12, 6)
+    query = {"w": 1.0, "h": 1.5, "Theta": 15.0}
+    columns = [data._sweeps_names.index(name) for name in query]
+    mask = np.all(block[:, columns] == list(query.values()), axis=1)
+    selected = data.select(**query)["rETotal"]
+    assert np.array_equal(selected, block[mask])
+
+    # Design variations and outer sweeps select contiguous rows returned as views.
+    selected = data.select(w=2.0, h=0.5, Freq=2.5)["rETotal"]
+    assert len(selected) == 13 * 12
+    assert np.shares_memory(selected, block)
+    assert np.all(selected[:, 2] == 2.5)
+
+    assert data.select(w=7.0) == {}
+    assert data.select(depth=1.0) == {}
+
+
+def test_select_nearest_with_tolerance() -> None:
+    data = make_multi_sweep_data()
+    assert data.nearest_value("Theta", 14.2) == 15.0
+    assert data.nearest_value("Theta", -200.0) == -90.0
+    assert data.nearest_value("Phi", 1000.0) == 330.0
+    assert data.nearest_value("Theta", 14.2, tolerance=0.5) is None
+    selected = data.select(w=1.0001, h=0.5, Freq=2.5, Theta=14.9, Phi=29.8, tolerance=0.25)["rETotal"]
+    assert selected.shape == (1, 6)
+    assert np.array_equal(selected[0, :-1], [1.0, 0.5, 2.5, 15.0, 30.0])
+    assert data.select(Theta=14.2, tolerance=0.5) == {}
+
+
+def test_get_expression_data_multi_sweep() -> None:
+    data = make_multi_sweep_data()
+    data.set_active_variation(3)
+    data.active_intrinsic["Freq"] = 2.5
+    data.active_intrinsic["Theta"] = 30.0
+    x, y = data.get_expression_data("rETotal", sweeps="Phi")
+    assert np.array_equal(x, np.arange(0.0, 360.0, 30.0))
+    assert np.allclose(y, (2.5 + 30.0 * 10 + x * 100) * 2.5)
+    y[:] = 0
+    assert data.get_expression_data("rETotal", sweeps="Phi")[1][1] != 0
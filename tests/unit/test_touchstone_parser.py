@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import logging
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import skrf as rf
+
+from ansys.aedt.core.visualization.advanced import touchstone_parser
+from ansys.aedt.core.visualization.advanced.touchstone_parser import TOUCHSTONE_CHECKS_CACHE
+from ansys.aedt.core.visualization.advanced.touchstone_parser import TouchstoneData
+from ansys.aedt.core.visualization.advanced.touchstone_parser import TouchstoneStack
+from ansys.aedt.core.visualization.advanced.touchstone_parser import _parse_genequiv_output
+from ansys.aedt.core.visualization.advanced.touchstone_parser import _passivity_result
+from ansys.aedt.core.visualization.advanced.touchstone_parser import _read_s_parameters
+from ansys.aedt.core.visualization.advanced.touchstone_parser import check_passivity
+from ansys.aedt.core.visualization.advanced.touchstone_parser import check_touchstone_files
+from ansys.aedt.core.visualization.advanced.touchstone_parser import read_touchstone_files
+from ansys.aedt.core.visualization.advanced.touchstone_parser import validate_touchstone_files
+
+FREQUENCIES = np.linspace(1e9, 10e9, 10)
+
+
+def scattering_matrices(ports, gain=0.9, seed=0):
+    """Random scattering matrices whose largest singular value is ``gain`` at every frequency."""
+    rng = np.random.default_rng(seed)
+    s = rng.standard_normal((len(FREQUENCIES), ports, ports)) + 1j * rng.standard_normal(
+        (len(FREQUENCIES), ports, ports)
+    )
+    return s / np.linalg.svd(s, compute_uv=False)[:, :1, np.newaxis] * gain
+
+
+def write_touchstone(path, s, data_format="RI", unit="Hz", port_names=None):
+    """Write scattering matrices in a Touchstone file."""
+    first, second = s.real, s.imag
+    if data_format != "RI":
+        first = np.abs(s) if data_format == "MA" else 20 * np.log10(np.abs(s))
+        second = np.degrees(np.angle(s))
+    values = np.stack((first, second), axis=-1)
+    if s.shape[1] == 2:
+        # Two-port data is written in the S11, S21, S12, S22 order
+        values = values.transpose(0, 2, 1, 3)
+    scale = {"Hz": 1, "MHz": 1e6, "GHz": 1e9}[unit]
+    header = [f"! Port[{i + 1}] = {name}" for i, name in enumerate(port_names or [])]
+    header.append(f"# {unit} S {data_format} R 50")
+    data = np.column_stack((FREQUENCIES / scale, values.reshape(len(s), -1)))
+    np.savetxt(path, data, header="\n".join(header), comments="")
+    return path
+
+
+def test_passivity_result() -> None:
+    s = scattering_matrices(3)
+    s[[2, 7]] *= 1.2
+
+    result = _passivity_result(s, FREQUENCIES)
+
+    assert result["status"] == "failed"
+    assert result["violated_frequencies"] == FREQUENCIES[[2, 7]].tolist()
+    assert result["worst_singular_value"] == pytest.approx(1.08)
+    assert "non-passive" in result["log"]
+    assert _passivity_result(scattering_matrices(3, gain=1), FREQUENCIES)["status"] == "passed"
+
+
+@pytest.mark.parametrize("ports", [2, 4])
+def test_check_passivity(tmp_path, ports) -> None:
+    s = scattering_matrices(ports)
+    s[5] *= 1.5
+    touchstone_file = write_touchstone(tmp_path / f"network.s{ports}p", s)
+
+    result = check_passivity(touchstone_file)
+
+    assert result["status"] == "failed"
+    assert result["violated_frequencies"] == [FREQUENCIES[5]]
+    assert result["worst_singular_value"] == pytest.approx(1.35)
+
+
+def test_validate_touchstone_files_cache(tmp_path) -> None:
+    write_touchstone(tmp_path / "passive.s2p", scattering_matrices(2))
+    write_touchstone(tmp_path / "active.s3p", scattering_matrices(3, gain=1.1))
+    write_touchstone(tmp_path / "copy.s2p", scattering_matrices(2))
+
+    with patch.object(touchstone_parser, "check_passivity", wraps=check_passivity) as mock_check:
+        results = validate_touchstone_files(tmp_path, causality=False, checker="numpy", max_workers=2, use_cache=True)
+        assert mock_check.call_count == 3
+        assert validate_touchstone_files(tmp_path, causality=False, checker="numpy", use_cache=True) == results
+        assert mock_check.call_count == 3
+        # Only the modified file is checked again
+        write_touchstone(tmp_path / "copy.s2p", scattering_matrices(2, gain=1.2))
+        updated = validate_touchstone_files(tmp_path, causality=False, checker="numpy", use_cache=True)
+        assert mock_check.call_count == 4
+        validate_touchstone_files(tmp_path, causality=False, checker="numpy")
+        assert mock_check.call_count == 7
+
+    assert results["passive.s2p"]["passivity"][0]["status"] == "passed"
+    assert results["active.s3p"]["passivity"][0]["status"] == "failed"
+    assert results["active.s3p"]["passivity"][0]["violated_frequencies"] == FREQUENCIES.tolist()
+    assert updated["copy.s2p"]["passivity"][0]["worst_singular_value"] == pytest.approx(1.2)
+    with open(tmp_path / TOUCHSTONE_CHECKS_CACHE) as f:
+        assert len(json.load(f)) == 3
+
+
+def test_validate_touchstone_files_cache_genequiv(tmp_path) -> None:
+    write_touchstone(tmp_path / "passive.s2p", scattering_matrices(2))
+    result = {"passivity": [{"status": "passed", "log": ""}]}
+
+    with patch.object(touchstone_parser, "_genequiv_check", return_value=result) as mock_check:
+        for installed_versions, call_count in [
+            ({"2025.2": str(tmp_path / "v252")}, 1),
+            ({"2025.2": str(tmp_path / "v252")}, 1),
+            ({"2026.1": str(tmp_path / "v261")}, 2),
+            ({"2025.2": str(tmp_path / "other")}, 3),
+        ]:
+            with patch.object(
+                touchstone_parser, "aedt_versions", SimpleNamespace(installed_versions=installed_versions)
+            ):
+                assert validate_touchstone_files(tmp_path, causality=False, use_cache=True)["passive.s2p"] == result
+            assert mock_check.call_count == call_count
+        assert mock_check.call_args.args[0].startswith(str(tmp_path / "other"))
+
+
+def test_validate_touchstone_files_no_cache_by_default(tmp_path) -> None:
+    write_touchstone(tmp_path / "passive.s2p", scattering_matrices(2))
+
+    with patch.object(touchstone_parser, "_file_hash", side_effect=AssertionError("File hashed")):
+        results = validate_touchstone_files(tmp_path, causality=False, checker="numpy")
+        check = check_touchstone_files(tmp_path, checker="numpy")
+
+    assert results["passive.s2p"]["passivity"][0]["status"] == "passed"
+    assert check["passive.s2p"][0][:2] == ["passivity", True]
+
+    assert not (tmp_path / TOUCHSTONE_CHECKS_CACHE).exists()
+
+
+def test_validate_touchstone_files_errors(tmp_path) -> None:
+    with pytest.raises(ValueError, match="Unknown checker"):
+        validate_touchstone_files(tmp_path, checker="other")
+    with pytest.raises(ValueError, match="workers"):
+        validate_touchstone_files(tmp_path, max_workers=0)
+    assert validate_touchstone_files(tmp_path / "missing") == {}
+
+
+def test_check_touchstone_files_numpy(tmp_path) -> None:
+    write_touchstone(tmp_path / "passive.s2p", scattering_matrices(2))
+    write_touchstone(tmp_path / "active.s2p", scattering_matrices(2, gain=1.1))
+
+    check = check_touchstone_files(tmp_path, checker="numpy")
+
+    assert check["passive.s2p"][0][:2] == ["passivity", True]
+    assert check["active.s2p"][0][:2] == ["passivity", False]
+
+
+def test_parse_genequiv_output() -> None:
+    output = "\n".join(
+        [
+            "Checking file    Input data is non-passive.",
+            "Checking file    Maximum causality error: 0.002 for entry S(1,2)",
+            "Checking file    Causality check is inconclusive.",
+        ]
+    )
+
+    result = _parse_genequiv_output(output, True, True)
+
+    assert [i["status"] for i in result["passivity"]] == ["failed"]
+    assert [i["status"] for i in result["causality"]] == ["failed", "inconclusive"]
+    assert result["passivity"][0]["log"] == "Input data is non-passive."
+    assert _parse_genequiv_output(output, False, True).keys() == {"causality"}
+
+
+@pytest.mark.parametrize("ports", [1, 2, 3, 4])
+@pytest.mark.parametrize(("data_format", "unit"), [("RI", "Hz"), ("MA", "GHz"), ("DB", "MHz")])
+def test_read_s_parameters(tmp_path, ports, data_format, unit) -> None:
+    s = scattering_matrices(ports)
+    names = [f"P{i}" for i in range(ports)]
+    touchstone_file = write_touchstone(tmp_path / f"network.s{ports}p", s, data_format, unit, names)
+
+    frequencies, parsed, z0, port_names = _read_s_parameters(touchstone_file)
+    network = rf.Network(str(touchstone_file))
+
+    assert np.allclose(frequencies, network.f, rtol=1e-12, atol=0)
+    assert np.allclose(parsed, network.s, rtol=1e-12, atol=1e-15)
+    assert z0 == 50.0
+    assert port_names == names
+
+
+def write_stack(path, count, ports=8, seed=0):
+    names = [f"TX_{i}" for i in range(ports // 2)] + [f"RX_{i}" for i in range(ports // 2)]
+    return [
+        write_touchstone(
+            path / f"channel{i:03d}.s{ports}p", scattering_matrices(ports, seed=seed + i), port_names=names
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_read_touchstone_files(tmp_path, use_processes) -> None:
+    files = write_stack(tmp_path, 3)
+
+    stack = read_touchstone_files(tmp_path, max_workers=2, use_processes=use_processes)
+
+    assert stack.s.shape == (3, len(FREQUENCIES), 8, 8)
+    assert stack.file_names == [i.name for i in files]
+    assert stack.port_names[:2] == ["TX_0", "TX_1"]
+    for touchstone_file, s in zip(files, stack.s):
+        assert np.allclose(s, rf.Network(str(touchstone_file)).s, rtol=1e-12, atol=1e-15)
+    assert np.array_equal(read_touchstone_files(files[::-1]).s, stack.s[::-1])
+
+
+def test_read_touchstone_files_errors(tmp_path) -> None:
+    write_stack(tmp_path, 2)
+    write_touchstone(tmp_path / "other.s2p", scattering_matrices(2))
+
+    with pytest.raises(ValueError, match="does not share"):
+        read_touchstone_files(tmp_path)
+    with pytest.raises(ValueError, match="No Touchstone"):
+        read_touchstone_files(tmp_path / "missing")
+    with pytest.raises(ValueError, match="shape"):
+        TouchstoneStack(np.zeros((2, 3, 4)), FREQUENCIES)
+
+
+def test_touchstone_stack_metrics(tmp_path) -> None:
+    files = write_stack(tmp_path, 4)
+    stack = read_touchstone_files(tmp_path)
+    networks = [TouchstoneData(touchstone_file=i) for i in files]
+
+    lower, upper = stack.insertion_loss_envelope("TX", "RX")
+    couples = networks[0].get_insertion_loss_index_from_prefix("TX", "RX")
+    for network, low, up in zip(networks, lower, upper):
+        curves = np.array([network.s_db[:, i, j] for i, j in couples])
+        assert np.allclose(low, curves.min(axis=0))
+        assert np.allclose(up, curves.max(axis=0))
+    lower, upper = stack.return_loss_envelope("rx")
+    assert np.allclose(upper[1], np.max([networks[1].s_db[:, i, i] for i in range(4, 8)], axis=0))
+
+    victims, next_sum = stack.next_power_sum("TX")
+    assert victims == [0, 1, 2, 3]
+    for network, power_sum in zip(networks, next_sum):
+        for v, victim in enumerate(victims):
+            aggressors = [i for i, j in network.get_next_xtalk_index("TX") if j == victim]
+            aggressors += [j for i, j in network.get_next_xtalk_index("TX") if i == victim]
+            expected = 10 * np.log10(np.sum([np.abs(network.s[:, victim, i]) ** 2 for i in aggressors], axis=0))
+            assert np.allclose(power_sum[:, v], expected)
+
+    victims, fext_sum = stack.fext_power_sum("TX", "RX")
+    assert victims == [4, 5, 6, 7]
+    for network, power_sum in zip(networks, fext_sum):
+        couples = network.get_fext_xtalk_index_from_prefix("TX", "RX")
+        for v, victim in enumerate(victims):
+            expected = np.sum([np.abs(network.s[:, j, i]) ** 2 for i, j in couples if j == victim], axis=0)
+            assert np.allclose(power_sum[:, v], 10 * np.log10(expected))
+
+
+@pytest.mark.parametrize("port_ordering", ["1234", "1324"])
+def test_touchstone_stack_mixed_mode(tmp_path, port_ordering) -> None:
+    files = write_stack(tmp_path, 3)
+
+    mixed_mode = read_touchstone_files(tmp_path).get_mixed_mode_stack(port_ordering=port_ordering)
+
+    assert mixed_mode.port_names == ["D0", "D1", "D2", "D3", "C0", "C1", "C2", "C3"]
+    for touchstone_file, s in zip(files, mixed_mode.s):
+        reference = TouchstoneData(touchstone_file=touchstone_file)
+        assert np.allclose(s, reference.get_mixed_mode_touchstone_data(port_ordering=port_ordering).s)
+    # The remaining ports are kept single ended
+    partial = read_touchstone_files(files).get_mixed_mode_stack(num_of_diff_ports=1)
+    network = rf.Network(str(files[0]))
+    network.se2gmm(1)
+    assert partial.port_names[:3] == ["D0", "C0", "TX_2"]
+    assert np.allclose(partial.s[0], network.s)
+    with pytest.raises(ValueError, match="port_ordering"):
+        read_touchstone_files(files).get_mixed_mode_stack(port_ordering="1423")
+
+
+def test_touchstone_stack_rank_worst_curves(tmp_path) -> None:
+    write_stack(tmp_path, 3, ports=4)
+    stack = read_touchstone_files(tmp_path)
+
+    ranking = stack.rank_worst_curves(freq_min=2, freq_max=6)
+
+    assert len(ranking) == 3 * 10
+    selected = (FREQUENCIES >= 2e9) & (FREQUENCIES <= 6e9)
+    for file_name, (i, j), mean in ranking:
+        assert mean == pytest.approx(np.abs(stack.s[stack.file_names.index(file_name), selected, i, j]).mean())
+    means = [i[2] for i in ranking]
+    assert means == sorted(means, reverse=True)
+    best = stack.rank_worst_curves(worst_is_higher=False, curve_list=[[0, 0], [1, 1]])
+    assert [i[2] for i in best] == sorted(i[2] for i in best)
+    assert {i[1] for i in best} == {(0, 0), (1, 1)}
+
+
+@pytest.mark.benchmark
+def test_read_touchstone_files_benchmark(tmp_path) -> None:
+    """Test reading a stack of two hundred Touchstone files."""
+    files = write_stack(tmp_path, 200, ports=4)
+
+    start = time.perf_counter()
+    networks = [rf.Network(str(i)) for i in files]
+    reference_time = time.perf_counter() - start
+    start = time.perf_counter()
+    stack = read_touchstone_files(tmp_path)
+    elapsed = time.perf_counter() - start
+
+    assert np.allclose(stack.s, np.stack([i.s for i in networks]))
+    logging.getLogger(__name__).info(f"Touchstone stack read in {elapsed:.3f} s, scikit-rf in {reference_time:.3f} s")
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from collections import Counter
+
+import pytest
+
+from ansys.aedt.core.application.variables import VariableManager
+
+
+class CountingDesktopObject:
+    """Desktop object storing variables in memory and counting every round trip."""
+
+    def __init__(self, name, variables, calls):
+        self._name = name
+        self._variables = dict(variables)
+        self._calls = calls
+
+    def __dir__(self):
+        return ["GetName", "GetVariables", "GetArrayVariables", "GetVariableValue", "ChangeProperty"]
+
+    def GetName(self):
+        self._calls["GetName"] += 1
+        return self._name
+
+    def GetVariables(self):
+        self._calls["GetVariables"] += 1
+        return list(self._variables)
+
+    def GetArrayVariables(self):
+        self._calls["GetArrayVariables"] += 1
+        return []
+
+    def GetVariableValue(self, name):
+        self._calls["GetVariableValue"] += 1
+        return self._variables[name]
+
+    def ChangeProperty(self, args):
+        self._calls["ChangeProperty"] += 1
+        changes = args[1][2]
+        if changes[0] == "NAME:DeletedProps":
+            del self._variables[changes[1]]
+        else:
+            self._variables[changes[1][0][5:]] = changes[1][changes[1].index("Value:=") + 1]
+
+
+class CountingApp:
+    design_type = "HFSS"
+    _aedt_version = "2026.1"
+    logger = None
+
+    def __init__(self, design_variables, project_variables):
+        self.calls = Counter()
+        self.odesign = CountingDesktopObject("HFSSDesign1", design_variables, self.calls)
+        self.oproject = CountingDesktopObject("Project1", project_variables, self.calls)
+
+    def _is_object_oriented_enabled(self):
+        return False
+
+    def get_evaluated_value(self, name):
+        self.calls["GetEvaluatedValue"] += 1
+        expression = self.aedt_variables()[name]
+        return float(expression.rstrip("m")) if expression.endswith("mm") else 1.0
+
+    def aedt_variables(self):
+        return {**self.odesign._variables, **self.oproject._variables}
+
+
+@pytest.fixture
+def counting_app():
+    design_variables = {f"w{i}": f"{i}mm" for i in range(200)}
+    design_variables["total"] = "w0+w1"
+    project_variables = {f"$p{i}": f"{i}mm" for i in range(50)}
+    return CountingApp(design_variables, project_variables)
+
+
+def test_variables_fetched_once(counting_app) -> None:
+    manager = VariableManager(counting_app)
+    variables = manager.variables
+    assert len(variables) == 251
+    assert counting_app.calls["GetVariableValue"] == 251
+    assert counting_app.calls["GetEvaluatedValue"] == 251
+
+    counting_app.calls.clear()
+    for _ in range(10):
+        assert manager.variables.keys() == variables.keys()
+        assert len(manager.independent_design_variables) == 200
+        assert list(manager.dependent_variables) == ["total"]
+        assert len(manager.project_variables) == 50
+    # Each view is listed once per version, then every access is served from the cache.
+    assert sum(counting_app.calls.values()) <= 8
+
+
+def test_setters_invalidate_cache(counting_app) -> None:
+    manager = VariableManager(counting_app)
+    assert "w0" in manager.variables
+    assert manager.set_variable("new_var", "3mm")
+    assert manager.variables["new_var"]._expression == "3mm"
+    assert manager.set_variable("w0", "5mm")
+    assert manager.variables["w0"]._expression == "5mm"
+    assert manager.delete_variable("w1")
+    assert "w1" not in manager.variables
+
+    counting_app.calls.clear()
+    manager.variables
+    manager.variables
+    assert sum(counting_app.calls.values()) <= 4
+
+
+def test_refresh_picks_up_external_changes(counting_app) -> None:
+    manager = VariableManager(counting_app)
+    assert "external" not in manager.variables
+    counting_app.odesign._variables["external"] = "1mm"
+    counting_app.odesign._variables["w2"] = "7mm"
+    assert "external" not in manager.variables
+    manager.refresh()
+    assert manager.variables["external"]._expression == "1mm"
+    assert manager.variables["w2"]._expression == "7mm"